@@ -0,0 +1,71 @@
+"""
+Compare the JSON codecs on realistic SDK payloads.
+
+Usage:
+    python -m benchmarks.bench_codecs [--min-time SECONDS]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from saha_sdk.codecs import available_codecs
+
+from .payloads import PAYLOADS
+
+
+def measure(fn: Callable[[], object], min_time: float) -> float:
+    """Seconds per call of fn, repeating until min_time has elapsed."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / number
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed * 1.2))
+
+
+def run(min_time: float = 0.2) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Time encoding and decoding of every payload with every installed codec.
+
+    Args:
+        min_time (float): Minimum measuring time per payload, codec and direction.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, float]]]: payload -> codec -> {"size", "encode", "decode"},
+            sizes in bytes and times in microseconds per call
+    """
+    codecs = available_codecs()
+    results = {}
+    for name, make in PAYLOADS.items():
+        value = make()
+        results[name] = {}
+        for codec_name, codec in codecs.items():
+            body = codec.dumps(value)
+            results[name][codec_name] = {
+                "size": len(body),
+                "encode": measure(lambda: codec.dumps(value), min_time) * 1e6,
+                "decode": measure(lambda: codec.loads(body), min_time) * 1e6,
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum measuring time per case in seconds.")
+    args = parser.parse_args()
+
+    results = run(args.min_time)
+    print(f"{'payload':<14} {'codec':<8} {'bytes':>9} {'encode us':>11} {'decode us':>11} {'vs json':>8}")
+    for payload, by_codec in results.items():
+        baseline = by_codec["json"]["encode"] + by_codec["json"]["decode"]
+        for codec, r in by_codec.items():
+            speedup = baseline / (r["encode"] + r["decode"])
+            print(f"{payload:<14} {codec:<8} {r['size']:>9} {r['encode']:>11.2f} {r['decode']:>11.2f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
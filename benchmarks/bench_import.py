@@ -0,0 +1,73 @@
+"""
+Measure SDK import times in fresh interpreters and check them against a budget.
+
+Usage:
+    python -m benchmarks.bench_import [--runs N] [--check]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Budgets in milliseconds for the median import time of each statement. They leave room
+# for slow CI machines; the point is to catch eager imports creeping back in.
+BUDGETS = {
+    "import saha_sdk": 15.0,
+    "from saha_sdk import Robot": 400.0,
+    "from saha_sdk import Robot, status": 600.0,
+}
+
+# Third-party packages each statement must not load.
+FORBIDDEN = {
+    "import saha_sdk": ("requests", "urllib3", "pydantic", "numpy", "httpx"),
+    "from saha_sdk import Robot": ("pydantic", "numpy", "httpx"),
+    "from saha_sdk import Robot, status": ("numpy", "httpx"),
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1e3, "modules": sorted(sys.modules)}}))
+"""
+
+
+def probe(statement: str) -> dict:
+    """Run a statement in a fresh interpreter; returns its time in ms and the loaded modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(statement: str, runs: int) -> dict:
+    """Median import time over several runs, the number of modules loaded and forbidden packages seen."""
+    results = [probe(statement) for _ in range(runs)]
+    modules = set(results[0]["modules"])
+    forbidden = [name for name in FORBIDDEN.get(statement, ()) if name in modules]
+    return {"ms": statistics.median(r["ms"] for r in results), "modules": len(modules), "forbidden": forbidden}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per statement.")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if a budget is exceeded.")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'statement':<36} {'median':>10} {'budget':>10} {'modules':>8}")
+    for statement, budget in BUDGETS.items():
+        result = measure(statement, args.runs)
+        over = result["ms"] > budget or result["forbidden"]
+        failed = failed or over
+        note = f"  loads {', '.join(result['forbidden'])}" if result["forbidden"] else ""
+        print(f"{statement:<36} {result['ms']:8.1f}ms {budget:8.1f}ms {result['modules']:8d}{'  OVER' if over else ''}{note}")
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure the per-call cost of request metrics with an in-process transport.
+
+Usage:
+    python -m benchmarks.bench_metrics [--calls N]
+"""
+
+import argparse
+import timeit
+
+from saha_sdk.client import Robot
+from saha_sdk.metrics import MetricsRegistry
+from saha_sdk.transport import Transport, TransportResponse
+
+
+class StaticTransport(Transport):
+    """Returns the same response without any I/O."""
+
+    def __init__(self, body: bytes = b"{}"):
+        self.response = TransportResponse(200, body)
+
+    def request(self, method, url, headers=None, **kwargs):
+        return self.response
+
+
+def per_call(robot: Robot, calls: int) -> float:
+    """Best seconds per robot.get() call out of five runs."""
+    return min(timeit.repeat(lambda: robot.get("/api/v1/status"), number=calls, repeat=5)) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100000, help="Calls per run.")
+    args = parser.parse_args()
+
+    registry = MetricsRegistry(enabled=False)
+    robot = Robot("http://robot", transport=StaticTransport(), metrics=registry)
+    disabled = per_call(robot, args.calls)
+    registry.enable()
+    enabled = per_call(robot, args.calls)
+    print(f"metrics disabled: {disabled * 1e9:8.0f} ns/call")
+    print(f"metrics enabled:  {enabled * 1e9:8.0f} ns/call (+{(enabled - disabled) * 1e9:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
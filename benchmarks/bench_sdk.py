@@ -0,0 +1,499 @@
+"""
+Benchmark every SDK module function against the mock robot server.
+
+Each function is timed per call against the in-process mock (ASGITransport) and over
+sockets (MockServer), with warm and cold connections, synchronously, as concurrent
+coroutines and fanned out over a fleet. Functions whose responses grow with the site
+are also run with 10 to 10,000 targets. Allocation peaks over sockets include the mock
+server's, which runs in the same process.
+
+Usage:
+    python -m benchmarks.bench_sdk [--servers inprocess,socket] [--modes sync,async,fleet]
+                                   [--connections warm,cold] [--sizes 10,1000,10000]
+                                   [--filter GLOB] [--min-time SECONDS] [--output FILE]
+    python -m benchmarks.bench_sdk --compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from saha_sdk import _compat, cruise, layer, mapping, navigation, profile, status, targets, task, ui
+from saha_sdk.cassette import RecordingTransport
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.mock import MockApp, MockRobot, MockServer
+from saha_sdk.models import (
+    CruiseControlRequestModel, CruiseRequestModel, MappingModel, Position, RobotModeModel, RobotProfileModel,
+    RobotRouteModel, RobotStopModel, SiteFloorModel, SpeechModel, TargetRequestModel, TaskRequestModel, TwistModel
+)
+from saha_sdk.transport import ASGITransport, AsyncTransport, PooledHTTPTransport
+
+FORMAT_VERSION = 1
+SITE, FLOOR = "site", "0"
+
+
+@dataclass
+class Case:
+    """One SDK function with its arguments for the i-th call.
+
+    ``prepare`` and ``cleanup`` run untimed before and after every call, directly on the
+    mock robot's state, so that mutating functions find the state they need and leave it
+    as it was.
+    """
+    fn: Callable
+    args: Callable[[int], tuple] = lambda i: ()
+    prepare: Optional[Callable[[MockRobot, int], Any]] = None
+    cleanup: Optional[Callable[[MockRobot, int], Any]] = None
+    scales: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.fn.__module__.rsplit('.', 1)[-1]}.{self.fn.__name__}"
+
+
+def _target_request(name: str) -> TargetRequestModel:
+    return TargetRequestModel(name=name, site=SITE, floor=FLOOR, eg="", eg_dir="", px=1.0, py=2.0)
+
+
+def _task_request(uid: str = f"{SITE}_{FLOOR}_target_1") -> TaskRequestModel:
+    return TaskRequestModel(type="TABLE_SERVICE", activate=False, target_uid=uid, payload=[False] * 4)
+
+
+def _cruise_request(name: str) -> CruiseRequestModel:
+    return CruiseRequestModel(name=name, waypoints=[f"{SITE}_{FLOOR}_target_1"], site=SITE, floor=FLOOR)
+
+
+def _call(mock: MockRobot, handler: str, body=None, **params):
+    return getattr(mock, handler)(params, {}, body)
+
+
+def _add_target(mock: MockRobot, i: int):
+    _call(mock, "add_target", _target_request(f"bench-{i}").model_dump())
+
+
+def _delete_target(mock: MockRobot, i: int):
+    _call(mock, "delete_target", site=SITE, floor=FLOOR, name=f"bench-{i}")
+
+
+def _add_cruise(mock: MockRobot, i: int):
+    _call(mock, "add_cruise", _cruise_request(f"bench-{i}").model_dump())
+
+
+def _delete_cruise(mock: MockRobot, i: int):
+    _call(mock, "delete_cruise", site=SITE, floor=FLOOR, name=f"bench-{i}")
+
+
+def _delete_last_task(mock: MockRobot, i: int):
+    del mock.tasks[max(mock.tasks)]
+
+
+def _add_task(mock: MockRobot, i: int):
+    mock.tasks[10 ** 9 + i] = dict(mock.tasks[1], id=10 ** 9 + i, uid=10 ** 9 + i)
+
+
+def _start_mapping(mock: MockRobot, i: int):
+    _call(mock, "start_mapping", MappingModel(site_floor=SiteFloorModel(site=SITE, floor="bench"), title="bench").model_dump())
+
+
+def _stop_mapping(mock: MockRobot, i: int):
+    mock.mapping = None
+
+
+def _add_map(mock: MockRobot, i: int):
+    mock.maps[(SITE, "bench")] = mock._map(SITE, "bench")
+
+
+# Every SDK module function. clear_all_tasks comes last because it empties the task list.
+CASES: List[Case] = [
+    Case(status.get_robot_status),
+    Case(status.get_hardware_status),
+    Case(status.get_robot_info),
+    Case(navigation.get_navigation_path),
+    Case(navigation.get_navigation_path_stream),
+    Case(navigation.get_current_position),
+    Case(navigation.get_position_stream),
+    Case(navigation.set_goal_pose, lambda i: (Position(x=1.0, y=2.0),)),
+    Case(navigation.set_goal_target, lambda i: (f"{SITE}_{FLOOR}_target_1",)),
+    Case(navigation.get_emergency_stop_status),
+    Case(navigation.set_emergency_stop, lambda i: (RobotStopModel(stop=False),)),
+    Case(navigation.send_safe_velocity, lambda i: (TwistModel(vel_x=0.1),)),
+    Case(navigation.send_velocity, lambda i: (TwistModel(vel_x=0.1),)),
+    Case(navigation.start_localization, lambda i: (SiteFloorModel(site=SITE, floor=FLOOR),)),
+    Case(targets.get_all_targets, scales=True),
+    Case(targets.add_target, lambda i: (_target_request(f"bench-{i}"),), cleanup=_delete_target),
+    Case(targets.get_targets_by_site, lambda i: (SITE,), scales=True),
+    Case(targets.get_targets_by_site_and_floor, lambda i: (SITE, FLOOR), scales=True),
+    Case(targets.get_target, lambda i: (SITE, FLOOR, "target_1")),
+    Case(targets.update_target, lambda i: (SITE, FLOOR, "target_2", _target_request("target_2"))),
+    Case(targets.delete_target, lambda i: (SITE, FLOOR, f"bench-{i}"), prepare=_add_target),
+    Case(cruise.get_default_cruise_route),
+    Case(cruise.set_default_cruise_route, lambda i: (RobotRouteModel(route="all"),)),
+    Case(cruise.get_all_cruises, scales=True),
+    Case(cruise.add_cruise, lambda i: (_cruise_request(f"bench-{i}"),), cleanup=_delete_cruise),
+    Case(cruise.start_cruise, lambda i: (CruiseControlRequestModel(cruise_cmd="CMD_START", cruise_route="all"),)),
+    Case(cruise.get_cruises_by_site, lambda i: (SITE,), scales=True),
+    Case(cruise.get_cruises_by_site_and_floor, lambda i: (SITE, FLOOR), scales=True),
+    Case(cruise.get_cruise, lambda i: (SITE, FLOOR, "all"), scales=True),
+    Case(cruise.update_cruise, lambda i: (SITE, FLOOR, "short", _cruise_request("short"))),
+    Case(cruise.delete_cruise, lambda i: (SITE, FLOOR, f"bench-{i}"), prepare=_add_cruise),
+    Case(task.get_all_tasks, scales=True),
+    Case(task.create_task, lambda i: (_task_request(),), cleanup=_delete_last_task),
+    Case(task.get_task, lambda i: ("1",)),
+    Case(task.update_task, lambda i: ("1", _task_request())),
+    Case(task.delete_task, lambda i: (str(10 ** 9 + i),), prepare=_add_task),
+    Case(task.pause_mission),
+    Case(task.resume_mission),
+    Case(layer.get_all_layers),
+    Case(layer.get_layers_by_site, lambda i: (SITE,)),
+    Case(layer.get_layers_by_site_and_floor, lambda i: (SITE, FLOOR)),
+    Case(layer.get_layer, lambda i: (SITE, FLOOR, f"{SITE}_{FLOOR}_layer-1")),
+    Case(mapping.get_available_maps),
+    Case(mapping.get_default_map),
+    Case(mapping.set_default_map, lambda i: (SiteFloorModel(site=SITE, floor=FLOOR),)),
+    Case(mapping.get_current_map),
+    Case(mapping.get_selected_map, lambda i: (SITE, FLOOR)),
+    Case(mapping.delete_selected_map, lambda i: (SITE, "bench"), prepare=_add_map),
+    Case(mapping.start_mapping, lambda i: (MappingModel(site_floor=SiteFloorModel(site=SITE, floor="bench"), title="bench"),), cleanup=_stop_mapping),
+    Case(mapping.cancel_mapping, prepare=_start_mapping),
+    Case(mapping.change_map, lambda i: (SiteFloorModel(site=SITE, floor=FLOOR),)),
+    Case(mapping.start_remapping, lambda i: (SiteFloorModel(site=SITE, floor=FLOOR),), cleanup=_stop_mapping),
+    Case(mapping.save_map, prepare=_start_mapping, cleanup=lambda mock, i: _call(mock, "change_map", {"site": SITE, "floor": FLOOR})),
+    Case(profile.get_robot_profiles),
+    Case(profile.change_environment_profile, lambda i: (RobotProfileModel(profile="Warehouse"),)),
+    Case(profile.change_behavior_profile, lambda i: (RobotProfileModel(profile="Default"),)),
+    Case(profile.change_speed_profile, lambda i: (RobotProfileModel(profile="normal"),)),
+    Case(profile.get_robot_modes),
+    Case(profile.set_robot_mode, lambda i: (RobotModeModel(mode="quiet"),)),
+    Case(profile.remove_robot_mode, lambda i: (RobotModeModel(mode="quiet"),), prepare=lambda mock, i: _call(mock, "set_mode", {"mode": "quiet"})),
+    Case(ui.speak_text, lambda i: (SpeechModel(lang="en", text="Hello"),), cleanup=lambda mock, i: mock.speech.clear()),
+    Case(ui.change_pixel_screen_video, lambda i: ("video.mp4",)),
+    Case(task.clear_all_tasks),
+]
+
+
+def make_app(robots: int, size: int) -> MockApp:
+    """Mock robots with ``size`` targets, tasks and cruise waypoints each."""
+    app = MockApp(robots=robots, targets=size)
+    for mock in app.robots.values():
+        uids = list(mock.targets)
+        _call(mock, "add_cruise", CruiseRequestModel(name="all", waypoints=uids, site=SITE, floor=FLOOR).model_dump())
+        _call(mock, "add_cruise", _cruise_request("short").model_dump())
+        for k in range(size):
+            _call(mock, "create_task", _task_request(uids[k]).model_dump())
+    return app
+
+
+def _parse(fn: Callable, data: Any) -> Any:
+    """Validate a response the way fn does, from its return annotation."""
+    model = fn.__annotations__["return"]
+    if getattr(model, "__origin__", None) is list:
+        item = model.__args__[0]
+        return [item(**x) for x in data]
+    return model(**data)
+
+
+def _endpoint(robot: Robot, case: Case) -> Tuple[str, str]:
+    """Method and path of the request a case sends, found by recording one call."""
+    recorder = RecordingTransport(robot.transport)
+    case.fn(Robot(robot.base_url, transport=recorder), *case.args(0))
+    interaction = recorder.cassette.interactions[-1]
+    return interaction.method, interaction.path[len(urlsplit(robot.base_url).path):]
+
+
+def summarize(timings: List[float], calls_per_round: int) -> Dict[str, float]:
+    """Latency statistics in microseconds per round, and calls per second."""
+    timings = sorted(timings)
+
+    def percentile(q: float) -> float:
+        return timings[min(len(timings) - 1, int(math.ceil(q * len(timings))) - 1)] * 1e6
+
+    mean = statistics.fmean(timings) if hasattr(statistics, "fmean") else statistics.mean(timings)
+    return {
+        "rounds": len(timings),
+        "calls_per_round": calls_per_round,
+        "mean_us": mean * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "p95_us": percentile(0.95),
+        "p99_us": percentile(0.99),
+        "min_us": timings[0] * 1e6,
+        "calls_per_s": calls_per_round / mean if mean > 0 else float("inf"),
+    }
+
+
+def measure(run_round: Callable[[int], float], min_time: float, min_rounds: int = 3, alloc_rounds: int = 1) -> Tuple[List[float], int]:
+    """Time rounds until min_time has passed, then measure the peak of allocations per round.
+
+    Allocations are traced in separate rounds because tracemalloc slows calls down severalfold.
+
+    Args:
+        run_round: Runs round i and returns its timed duration in seconds.
+
+    Returns:
+        Round durations and the median peak of memory allocated during a round, in bytes.
+    """
+    timings: List[float] = []
+    i = 0
+    deadline = time.perf_counter() + min_time
+    while len(timings) < min_rounds or time.perf_counter() < deadline:
+        timings.append(run_round(i))
+        i += 1
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_rounds):
+            tracemalloc.clear_traces()
+            baseline = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            run_round(i)
+            i += 1
+            peaks.append(max(0, tracemalloc.get_traced_memory()[1] - baseline))
+    finally:
+        tracemalloc.stop()
+    return timings, int(statistics.median(peaks))
+
+
+class Target:
+    """Clients of a mock app served in-process or over sockets."""
+
+    def __init__(self, server: str, app: MockApp):
+        self.server = server
+        self.app = app
+        self._mock_server: Optional[MockServer] = None
+        if server == "socket":
+            self._mock_server = MockServer(app).start()
+            self.urls = dict(self._mock_server.urls)
+            self.transport = PooledHTTPTransport(maxsize=len(app.robots))
+        else:
+            self.urls = {name: f"http://mock/robots/{name}" for name in app.robots}
+            self.transport = ASGITransport(app)
+        self.names = list(app.robots)
+
+    def robot(self, name: Optional[str] = None, transport=None) -> Robot:
+        return Robot(self.urls[name or self.names[0]], transport=transport or self.transport)
+
+    def close(self):
+        self.transport.close()
+        if self._mock_server is not None:
+            self._mock_server.stop()
+
+
+def _run_sync(target: Target, case: Case, cold: bool) -> Callable[[int], float]:
+    mock = target.app[target.names[0]]
+    robot = target.robot()
+
+    def run_round(i: int) -> float:
+        args = case.args(i)
+        if case.prepare:
+            case.prepare(mock, i)
+        start = time.perf_counter()
+        if cold:
+            transport = PooledHTTPTransport(maxsize=1)
+            case.fn(target.robot(transport=transport), *args)
+            transport.close()
+        else:
+            case.fn(robot, *args)
+        elapsed = time.perf_counter() - start
+        if case.cleanup:
+            case.cleanup(mock, i)
+        return elapsed
+    return run_round
+
+
+def _run_fleet(target: Target, case: Case, fleet: RobotFleet) -> Callable[[int], float]:
+    mocks = [target.app[name] for name in target.names]
+
+    def run_round(i: int) -> float:
+        args = case.args(i)
+        if case.prepare:
+            for mock in mocks:
+                case.prepare(mock, i)
+        start = time.perf_counter()
+        results = fleet.map(case.fn, *args, return_exceptions=False)
+        elapsed = time.perf_counter() - start
+        if case.cleanup:
+            for mock in mocks:
+                case.cleanup(mock, i)
+        assert len(results) == len(mocks)
+        return elapsed
+    return run_round
+
+
+def _run_async(robot: Robot, case: Case, concurrency: int, loop: asyncio.AbstractEventLoop) -> Callable[[int], float]:
+    method, path = _endpoint(robot, case)
+
+    async def call():
+        return _parse(case.fn, await robot.request_async(method, path))
+
+    async def batch():
+        await asyncio.gather(*(call() for _ in range(concurrency)))
+
+    def run_round(i: int) -> float:
+        start = time.perf_counter()
+        loop.run_until_complete(batch())
+        return time.perf_counter() - start
+    return run_round
+
+
+def run(
+    servers=("inprocess", "socket"),
+    modes=("sync", "async", "fleet"),
+    connections=("warm", "cold"),
+    sizes=(10, 1000, 10000),
+    pattern: str = "*",
+    min_time: float = 0.1,
+    fleet_size: int = 8,
+    concurrency: int = 16,
+    log: Callable[[str], None] = lambda line: None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every case matching a pattern.
+
+    Cold connections only apply to sync calls over sockets; async calls only to read-only
+    functions, and over sockets only with httpx installed. Functions other than those
+    whose responses grow with the site are only run at the smallest size.
+
+    Args:
+        servers (Tuple[str, ...]): "inprocess" and/or "socket".
+        modes (Tuple[str, ...]): "sync", "async" and/or "fleet".
+        connections (Tuple[str, ...]): "warm" and/or "cold".
+        sizes (Tuple[int, ...]): Numbers of targets, tasks and cruise waypoints per robot.
+        pattern (str): Glob over case ids, e.g. "*/sync/*/targets.*".
+        min_time (float): Minimum measuring time per case in seconds.
+        fleet_size (int): Robots in fleet fan-out.
+        concurrency (int): Concurrent coroutines per async round.
+        log (Callable[[str], None]): Called with a line per finished case.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Statistics keyed by "server/mode/connection/size/module.function"
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    sizes = sorted(sizes)
+    for server in servers:
+        for size in sizes:
+            cases = [case for case in CASES if case.scales or size == sizes[0]]
+            target = Target(server, make_app(fleet_size, size))
+            fleet = RobotFleet({name: target.robot(name) for name in target.names}, max_workers=fleet_size)
+            loop = asyncio.new_event_loop()
+            async_robot = None
+            if "async" in modes:
+                if server == "inprocess":
+                    async_robot = target.robot()
+                elif _compat.httpx is not None:
+                    async_robot = target.robot(transport=AsyncTransport())
+            plan = []
+            for case in cases:
+                if "sync" in modes:
+                    for connection in connections:
+                        if connection == "warm" or server == "socket":
+                            plan.append(("sync", connection, case, lambda case=case, connection=connection: (
+                                _run_sync(target, case, connection == "cold"), 1
+                            )))
+                if "async" in modes and async_robot is not None and "warm" in connections and case.fn.__name__.startswith("get_"):
+                    plan.append(("async", "warm", case, lambda case=case: (_run_async(async_robot, case, concurrency, loop), concurrency)))
+                if "fleet" in modes and "warm" in connections:
+                    plan.append(("fleet", "warm", case, lambda case=case: (_run_fleet(target, case, fleet), fleet_size)))
+            try:
+                for mode, connection, case, make in plan:
+                    key = f"{server}/{mode}/{connection}/{size}/{case.name}"
+                    if not fnmatch.fnmatchcase(key, pattern):
+                        continue
+                    run_round, calls = make()
+                    timings, peak = measure(run_round, min_time)
+                    results[key] = summarize(timings, calls)
+                    results[key]["alloc_peak_bytes"] = peak
+                    log(f"{key:<72} {results[key]['median_us']:>11.1f} us {results[key]['calls_per_s']:>10.0f}/s {peak / 1024:>9.1f} KiB")
+            finally:
+                fleet.close()
+                loop.close()
+                target.close()
+    return results
+
+
+def save(results: Dict[str, Dict[str, float]], path: str):
+    """Write results with the environment they were measured in."""
+    document = {
+        "version": FORMAT_VERSION,
+        "created": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "codec": Robot("http://mock").codec.name,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=1, sort_keys=True)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1) -> List[Tuple[str, float, float, float]]:
+    """
+    Compare the median latency of the cases two result documents share.
+
+    Args:
+        baseline (Dict[str, Any]): Document written by save().
+        current (Dict[str, Any]): Document written by save().
+        threshold (float): Relative slowdown that counts as a regression.
+
+    Returns:
+        List[Tuple[str, float, float, float]]: (case, baseline us, current us, ratio) of every
+            regression, worst first
+    """
+    regressions = []
+    for key, stats in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None or before["median_us"] <= 0:
+            continue
+        ratio = stats["median_us"] / before["median_us"]
+        if ratio > 1 + threshold:
+            regressions.append((key, before["median_us"], stats["median_us"], ratio))
+    return sorted(regressions, key=lambda r: -r[3])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--servers", default="inprocess,socket", help="Comma-separated: inprocess, socket.")
+    parser.add_argument("--modes", default="sync,async,fleet", help="Comma-separated: sync, async, fleet.")
+    parser.add_argument("--connections", default="warm,cold", help="Comma-separated: warm, cold.")
+    parser.add_argument("--sizes", default="10,1000,10000", help="Comma-separated numbers of targets per robot.")
+    parser.add_argument("--filter", default="*", help="Glob over case ids, e.g. '*/sync/*/targets.*'.")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum measuring time per case in seconds.")
+    parser.add_argument("--fleet-size", type=int, default=8, help="Robots in fleet fan-out.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent coroutines per async round.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="Compare two result files.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown reported as a regression.")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"{key:<72} {before:>11.1f} -> {after:>11.1f} us ({ratio:.2f}x)")
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1 if regressions else 0)
+
+    print(f"{'case':<72} {'median':>14} {'throughput':>12} {'alloc peak':>13}")
+    results = run(
+        servers=args.servers.split(","), modes=args.modes.split(","), connections=args.connections.split(","),
+        sizes=[int(size) for size in args.sizes.split(",")], pattern=args.filter, min_time=args.min_time,
+        fleet_size=args.fleet_size, concurrency=args.concurrency, log=print
+    )
+    if args.output:
+        save(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
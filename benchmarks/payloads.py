@@ -0,0 +1,87 @@
+"""
+Realistic SDK payloads for benchmarks, shaped like the responses of a robot with a
+large site: target and cruise lists, task history, and high-rate status polling.
+"""
+
+import random
+from typing import Any, Dict, List
+
+
+def target(k: int, site: str = "site", floor: str = "floor") -> Dict[str, Any]:
+    rng = random.Random(k)
+    return {
+        "name": f"Table {k}",
+        "uid": f"{site}_{floor}_target-{k}",
+        "site_floor": {"site": site, "floor": floor},
+        "eg": "",
+        "eg_dir": "",
+        "px": round(rng.uniform(-50, 50), 3),
+        "py": round(rng.uniform(-50, 50), 3),
+        "yaw_deg": round(rng.uniform(-180, 180), 1),
+        "tol": 0.5,
+        "type": "table",
+        "label": "{}",
+        "cid": "",
+    }
+
+
+def targets(n: int = 500) -> List[Dict[str, Any]]:
+    """GET /api/v1/targets"""
+    return [target(k) for k in range(n)]
+
+
+def cruise(n: int = 100) -> Dict[str, Any]:
+    """GET /api/v1/cruises/{site}/{floor}/{name}"""
+    return {"name": "Patrol", "waypoints": [target(k) for k in range(n)], "site_floor": {"site": "site", "floor": "floor"}}
+
+
+def tasks(n: int = 1000) -> List[Dict[str, Any]]:
+    """GET /api/v1/tasks"""
+    return [
+        {
+            "id": k, "uid": k, "site": "site", "floor": "floor", "task_type": "TABLE_SERVICE",
+            "task_index": k % 4, "success": True, "completed": k % 7 != 0, "message": "Task completed",
+            "target": target(k % 200), "create_time": 1700000000.0 + 37.5 * k, "celebrating_name": "",
+            "payload": [k % 4 == i for i in range(4)],
+        }
+        for k in range(n)
+    ]
+
+
+def status() -> Dict[str, Any]:
+    """GET /api/v1/status"""
+    return {"is_charging": False, "battery_percent": 87.5, "is_estopped": False, "current_state": "READY", "out_of_service": False}
+
+
+def hardware() -> Dict[str, Any]:
+    """GET /api/v1/status/hardware"""
+    return {
+        "lidars": [{"name": name, "is_working": True, "state": "WORKING", "error": ""} for name in ("main_lidar", "rear_lidar")],
+        "cameras": [{"name": name, "is_working": True, "state": "WORKING", "error": ""} for name in ("front_camera", "depth_camera")],
+        "internet_status": {
+            "state": "CONNECTED", "error": "", "wifi_enabled": True, "wifi_connected": True, "wifi_ssid": "Robots",
+            "wifi_ip_addr": "10.0.0.12", "wifi_mac_addr": "00:11:22:33:44:55", "mobile_enabled": False, "mobile_connected": False,
+        },
+    }
+
+
+def position() -> Dict[str, Any]:
+    """GET /api/v1/navigation/position/stream"""
+    return {"position": {"x": 12.345, "y": -3.21, "theta": 1.5707}, "twist": {"vel_x": 0.42, "vel_z": 0.05}}
+
+
+def task_request() -> Dict[str, Any]:
+    """POST /api/v1/tasks"""
+    return {"timeout": 30, "type": "TABLE_SERVICE", "activate": True, "task_index": 0,
+            "target_uid": "site_floor_target-1", "payload": [True, False, False, False], "celebrating_name": ""}
+
+
+PAYLOADS = {
+    "status": status,
+    "position": position,
+    "hardware": hardware,
+    "task_request": task_request,
+    "cruise_100": cruise,
+    "targets_500": targets,
+    "tasks_1000": tasks,
+}
@@ -1,14 +1,61 @@
-from .client import Robot
-from . import (
-    cruise,
-    exceptions,
-    layer,
-    mapping,
-    navigation,
-    profile,
-    status,
-    targets,
-    task,
-    ui,
-    models
+import importlib
+
+# Submodules and classes are imported on first access (PEP 562), so "import saha_sdk"
+# stays cheap and only the parts that are used load requests, pydantic or numpy.
+_SUBMODULES = (
+    "breaker",
+    "cassette",
+    "client",
+    "codecs",
+    "cruise",
+    "dispatch",
+    "endpoints",
+    "exceptions",
+    "fleet",
+    "health",
+    "history",
+    "keepalive",
+    "layer",
+    "mapping",
+    "metrics",
+    "mock",
+    "navigation",
+    "planning",
+    "profile",
+    "ratelimit",
+    "scheduler",
+    "snapshot",
+    "status",
+    "targets",
+    "telemetry",
+    "task",
+    "tour",
+    "tracing",
+    "tracking",
+    "transport",
+    "trays",
+    "ui",
+    "watch",
+    "models",
 )
+_ATTRIBUTES = {
+    "Robot": "client",
+    "RobotFleet": "fleet",
+}
+
+__all__ = ["Robot", "RobotFleet", *_SUBMODULES]
+
+
+def __getattr__(name: str):
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(f".{_ATTRIBUTES[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
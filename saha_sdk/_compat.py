@@ -0,0 +1,51 @@
+import importlib
+
+# Optional dependencies, imported on first access so that modules which do not use them
+# do not pay for them. Missing packages are None.
+_OPTIONAL = {
+    "numpy": "numpy",
+    "httpx": "httpx",
+    "orjson": "orjson",
+    "msgspec": "msgspec",
+    "opentelemetry_trace": "opentelemetry.trace",
+}
+
+
+def __getattr__(name: str):
+    if name not in _OPTIONAL:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(_OPTIONAL[name])
+    except ImportError:
+        module = None
+    globals()[name] = module
+    return module
+
+
+def _load(name: str):
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def _require(module, package: str, extra: str, feature: str):
+    if module is None:
+        raise ImportError(f"{feature} requires {package}. Install it with: pip install saha-sdk[{extra}]")
+
+
+def require_numpy(feature: str):
+    """Raise an ImportError naming the feature if numpy is not installed."""
+    _require(_load("numpy"), "numpy", "numpy", feature)
+
+
+def require_httpx(feature: str):
+    """Raise an ImportError naming the feature if httpx is not installed."""
+    _require(_load("httpx"), "httpx", "async", feature)
+
+
+def require_orjson(feature: str):
+    """Raise an ImportError naming the feature if orjson is not installed."""
+    _require(_load("orjson"), "orjson", "fast", feature)
+
+
+def require_msgspec(feature: str):
+    """Raise an ImportError naming the feature if msgspec is not installed."""
+    _require(_load("msgspec"), "msgspec", "msgspec", feature)
@@ -0,0 +1,171 @@
+import threading
+import time
+from typing import Callable, Collection, Optional
+
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Statuses meaning the robot's API server is unavailable, rather than the request being wrong.
+FAILURE_STATUSES = (502, 503, 504)
+
+
+class CircuitBreaker:
+    """Stops sending requests to a robot that keeps failing.
+
+    While closed, requests pass and consecutive failures (network errors and
+    FAILURE_STATUSES) are counted. At failure_threshold the circuit opens: requests raise
+    CircuitOpenError at once instead of waiting for the network, and a background thread
+    probes the robot every probe_interval seconds, closing the circuit as soon as it answers.
+    Once reset_timeout has passed the circuit is half-open and lets a single trial request
+    through; its success closes the circuit and its failure opens it again.
+
+    A breaker belongs to one Robot: ``Robot(url, breaker=CircuitBreaker())``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        probe_interval: Optional[float] = 1.0,
+        probe_path: str = "/api/v1/status",
+        probe_timeout: float = 2.0,
+        failure_statuses: Collection[int] = FAILURE_STATUSES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize a new breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a trial request is let through.
+            probe_interval: Seconds between background probes while open. None disables probing.
+            probe_path: Cheap endpoint requested by probes.
+            probe_timeout: Timeout of a probe request in seconds.
+            failure_statuses: Response statuses that count as failures.
+            clock: Monotonic clock in seconds.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_interval = probe_interval
+        self.probe_path = probe_path
+        self.probe_timeout = probe_timeout
+        self.failure_statuses = frozenset(failure_statuses)
+        self.clock = clock
+        self.failures = 0
+        self.opens = 0
+        self.rejected = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial = False
+        self._probe: Optional[Callable[[], bool]] = None
+        self._prober: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def bind(self, probe: Callable[[], bool]):
+        """Attach the probe of the robot this breaker guards; called by Robot.
+
+        Args:
+            probe: Sends one probe request and returns whether the robot answered.
+        """
+        if self._probe is not None:
+            raise ValueError("CircuitBreaker is already bound to a robot")
+        self._probe = probe
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            if self._state == OPEN and self.clock() >= self._opened_at + self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_request(self):
+        """Admit a request, or raise CircuitOpenError if it must not be sent."""
+        if self._state == CLOSED:
+            return
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            now = self.clock()
+            if self._state == OPEN and now >= self._opened_at + self.reset_timeout:
+                self._state = HALF_OPEN
+            if self._state == OPEN or self._trial:
+                self.rejected += 1
+                retry_after = max(0.0, self._opened_at + self.reset_timeout - now)
+                raise CircuitOpenError(f"Circuit open after {self.failures} consecutive failures", retry_after=retry_after)
+            self._trial = True
+
+    def record_status(self, status_code: int):
+        """Record the response status of an admitted request."""
+        if status_code in self.failure_statuses:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        """Record a request that reached the robot; closes the circuit."""
+        if self._state == CLOSED and not self.failures:
+            return
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+            self._trial = False
+
+    def record_failure(self):
+        """Record a request that failed to reach the robot."""
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self.failures >= self.failure_threshold):
+                self._open()
+
+    def release_trial(self):
+        """Free the half-open trial slot of an admitted request that ended without an outcome.
+
+        Called by Robot when a request raises something other than a network error, e.g.
+        asyncio.CancelledError, so the next request can be admitted as the trial instead.
+        """
+        if not self._trial:
+            return
+        with self._lock:
+            self._trial = False
+
+    def reset(self):
+        """Close the circuit and forget past failures."""
+        self.record_success()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._trial = False
+        self.opens += 1
+        if self._probe is not None and self.probe_interval is not None and self._prober is None:
+            self._stop.clear()
+            self._prober = threading.Thread(target=self._run_probes, name="saha-circuit-probe", daemon=True)
+            self._prober.start()
+
+    def _run_probes(self):
+        while not self._stop.wait(self.probe_interval):
+            with self._lock:
+                if self._state == CLOSED:
+                    self._prober = None
+                    return
+            try:
+                answered = self._probe()
+            except Exception:
+                answered = False
+            if answered:
+                self.record_success()
+        with self._lock:
+            self._prober = None
+
+    def close(self):
+        """Stop the background probe thread."""
+        self._stop.set()
+        prober = self._prober
+        if prober is not None:
+            prober.join()
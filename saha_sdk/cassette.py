@@ -0,0 +1,280 @@
+import asyncio
+import base64
+import gzip
+import json as _json
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .transport import Response, Transport, TransportResponse, _prepare
+
+FORMAT_VERSION = 1
+
+# Replay speeds by name; numbers are acceleration factors.
+SPEEDS = {"original": 1.0, "asap": None}
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Times are seconds: ``offset`` since the recording started and ``duration`` until the
+    response (or network error) arrived. Request headers are not recorded, so API keys do
+    not end up in cassette files.
+    """
+    offset: float
+    duration: float
+    method: str
+    path: str
+    body: Optional[bytes] = None
+    status: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str, Optional[bytes]]:
+        return self.method, self.path, self.body
+
+
+def _pack_bytes(data: Optional[bytes]):
+    if data is None:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"b64": base64.b64encode(data).decode("ascii")}
+
+
+def _unpack_bytes(value) -> Optional[bytes]:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return base64.b64decode(value["b64"])
+    return value.encode("utf-8")
+
+
+class Cassette:
+    """A sequence of recorded interactions, stored as gzip-compressed JSON lines."""
+
+    def __init__(self, interactions: Optional[List[Interaction]] = None, base_url: str = "", recorded_at: Optional[float] = None):
+        """Initialize a cassette.
+
+        Args:
+            interactions: Recorded interactions in the order they were sent.
+            base_url: URL of the robot the traffic was recorded from, for reference.
+            recorded_at: Unix time the recording started.
+        """
+        self.interactions = interactions if interactions is not None else []
+        self.base_url = base_url
+        self.recorded_at = recorded_at if recorded_at is not None else time.time()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(self.interactions)
+
+    def save(self, path: str):
+        """Write the cassette to a file."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            header = {"version": FORMAT_VERSION, "base_url": self.base_url, "recorded_at": self.recorded_at}
+            f.write(_json.dumps(header) + "\n")
+            for i in self.interactions:
+                record = {
+                    "t": round(i.offset, 6), "d": round(i.duration, 6), "m": i.method, "p": i.path,
+                    "q": _pack_bytes(i.body), "s": i.status, "h": i.headers, "b": _pack_bytes(i.content), "e": i.error,
+                }
+                f.write(_json.dumps({k: v for k, v in record.items() if v is not None and v != {}}, separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Read a cassette written by save()."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = _json.loads(f.readline())
+            if header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+            interactions = []
+            for line in f:
+                r = _json.loads(line)
+                interactions.append(Interaction(
+                    offset=r["t"], duration=r["d"], method=r["m"], path=r["p"], body=_unpack_bytes(r.get("q")),
+                    status=r.get("s"), headers=r.get("h", {}), content=_unpack_bytes(r.get("b")) or b"", error=r.get("e")
+                ))
+        return cls(interactions, header.get("base_url", ""), header.get("recorded_at"))
+
+
+def _request_key(method: str, url: str, headers, params, json, data) -> Tuple[str, str, Optional[bytes]]:
+    url, _, body = _prepare(url, headers, params, json, data)
+    if body is not None:
+        # Codecs serialize differently; compare JSON bodies by content.
+        try:
+            body = _json.dumps(_json.loads(body), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        except ValueError:
+            pass
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return method.upper(), path, body
+
+
+class RecordingTransport(Transport):
+    """Passes requests to another transport and records them into a cassette.
+
+    Usually created by ``Robot.record()``.
+    """
+
+    def __init__(self, transport: Transport, cassette: Optional[Cassette] = None):
+        """Initialize a new transport.
+
+        Args:
+            transport: Transport that actually sends the requests.
+            cassette: Cassette to append to. Defaults to a new one.
+        """
+        self.transport = transport
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.network_errors = transport.network_errors
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _record(self, key, start: float, response: Optional[Response], error: Optional[BaseException]):
+        method, path, body = key
+        interaction = Interaction(
+            offset=start - self._origin, duration=time.perf_counter() - start, method=method, path=path, body=body
+        )
+        if response is not None:
+            interaction.status = response.status_code
+            interaction.headers = dict(response.headers)
+            interaction.content = response.content
+        else:
+            interaction.error = str(error)
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+
+    def request(self, method: str, url: str, headers=None, params=None, json=None, data=None, **kwargs) -> Response:
+        key = _request_key(method, url, headers, params, json, data)
+        start = time.perf_counter()
+        try:
+            response = self.transport.request(method, url, headers=headers, params=params, json=json, data=data, **kwargs)
+        except self.network_errors as e:
+            self._record(key, start, None, e)
+            raise
+        self._record(key, start, response, None)
+        return response
+
+    async def request_async(self, method: str, url: str, headers=None, params=None, json=None, data=None, **kwargs) -> Response:
+        key = _request_key(method, url, headers, params, json, data)
+        start = time.perf_counter()
+        try:
+            response = await self.transport.request_async(method, url, headers=headers, params=params, json=json, data=data, **kwargs)
+        except self.network_errors as e:
+            self._record(key, start, None, e)
+            raise
+        self._record(key, start, response, None)
+        return response
+
+    def warmup(self, url: str, headers=None, connections: int = 1, timeout=None):
+        self.transport.warmup(url, headers=headers, connections=connections, timeout=timeout)
+
+    def close(self):
+        self.transport.close()
+
+
+class ReplayedNetworkError(Exception):
+    """A network error that occurred while recording, raised again during replay."""
+
+
+class UnrecordedRequestError(LookupError):
+    """A request with no (remaining) recorded interaction."""
+
+
+class ReplayTransport(Transport):
+    """Serves the responses of a cassette instead of contacting a robot.
+
+    Requests are matched to recorded interactions by method, path with query string and
+    body; identical requests get their recorded responses in order. Replay reproduces the
+    recorded timeline, compressed by the replay speed: a request is not answered before its
+    interaction's offset divided by the speed has passed since the first replayed request,
+    and is then held back for its recorded duration divided by the speed. Requests that come
+    later than recorded only wait for the duration.
+    """
+
+    network_errors = (ReplayedNetworkError,)
+
+    def __init__(self, cassette: Union[Cassette, str], speed: Union[str, float] = "original", repeat: bool = False):
+        """Initialize a new transport.
+
+        Args:
+            cassette: Cassette or path of a cassette file.
+            speed: "original" for recorded latencies, "asap" to respond immediately, or a
+                factor by which to accelerate, e.g. 10.0.
+            repeat: Keep serving the last recorded response of a request once all of its
+                recordings were used, instead of raising UnrecordedRequestError.
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        if isinstance(speed, str):
+            if speed not in SPEEDS:
+                raise ValueError(f"Unknown speed: {speed}. Use one of {sorted(SPEEDS)} or a number")
+            speed = SPEEDS[speed]
+        elif speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.repeat = repeat
+        self._queues: Dict[Tuple[str, str, Optional[bytes]], Deque[Interaction]] = defaultdict(deque)
+        self._last: Dict[Tuple[str, str, Optional[bytes]], Interaction] = {}
+        self._lock = threading.Lock()
+        self._origin: Optional[float] = None
+        self._first_offset = min((i.offset for i in self.cassette), default=0.0)
+        for interaction in self.cassette:
+            self._queues[interaction.key].append(interaction)
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded interactions not served yet."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def _next(self, key) -> Interaction:
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = self._last[key] = queue.popleft()
+                return interaction
+            if self.repeat and key in self._last:
+                return self._last[key]
+        raise UnrecordedRequestError(f"No recorded response for {key[0]} {key[1]}")
+
+    def _delay(self, interaction: Interaction) -> float:
+        if self.speed is None:
+            return 0.0
+        now = time.perf_counter()
+        with self._lock:
+            if self._origin is None:
+                self._origin = now
+            due = self._origin + (interaction.offset - self._first_offset) / self.speed
+        return max(0.0, due - now) + interaction.duration / self.speed
+
+    @staticmethod
+    def _response(interaction: Interaction, url: str) -> TransportResponse:
+        if interaction.error is not None:
+            raise ReplayedNetworkError(interaction.error)
+        return TransportResponse(interaction.status, interaction.content, dict(interaction.headers), url)
+
+    def request(self, method: str, url: str, headers=None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        interaction = self._next(_request_key(method, url, headers, params, json, data))
+        delay = self._delay(interaction)
+        if delay > 0:
+            time.sleep(delay)
+        return self._response(interaction, url)
+
+    async def request_async(self, method: str, url: str, headers=None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        interaction = self._next(_request_key(method, url, headers, params, json, data))
+        delay = self._delay(interaction)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._response(interaction, url)
+
+    def warmup(self, url: str, headers=None, connections: int = 1, timeout=None):
+        """Nothing to connect to; recorded interactions are left for the real requests."""
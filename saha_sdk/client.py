@@ -1,7 +1,16 @@
 # saharobotik/client.py
 
+import time
 import requests
-from typing import Optional, Dict, Any
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Iterator, Mapping, Tuple, Union
+from . import metrics as _metrics
+from . import tracing
+from .breaker import CircuitBreaker
+from .cassette import Cassette, RecordingTransport
+from .codecs import Codec, get_codec
+from .ratelimit import RateLimiter
 from .exceptions import (
     SahaRobotikAPIError,
     NotFoundError,
@@ -9,36 +18,144 @@ from .exceptions import (
     ServerError,
     BadRequestError
 )
-from .models import ResponseModel
+from .transport import RequestsTransport, Response, Transport
+
+
+def _credentials(api_key: Optional[str]) -> Tuple[Optional[str], Mapping[str, str]]:
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["x-api-key"] = api_key
+    return api_key, MappingProxyType(headers)
 
 
 class Robot:
-    """A client for the Saha Robotik API."""
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    """A client for the Saha Robotik API.
+
+    A client can be shared by many threads. The API key and the headers derived from it
+    are one immutable snapshot that set_api_key() replaces in a single assignment, so
+    every request is sent with either the old or the new key, never a mix, and requests
+    read it without locking. Connection reuse across threads is up to the transport:
+    ``PooledHTTPTransport`` and ``RequestsTransport(per_thread_sessions=True)`` are safe
+    to share.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        name: Optional[str] = None,
+        metrics: Optional[_metrics.MetricsRegistry] = None,
+        tracer: Optional[tracing.Tracer] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        warm: bool = False
+    ):
         """Initialize a new client.
 
         Args:
             base_url: The base URL of the Saha Robotik API.
             api_key: Your API key (optional). Can be set later via set_api_key().
+            transport: How requests are sent (optional). Defaults to ``requests.request``.
+            codec: JSON codec for request and response bodies (optional): "json", "orjson",
+                "msgspec" or a Codec. Defaults to the fastest one installed.
+            name: Label of the robot in metrics (optional). Defaults to the base URL.
+            metrics: Registry that records request metrics (optional). Defaults to the
+                shared ``metrics.REGISTRY``, which is disabled until ``metrics.enable()``.
+            tracer: Receives request lifecycle events (optional).
+            breaker: Circuit breaker that fails fast while the robot is unreachable (optional).
+            rate_limiter: Client-side request rate limits (optional). Can be shared by
+                clients of the same robot.
+            warm: Call warmup() before returning. A robot that cannot be reached is not an
+                error here; its first call reports it.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self._update_headers()
+        self._credentials = _credentials(api_key)
+        self.transport = transport if transport is not None else RequestsTransport()
+        self.codec = get_codec(codec)
+        self.name = name or self.base_url
+        self.metrics = metrics if metrics is not None else _metrics.REGISTRY
+        self.tracer = tracer
+        self.breaker = breaker
+        self.rate_limiter = rate_limiter
+        if breaker is not None:
+            breaker.bind(self._probe)
+        if warm:
+            try:
+                self.warmup()
+            except SahaRobotikAPIError:
+                pass
 
-    def _update_headers(self):
-        """Update request headers according to the current API key."""
-        self.headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            self.headers["x-api-key"] = self.api_key
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._credentials[0]
 
-    def set_api_key(self, api_key: str):
+    @api_key.setter
+    def api_key(self, api_key: Optional[str]):
+        self.set_api_key(api_key)
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Headers sent with every request, as a read-only snapshot."""
+        return self._credentials[1]
+
+    def set_api_key(self, api_key: Optional[str]):
         """Set or update the API key used for authentication.
 
+        Safe to call while other threads send requests; requests already sent keep the old key.
+
         Args:
             api_key: Your API key.
         """
-        self.api_key = api_key
-        self._update_headers()
+        self._credentials = _credentials(api_key)
+
+    def warmup(self, connections: int = 1, path: str = "/api/v1/status", timeout: Optional[float] = None) -> float:
+        """Resolve the robot's host name and open keep-alive connections before the first call.
+
+        Sends GET requests to a cheap endpoint, concurrently if connections > 1, so the first
+        real call does not pay for DNS resolution and the TCP (and TLS) handshake. Warmup
+        requests bypass metrics, tracing, rate limits and the circuit breaker. Calling it
+        periodically keeps idle connections from being closed; see ``keepalive.KeepAlive``.
+
+        Args:
+            connections: Keep-alive connections to open, if the transport pools them.
+            path: Endpoint to request.
+            timeout: Timeout of each request in seconds.
+
+        Returns:
+            Seconds taken.
+
+        Raises:
+            SahaRobotikAPIError: If the robot cannot be reached.
+        """
+        start = time.perf_counter()
+        transport = self.transport
+        try:
+            transport.warmup(self._full_url(path), headers=self._credentials[1], connections=connections, timeout=timeout)
+        except transport.network_errors as e:
+            raise SahaRobotikAPIError(f"Network Error: {str(e)}")
+        return time.perf_counter() - start
+
+    @contextmanager
+    def record(self, path: Optional[str] = None) -> Iterator[Cassette]:
+        """Record every request sent within the block, with its response and timing.
+
+        Replay the recording with ``cassette.ReplayTransport``.
+
+        Args:
+            path: File to save the cassette to when the block exits (optional).
+
+        Yields:
+            The cassette being recorded.
+        """
+        recorder = RecordingTransport(self.transport, Cassette(base_url=self.base_url))
+        self.transport = recorder
+        try:
+            yield recorder.cassette
+        finally:
+            self.transport = recorder.transport
+            if path is not None:
+                recorder.cassette.save(path)
 
     def _full_url(self, path: str) -> str:
         return f"{self.base_url}{path}"
@@ -65,7 +182,7 @@ class Robot:
         Returns:
             JSON response from the API.
         """
-        return self._request("POST", path, json=data)
+        return self._request("POST", path, **self.codec.request_kwargs(data))
 
     def patch(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send a PATCH request to the API.
@@ -77,35 +194,199 @@ class Robot:
         Returns:
             JSON response from the API.
         """
-        return self._request("PATCH", path, json=data)
+        return self._request("PATCH", path, **self.codec.request_kwargs(data))
 
-    def delete(self, path: str) -> Dict[str, Any]:
+    def delete(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send a DELETE request to the API.
 
         Args:
             path: The path of the API endpoint.
+            data: Request body (optional).
 
         Returns:
             JSON response from the API.
         """
-        return self._request("DELETE", path)
+        if data is None:
+            return self._request("DELETE", path)
+        return self._request("DELETE", path, **self.codec.request_kwargs(data))
+
+    def get_raw(self, path: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Send a GET request and return the undecoded response body.
+
+        Args:
+            path: The path of the API endpoint.
+            params: Query parameters.
 
-    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        Returns:
+            Raw response body.
+        """
+        return self._request("GET", path, self._handle_raw_response, params=params)
+
+    async def request_async(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a request from a coroutine.
+
+        Args:
+            method: HTTP method.
+            path: The path of the API endpoint.
+            params: Query parameters.
+            data: Request body.
+
+        Returns:
+            JSON response from the API.
+        """
+        kwargs = {"params": params} if params is not None else {}
+        if data is not None:
+            kwargs.update(self.codec.request_kwargs(data))
+        if self.metrics.enabled:
+            self._encode_json(kwargs)
+        url = self._full_url(path)
+        transport = self.transport
+        breaker = self.breaker
+        start = time.perf_counter()
+        span = self.tracer.start_request(self.name, method, path) if self.tracer is not None else None
+        response = error = None
+        try:
+            token = tracing._current_request.set(span)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(method, path)
+                if breaker is not None:
+                    breaker.before_request()
+                try:
+                    response = await transport.request_async(method, url, headers=self._credentials[1], **kwargs)
+                except transport.network_errors as e:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    raise SahaRobotikAPIError(f"Network Error: {str(e)}")
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release_trial()
+                    raise
+            finally:
+                tracing._current_request.reset(token)
+            if breaker is not None:
+                breaker.record_status(response.status_code)
+            self._trace_received(span, response)
+            result = self._handle_response(response)
+            self._trace_decoded(span)
+            return result
+        except Exception as e:
+            error = e
+            self._trace_error(span, e)
+            raise
+        finally:
+            if self.metrics.enabled:
+                self._observe(method, path, kwargs, start, response, error)
+
+    def _request(self, method: str, path: str, handler: Optional[Callable[[Response], Any]] = None, **kwargs) -> Any:
+        handler = handler or self._handle_response
+        if self.tracer is None and not self.metrics.enabled:
+            return handler(self._send(method, path, **kwargs))
+        if self.metrics.enabled:
+            self._encode_json(kwargs)
+        start = time.perf_counter()
+        span = self.tracer.start_request(self.name, method, path) if self.tracer is not None else None
+        response = error = None
+        try:
+            token = tracing._current_request.set(span)
+            try:
+                response = self._send(method, path, **kwargs)
+            finally:
+                tracing._current_request.reset(token)
+            self._trace_received(span, response)
+            result = handler(response)
+            self._trace_decoded(span)
+            return result
+        except Exception as e:
+            error = e
+            self._trace_error(span, e)
+            raise
+        finally:
+            if self.metrics.enabled:
+                self._observe(method, path, kwargs, start, response, error)
+
+    @staticmethod
+    def _trace_received(span: Optional[tracing.RequestSpan], response: Response):
+        if span is not None:
+            span.received = time.perf_counter()
+            span.status = response.status_code
+            span.tracer.emit(tracing.AFTER_RECEIVE, span)
+
+    @staticmethod
+    def _trace_decoded(span: Optional[tracing.RequestSpan]):
+        if span is not None:
+            span.decoded = span.end = time.perf_counter()
+            span.tracer.emit(tracing.AFTER_DECODE, span)
+
+    @staticmethod
+    def _trace_error(span: Optional[tracing.RequestSpan], error: Exception):
+        if span is not None:
+            span.end = time.perf_counter()
+            span.error = error
+            span.tracer.emit(tracing.ON_ERROR, span)
+
+    def _encode_json(self, kwargs: Dict[str, Any]):
+        """Encode a ``json=`` body once, so its size can be measured on the bytes that are sent."""
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+
+    def _observe(self, method: str, path: str, kwargs: Dict[str, Any], start: float, response: Optional[Response], error: Optional[Exception]):
+        duration = time.perf_counter() - start
+        body = kwargs.get("data")
+        content = getattr(response, "content", None)
+        self.metrics.observe(
+            self.name, method, path, duration,
+            status=getattr(response, "status_code", None),
+            bytes_out=len(body) if isinstance(body, (bytes, bytearray, str)) else 0,
+            bytes_in=len(content) if isinstance(content, (bytes, bytearray)) else 0,
+            exception=error
+        )
+
+    def _send(self, method: str, path: str, **kwargs) -> Response:
         url = self._full_url(path)
+        transport = self.transport
+        breaker = self.breaker
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, path)
+        if breaker is None:
+            try:
+                return transport.request(method, url, headers=self._credentials[1], **kwargs)
+            except transport.network_errors as e:
+                raise SahaRobotikAPIError(f"Network Error: {str(e)}")
+        breaker.before_request()
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
-        except requests.RequestException as e:
+            response = transport.request(method, url, headers=self._credentials[1], **kwargs)
+        except transport.network_errors as e:
+            breaker.record_failure()
             raise SahaRobotikAPIError(f"Network Error: {str(e)}")
+        except BaseException:
+            breaker.release_trial()
+            raise
+        breaker.record_status(response.status_code)
+        return response
 
-        return self._handle_response(response)
+    def _probe(self) -> bool:
+        transport = self.transport
+        try:
+            response = transport.request("GET", self._full_url(self.breaker.probe_path), headers=self._credentials[1], timeout=self.breaker.probe_timeout)
+        except transport.network_errors:
+            return False
+        return response.status_code not in self.breaker.failure_statuses
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _handle_response(self, response: Response) -> Dict[str, Any]:
         if 200 <= response.status_code < 300:
             try:
-                return response.json()
+                return self.codec.decode(response)
             except ValueError:
                 return {"raw": response.text}
+        self._raise_error(response)
+
+    def _handle_raw_response(self, response: Response) -> bytes:
+        if 200 <= response.status_code < 300:
+            return response.content
+        self._raise_error(response)
 
+    def _raise_error(self, response: Response):
         try:
             error_data = response.json()
             error_msg = error_data.get("error", {}).get("message", response.text)
@@ -0,0 +1,133 @@
+import json
+from typing import Any, Dict, Optional, Union
+
+from ._compat import msgspec, orjson, require_msgspec, require_orjson
+
+
+class Codec:
+    """Encodes request bodies and decodes response bodies."""
+
+    name = ""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value as JSON."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON. Raises ValueError if data is not valid JSON."""
+        raise NotImplementedError
+
+    def request_kwargs(self, data: Any) -> Dict[str, Any]:
+        """Keyword arguments that send data as the JSON body of a request."""
+        return {"data": self.dumps(data) if data is not None else None}
+
+    def decode(self, response) -> Any:
+        """Decode the body of a response. Raises ValueError if it is not valid JSON."""
+        return self.loads(response.content)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+
+class JSONCodec(Codec):
+    """The standard library json module.
+
+    Bodies are left to the transport (``json=`` and ``response.json()``), exactly as
+    requests handles them.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def request_kwargs(self, data: Any) -> Dict[str, Any]:
+        return {"json": data}
+
+    def decode(self, response) -> Any:
+        return response.json()
+
+
+class OrjsonCodec(Codec):
+    """orjson, typically several times faster than json in both directions."""
+
+    name = "orjson"
+
+    def __init__(self):
+        require_orjson("OrjsonCodec")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """msgspec with a reusable encoder and decoder."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        require_msgspec("MsgspecCodec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def available_codecs() -> Dict[str, Codec]:
+    """
+    Instances of every codec whose library is installed.
+
+    Returns:
+        Dict[str, Codec]: Codecs keyed by name
+    """
+    result: Dict[str, Codec] = {"json": JSONCodec()}
+    if orjson is not None:
+        result["orjson"] = OrjsonCodec()
+    if msgspec is not None:
+        result["msgspec"] = MsgspecCodec()
+    return result
+
+
+def get_codec(codec: Optional[Union[str, Codec]] = None) -> Codec:
+    """
+    Resolve a codec.
+
+    Args:
+        codec (Optional[Union[str, Codec]]): A Codec instance, a codec name ("json", "orjson",
+            "msgspec"), or None / "auto" for the fastest installed one: orjson, then msgspec,
+            then json.
+
+    Returns:
+        Codec: The codec
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec is None or codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JSONCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec: {codec}")
+    return CODECS[codec]()
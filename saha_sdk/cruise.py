@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import RobotRouteModel, CruiseModel, CruiseRequestModel, CruiseControlRequestModel, ResponseModel
 from typing import List
 
+@traced
 def get_default_cruise_route(client: Robot) -> RobotRouteModel:
     """
     Get the default cruise route for the robot.
@@ -15,6 +17,7 @@ def get_default_cruise_route(client: Robot) -> RobotRouteModel:
     response = client.get("/api/v1/config/default-route")
     return RobotRouteModel(**response)
 
+@traced
 def set_default_cruise_route(client: Robot, route_model: RobotRouteModel) -> ResponseModel:
     """
     Set the default cruise route for the robot.
@@ -29,6 +32,7 @@ def set_default_cruise_route(client: Robot, route_model: RobotRouteModel) -> Res
     response = client.post("/api/v1/config/default-route", data=route_model.dict())
     return ResponseModel(**response)
 
+@traced
 def get_all_cruises(client: Robot) -> List[CruiseModel]:
     """
     Get the list of all cruises for the robot.
@@ -42,6 +46,7 @@ def get_all_cruises(client: Robot) -> List[CruiseModel]:
     response = client.get("/api/v1/cruises")
     return [CruiseModel(**item) for item in response]
 
+@traced
 def add_cruise(client: Robot, cruise_request: CruiseRequestModel) -> ResponseModel:
     """
     Add a new cruise to the robot.
@@ -56,6 +61,7 @@ def add_cruise(client: Robot, cruise_request: CruiseRequestModel) -> ResponseMod
     response = client.post("/api/v1/cruises", data=cruise_request.dict())
     return ResponseModel(**response)
 
+@traced
 def start_cruise(client: Robot, cruise_control_request: CruiseControlRequestModel) -> ResponseModel:
     """
     Start a cruise on the robot.
@@ -70,6 +76,7 @@ def start_cruise(client: Robot, cruise_control_request: CruiseControlRequestMode
     response = client.post("/api/v1/cruises/control", data=cruise_control_request.dict())
     return ResponseModel(**response)
 
+@traced
 def get_cruises_by_site(client: Robot, site: str) -> List[CruiseModel]:
     """
     Get the list of cruises filtered by site.
@@ -84,6 +91,7 @@ def get_cruises_by_site(client: Robot, site: str) -> List[CruiseModel]:
     response = client.get(f"/api/v1/cruises/{site}")
     return [CruiseModel(**item) for item in response]
 
+@traced
 def get_cruises_by_site_and_floor(client: Robot, site: str, floor: str) -> List[CruiseModel]:
     """
     Get the list of cruises filtered by site and floor.
@@ -99,6 +107,7 @@ def get_cruises_by_site_and_floor(client: Robot, site: str, floor: str) -> List[
     response = client.get(f"/api/v1/cruises/{site}/{floor}")
     return [CruiseModel(**item) for item in response]
 
+@traced
 def get_cruise(client: Robot, site: str, floor: str, name: str) -> CruiseModel:
     """
     Get a specific cruise by its site, floor, and name.
@@ -115,6 +124,7 @@ def get_cruise(client: Robot, site: str, floor: str, name: str) -> CruiseModel:
     response = client.get(f"/api/v1/cruises/{site}/{floor}/{name}")
     return CruiseModel(**response)
 
+@traced
 def update_cruise(client: Robot, site: str, floor: str, name: str, cruise_request: CruiseRequestModel) -> ResponseModel:
     """
     Update a specific cruise by name.
@@ -132,6 +142,7 @@ def update_cruise(client: Robot, site: str, floor: str, name: str, cruise_reques
     response = client.patch(f"/api/v1/cruises/{site}/{floor}/{name}", data=cruise_request.dict())
     return ResponseModel(**response)
 
+@traced
 def delete_cruise(client: Robot, site: str, floor: str, name: str) -> ResponseModel:
     """
     Delete a specific cruise by name.
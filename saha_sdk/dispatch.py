@@ -0,0 +1,373 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import navigation, status, targets, task
+from .fleet import RobotFleet
+from .models import ResponseModel, RobotState, RobotStatus, TaskModel, TaskRequestModel
+from .planning import INF, CostFunction, Point, euclidean, greedy_assignment, solve_assignment, target_positions
+
+
+@dataclass
+class RobotSnapshot:
+    """Last known position, battery and state of a fleet robot."""
+    name: str
+    x: float = 0.0
+    y: float = 0.0
+    battery_percent: float = 0.0
+    current_state: str = ""
+    is_charging: bool = False
+    is_estopped: bool = False
+    out_of_service: bool = False
+    updated_at: float = 0.0
+    error: Optional[Exception] = None
+    queued: int = 0
+    queued_cost: float = 0.0
+    end: Optional[Point] = None
+
+    @property
+    def position(self) -> Point:
+        return (self.x, self.y)
+
+    @property
+    def end_position(self) -> Point:
+        """Where the robot will be once its queued tasks are done."""
+        return self.end if self.end is not None else self.position
+
+
+@dataclass
+class Assignment:
+    """A task assigned to a robot, with the result of issuing it."""
+    robot: str
+    task: TaskRequestModel
+    cost: float
+    response: Optional[ResponseModel] = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class FailedTask:
+    """A queued task that was given up on after max_attempts dispatch rounds."""
+    task: TaskRequestModel
+    attempts: int
+    error: Optional[Exception] = None
+
+
+class _Pending:
+    __slots__ = ("task", "attempts")
+
+    def __init__(self, task: TaskRequestModel):
+        self.task = task
+        self.attempts = 0
+
+
+class TaskDispatcher:
+    """Assigns queued tasks to the fleet robot with the lowest travel cost."""
+
+    def __init__(
+        self,
+        fleet: RobotFleet,
+        cost_fn: CostFunction = euclidean,
+        method: str = "hungarian",
+        batch_size: int = 64,
+        max_tasks_per_robot: int = 4,
+        min_battery: float = 20.0,
+        available_states: Optional[Iterable[str]] = ("READY", "READY_FOR_MISSION"),
+        snapshot_max_age: float = 2.0,
+        targets_max_age: float = 60.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize a new dispatcher.
+
+        Args:
+            fleet: Robots tasks can be assigned to.
+            cost_fn: Travel cost between two (x, y) points. Defaults to straight-line distance;
+                pass a grid path cost function for maps with obstacles.
+            method: "hungarian" for optimal batch assignment or "greedy" for faster approximate assignment.
+            batch_size: Maximum number of queued tasks assigned per dispatch() call.
+            max_tasks_per_robot: Maximum number of tasks a robot receives per batch.
+            min_battery: Robots below this battery percentage are not assigned new tasks.
+            available_states: Robot states that accept new tasks. None accepts any state.
+            snapshot_max_age: Snapshots older than this many seconds are refreshed before dispatching.
+            targets_max_age: Target coordinates older than this many seconds are refreshed before dispatching.
+            max_attempts: Rounds in which a task may fail to be created, or find no robot that
+                knows its target, before it is moved to ``failed``.
+            clock: Monotonic time source in seconds.
+        """
+        if method not in ("hungarian", "greedy"):
+            raise ValueError(f"Unknown assignment method: {method}")
+        self.fleet = fleet
+        self.cost_fn = cost_fn
+        self.method = method
+        self.batch_size = batch_size
+        self.max_tasks_per_robot = max_tasks_per_robot
+        self.min_battery = min_battery
+        self.available_states = None if available_states is None else frozenset(available_states)
+        self.snapshot_max_age = snapshot_max_age
+        self.targets_max_age = targets_max_age
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.snapshots: Dict[str, RobotSnapshot] = {}
+        self.positions: Dict[str, Dict[str, Point]] = {}
+        self.targets_updated: Dict[str, float] = {}
+        self.failed: List[FailedTask] = []
+        self._queue: Deque[_Pending] = deque()
+        self._lock = threading.Lock()
+
+    # Queue
+
+    def submit(self, task_request: TaskRequestModel):
+        """Queue a task for assignment.
+
+        Args:
+            task_request: Task to assign.
+        """
+        with self._lock:
+            self._queue.append(_Pending(task_request))
+
+    def submit_many(self, task_requests: Iterable[TaskRequestModel]):
+        """Queue several tasks for assignment.
+
+        Args:
+            task_requests: Tasks to assign, in order.
+        """
+        with self._lock:
+            self._queue.extend(_Pending(t) for t in task_requests)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued tasks."""
+        return len(self._queue)
+
+    # Snapshots
+
+    def update_snapshot(
+        self,
+        name: str,
+        robot_status: Optional[RobotStatus] = None,
+        robot_state: Optional[RobotState] = None,
+        robot_tasks: Optional[List[TaskModel]] = None
+    ):
+        """Update the snapshot of a robot from status, position and/or task list data.
+
+        Useful when another component already polls or streams these endpoints.
+
+        Args:
+            name: Name of the robot within the fleet.
+            robot_status: Latest status of the robot.
+            robot_state: Latest position of the robot.
+            robot_tasks: Latest task list of the robot. Its uncompleted tasks replace the
+                tasks this dispatcher counted as queued on the robot.
+        """
+        snapshot = self.snapshots.get(name) or RobotSnapshot(name=name)
+        if robot_status is not None:
+            snapshot.battery_percent = robot_status.battery_percent
+            snapshot.current_state = robot_status.current_state
+            snapshot.is_charging = robot_status.is_charging
+            snapshot.is_estopped = robot_status.is_estopped
+            snapshot.out_of_service = robot_status.out_of_service
+        if robot_state is not None:
+            snapshot.x = robot_state.position.x
+            snapshot.y = robot_state.position.y
+        if robot_tasks is not None:
+            queued = sorted((t for t in robot_tasks if not t.completed), key=lambda t: t.create_time)
+            point, cost = snapshot.position, 0.0
+            for queued_task in queued:
+                goal = (queued_task.target.px, queued_task.target.py)
+                cost += self.cost_fn(point, goal)
+                point = goal
+            snapshot.queued = len(queued)
+            snapshot.queued_cost = cost
+            snapshot.end = point if queued else None
+        snapshot.updated_at = self.clock()
+        snapshot.error = None
+        self.snapshots[name] = snapshot
+
+    def refresh(self) -> Dict[str, RobotSnapshot]:
+        """Fetch status, position and task list of every robot concurrently.
+
+        Returns:
+            Updated snapshots keyed by robot name.
+        """
+        futures = {
+            name: (self.fleet.submit(status.get_robot_status, robot),
+                   self.fleet.submit(navigation.get_current_position, robot),
+                   self.fleet.submit(task.get_all_tasks, robot))
+            for name, robot in self.fleet.items()
+        }
+        for name, (status_future, position_future, tasks_future) in futures.items():
+            try:
+                self.update_snapshot(name, status_future.result(), position_future.result(), tasks_future.result())
+            except Exception as e:
+                snapshot = self.snapshots.setdefault(name, RobotSnapshot(name=name))
+                snapshot.error = e
+        return self.snapshots
+
+    def refresh_targets(self, names: Optional[Iterable[str]] = None):
+        """Fetch target coordinates of the robots concurrently.
+
+        Args:
+            names: Robots to refresh. Defaults to the whole fleet.
+        """
+        results = self.fleet.map(targets.get_all_targets, names=names)
+        now = self.clock()
+        for name, result in results.items():
+            if not isinstance(result, Exception):
+                self.positions[name] = target_positions(result)
+                self.targets_updated[name] = now
+
+    def is_available(self, snapshot: RobotSnapshot) -> bool:
+        """Check whether a robot may receive new tasks."""
+        return (
+            snapshot.error is None
+            and not snapshot.is_estopped
+            and not snapshot.out_of_service
+            and snapshot.battery_percent >= self.min_battery
+            and (self.available_states is None or snapshot.current_state in self.available_states)
+        )
+
+    # Assignment
+
+    def plan(self, task_requests: Sequence[TaskRequestModel]) -> Tuple[List[Assignment], List[TaskRequestModel]]:
+        """Assign tasks to available robots using the current snapshots, without issuing them.
+
+        Tasks are assigned in rounds. Each round gives every robot at most one task, solving the
+        robot x task cost matrix, after which the robot's position moves to the assigned target
+        and its accumulated cost grows. This spreads load across robots while still favouring
+        the nearest one. Robots start from the end of the tasks already queued on them, with
+        their travel cost as accumulated cost.
+
+        Args:
+            task_requests: Tasks to assign.
+
+        Returns:
+            Assignments in per-robot execution order, and the tasks that could not be assigned.
+        """
+        indexed, remaining = self._plan(task_requests)
+        return [assignment for _, assignment in indexed], [task_requests[t] for t in remaining]
+
+    def _plan(self, task_requests: Sequence[TaskRequestModel]) -> Tuple[List[Tuple[int, Assignment]], List[int]]:
+        """plan() by position in task_requests, so equal or identical requests stay apart."""
+        robots = [s for s in self.snapshots.values() if s.name in self.fleet and self.is_available(s)]
+        solve = solve_assignment if self.method == "hungarian" else greedy_assignment
+        positions = [s.end_position for s in robots]
+        accumulated = [s.queued_cost for s in robots]
+        remaining = list(range(len(task_requests)))
+        assignments: List[Tuple[int, Assignment]] = []
+
+        for _ in range(self.max_tasks_per_robot):
+            if not remaining or not robots:
+                break
+            matrix = []
+            for r, snapshot in enumerate(robots):
+                known = self.positions.get(snapshot.name, {})
+                row = []
+                for t in remaining:
+                    goal = known.get(task_requests[t].target_uid)
+                    row.append(INF if goal is None else accumulated[r] + self.cost_fn(positions[r], goal))
+                matrix.append(row)
+            pairs = solve(matrix)
+            if not pairs:
+                break
+            assigned = set()
+            for r, col in pairs:
+                t = remaining[col]
+                name = robots[r].name
+                leg = matrix[r][col] - accumulated[r]
+                accumulated[r] += leg
+                positions[r] = self.positions[name][task_requests[t].target_uid]
+                assignments.append((t, Assignment(robot=name, task=task_requests[t], cost=leg)))
+                assigned.add(col)
+            remaining = [t for i, t in enumerate(remaining) if i not in assigned]
+
+        return assignments, remaining
+
+    def dispatch(self) -> List[Assignment]:
+        """Assign the next batch of queued tasks and issue them with ``task.create_task``.
+
+        Robots are called concurrently; tasks for the same robot are created in order. Tasks
+        that cannot be assigned, e.g. because no robot is available, stay at the head of the
+        queue. Tasks whose target no available robot knows, and tasks whose creation fails,
+        are retried in later rounds and moved to ``failed`` after max_attempts rounds.
+
+        Returns:
+            Assignments of this batch, with the response or error of each create_task call.
+        """
+        with self._lock:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+        if not batch:
+            return []
+
+        now = self.clock()
+        if len(self.snapshots) < len(self.fleet) or any(
+            now - s.updated_at > self.snapshot_max_age for s in self.snapshots.values()
+        ):
+            self.refresh()
+        stale = [
+            name for name in self.fleet
+            if name not in self.positions or now - self.targets_updated.get(name, now) > self.targets_max_age
+        ]
+        if stale:
+            self.refresh_targets(stale)
+
+        # Bookkeeping is by position in the batch: the same request may be queued twice.
+        indexed, unassigned = self._plan([p.task for p in batch])
+        assignments = [assignment for _, assignment in indexed]
+
+        per_robot: Dict[str, List[Assignment]] = {}
+        for assignment in assignments:
+            per_robot.setdefault(assignment.robot, []).append(assignment)
+        futures = [self.fleet.submit(self._issue, name, items) for name, items in per_robot.items()]
+        for future in futures:
+            future.result()
+
+        retry = set(unassigned)
+        unroutable = [k for k in unassigned if not self._routable(batch[k].task)]
+        errors: Dict[int, Exception] = {}
+        for k, assignment in indexed:
+            if assignment.error is None:
+                self._record_issued(assignment)
+            else:
+                errors[k] = assignment.error
+                self.snapshots[assignment.robot].error = assignment.error
+        for k in unroutable + list(errors):
+            entry = batch[k]
+            entry.attempts += 1
+            if entry.attempts >= self.max_attempts:
+                self.failed.append(FailedTask(entry.task, entry.attempts, errors.get(k)))
+                retry.discard(k)
+            else:
+                retry.add(k)
+        if unroutable:
+            # A target unknown to every robot may have been added since the last refresh.
+            self.targets_updated = {name: -INF for name in self.fleet}
+        requeue = [p for k, p in enumerate(batch) if k in retry]
+        if requeue:
+            with self._lock:
+                self._queue.extendleft(reversed(requeue))
+        return assignments
+
+    def _routable(self, task_request: TaskRequestModel) -> bool:
+        """Whether an available robot knows the target of a task, or no robot is available to tell."""
+        known = [
+            self.positions.get(s.name, {}) for s in self.snapshots.values()
+            if s.name in self.fleet and self.is_available(s)
+        ]
+        return not known or any(task_request.target_uid in positions for positions in known)
+
+    def _record_issued(self, assignment: Assignment):
+        snapshot = self.snapshots[assignment.robot]
+        snapshot.queued += 1
+        snapshot.queued_cost += assignment.cost
+        snapshot.end = self.positions[assignment.robot][assignment.task.target_uid]
+
+    def _issue(self, name: str, assignments: List[Assignment]):
+        robot = self.fleet[name]
+        for assignment in assignments:
+            try:
+                assignment.response = task.create_task(robot, assignment.task)
+            except Exception as e:
+                assignment.error = e
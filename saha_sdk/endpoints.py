@@ -0,0 +1,183 @@
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# Path templates of every endpoint used by the SDK. Parameters are written as {name}.
+TEMPLATES: Tuple[str, ...] = (
+    "/api/v1/config/default-route",
+    "/api/v1/cruises",
+    "/api/v1/cruises/control",
+    "/api/v1/cruises/{site}",
+    "/api/v1/cruises/{site}/{floor}",
+    "/api/v1/cruises/{site}/{floor}/{name}",
+    "/api/v1/layers",
+    "/api/v1/layers/{site}",
+    "/api/v1/layers/{site}/{floor}",
+    "/api/v1/layers/{site}/{floor}/{uid}",
+    "/api/v1/mapping",
+    "/api/v1/mapping/cancel",
+    "/api/v1/mapping/change",
+    "/api/v1/mapping/default-map",
+    "/api/v1/mapping/map",
+    "/api/v1/mapping/remap",
+    "/api/v1/mapping/save",
+    "/api/v1/mapping/start",
+    "/api/v1/mapping/{site}/{floor}",
+    "/api/v1/mode",
+    "/api/v1/mode/{mode}",
+    "/api/v1/navigation/goal/pose",
+    "/api/v1/navigation/goal/target",
+    "/api/v1/navigation/localization",
+    "/api/v1/navigation/path",
+    "/api/v1/navigation/path/stream",
+    "/api/v1/navigation/position",
+    "/api/v1/navigation/position/stream",
+    "/api/v1/navigation/stop",
+    "/api/v1/navigation/vel",
+    "/api/v1/navigation/vel/safe",
+    "/api/v1/profile",
+    "/api/v1/profile/behavior",
+    "/api/v1/profile/environment",
+    "/api/v1/profile/speed",
+    "/api/v1/status",
+    "/api/v1/status/hardware",
+    "/api/v1/status/info",
+    "/api/v1/targets",
+    "/api/v1/targets/{site}",
+    "/api/v1/targets/{site}/{floor}",
+    "/api/v1/targets/{site}/{floor}/{name}",
+    "/api/v1/tasks",
+    "/api/v1/tasks/clear",
+    "/api/v1/tasks/pause",
+    "/api/v1/tasks/resume",
+    "/api/v1/tasks/{task_uid}",
+    "/api/v1/ui/screen/pixel",
+    "/api/v1/ui/speech",
+)
+
+UNMATCHED = "{unmatched}"
+
+
+class _Node:
+    __slots__ = ("static", "param", "param_node", "template")
+
+    def __init__(self):
+        self.static: Dict[str, "_Node"] = {}
+        self.param: Optional[str] = None
+        self.param_node: Optional["_Node"] = None
+        self.template: Optional[str] = None
+
+
+class EndpointMatcher:
+    """Maps concrete request paths to their path templates.
+
+    Templates are stored in a segment trie where literal segments take precedence over
+    parameters, so "/api/v1/tasks/clear" is not mistaken for "/api/v1/tasks/{task_uid}".
+    Results are cached per path.
+    """
+
+    def __init__(self, templates: Iterable[str] = TEMPLATES, cache_size: int = 4096):
+        """Initialize a new matcher.
+
+        Args:
+            templates: Path templates with {name} parameters.
+            cache_size: Maximum number of cached paths.
+        """
+        self.root = _Node()
+        self.cache_size = cache_size
+        self._cache: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+        for template in templates:
+            self.add(template)
+
+    @staticmethod
+    def _segments(path: str):
+        return [s for s in path.split("?", 1)[0].split("/") if s]
+
+    def add(self, template: str):
+        """Register a path template."""
+        node = self.root
+        for segment in self._segments(template):
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.param_node is None:
+                    node.param, node.param_node = name, _Node()
+                node = node.param_node
+            else:
+                node = node.static.setdefault(segment, _Node())
+        node.template = template
+        with self._lock:
+            self._cache.clear()
+
+    def _walk(self, node: _Node, segments, index: int, params: Dict[str, str]) -> Optional[str]:
+        if index == len(segments):
+            return node.template
+        child = node.static.get(segments[index])
+        if child is not None:
+            template = self._walk(child, segments, index + 1, params)
+            if template is not None:
+                return template
+        if node.param_node is not None:
+            params[node.param] = segments[index]
+            template = self._walk(node.param_node, segments, index + 1, params)
+            if template is not None:
+                return template
+            del params[node.param]
+        return None
+
+    def match(self, path: str) -> Tuple[str, Dict[str, str]]:
+        """Template and parameters of a path.
+
+        Args:
+            path: Request path, optionally with a query string.
+
+        Returns:
+            The template and its parameter values, or (UNMATCHED, {}) for unknown paths.
+        """
+        template, params = self._lookup(path)
+        return template, dict(params)
+
+    def template(self, path: str) -> str:
+        """Template of a path, or UNMATCHED."""
+        return self._lookup(path)[0]
+
+    def _lookup(self, path: str) -> Tuple[str, Dict[str, str]]:
+        cached = self._cache.get(path)
+        if cached is not None:
+            return cached
+        params: Dict[str, str] = {}
+        template = self._walk(self.root, self._segments(path), 0, params)
+        result = (template, params) if template is not None else (UNMATCHED, {})
+        with self._lock:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[path] = result
+        return result
+
+
+_default = EndpointMatcher()
+
+
+def match(path: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Template and parameters of a path, using the SDK's endpoint templates.
+
+    Args:
+        path (str): Request path, e.g. "/api/v1/targets/site/floor/t1".
+
+    Returns:
+        Tuple[str, Dict[str, str]]: e.g. ("/api/v1/targets/{site}/{floor}/{name}", {"site": "site", ...})
+    """
+    return _default.match(path)
+
+
+def template_for(path: str) -> str:
+    """
+    Template of a path, using the SDK's endpoint templates.
+
+    Args:
+        path (str): Request path.
+
+    Returns:
+        str: The template, or "{unmatched}" for paths outside the SDK's API
+    """
+    return _default.template(path)
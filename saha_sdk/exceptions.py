@@ -65,4 +65,19 @@ class CreatedSuccess(SahaRobotikAPIError):
 
 class ServerError(SahaRobotikAPIError):
     """Server error"""
-    pass
\ No newline at end of file
+    pass
+
+class CircuitOpenError(SahaRobotikAPIError):
+    """Raised without sending a request while the robot's circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: float = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+class RateLimitedError(SahaRobotikAPIError):
+    """Raised without sending a request when a client-side rate limit rejects it."""
+
+    def __init__(self, message: str, retry_after: float = None, endpoint_class: str = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+        self.endpoint_class = endpoint_class
@@ -0,0 +1,144 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .client import Robot
+
+
+class RobotFleet:
+    """A named collection of Robot clients that can be queried concurrently."""
+
+    def __init__(
+        self,
+        robots: Optional[Union[Mapping[str, Robot], Iterable[Tuple[str, Robot]]]] = None,
+        max_workers: int = 32
+    ):
+        """Initialize a new fleet.
+
+        Args:
+            robots: Robot clients keyed by name, or an iterable of (name, Robot) pairs.
+            max_workers: Maximum number of requests in flight across the whole fleet.
+        """
+        self.robots: Dict[str, Robot] = dict(robots or {})
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, robot: Robot):
+        """Add a robot to the fleet, replacing any robot with the same name.
+
+        Args:
+            name: Name of the robot within the fleet.
+            robot: API client of the robot.
+        """
+        self.robots[name] = robot
+
+    def remove(self, name: str) -> Robot:
+        """Remove a robot from the fleet.
+
+        Args:
+            name: Name of the robot within the fleet.
+
+        Returns:
+            The removed API client.
+        """
+        return self.robots.pop(name)
+
+    def __getitem__(self, name: str) -> Robot:
+        return self.robots[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.robots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.robots))
+
+    def __len__(self) -> int:
+        return len(self.robots)
+
+    def items(self):
+        return list(self.robots.items())
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by all concurrent fleet operations."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="saha-fleet"
+                    )
+        return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Schedule a call on the fleet's thread pool.
+
+        Args:
+            fn: Callable to run.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Future of the call.
+        """
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        names: Optional[Iterable[str]] = None,
+        return_exceptions: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Call ``fn(robot, *args, **kwargs)`` for every robot concurrently.
+
+        Args:
+            fn: Function taking a Robot as its first argument, e.g. ``status.get_robot_status``.
+            *args: Additional positional arguments for fn.
+            names: Restrict the call to these robots. Defaults to the whole fleet.
+            return_exceptions: If True, exceptions are returned in place of results.
+                Otherwise the first exception is raised once all calls have finished.
+            **kwargs: Additional keyword arguments for fn.
+
+        Returns:
+            Results keyed by robot name.
+        """
+        selected = list(self.robots) if names is None else list(names)
+        futures = {name: self.submit(fn, self.robots[name], *args, **kwargs) for name in selected}
+        results: Dict[str, Any] = {}
+        first_error: Optional[BaseException] = None
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+                results[name] = e
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return results
+
+    def warmup(self, connections: int = 1) -> Dict[str, Any]:
+        """Call ``Robot.warmup`` for every robot concurrently.
+
+        Args:
+            connections: Keep-alive connections to open per robot.
+
+        Returns:
+            Seconds taken, or the exception raised, keyed by robot name.
+        """
+        return self.map(Robot.warmup, connections=connections)
+
+    def close(self):
+        """Shut down the fleet's thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "RobotFleet":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
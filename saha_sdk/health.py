@@ -0,0 +1,236 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from . import snapshot
+from ._compat import numpy as np, require_numpy
+from .fleet import RobotFleet
+from .models import RobotHardwareStatus
+
+SENSOR_KINDS = ("lidar", "camera")
+CONNECTIVITY = ("offline", "wifi", "mobile", "both")
+IGNORED_ERRORS = ("", "No error")
+
+
+@dataclass
+class FleetHealth:
+    """Aggregated hardware health of a fleet."""
+    robots: int = 0
+    sensors: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    failing: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    connectivity: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    top_errors: List[Tuple[str, int]] = field(default_factory=list)
+
+
+class _Entry:
+    """Hardware status of one robot encoded as small integer arrays."""
+    __slots__ = ("hardware", "site", "kind", "working", "errors", "connectivity")
+
+    def __init__(self, hardware, site, kind, working, errors, connectivity):
+        self.hardware = hardware
+        self.site = site
+        self.kind = kind
+        self.working = working
+        self.errors = errors
+        self.connectivity = connectivity
+
+
+class HardwareHealthAggregator:
+    """Fleet-wide hardware health counts grouped by site.
+
+    Every robot's lidars, cameras and internet status are encoded once into integer columns
+    (sensor kind, working flag, interned error string, connectivity class). Counts per site
+    are computed with bincount over all robots in one pass; when only a few robots change
+    between collections, their old contribution is subtracted and the new one added instead.
+    """
+
+    def __init__(self, fleet: Optional[RobotFleet] = None, ignored_errors: Iterable[str] = IGNORED_ERRORS, rebuild_ratio: float = 0.25):
+        """Initialize a new aggregator.
+
+        Args:
+            fleet: Fleet used by collect() to fetch hardware statuses.
+            ignored_errors: Error strings that do not count as errors.
+            rebuild_ratio: Fraction of changed robots above which counts are recomputed
+                from scratch rather than updated per robot.
+        """
+        require_numpy("HardwareHealthAggregator")
+        self.fleet = fleet
+        self.ignored_errors = set(ignored_errors)
+        self.rebuild_ratio = rebuild_ratio
+        self.sites: List[str] = []
+        self.errors: List[str] = []
+        self._site_codes: Dict[str, int] = {}
+        self._error_codes: Dict[str, int] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._robot_sites: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._sensors = np.zeros((0, len(SENSOR_KINDS)), dtype=np.int64)
+        self._failing = np.zeros((0, len(SENSOR_KINDS)), dtype=np.int64)
+        self._connectivity = np.zeros((0, len(CONNECTIVITY)), dtype=np.int64)
+        self._error_counts = np.zeros(0, dtype=np.int64)
+
+    # Encoding
+
+    @staticmethod
+    def _intern(value: str, names: List[str], codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(names)
+            names.append(value)
+        return code
+
+    def _error_code(self, error: str) -> int:
+        if error in self.ignored_errors:
+            return -1
+        return self._intern(error, self.errors, self._error_codes)
+
+    def _encode(self, hardware: RobotHardwareStatus, site: str) -> _Entry:
+        sensors = [(0, s) for s in hardware.lidars] + [(1, s) for s in hardware.cameras]
+        internet = hardware.internet_status
+        errors = [self._error_code(s.error) for _, s in sensors] + [self._error_code(internet.error)]
+        connectivity = int(internet.wifi_connected) + 2 * int(internet.mobile_connected)
+        return _Entry(
+            hardware=hardware,
+            site=self._intern(site, self.sites, self._site_codes),
+            kind=np.array([k for k, _ in sensors], dtype=np.int64),
+            working=np.array([s.is_working for _, s in sensors], dtype=bool),
+            errors=np.array([e for e in errors if e >= 0], dtype=np.int64),
+            connectivity=connectivity
+        )
+
+    def _grow(self):
+        sites, errors = len(self.sites), len(self.errors)
+        if len(self._sensors) < sites:
+            pad = ((0, sites - len(self._sensors)), (0, 0))
+            self._sensors = np.pad(self._sensors, pad)
+            self._failing = np.pad(self._failing, pad)
+            self._connectivity = np.pad(self._connectivity, pad)
+        if len(self._error_counts) < errors:
+            self._error_counts = np.pad(self._error_counts, (0, errors - len(self._error_counts)))
+
+    # Updating
+
+    def _apply(self, entry: _Entry, sign: int):
+        kinds = len(SENSOR_KINDS)
+        self._sensors[entry.site] += sign * np.bincount(entry.kind, minlength=kinds)
+        self._failing[entry.site] += sign * np.bincount(entry.kind[~entry.working], minlength=kinds)
+        self._connectivity[entry.site, entry.connectivity] += sign
+        self._error_counts += sign * np.bincount(entry.errors, minlength=len(self._error_counts))
+
+    def _rebuild(self):
+        entries = list(self._entries.values())
+        sites, kinds = len(self.sites), len(SENSOR_KINDS)
+        robot_sites = np.array([e.site for e in entries], dtype=np.int64)
+        sizes = np.array([len(e.kind) for e in entries], dtype=np.int64)
+        sensor_sites = np.repeat(robot_sites, sizes)
+        kind = np.concatenate([e.kind for e in entries]) if entries else np.zeros(0, dtype=np.int64)
+        working = np.concatenate([e.working for e in entries]) if entries else np.zeros(0, dtype=bool)
+        cell = sensor_sites * kinds + kind
+        self._sensors = np.bincount(cell, minlength=sites * kinds).reshape(sites, kinds)
+        self._failing = np.bincount(cell[~working], minlength=sites * kinds).reshape(sites, kinds)
+        connectivity = np.array([e.connectivity for e in entries], dtype=np.int64)
+        self._connectivity = np.bincount(
+            robot_sites * len(CONNECTIVITY) + connectivity, minlength=sites * len(CONNECTIVITY)
+        ).reshape(sites, len(CONNECTIVITY))
+        errors = np.concatenate([e.errors for e in entries]) if entries else np.zeros(0, dtype=np.int64)
+        self._error_counts = np.bincount(errors, minlength=len(self.errors))
+
+    def update(self, statuses: Mapping[str, RobotHardwareStatus], sites: Optional[Mapping[str, str]] = None) -> int:
+        """Record the hardware status of several robots.
+
+        Args:
+            statuses: Hardware statuses keyed by robot name.
+            sites: Sites keyed by robot name. Robots without one keep their previous site.
+
+        Returns:
+            Number of robots whose status or site changed.
+        """
+        with self._lock:
+            if sites:
+                self._robot_sites.update(sites)
+            changed = []
+            for name, hardware in statuses.items():
+                site = self._robot_sites.get(name, "")
+                previous = self._entries.get(name)
+                if previous is not None and previous.hardware == hardware and self.sites[previous.site] == site:
+                    continue
+                changed.append((name, previous, self._encode(hardware, site)))
+            if not changed:
+                return 0
+            self._grow()
+            if len(changed) > self.rebuild_ratio * max(len(self._entries), 1):
+                for name, _, entry in changed:
+                    self._entries[name] = entry
+                self._rebuild()
+            else:
+                for name, previous, entry in changed:
+                    if previous is not None:
+                        self._apply(previous, -1)
+                    self._apply(entry, 1)
+                    self._entries[name] = entry
+            return len(changed)
+
+    def remove(self, name: str):
+        """Stop counting a robot."""
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            self._robot_sites.pop(name, None)
+            if entry is not None:
+                self._apply(entry, -1)
+
+    def collect(self) -> int:
+        """Fetch the hardware status of every robot in the fleet concurrently and update the counts.
+
+        Robot info is fetched along with it for robots whose site is not known yet. Robots
+        that cannot be reached keep their last status.
+
+        Returns:
+            Number of robots whose status or site changed.
+        """
+        unknown = [name for name in self.fleet if name not in self._robot_sites]
+        known = [name for name in self.fleet if name in self._robot_sites]
+        snaps = snapshot.get_fleet_snapshot(self.fleet, parts=("hardware", "info"), names=unknown)
+        snaps.update(snapshot.get_fleet_snapshot(self.fleet, parts=("hardware",), names=known))
+        statuses = {name: snap.hardware for name, snap in snaps.items() if snap.hardware is not None}
+        sites = {name: snap.info.site_floor.site for name, snap in snaps.items() if snap.info is not None}
+        return self.update(statuses, sites)
+
+    # Reading
+
+    def _by_site(self, counts: "np.ndarray", labels: Tuple[str, ...]) -> Dict[str, Dict[str, int]]:
+        robots = self._connectivity.sum(axis=1)
+        return {
+            site: {label: int(n) for label, n in zip(labels, row)}
+            for site, row, present in zip(self.sites, counts, robots)
+            if present
+        }
+
+    def failing_sensors(self) -> Dict[str, Dict[str, int]]:
+        """Number of sensors that are not working, keyed by site and sensor kind."""
+        with self._lock:
+            return self._by_site(self._failing, SENSOR_KINDS)
+
+    def connectivity(self) -> Dict[str, Dict[str, int]]:
+        """Number of robots connected over Wi-Fi, mobile, both or neither, keyed by site."""
+        with self._lock:
+            return self._by_site(self._connectivity, CONNECTIVITY)
+
+    def top_errors(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The most frequent sensor and internet error strings with their counts."""
+        with self._lock:
+            counts = self._error_counts
+            order = np.argsort(-counts, kind="stable")[:n]
+            return [(self.errors[i], int(counts[i])) for i in order if counts[i] > 0]
+
+    def summary(self, n_errors: int = 10) -> FleetHealth:
+        """All aggregated views at once."""
+        with self._lock:
+            robots = len(self._entries)
+            sensors = self._by_site(self._sensors, SENSOR_KINDS)
+        return FleetHealth(
+            robots=robots,
+            sensors=sensors,
+            failing=self.failing_sensors(),
+            connectivity=self.connectivity(),
+            top_errors=self.top_errors(n_errors)
+        )
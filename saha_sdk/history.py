@@ -0,0 +1,302 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .client import Robot
+from .models import TaskModel
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    robot TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    site TEXT,
+    floor TEXT,
+    task_type TEXT,
+    task_index INTEGER,
+    target_uid TEXT,
+    create_time REAL,
+    celebrating_name TEXT,
+    payload TEXT,
+    first_seen REAL,
+    PRIMARY KEY (robot, create_time, id)
+);
+CREATE TABLE IF NOT EXISTS task_events (
+    robot TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    create_time REAL NOT NULL,
+    observed_at REAL NOT NULL,
+    success INTEGER,
+    completed INTEGER,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS task_events_by_task ON task_events (robot, create_time, id);
+"""
+
+# Message of the event that closes an open task the robot no longer lists
+VANISHED_MESSAGE = "Task no longer listed by the robot"
+
+# (create_time, id) of a task; ids alone may be reused, e.g. after the robot's task list is reset
+TaskKey = Tuple[float, int]
+_NO_TASKS: TaskKey = (float("-inf"), -1)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one TaskHistory.sync() or ingest() call."""
+    robot: str
+    new: int
+    changed: int
+    watermark: TaskKey
+    closed: int = 0
+
+
+@dataclass
+class LatencyStats:
+    """Completion latency summary of one target, in seconds."""
+    target_uid: str
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    max: float
+
+
+class TaskHistory:
+    """Append-only local store of task records, kept in sync with one or more robots.
+
+    Task creation records are written once. Every change of a task's success, completed
+    or message fields is appended to an event log, so completion latency and throughput
+    can be computed locally without querying the robot again. Tasks are identified by
+    their creation time and id, so ids the robot reuses are stored as new tasks.
+    """
+
+    def __init__(self, path: str = ":memory:", clock: Callable[[], float] = time.time):
+        """Open or create a task history database.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a temporary store.
+            clock: Wall clock used to timestamp observed changes.
+        """
+        self.path = path
+        self.clock = clock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._watermarks: Dict[str, TaskKey] = {}
+        self._open: Dict[str, Dict[TaskKey, Tuple[Any, Any, Any]]] = {}
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def __enter__(self) -> "TaskHistory":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_state(self, robot: str):
+        """Restore the watermark and the last state of unfinished tasks of a robot."""
+        row = self._db.execute(
+            "SELECT create_time, id FROM tasks WHERE robot = ? ORDER BY create_time DESC, id DESC LIMIT 1",
+            (robot,)
+        ).fetchone()
+        self._watermarks[robot] = tuple(row) if row is not None else _NO_TASKS
+        rows = self._db.execute(
+            """
+            SELECT e.create_time, e.id, e.success, e.completed, e.message FROM task_events e
+            JOIN (SELECT create_time, id, MAX(rowid) AS last FROM task_events WHERE robot = ?
+                  GROUP BY create_time, id) l
+              ON e.rowid = l.last
+            WHERE e.completed = 0
+            """,
+            (robot,)
+        ).fetchall()
+        self._open[robot] = {(r[0], r[1]): (bool(r[2]), bool(r[3]), r[4]) for r in rows}
+
+    def watermark(self, robot: str = "default") -> TaskKey:
+        """(create_time, id) of the newest task stored for a robot, or (-inf, -1) if none."""
+        with self._lock:
+            if robot not in self._watermarks:
+                self._load_state(robot)
+            return self._watermarks[robot]
+
+    def sync(self, client: Robot, robot: str = "default") -> SyncResult:
+        """Pull new tasks and state changes from a robot.
+
+        The robot always returns its full task list, so only tasks above the (create_time, id)
+        watermark and tasks still open locally are validated and compared; finished tasks
+        that are already stored are skipped without building TaskModel instances. Open tasks
+        the robot no longer lists are closed with an unsuccessful VANISHED_MESSAGE event.
+
+        Args:
+            client: API client of the robot.
+            robot: Name the robot's records are stored under.
+
+        Returns:
+            SyncResult with the number of new tasks, state changes and vanished tasks closed
+            (new, changed, closed), and the robot's watermark after the sync.
+        """
+        items = client.get("/api/v1/tasks")
+        return self.ingest(items, robot)
+
+    def ingest(self, items: List[Dict[str, Any]], robot: str = "default") -> SyncResult:
+        """Store new tasks and state changes from a raw ``/api/v1/tasks`` response.
+
+        Args:
+            items: Task dictionaries as returned by the robot.
+            robot: Name the robot's records are stored under.
+
+        Returns:
+            SyncResult with the number of new tasks, state changes and vanished tasks closed
+            (new, changed, closed), and the robot's watermark after the ingest.
+        """
+        now = self.clock()
+        with self._lock:
+            if robot not in self._watermarks:
+                self._load_state(robot)
+            watermark = self._watermarks[robot]
+            open_tasks = self._open[robot]
+            new_rows = []
+            events = []
+            listed = set()
+            for item in items:
+                task_id = item.get("id")
+                create_time = item.get("create_time")
+                if task_id is None or create_time is None:
+                    continue
+                key = (create_time, task_id)
+                listed.add(key)
+                if key <= watermark and key not in open_tasks:
+                    continue
+                record = TaskModel(**item)
+                key = (record.create_time, record.id)
+                state = (record.success, record.completed, record.message)
+                if key > watermark and key not in open_tasks:
+                    new_rows.append((
+                        robot, record.id, record.site, record.floor, record.task_type, record.task_index,
+                        record.target.uid, record.create_time, record.celebrating_name,
+                        json.dumps(record.payload), now
+                    ))
+                elif open_tasks.get(key) == state:
+                    continue
+                events.append((
+                    robot, record.id, record.create_time, now,
+                    int(record.success), int(record.completed), record.message
+                ))
+                if record.completed:
+                    open_tasks.pop(key, None)
+                else:
+                    open_tasks[key] = state
+
+            vanished = [key for key in open_tasks if key not in listed]
+            for create_time, task_id in vanished:
+                events.append((robot, task_id, create_time, now, 0, 1, VANISHED_MESSAGE))
+                del open_tasks[(create_time, task_id)]
+
+            with self._db:
+                self._db.executemany("INSERT OR IGNORE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", new_rows)
+                self._db.executemany("INSERT INTO task_events VALUES (?, ?, ?, ?, ?, ?, ?)", events)
+            if new_rows:
+                self._watermarks[robot] = max(watermark, max((row[7], row[1]) for row in new_rows))
+            return SyncResult(
+                robot, len(new_rows), len(events) - len(new_rows) - len(vanished),
+                self._watermarks[robot], len(vanished)
+            )
+
+    def tasks(self, robot: Optional[str] = None, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Stored tasks with their latest state, oldest first.
+
+        Args:
+            robot: Restrict to one robot.
+            since: Only tasks created at or after this timestamp.
+
+        Returns:
+            Task rows as dictionaries.
+        """
+        query = """
+            SELECT t.robot, t.id, t.site, t.floor, t.task_type, t.task_index, t.target_uid, t.create_time,
+                   t.payload, e.success, e.completed, e.message, e.observed_at
+            FROM tasks t
+            JOIN (SELECT robot, create_time, id, MAX(rowid) AS last FROM task_events
+                  GROUP BY robot, create_time, id) l
+              ON l.robot = t.robot AND l.create_time = t.create_time AND l.id = t.id
+            JOIN task_events e ON e.rowid = l.last
+            WHERE (? IS NULL OR t.robot = ?) AND (? IS NULL OR t.create_time >= ?)
+            ORDER BY t.create_time, t.id
+        """
+        columns = ("robot", "id", "site", "floor", "task_type", "task_index", "target_uid", "create_time",
+                   "payload", "success", "completed", "message", "updated_at")
+        with self._lock:
+            rows = self._db.execute(query, (robot, robot, since, since)).fetchall()
+        result = []
+        for row in rows:
+            record = dict(zip(columns, row))
+            record["payload"] = json.loads(record["payload"])
+            record["success"] = bool(record["success"])
+            record["completed"] = bool(record["completed"])
+            result.append(record)
+        return result
+
+    def _completions(self, robot: Optional[str], since: Optional[float]) -> List[Tuple[str, float, float]]:
+        """(target_uid, create_time, completed_at) of every task seen completed; vanished tasks are excluded."""
+        query = """
+            SELECT t.target_uid, t.create_time, MIN(e.observed_at)
+            FROM tasks t JOIN task_events e ON e.robot = t.robot AND e.create_time = t.create_time AND e.id = t.id
+            WHERE e.completed = 1 AND e.message IS NOT ? AND (? IS NULL OR t.robot = ?)
+            GROUP BY t.robot, t.create_time, t.id
+            HAVING (? IS NULL OR MIN(e.observed_at) >= ?)
+        """
+        with self._lock:
+            return self._db.execute(query, (VANISHED_MESSAGE, robot, robot, since, since)).fetchall()
+
+    def throughput(self, bucket: float = 3600.0, robot: Optional[str] = None, since: Optional[float] = None) -> List[Tuple[float, int]]:
+        """Number of tasks completed per time bucket.
+
+        Completion times are the sync times at which a task was first seen completed,
+        so they are accurate to the sync interval.
+
+        Args:
+            bucket: Bucket width in seconds.
+            robot: Restrict to one robot.
+            since: Only completions at or after this timestamp.
+
+        Returns:
+            (bucket start, completed count) pairs in time order.
+        """
+        counts: Dict[float, int] = {}
+        for _, _, completed_at in self._completions(robot, since):
+            start = (completed_at // bucket) * bucket
+            counts[start] = counts.get(start, 0) + 1
+        return sorted(counts.items())
+
+    def completion_latency(self, robot: Optional[str] = None, since: Optional[float] = None) -> Dict[str, LatencyStats]:
+        """Time from task creation to observed completion, per target.
+
+        Args:
+            robot: Restrict to one robot.
+            since: Only completions at or after this timestamp.
+
+        Returns:
+            Latency statistics keyed by target UID.
+        """
+        per_target: Dict[str, List[float]] = {}
+        for target_uid, create_time, completed_at in self._completions(robot, since):
+            per_target.setdefault(target_uid, []).append(max(0.0, completed_at - create_time))
+
+        stats = {}
+        for target_uid, values in per_target.items():
+            values.sort()
+            n = len(values)
+            stats[target_uid] = LatencyStats(
+                target_uid=target_uid,
+                count=n,
+                mean=sum(values) / n,
+                p50=values[min(n - 1, int(0.5 * n))],
+                p95=values[min(n - 1, int(0.95 * n))],
+                max=values[-1]
+            )
+        return stats
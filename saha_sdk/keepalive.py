@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from .fleet import RobotFleet
+
+_logger = logging.getLogger(__name__)
+
+
+class KeepAlive:
+    """Keeps the pooled connections of a fleet open with periodic lightweight probes.
+
+    Robot API servers and NAT gateways close connections that stay idle, and the next call
+    then pays for a new handshake. Every interval seconds each robot is sent ``connections``
+    concurrent probe requests (``Robot.warmup``), which reuse and so refresh its idle
+    connections, or reopen the ones that were closed. Robots that do not answer are retried
+    on the next round.
+
+    Usage:
+        keepalive = KeepAlive(fleet, interval=20.0)
+        keepalive.start()
+    """
+
+    def __init__(self, fleet: RobotFleet, interval: float = 30.0, connections: int = 1):
+        """Initialize a new keep-alive.
+
+        Args:
+            fleet: Robots to keep connected.
+            interval: Seconds between probe rounds. Should be shorter than the robots'
+                keep-alive timeout.
+            connections: Connections to keep open per robot.
+        """
+        self.fleet = fleet
+        self.interval = interval
+        self.connections = connections
+        self.rounds = 0
+        self.failures: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def probe(self) -> Dict[str, Optional[Exception]]:
+        """Probe every robot once.
+
+        Returns:
+            The error of every robot that did not answer, or None, keyed by robot name.
+        """
+        results = self.fleet.warmup(self.connections)
+        errors = {name: result if isinstance(result, Exception) else None for name, result in results.items()}
+        self.rounds += 1
+        for name, error in errors.items():
+            if error is not None:
+                self.failures[name] = self.failures.get(name, 0) + 1
+        return errors
+
+    def start(self):
+        """Probe in a background thread every interval seconds."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="saha-keepalive", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.probe()
+            except Exception:
+                _logger.exception("Keep-alive probe round failed")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import LayersModel, ResponseModel
 from typing import List
 
+@traced
 def get_all_layers(client: Robot) -> List[LayersModel]:
     """
     Get the list of all layers of the robot.
@@ -15,6 +17,7 @@ def get_all_layers(client: Robot) -> List[LayersModel]:
     response = client.get("/api/v1/layers")
     return [LayersModel(**item) for item in response]
 
+@traced
 def get_layers_by_site(client: Robot, site: str) -> List[LayersModel]:
     """
     Get the list of layers filtered by site.
@@ -29,6 +32,7 @@ def get_layers_by_site(client: Robot, site: str) -> List[LayersModel]:
     response = client.get(f"/api/v1/layers/{site}")
     return [LayersModel(**item) for item in response]
 
+@traced
 def get_layers_by_site_and_floor(client: Robot, site: str, floor: str) -> List[LayersModel]:
     """
     Get the list of layers filtered by site and floor.
@@ -44,6 +48,7 @@ def get_layers_by_site_and_floor(client: Robot, site: str, floor: str) -> List[L
     response = client.get(f"/api/v1/layers/{site}/{floor}")
     return [LayersModel(**item) for item in response]
 
+@traced
 def get_layer(client: Robot, site: str, floor: str, uid: str) -> LayersModel:
     """
     Get a specific layer by its site, floor, and UID.
@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import FloorModel, SiteFloorModel, MapModel, MappingModel, ResponseModel
 from typing import List
 
+@traced
 def get_available_maps(client: Robot) -> List[FloorModel]:
     """
     Get the list of available maps (floors) for the robot.
@@ -15,6 +17,7 @@ def get_available_maps(client: Robot) -> List[FloorModel]:
     response = client.get("/api/v1/mapping")
     return [FloorModel(**item) for item in response]
 
+@traced
 def get_default_map(client: Robot) -> SiteFloorModel:
     """
     Get the default map for the robot.
@@ -28,6 +31,7 @@ def get_default_map(client: Robot) -> SiteFloorModel:
     response = client.get("/api/v1/mapping/default-map")
     return SiteFloorModel(**response)
 
+@traced
 def set_default_map(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     """
     Set the default map for the robot.
@@ -42,6 +46,7 @@ def set_default_map(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     response = client.post("/api/v1/mapping/default-map", data=site_floor.dict())
     return ResponseModel(**response)
 
+@traced
 def get_current_map(client: Robot) -> MapModel:
     """
     Get the robot's current map as a base64-encoded PNG.
@@ -55,6 +60,7 @@ def get_current_map(client: Robot) -> MapModel:
     response = client.get("/api/v1/mapping/map")
     return MapModel(**response)
 
+@traced
 def get_selected_map(client: Robot, site: str, floor: str) -> MapModel:
     """
     Get the selected map for a specific site and floor as a base64-encoded PNG.
@@ -70,6 +76,7 @@ def get_selected_map(client: Robot, site: str, floor: str) -> MapModel:
     response = client.get(f"/api/v1/mapping/{site}/{floor}")
     return MapModel(**response)
 
+@traced
 def delete_selected_map(client: Robot, site: str, floor: str) -> ResponseModel:
     """
     Delete the selected map for a specific site and floor.
@@ -85,6 +92,7 @@ def delete_selected_map(client: Robot, site: str, floor: str) -> ResponseModel:
     response = client.delete(f"/api/v1/mapping/{site}/{floor}")
     return ResponseModel(**response)
 
+@traced
 def start_mapping(client: Robot, mapping_model: MappingModel) -> ResponseModel:
     """
     Start the mapping process for the robot.
@@ -99,6 +107,7 @@ def start_mapping(client: Robot, mapping_model: MappingModel) -> ResponseModel:
     response = client.post("/api/v1/mapping/start", data=mapping_model.dict())
     return ResponseModel(**response)
 
+@traced
 def cancel_mapping(client: Robot) -> ResponseModel:
     """
     Cancel the robot's current mapping process.
@@ -112,6 +121,7 @@ def cancel_mapping(client: Robot) -> ResponseModel:
     response = client.post("/api/v1/mapping/cancel")
     return ResponseModel(**response)
 
+@traced
 def change_map(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     """
     Change the robot's current map to a new site and floor.
@@ -126,6 +136,7 @@ def change_map(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     response = client.post("/api/v1/mapping/change", data=site_floor.dict())
     return ResponseModel(**response)
 
+@traced
 def start_remapping(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     """
     Start the remapping process for the robot.
@@ -140,6 +151,7 @@ def start_remapping(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     response = client.post("/api/v1/mapping/remap", data=site_floor.dict())
     return ResponseModel(**response)
 
+@traced
 def save_map(client: Robot) -> ResponseModel:
     """
     Save the robot's current map.
@@ -0,0 +1,281 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import endpoints
+
+# Latencies are recorded in microseconds. Every power of two is split into 64 linear
+# sub-buckets, bounding the relative error of a recorded value to 1/64 (about 1.6 %).
+_SUB_BITS = 7
+_HALF = 1 << (_SUB_BITS - 1)
+
+# Upper bounds of the Prometheus histogram buckets, in seconds.
+PROMETHEUS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _bucket(value: int) -> int:
+    shift = value.bit_length() - _SUB_BITS
+    if shift <= 0:
+        return value
+    return (shift << (_SUB_BITS - 1)) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < 2 * _HALF:
+        return index, index
+    shift = (index >> (_SUB_BITS - 1)) - 1
+    mantissa = index - (shift << (_SUB_BITS - 1))
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """A log-linear latency histogram in the style of HdrHistogram.
+
+    Counts are kept sparsely per bucket, so a histogram of a rarely used endpoint costs a
+    few dozen bytes, while percentiles remain accurate to about 1.6 % at any scale.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """Add a latency in seconds."""
+        index = _bucket(int(seconds * 1e6))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "Histogram"):
+        """Add the recorded values of another histogram."""
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds below which q percent of the recorded values fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1] / 1e6, self.max)
+        return self.max
+
+    def cumulative(self, bounds: Iterable[float]) -> List[int]:
+        """Number of values at or below each bound in seconds, for histogram exporters."""
+        items = sorted(self.counts.items())
+        result = []
+        position = seen = 0
+        for bound in bounds:
+            limit = bound * 1e6
+            while position < len(items) and _bucket_bounds(items[position][0])[1] <= limit:
+                seen += items[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+    def summary(self) -> "LatencySummary":
+        """Count, mean, extremes and percentiles of the recorded values."""
+        return LatencySummary(
+            count=self.count, mean=self.mean, min=self.min if self.count else 0.0, max=self.max,
+            p50=self.percentile(50), p90=self.percentile(90), p99=self.percentile(99), p999=self.percentile(99.9)
+        )
+
+
+@dataclass
+class LatencySummary:
+    """Latency distribution of an endpoint in seconds."""
+    count: int
+    mean: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+    p999: float
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters of one robot, method and path template."""
+    robot: str
+    method: str
+    endpoint: str
+    requests: int = 0
+    errors: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    exceptions: Dict[str, int] = field(default_factory=dict)
+    latency: Optional[LatencySummary] = None
+
+
+class _Series:
+    __slots__ = ("requests", "errors", "bytes_out", "bytes_in", "statuses", "exceptions", "histogram")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.statuses: Dict[int, int] = {}
+        self.exceptions: Dict[str, int] = {}
+        self.histogram = Histogram()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Request counters and latency histograms per (robot, method, path template).
+
+    Clients check ``enabled`` before doing any measuring, so a disabled registry costs one
+    attribute lookup per call.
+    """
+
+    def __init__(self, enabled: bool = True, matcher: Optional[endpoints.EndpointMatcher] = None):
+        """Initialize a new registry.
+
+        Args:
+            enabled: Whether clients record into this registry.
+            matcher: Maps request paths to templates. Defaults to the SDK's endpoints.
+        """
+        self.enabled = enabled
+        self.matcher = matcher or endpoints._default
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._series = {}
+
+    def observe(
+        self,
+        robot: str,
+        method: str,
+        path: str,
+        duration: float,
+        status: Optional[int] = None,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+        exception: Optional[BaseException] = None
+    ):
+        """Record one request.
+
+        Args:
+            robot: Robot label, usually ``Robot.name``.
+            method: HTTP method.
+            path: Request path; grouped by its template.
+            duration: Time from sending to a decoded response or an error, in seconds.
+            status: HTTP status code, if a response was received.
+            bytes_out: Size of the request body.
+            bytes_in: Size of the response body.
+            exception: Exception raised by the call, if any.
+        """
+        key = (robot, method, self.matcher.template(path))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.requests += 1
+            series.bytes_out += bytes_out
+            series.bytes_in += bytes_in
+            if status is not None:
+                series.statuses[status] = series.statuses.get(status, 0) + 1
+            if exception is not None:
+                series.errors += 1
+                name = type(exception).__name__
+                series.exceptions[name] = series.exceptions.get(name, 0) + 1
+            series.histogram.record(duration)
+
+    def snapshot(self) -> List[EndpointMetrics]:
+        """Current counters and latency percentiles of every series."""
+        with self._lock:
+            items = [
+                (key, s.requests, s.errors, s.bytes_out, s.bytes_in, dict(s.statuses), dict(s.exceptions), self._copy(s.histogram))
+                for key, s in self._series.items()
+            ]
+        result = []
+        for (robot, method, endpoint), requests, errors, bytes_out, bytes_in, statuses, exceptions, h in items:
+            result.append(EndpointMetrics(
+                robot=robot, method=method, endpoint=endpoint, requests=requests, errors=errors,
+                bytes_out=bytes_out, bytes_in=bytes_in, statuses=statuses, exceptions=exceptions,
+                latency=h.summary()
+            ))
+        return result
+
+    @staticmethod
+    def _copy(histogram: Histogram) -> Histogram:
+        copy = Histogram()
+        copy.merge(histogram)
+        return copy
+
+    def to_prometheus(self, prefix: str = "saha_sdk") -> str:
+        """Render all series in the Prometheus text exposition format."""
+        with self._lock:
+            items = [(key, s, self._copy(s.histogram)) for key, s in self._series.items()]
+        lines = {
+            "requests": [f"# HELP {prefix}_requests_total Requests sent, by response status.", f"# TYPE {prefix}_requests_total counter"],
+            "exceptions": [f"# HELP {prefix}_exceptions_total Requests that raised, by exception class.", f"# TYPE {prefix}_exceptions_total counter"],
+            "bytes_out": [f"# HELP {prefix}_request_bytes_total Request body bytes sent.", f"# TYPE {prefix}_request_bytes_total counter"],
+            "bytes_in": [f"# HELP {prefix}_response_bytes_total Response body bytes received.", f"# TYPE {prefix}_response_bytes_total counter"],
+            "latency": [f"# HELP {prefix}_request_duration_seconds Request latency.", f"# TYPE {prefix}_request_duration_seconds histogram"],
+        }
+        for (robot, method, endpoint), series, histogram in sorted(items, key=lambda item: item[0]):
+            labels = f'robot="{_escape(robot)}",method="{method}",endpoint="{_escape(endpoint)}"'
+            for status, n in sorted(series.statuses.items()):
+                lines["requests"].append(f'{prefix}_requests_total{{{labels},status="{status}"}} {n}')
+            no_status = series.requests - sum(series.statuses.values())
+            if no_status:
+                lines["requests"].append(f'{prefix}_requests_total{{{labels},status="none"}} {no_status}')
+            for name, n in sorted(series.exceptions.items()):
+                lines["exceptions"].append(f'{prefix}_exceptions_total{{{labels},exception="{name}"}} {n}')
+            lines["bytes_out"].append(f"{prefix}_request_bytes_total{{{labels}}} {series.bytes_out}")
+            lines["bytes_in"].append(f"{prefix}_response_bytes_total{{{labels}}} {series.bytes_in}")
+            for bound, n in zip(PROMETHEUS_BUCKETS, histogram.cumulative(PROMETHEUS_BUCKETS)):
+                lines["latency"].append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {n}')
+            lines["latency"].append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines["latency"].append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {histogram.total}")
+            lines["latency"].append(f"{prefix}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(line for group in lines.values() for line in group) + "\n"
+
+
+# Registry used by clients created without one. Disabled until enable() is called.
+REGISTRY = MetricsRegistry(enabled=False)
+
+
+def enable():
+    """Start recording metrics of every client using the default registry."""
+    REGISTRY.enable()
+
+
+def disable():
+    """Stop recording metrics into the default registry."""
+    REGISTRY.disable()
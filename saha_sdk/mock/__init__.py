@@ -0,0 +1,25 @@
+"""
+An in-memory mock of the Saha Robotik API for tests, benchmarks and load tests.
+
+Usage:
+    from saha_sdk.mock import MockApp, MockServer
+
+    with MockServer(MockApp(robots=3)) as server:
+        robot = Robot(server.urls["robot-1"])
+
+    # In-process, without sockets
+    robot = Robot("http://mock", transport=ASGITransport(MockApp()))
+
+    # Robots that drive to their goals on a simulated clock
+    clock = SimClock()
+    app = MockApp(robots=10, robot_class=SimulatedRobot, clock=clock)
+
+Or from a shell:
+    python -m saha_sdk.mock --robots 10 --port 7242 --port-per-robot
+"""
+
+from .app import MockApp, MockResponse
+from .faults import PROFILES, FaultInjector, FaultRule, Latency
+from .robot import MockError, MockRobot
+from .server import MockServer
+from .sim import SPEED_SCALES, Battery, Kinematics, SimClock, SimulatedRobot
@@ -0,0 +1,59 @@
+"""
+Run the mock robot server.
+
+Usage:
+    python -m saha_sdk.mock [--robots N] [--host HOST] [--port PORT] [--port-per-robot] [--targets N]
+                            [--faults PROFILE] [--seed N] [--simulate SPEED]
+
+Faults can be changed while running through the admin endpoint, e.g.:
+    curl -X PUT localhost:7242/_admin/faults -d '{"profile": "warehouse-wifi", "seed": 1}'
+"""
+
+import argparse
+import asyncio
+
+from .app import MockApp
+from .faults import PROFILES, FaultInjector
+from .server import MockServer
+from .sim import SimClock, SimulatedRobot
+
+
+async def serve(server: MockServer):
+    async with server:
+        for name, url in server.urls.items():
+            print(f"{name}: {url}")
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", type=int, default=1, help="Number of virtual robots.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=7242, help="Port, or first port with --port-per-robot.")
+    parser.add_argument("--port-per-robot", action="store_true", help="Give every robot its own port.")
+    parser.add_argument("--targets", type=int, default=10, help="Generated targets per robot.")
+    parser.add_argument("--faults", choices=sorted(PROFILES), help="Network conditions to simulate.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of injected faults.")
+    parser.add_argument(
+        "--simulate", type=float, metavar="SPEED",
+        help="Drive robots to their goals on a clock running SPEED times faster than real time."
+    )
+    args = parser.parse_args()
+
+    faults = FaultInjector(seed=args.seed)
+    if args.faults:
+        faults.configure(profile=args.faults)
+    if args.simulate:
+        app = MockApp(
+            robots=args.robots, targets=args.targets, faults=faults, robot_class=SimulatedRobot, clock=SimClock(speed=args.simulate)
+        )
+    else:
+        app = MockApp(robots=args.robots, targets=args.targets, faults=faults)
+    try:
+        asyncio.run(serve(MockServer(app, args.host, args.port, args.port_per_robot)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import asyncio
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union
+from urllib.parse import parse_qsl, unquote
+
+from ..codecs import Codec, get_codec
+from ..endpoints import UNMATCHED, EndpointMatcher
+from .faults import Fault, FaultInjector, FaultRule
+from .robot import ROUTES, MockError, MockRobot
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 422: "Unprocessable Entity", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class MockResponse:
+    """A response of the mock server, with how injected faults alter its delivery.
+
+    Attributes:
+        drop: Close the connection instead of responding.
+        body_rate: Send the body at this many bytes per second.
+        stall: Seconds to wait between the headers and the body.
+    """
+
+    __slots__ = ("status", "body", "headers", "drop", "body_rate", "stall")
+
+    def __init__(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.body = body
+        self.headers = headers if headers is not None else {"Content-Type": "application/json"}
+        self.drop = False
+        self.body_rate: Optional[float] = None
+        self.stall = 0.0
+
+    @property
+    def reason(self) -> str:
+        return _REASONS.get(self.status, "Unknown")
+
+
+class MockApp:
+    """Serves the Saha Robotik API for any number of virtual robots.
+
+    A robot is addressed by a path prefix ("/robots/robot-2/api/v1/status"), by the port
+    it was given on a MockServer, or otherwise is the first robot. The app can be used
+    in-process as an ASGI application (``transport.ASGITransport``) or served over
+    sockets by ``MockServer``.
+
+    Latency and failures are injected by ``faults``, which can also be configured at
+    runtime through the admin endpoint "/_admin/faults":
+
+    - GET: current seed and rules
+    - PUT: replace them with {"profile": ..., "seed": ..., "rules": [...]}
+    - POST: add one rule
+    - DELETE: remove all rules
+    """
+
+    def __init__(
+        self,
+        robots: Union[int, Iterable[MockRobot]] = 1,
+        codec: Optional[Union[str, Codec]] = None,
+        faults: Optional[FaultInjector] = None,
+        robot_class: Type[MockRobot] = MockRobot,
+        **robot_kwargs
+    ):
+        """Initialize a new app.
+
+        Args:
+            robots: Robots to serve, or the number of robots to create, named robot-1, robot-2, ...
+            codec: JSON codec of request and response bodies. Defaults to the fastest installed.
+            faults: Fault injector (optional). Defaults to one without rules.
+            robot_class: Class of created robots, e.g. ``sim.SimulatedRobot``.
+            **robot_kwargs: Options of created robots, e.g. targets=1000.
+        """
+        if isinstance(robots, int):
+            robots = [robot_class(f"robot-{i + 1}", seed=i, **robot_kwargs) for i in range(robots)]
+        self.robots: Dict[str, MockRobot] = {}
+        for robot in robots:
+            self.add(robot)
+        self.codec = get_codec(codec)
+        self.faults = faults if faults is not None else FaultInjector()
+        self.ports: Dict[int, str] = {}
+        self.matcher = EndpointMatcher(sorted({template for _, template in ROUTES}))
+
+    def add(self, robot: MockRobot):
+        """Serve a robot, replacing any robot with the same name."""
+        self.robots[robot.name] = robot
+
+    def remove(self, name: str) -> MockRobot:
+        """Stop serving a robot."""
+        return self.robots.pop(name)
+
+    def __getitem__(self, name: str) -> MockRobot:
+        return self.robots[name]
+
+    def _json(self, status: int, payload: Any) -> MockResponse:
+        return MockResponse(status, self.codec.dumps(payload))
+
+    def _error(self, status: int, message: str) -> MockResponse:
+        return self._json(status, {"error": {"message": message}})
+
+    def _robot(self, path: str, port: Optional[int]) -> Tuple[Optional[MockRobot], str]:
+        if path.startswith("/robots/"):
+            name, _, rest = path[len("/robots/"):].partition("/")
+            return self.robots.get(name), "/" + rest
+        name = self.ports.get(port) if port is not None else None
+        if name is not None:
+            return self.robots.get(name), path
+        return next(iter(self.robots.values()), None), path
+
+    def dispatch(self, method: str, target: str, body: bytes = b"", port: Optional[int] = None) -> MockResponse:
+        """Answer one request.
+
+        Args:
+            method: HTTP method.
+            target: Path with optional query string.
+            body: Request body.
+            port: Port the request arrived on, if served by a MockServer.
+        """
+        path, _, query_string = target.partition("?")
+        path = unquote(path)
+        if path == "/health":
+            return self._json(200, {"status": "ok", "robots": len(self.robots)})
+        if path == "/robots":
+            return self._json(200, sorted(self.robots))
+        if path == "/_admin/faults":
+            return self._admin_faults(method.upper(), body)
+        robot, path = self._robot(path, port)
+        if robot is None:
+            return self._error(404, "Robot not found")
+        template, params = self.matcher.match(path)
+        if template == UNMATCHED:
+            return self._error(404, f"Not found: {path}")
+        handler = ROUTES.get((method.upper(), template))
+        if handler is None:
+            return self._error(405, f"Method not allowed: {method} {template}")
+        try:
+            payload = self.codec.loads(body) if body else None
+        except ValueError:
+            return self._error(400, "Invalid JSON body")
+        query = dict(parse_qsl(query_string))
+        try:
+            with robot.lock:
+                robot.update()
+                result = getattr(robot, handler)(params, query, payload)
+        except MockError as e:
+            return self._error(e.status, e.message)
+        except Exception as e:
+            return self._error(500, f"{type(e).__name__}: {e}")
+        return self._json(200, result)
+
+    def _admin_faults(self, method: str, body: bytes) -> MockResponse:
+        try:
+            payload = self.codec.loads(body) if body else {}
+            if method == "PUT":
+                self.faults.configure(
+                    [FaultRule.from_dict(rule) for rule in payload.get("rules", [])], payload.get("seed"), payload.get("profile")
+                )
+            elif method == "POST":
+                self.faults.add(FaultRule.from_dict(payload))
+            elif method == "DELETE":
+                self.faults.clear()
+            elif method != "GET":
+                return self._error(405, f"Method not allowed: {method} /_admin/faults")
+        except (TypeError, ValueError, AttributeError) as e:
+            return self._error(400, f"Invalid fault configuration: {e}")
+        return self._json(200, self.faults.to_dict())
+
+    def _fault(self, method: str, target: str, port: Optional[int]) -> Optional[Fault]:
+        path = unquote(target.partition("?")[0])
+        robot, path = self._robot(path, port)
+        template = self.matcher.template(path)
+        if robot is None or template == UNMATCHED:
+            return None
+        return self.faults.decide(method.upper(), template, robot.name)
+
+    async def handle(self, method: str, target: str, body: bytes = b"", port: Optional[int] = None) -> MockResponse:
+        """Answer one request from a coroutine, applying injected faults. See dispatch()."""
+        fault = self._fault(method, target, port) if self.faults.rules else None
+        if fault is None:
+            return self.dispatch(method, target, body, port)
+        if fault.delay > 0:
+            await asyncio.sleep(fault.delay)
+        if fault.drop:
+            response = MockResponse(0, b"")
+            response.drop = True
+            return response
+        if fault.status is not None:
+            response = self._error(fault.status, "Injected fault")
+        else:
+            response = self.dispatch(method, target, body, port)
+        response.body_rate = fault.body_rate
+        response.stall = fault.stall
+        return response
+
+    async def __call__(self, scope, receive, send):
+        """ASGI entry point."""
+        if scope["type"] != "http":
+            return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        target = scope.get("raw_path", scope["path"].encode("latin-1")).decode("latin-1")
+        if scope.get("query_string"):
+            target = f"{target}?{scope['query_string'].decode('latin-1')}"
+        server = scope.get("server")
+        response = await self.handle(scope["method"], target, b"".join(chunks), server[1] if server else None)
+        if response.drop:
+            raise ConnectionResetError("Connection dropped by fault injection")
+        headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response.headers.items()]
+        headers.append((b"content-length", str(len(response.body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": response.status, "headers": headers})
+        delay = response.stall + (len(response.body) / response.body_rate if response.body_rate else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await send({"type": "http.response.body", "body": response.body})
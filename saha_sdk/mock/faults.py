@@ -0,0 +1,199 @@
+import fnmatch
+import math
+import random
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass
+class Latency:
+    """A latency distribution in seconds.
+
+    - constant: always ``value``
+    - uniform: between ``low`` and ``high``
+    - normal: ``mean`` with standard deviation ``sigma``, clipped at 0
+    - lognormal: ``median`` with shape ``sigma``; long-tailed like most real networks
+    - exponential: ``mean``
+    """
+    distribution: str = "constant"
+    value: float = 0.0
+    low: float = 0.0
+    high: float = 0.0
+    mean: float = 0.0
+    median: float = 0.0
+    sigma: float = 0.0
+
+    def __post_init__(self):
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {self.distribution}. Use one of {DISTRIBUTIONS}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            return self.value
+        if self.distribution == "uniform":
+            return rng.uniform(self.low, self.high)
+        if self.distribution == "normal":
+            return max(0.0, rng.gauss(self.mean, self.sigma))
+        if self.distribution == "lognormal":
+            return rng.lognormvariate(math.log(self.median), self.sigma) if self.median > 0 else 0.0
+        return rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+
+
+@dataclass
+class FaultRule:
+    """Faults applied to the requests matching an endpoint, method and robot.
+
+    Attributes:
+        endpoint: Path template or glob over templates, e.g. "/api/v1/navigation/*". None matches all.
+        method: HTTP method, or None for all.
+        robot: Robot name, or None for all.
+        latency: Delay before the response.
+        jitter: Extra uniformly distributed delay of up to this many seconds.
+        drop_rate: Probability of closing the connection without a response.
+        error_rate: Probability of starting a burst of server errors.
+        error_burst: Number of consecutive requests answered with error_status once a burst starts.
+        error_status: Status code of injected errors.
+        body_rate: Send response bodies at this many bytes per second.
+        stall_rate: Probability of stalling after the response headers.
+        stall: Seconds a stalled response waits before its body.
+    """
+    endpoint: Optional[str] = None
+    method: Optional[str] = None
+    robot: Optional[str] = None
+    latency: Optional[Latency] = None
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    error_rate: float = 0.0
+    error_burst: int = 1
+    error_status: int = 503
+    body_rate: Optional[float] = None
+    stall_rate: float = 0.0
+    stall: float = 0.0
+
+    def matches(self, method: str, template: str, robot: str) -> bool:
+        return (
+            (self.method is None or self.method.upper() == method)
+            and (self.robot is None or self.robot == robot)
+            and (self.endpoint is None or self.endpoint == template or fnmatch.fnmatchcase(template, self.endpoint))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaultRule":
+        data = dict(data)
+        if isinstance(data.get("latency"), dict):
+            data["latency"] = Latency(**data["latency"])
+        return cls(**data)
+
+
+@dataclass
+class Fault:
+    """What happens to one request."""
+    delay: float = 0.0
+    drop: bool = False
+    status: Optional[int] = None
+    body_rate: Optional[float] = None
+    stall: float = 0.0
+
+
+# Named sets of rules for common network conditions.
+PROFILES: Dict[str, List[FaultRule]] = {
+    "lan": [FaultRule(latency=Latency("lognormal", median=0.002, sigma=0.3))],
+    "warehouse-wifi": [
+        FaultRule(latency=Latency("lognormal", median=0.03, sigma=0.8), jitter=0.02, drop_rate=0.005, error_rate=0.002, error_burst=5),
+        FaultRule(endpoint="/api/v1/navigation/*/stream", stall_rate=0.02, stall=2.0, body_rate=20000.0),
+    ],
+    "congested": [
+        FaultRule(latency=Latency("exponential", mean=0.25), jitter=0.1, drop_rate=0.02, error_rate=0.01, error_burst=10, body_rate=5000.0),
+    ],
+}
+
+
+class FaultInjector:
+    """Decides latency and failures of mock requests from a list of rules.
+
+    Random decisions come from one generator per (rule, robot) seeded from ``seed``, so
+    a robot sees the same sequence of faults on every run regardless of what other robots
+    do. When several rules match, delays add up and the first rule to inject a failure wins.
+    """
+
+    def __init__(self, rules: Optional[List[FaultRule]] = None, seed: int = 0):
+        """Initialize a new injector.
+
+        Args:
+            rules: Fault rules.
+            seed: Seed of the random decisions.
+        """
+        self.rules: List[FaultRule] = list(rules or [])
+        self.seed = seed
+        self._rngs: Dict[Tuple[int, str], random.Random] = {}
+        self._bursts: Dict[Tuple[int, str], int] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, rules: Optional[List[FaultRule]] = None, seed: Optional[int] = None, profile: Optional[str] = None):
+        """Replace the rules and restart the random sequences.
+
+        Args:
+            rules: New rules, added after those of the profile.
+            seed: New seed (optional).
+            profile: Name of a rule set in PROFILES (optional).
+        """
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f"Unknown profile: {profile}. Use one of {sorted(PROFILES)}")
+        with self._lock:
+            self.rules = list(PROFILES[profile] if profile is not None else []) + list(rules or [])
+            if seed is not None:
+                self.seed = seed
+            self._rngs = {}
+            self._bursts = {}
+
+    def add(self, rule: FaultRule):
+        with self._lock:
+            self.rules.append(rule)
+
+    def clear(self):
+        self.configure([])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seed": self.seed, "rules": [rule.to_dict() for rule in self.rules]}
+
+    def _rng(self, index: int, robot: str) -> random.Random:
+        rng = self._rngs.get((index, robot))
+        if rng is None:
+            rng = self._rngs[(index, robot)] = random.Random(f"{self.seed}:{index}:{robot}")
+        return rng
+
+    def decide(self, method: str, template: str, robot: str) -> Optional[Fault]:
+        """The fault of a request, or None if no rule matches."""
+        fault = None
+        with self._lock:
+            for index, rule in enumerate(self.rules):
+                if not rule.matches(method, template, robot):
+                    continue
+                fault = fault or Fault()
+                rng = self._rng(index, robot)
+                if rule.latency is not None:
+                    fault.delay += rule.latency.sample(rng)
+                if rule.jitter:
+                    fault.delay += rng.uniform(0.0, rule.jitter)
+                failed = fault.drop or fault.status is not None
+                if rule.drop_rate and rng.random() < rule.drop_rate and not failed:
+                    fault.drop = True
+                    failed = True
+                burst = self._bursts.get((index, robot), 0)
+                if burst == 0 and rule.error_rate and rng.random() < rule.error_rate:
+                    burst = rule.error_burst
+                if burst:
+                    self._bursts[(index, robot)] = burst - 1
+                    if not failed:
+                        fault.status = rule.error_status
+                if rule.body_rate:
+                    fault.body_rate = rule.body_rate
+                if rule.stall_rate and rng.random() < rule.stall_rate:
+                    fault.stall = max(fault.stall, rule.stall)
+        return fault
@@ -0,0 +1,396 @@
+"""
+Drive many virtual robots through the SDK to find how many one controller process can supervise.
+
+For each fleet size the mock server is started with that many simulated robots, and the
+controller polls status, reads position streams, creates tasks and sends teleop
+velocities at the rates of a traffic mix. Frames of a stream are dropped when the
+previous one is still in flight or the controller falls a whole period behind.
+
+Usage:
+    python -m saha_sdk.mock.loadgen [--robots 10,50,100,200] [--mix dispatch] [--duration SECONDS]
+                                    [--workers N] [--targets N] [--faults PROFILE] [--in-process]
+                                    [--max-drop RATE] [--max-errors RATE] [--output FILE]
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .. import navigation, status, task
+from ..client import Robot
+from ..fleet import RobotFleet
+from ..models import TaskRequestModel, TwistModel
+from ..transport import PooledHTTPTransport
+from .app import MockApp
+from .faults import FaultInjector
+from .server import MockServer
+from .sim import SimClock, SimulatedRobot
+
+
+@dataclass
+class TrafficMix:
+    """Request rates per robot.
+
+    Attributes:
+        status_hz: Status polls per second.
+        position_hz: Position stream frames per second.
+        tasks_per_minute: Mean rate of task creation; arrivals are random (Poisson).
+        teleop_hz: Velocity commands per second for teleoperated robots.
+        teleop_fraction: Share of robots under teleoperation.
+    """
+    status_hz: float = 1.0
+    position_hz: float = 5.0
+    tasks_per_minute: float = 1.0
+    teleop_hz: float = 10.0
+    teleop_fraction: float = 0.0
+
+
+# Named traffic mixes.
+MIXES: Dict[str, TrafficMix] = {
+    "monitoring": TrafficMix(status_hz=1.0, position_hz=1.0, tasks_per_minute=0.0),
+    "dispatch": TrafficMix(status_hz=1.0, position_hz=5.0, tasks_per_minute=2.0),
+    "teleop": TrafficMix(status_hz=1.0, position_hz=10.0, tasks_per_minute=0.0, teleop_hz=10.0, teleop_fraction=0.2),
+}
+
+STREAMS = ("status", "position", "task", "teleop")
+
+
+@dataclass
+class StepResult:
+    """Load and controller resources for one fleet size.
+
+    Latencies are in milliseconds from when a request was due until its response was
+    validated, so they include waiting for a worker.
+    """
+    robots: int
+    duration: float
+    scheduled: int = 0
+    requests: int = 0
+    dropped: int = 0
+    errors: int = 0
+    cpu_percent: float = 0.0
+    rss_mb: Optional[float] = None
+    server_cpu_percent: Optional[float] = None
+    latency: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def requests_per_s(self) -> float:
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def drop_rate(self) -> float:
+        return self.dropped / self.scheduled if self.scheduled else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        return dict(asdict(self), requests_per_s=self.requests_per_s, drop_rate=self.drop_rate, error_rate=self.error_rate)
+
+
+class _Stream:
+    __slots__ = ("kind", "robot", "period", "call", "due", "busy", "periodic")
+
+    def __init__(self, kind: str, robot: Robot, period: float, call: Callable[[Robot], object], due: float, periodic: bool = True):
+        self.kind = kind
+        self.robot = robot
+        self.period = period
+        self.call = call
+        self.due = due
+        self.busy = False
+        self.periodic = periodic
+
+    def __lt__(self, other: "_Stream") -> bool:
+        return self.due < other.due
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+
+    def at(q: float) -> float:
+        return samples[min(len(samples) - 1, max(0, int(math.ceil(q * len(samples))) - 1))] * 1e3
+
+    return {"count": len(samples), "p50": at(0.5), "p95": at(0.95), "p99": at(0.99), "max": samples[-1] * 1e3}
+
+
+def _rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def _cpu_seconds(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class LoadGenerator:
+    """Runs traffic mixes against mock fleets of growing size.
+
+    Usage:
+        generator = LoadGenerator(MIXES["dispatch"])
+        for result in generator.ramp([10, 50, 100], duration=10, max_drop=0.01):
+            print(result.robots, result.drop_rate, result.latency["position"]["p99"])
+    """
+
+    def __init__(
+        self,
+        mix: Optional[TrafficMix] = None,
+        workers: int = 32,
+        targets: int = 10,
+        faults: Optional[Union[str, FaultInjector]] = None,
+        in_process: bool = False,
+        seed: int = 0
+    ):
+        """Initialize a new load generator.
+
+        Args:
+            mix: Request rates per robot. Defaults to MIXES["dispatch"].
+            workers: Requests the controller keeps in flight at most.
+            targets: Targets per robot; tasks go to random ones.
+            faults: Fault profile name, or a FaultInjector when in_process.
+            in_process: Serve the mock from a thread of this process instead of a
+                subprocess. Simpler, but the server's CPU and memory then count as the controller's.
+            seed: Seed of stream offsets, task targets and task arrivals.
+        """
+        if isinstance(faults, FaultInjector) and not in_process:
+            raise ValueError("A FaultInjector requires in_process=True; pass a profile name instead")
+        self.mix = mix if mix is not None else MIXES["dispatch"]
+        self.workers = workers
+        self.targets = targets
+        self.faults = faults
+        self.in_process = in_process
+        self.seed = seed
+
+    def _start_server(self, robots: int):
+        if self.in_process:
+            faults = self.faults
+            if isinstance(faults, str):
+                faults = FaultInjector()
+                faults.configure(profile=self.faults)
+            app = MockApp(robots, faults=faults, robot_class=SimulatedRobot, clock=SimClock(speed=1.0), targets=self.targets)
+            server = MockServer(app).start()
+            return server, dict(server.urls), None
+        command = [
+            sys.executable, "-u", "-m", "saha_sdk.mock", "--robots", str(robots), "--port", "0",
+            "--targets", str(self.targets), "--simulate", "1", "--seed", str(self.seed)
+        ]
+        if self.faults:
+            command += ["--faults", self.faults]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        urls = {}
+        while len(urls) < robots:
+            line = process.stdout.readline()
+            if not line:
+                process.wait()
+                raise RuntimeError(f"Mock server exited with status {process.returncode}")
+            name, _, url = line.strip().partition(": ")
+            urls[name] = url
+        return process, urls, process.pid
+
+    @staticmethod
+    def _stop_server(server):
+        if isinstance(server, MockServer):
+            server.stop()
+            return
+        server.terminate()
+        server.wait()
+
+    def _streams(self, robots: Dict[str, Robot], rng: random.Random, start: float) -> List[_Stream]:
+        mix = self.mix
+        names = sorted(robots)
+        teleop = set(rng.sample(names, int(round(len(names) * mix.teleop_fraction))))
+        streams = []
+
+        def add(kind: str, robot: Robot, hz: float, call: Callable[[Robot], object], periodic: bool = True):
+            if hz > 0:
+                period = 1.0 / hz
+                offset = rng.expovariate(hz) if not periodic else rng.uniform(0, period)
+                streams.append(_Stream(kind, robot, period, call, start + offset, periodic))
+
+        for name in names:
+            robot = robots[name]
+            add("status", robot, mix.status_hz, status.get_robot_status)
+            add("position", robot, mix.position_hz, navigation.get_position_stream)
+            add("task", robot, mix.tasks_per_minute / 60.0, self._create_task(random.Random(f"{self.seed}:{name}")), periodic=False)
+            if name in teleop:
+                add("teleop", robot, mix.teleop_hz, lambda r: navigation.send_velocity(r, TwistModel(vel_x=0.3, vel_z=0.1)))
+        return streams
+
+    def _create_task(self, rng: random.Random) -> Callable[[Robot], object]:
+        def call(robot: Robot):
+            uid = f"site_0_target_{rng.randint(1, self.targets)}"
+            return task.create_task(robot, TaskRequestModel(type="DELIVERY", activate=True, target_uid=uid, payload=[False] * 4))
+        return call
+
+    def run_step(self, robots: int, duration: float = 10.0) -> StepResult:
+        """Drive a fleet of a given size for a while and measure the controller.
+
+        Args:
+            robots: Number of virtual robots.
+            duration: Seconds of traffic.
+        """
+        server, urls, server_pid = self._start_server(robots)
+        transport = PooledHTTPTransport(maxsize=self.workers)
+        fleet = RobotFleet({name: Robot(url, transport=transport, name=name) for name, url in urls.items()}, max_workers=self.workers)
+        rng = random.Random(self.seed)
+        result = StepResult(robots=robots, duration=duration)
+        latencies: Dict[str, List[float]] = {kind: [] for kind in STREAMS}
+        lock = threading.Lock()
+
+        def job(stream: _Stream, due: float):
+            try:
+                stream.call(stream.robot)
+            except Exception:
+                with lock:
+                    result.errors += 1
+            else:
+                latency = time.perf_counter() - due
+                with lock:
+                    latencies[stream.kind].append(latency)
+            finally:
+                stream.busy = False
+
+        start = time.perf_counter()
+        cpu_start, server_cpu_start = time.process_time(), _cpu_seconds(server_pid) if server_pid else None
+        try:
+            streams = self._streams(fleet.robots, rng, start)
+            heapq.heapify(streams)
+            end = start + duration
+            while streams and streams[0].due < end:
+                stream = heapq.heappop(streams)
+                now = time.perf_counter()
+                if stream.due > now:
+                    time.sleep(stream.due - now)
+                    now = time.perf_counter()
+                result.scheduled += 1
+                if stream.periodic and (stream.busy or now - stream.due > stream.period):
+                    result.dropped += 1
+                else:
+                    stream.busy = True
+                    result.requests += 1
+                    fleet.submit(job, stream, stream.due)
+                stream.due += stream.period if stream.periodic else rng.expovariate(1.0 / stream.period)
+                heapq.heappush(streams, stream)
+        finally:
+            fleet.close()
+            elapsed = time.perf_counter() - start
+            result.cpu_percent = (time.process_time() - cpu_start) / elapsed * 100
+            result.rss_mb = _rss_mb()
+            if server_cpu_start is not None:
+                server_cpu = _cpu_seconds(server_pid)
+                result.server_cpu_percent = (server_cpu - server_cpu_start) / elapsed * 100 if server_cpu is not None else None
+            transport.close()
+            self._stop_server(server)
+        result.latency = {kind: _percentiles(samples) for kind, samples in latencies.items() if samples}
+        return result
+
+    def ramp(
+        self,
+        counts: Sequence[int],
+        duration: float = 10.0,
+        max_drop: Optional[float] = None,
+        log: Optional[Callable[[StepResult], None]] = None,
+        max_errors: Optional[float] = None
+    ) -> List[StepResult]:
+        """Run steps of growing fleet size.
+
+        Args:
+            counts: Fleet sizes, in increasing order.
+            duration: Seconds of traffic per step.
+            max_drop: Stop after the first step that drops more than this share of frames.
+            log: Called with each step's result.
+            max_errors: Stop after the first step in which more than this share of requests
+                failed. With injected faults, allow at least the profile's error and drop rates.
+
+        Returns:
+            Results of the steps that ran.
+        """
+        results = []
+        for robots in counts:
+            result = self.run_step(robots, duration)
+            results.append(result)
+            if log is not None:
+                log(result)
+            if max_drop is not None and result.drop_rate > max_drop:
+                break
+            if max_errors is not None and result.error_rate > max_errors:
+                break
+        return results
+
+
+def capacity(results: Sequence[StepResult], max_drop: float, max_errors: float = 0.0) -> int:
+    """Largest fleet size within the drop and error budgets, or 0. By default no errors are allowed."""
+    return max((r.robots for r in results if r.drop_rate <= max_drop and r.error_rate <= max_errors), default=0)
+
+
+def _row(result: StepResult) -> str:
+    def p99(kind: str) -> str:
+        return f"{result.latency[kind]['p99']:.1f}" if kind in result.latency else "-"
+
+    server = f"{result.server_cpu_percent:.0f}" if result.server_cpu_percent is not None else "-"
+    rss = f"{result.rss_mb:.0f}" if result.rss_mb is not None else "-"
+    return (
+        f"{result.robots:>7} {result.requests_per_s:>8.0f} {result.drop_rate:>7.2%} {result.errors:>6} "
+        f"{result.cpu_percent:>6.0f} {rss:>7} {server:>7} {p99('status'):>9} {p99('position'):>9} {p99('task'):>9} {p99('teleop'):>9}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", default="10,50,100,200", help="Comma-separated fleet sizes.")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="dispatch", help="Traffic mix.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of traffic per fleet size.")
+    parser.add_argument("--workers", type=int, default=32, help="Requests in flight at most.")
+    parser.add_argument("--targets", type=int, default=10, help="Targets per robot.")
+    parser.add_argument("--faults", help="Fault profile of the mock server, e.g. warehouse-wifi.")
+    parser.add_argument("--in-process", action="store_true", help="Serve the mock from this process.")
+    parser.add_argument("--max-drop", type=float, default=0.01, help="Share of dropped frames that ends the ramp.")
+    parser.add_argument(
+        "--max-errors", type=float,
+        help="Share of failed requests that ends the ramp. Defaults to 0, or to no limit with --faults."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated traffic.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    args = parser.parse_args()
+
+    generator = LoadGenerator(MIXES[args.mix], args.workers, args.targets, args.faults, args.in_process, args.seed)
+    print(f"{'robots':>7} {'req/s':>8} {'dropped':>7} {'errors':>6} {'cpu %':>6} {'rss MB':>7} {'srv %':>7} "
+          f"{'status':>9} {'position':>9} {'task':>9} {'teleop':>9}  (p99 ms)")
+    max_errors = args.max_errors if args.max_errors is not None else (1.0 if args.faults else 0.0)
+    results = generator.ramp(
+        [int(n) for n in args.robots.split(",")], args.duration, args.max_drop, lambda r: print(_row(r)), max_errors
+    )
+    print(
+        f"capacity: {capacity(results, args.max_drop, max_errors)} robots with {args.mix} traffic, "
+        f"at most {args.max_drop:.1%} dropped frames and {max_errors:.1%} failed requests"
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"mix": asdict(generator.mix), "workers": args.workers, "steps": [r.to_dict() for r in results]}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,578 @@
+import base64
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import models
+
+# A 1x1 transparent PNG, served as the image of every map.
+_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)).decode("ascii")
+
+
+class MockError(Exception):
+    """An API error response of the mock robot."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _ok(message: str = "", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {"status_code": 200, "success": True, "message": message, "data": data, "error": None}
+
+
+def _validate(model, body: Any):
+    if not isinstance(body, dict):
+        raise MockError(422, f"Expected a JSON object for {model.__name__}")
+    try:
+        return model(**body)
+    except (TypeError, ValueError) as e:
+        raise MockError(422, str(e))
+
+
+def _target(name: str, site: str, floor: str, px: float = 0.0, py: float = 0.0, yaw_deg: float = 0.0, **fields) -> Dict[str, Any]:
+    target = {
+        "name": name, "uid": f"{site}_{floor}_{name}", "site_floor": {"site": site, "floor": floor},
+        "eg": "", "eg_dir": "", "px": px, "py": py, "yaw_deg": yaw_deg,
+        "tol": 0.5, "type": "default", "label": "{}", "cid": "",
+    }
+    target.update(fields)
+    return target
+
+
+class MockRobot:
+    """In-memory state of one virtual robot and the handlers of every API endpoint.
+
+    Goals are reached immediately: the robot is placed on the goal and its path is the
+    straight line to it. See ``sim.SimulatedRobot`` for a robot that drives there.
+    """
+
+    def __init__(self, name: str = "robot-1", site: str = "site", floor: str = "0", targets: int = 10, seed: int = 0):
+        """Initialize a new robot.
+
+        Args:
+            name: Robot UID, also used to address it on a MockApp.
+            site: Site of the robot's map.
+            floor: Floor of the robot's map.
+            targets: Number of generated targets on the map.
+            seed: Seed of the generated target positions.
+        """
+        self.name = name
+        self.site = site
+        self.floor = floor
+        self.lock = threading.Lock()
+        self.status = {
+            "is_charging": False, "battery_percent": 100.0, "is_estopped": False,
+            "current_state": "READY", "out_of_service": False,
+        }
+        self.position = {"x": 0.0, "y": 0.0, "theta": 0.0}
+        self.twist = {"vel_x": 0.0, "vel_z": 0.0}
+        self.path: List[Dict[str, float]] = []
+        self.goal: Optional[Dict[str, float]] = None
+        self.hardware = {
+            "lidars": [{"name": "main_lidar", "is_working": True, "state": "WORKING", "error": ""}],
+            "cameras": [{"name": "front_camera", "is_working": True, "state": "WORKING", "error": ""}],
+            "internet_status": {
+                "state": "CONNECTED", "error": "", "wifi_enabled": True, "wifi_connected": True,
+                "wifi_ssid": "MockNetwork", "wifi_ip_addr": "192.168.1.100", "wifi_mac_addr": "00:11:22:33:44:55",
+                "mobile_enabled": False, "mobile_connected": False,
+            },
+        }
+        rng = random.Random(seed)
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        for i in range(targets):
+            target = _target(f"target_{i + 1}", site, floor, round(rng.uniform(0, 20), 2), round(rng.uniform(0, 20), 2), round(rng.uniform(-180, 180), 1))
+            self.targets[target["uid"]] = target
+        self.cruises: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.default_route = ""
+        self.layers: List[Dict[str, Any]] = [{
+            "id": 1, "uid": f"{site}_{floor}_layer-1", "site_floor": {"site": site, "floor": floor},
+            "points": [{"x": 0.0, "y": 0.0, "z": 0.0}, {"x": 1.0, "y": 0.0, "z": 0.0}, {"x": 1.0, "y": 1.0, "z": 0.0}],
+            "layers": [{"enable": True, "type": "speed", "options": {"max_speed": 0.3}}],
+        }]
+        self.maps: Dict[Tuple[str, str], Dict[str, Any]] = {(site, floor): self._map(site, floor)}
+        self.default_map = (site, floor)
+        self.current_map = (site, floor)
+        self.mapping: Optional[Dict[str, Any]] = None
+        self.profiles = {
+            "avaible_environment_profiles": ["Mall", "Restaurant", "Warehouse"],
+            "avaible_behavior_profiles": ["Default", "Nova"],
+            "avaible_speed_profiles": ["slow", "normal", "fast", "faster", "fastest"],
+            "current_environment_profile": "Restaurant",
+            "current_behavior_profile": "Default",
+            "current_speed_profile": "normal",
+        }
+        self.modes = {"avaible_modes": ["elev", "quiet", "night"], "current_modes": []}
+        self.tasks: Dict[int, Dict[str, Any]] = {}
+        self.next_task_id = 1
+        self.paused = False
+        self.speech: List[Dict[str, str]] = []
+        self.screen_url = ""
+
+    @staticmethod
+    def _map(site: str, floor: str) -> Dict[str, Any]:
+        return {
+            "floor": {"site": site, "name": floor, "title": f"{site} {floor}", "elev_groups_default": "", "elev_groups": "[]", "has_map": True},
+            "map": {
+                "site_floor": {"site": site, "floor": floor}, "resolution": 0.05, "width": 1, "height": 1,
+                "origin": {"x": 0.0, "y": 0.0, "z": 0.0}, "map_png_base64": _PNG,
+            },
+        }
+
+    def now(self) -> float:
+        """Current time of the robot, used for timestamps."""
+        return time.time()
+
+    def update(self):
+        """Bring time-dependent state up to date. Called before every request is handled."""
+
+    def _find_target(self, uid: str) -> Dict[str, Any]:
+        target = self.targets.get(uid)
+        if target is None:
+            raise MockError(404, f"Target not found: {uid}")
+        return target
+
+    def _move_to(self, x: float, y: float, theta: float):
+        if self.status["is_estopped"]:
+            raise MockError(400, "Robot is emergency stopped")
+        start = dict(self.position)
+        self.goal = {"x": x, "y": y, "theta": theta}
+        self.path = [start, dict(self.goal)]
+        self.position = dict(self.goal)
+
+    # Status
+
+    def get_status(self, params, query, body):
+        return dict(self.status)
+
+    def get_hardware(self, params, query, body):
+        return self.hardware
+
+    def get_info(self, params, query, body):
+        return {"robot_uid": self.name, "project_id": "mock", "site_floor": {"site": self.current_map[0], "floor": self.current_map[1]}}
+
+    # Navigation
+
+    def get_path(self, params, query, body):
+        return {"site": self.current_map[0], "floor": self.current_map[1], "points": self.path}
+
+    def get_position(self, params, query, body):
+        return {"position": dict(self.position), "twist": dict(self.twist)}
+
+    def set_goal_pose(self, params, query, body):
+        pose = _validate(models.Position, body)
+        self._move_to(pose.x, pose.y, pose.theta)
+        return _ok("Moving to pose")
+
+    def set_goal_target(self, params, query, body):
+        goal = _validate(models.GoalTargetModel, body)
+        target = self._find_target(goal.target_uid)
+        self._move_to(target["px"], target["py"], math.radians(target["yaw_deg"]))
+        return _ok(f"Moving to target: {goal.target_uid}")
+
+    def get_stop(self, params, query, body):
+        return {"stop": self.status["is_estopped"]}
+
+    def set_stop(self, params, query, body):
+        stop = _validate(models.RobotStopModel, body).stop
+        self.status["is_estopped"] = stop
+        self.status["current_state"] = "STOPPED" if stop else "READY"
+        if stop:
+            self.twist = {"vel_x": 0.0, "vel_z": 0.0}
+        return _ok("Emergency stop set" if stop else "Emergency stop released")
+
+    def set_velocity(self, params, query, body):
+        vel = _validate(models.TwistModel, body)
+        if self.status["is_estopped"]:
+            raise MockError(400, "Robot is emergency stopped")
+        self.twist = {"vel_x": vel.vel_x, "vel_z": vel.vel_z}
+        return _ok("Velocity set")
+
+    def start_localization(self, params, query, body):
+        site_floor = _validate(models.SiteFloorModel, body)
+        if (site_floor.site, site_floor.floor) not in self.maps:
+            raise MockError(404, f"Map not found: {site_floor.site}/{site_floor.floor}")
+        self.current_map = (site_floor.site, site_floor.floor)
+        return _ok("Localization started")
+
+    # Targets
+
+    def get_targets(self, params, query, body):
+        site, floor = params.get("site"), params.get("floor")
+        return [
+            t for t in self.targets.values()
+            if (site is None or t["site_floor"]["site"] == site) and (floor is None or t["site_floor"]["floor"] == floor)
+        ]
+
+    def add_target(self, params, query, body):
+        request = _validate(models.TargetRequestModel, body)
+        uid = f"{request.site}_{request.floor}_{request.name}"
+        if uid in self.targets:
+            raise MockError(400, f"Target already exists: {uid}")
+        self.targets[uid] = self._target_from(request)
+        return _ok("Target added", {"uid": uid})
+
+    def _target_from(self, request) -> Dict[str, Any]:
+        px, py, yaw_deg = request.px, request.py, request.yaw_deg
+        if request.use_current_position:
+            px, py, yaw_deg = self.position["x"], self.position["y"], math.degrees(self.position["theta"])
+        return _target(
+            request.name, request.site, request.floor, px, py, yaw_deg, eg=request.eg, eg_dir=request.eg_dir,
+            tol=request.tol, type=request.type, label=request.label, cid=request.cid
+        )
+
+    def get_target(self, params, query, body):
+        return self._find_target(f"{params['site']}_{params['floor']}_{params['name']}")
+
+    def update_target(self, params, query, body):
+        uid = f"{params['site']}_{params['floor']}_{params['name']}"
+        self._find_target(uid)
+        target = self._target_from(_validate(models.TargetRequestModel, body))
+        del self.targets[uid]
+        self.targets[target["uid"]] = target
+        return _ok("Target updated")
+
+    def delete_target(self, params, query, body):
+        uid = f"{params['site']}_{params['floor']}_{params['name']}"
+        self._find_target(uid)
+        del self.targets[uid]
+        return _ok("Target deleted")
+
+    # Cruises
+
+    def _cruise(self, cruise: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "name": cruise["name"], "site_floor": {"site": cruise["site"], "floor": cruise["floor"]},
+            "waypoints": [self.targets[uid] for uid in cruise["waypoints"] if uid in self.targets],
+        }
+
+    def _find_cruise(self, params) -> Dict[str, Any]:
+        cruise = self.cruises.get((params["site"], params["floor"], params["name"]))
+        if cruise is None:
+            raise MockError(404, f"Cruise not found: {params['name']}")
+        return cruise
+
+    def get_default_route(self, params, query, body):
+        return {"route": self.default_route}
+
+    def set_default_route(self, params, query, body):
+        self.default_route = _validate(models.RobotRouteModel, body).route
+        return _ok("Default route set")
+
+    def get_cruises(self, params, query, body):
+        site, floor = params.get("site"), params.get("floor")
+        return [
+            self._cruise(c) for c in self.cruises.values()
+            if (site is None or c["site"] == site) and (floor is None or c["floor"] == floor)
+        ]
+
+    def _cruise_from(self, body) -> Dict[str, Any]:
+        request = _validate(models.CruiseRequestModel, body)
+        for uid in request.waypoints:
+            self._find_target(uid)
+        return {"name": request.name, "site": request.site, "floor": request.floor, "waypoints": list(request.waypoints)}
+
+    def add_cruise(self, params, query, body):
+        cruise = self._cruise_from(body)
+        key = (cruise["site"], cruise["floor"], cruise["name"])
+        if key in self.cruises:
+            raise MockError(400, f"Cruise already exists: {cruise['name']}")
+        self.cruises[key] = cruise
+        return _ok("Cruise added")
+
+    def control_cruise(self, params, query, body):
+        control = _validate(models.CruiseControlRequestModel, body)
+        route = control.cruise_route or self.default_route
+        if control.cruise_cmd == "CMD_START":
+            cruise = next((c for c in self.cruises.values() if c["name"] == route), None)
+            if cruise is None:
+                raise MockError(404, f"Cruise not found: {route}")
+            self.status["current_state"] = "CRUISING"
+            return _ok(f"Cruise started: {route}")
+        if control.cruise_cmd == "CMD_STOP":
+            self.status["current_state"] = "READY"
+            return _ok("Cruise stopped")
+        raise MockError(400, f"Unknown cruise command: {control.cruise_cmd}")
+
+    def get_cruise(self, params, query, body):
+        return self._cruise(self._find_cruise(params))
+
+    def update_cruise(self, params, query, body):
+        self._find_cruise(params)
+        cruise = self._cruise_from(body)
+        del self.cruises[(params["site"], params["floor"], params["name"])]
+        self.cruises[(cruise["site"], cruise["floor"], cruise["name"])] = cruise
+        return _ok("Cruise updated")
+
+    def delete_cruise(self, params, query, body):
+        self._find_cruise(params)
+        del self.cruises[(params["site"], params["floor"], params["name"])]
+        return _ok("Cruise deleted")
+
+    # Layers
+
+    def get_layers(self, params, query, body):
+        site, floor = params.get("site"), params.get("floor")
+        return [
+            layer for layer in self.layers
+            if (site is None or layer["site_floor"]["site"] == site) and (floor is None or layer["site_floor"]["floor"] == floor)
+        ]
+
+    def get_layer(self, params, query, body):
+        for layer in self.get_layers(params, query, body):
+            if layer["uid"] == params["uid"]:
+                return layer
+        raise MockError(404, f"Layer not found: {params['uid']}")
+
+    # Mapping
+
+    def get_maps(self, params, query, body):
+        return [m["floor"] for m in self.maps.values()]
+
+    def get_default_map(self, params, query, body):
+        return {"site": self.default_map[0], "floor": self.default_map[1]}
+
+    def _map_key(self, site: str, floor: str) -> Tuple[str, str]:
+        if (site, floor) not in self.maps:
+            raise MockError(404, f"Map not found: {site}/{floor}")
+        return site, floor
+
+    def set_default_map(self, params, query, body):
+        site_floor = _validate(models.SiteFloorModel, body)
+        self.default_map = self._map_key(site_floor.site, site_floor.floor)
+        return _ok("Default map set")
+
+    def get_current_map(self, params, query, body):
+        return self.maps[self.current_map]["map"]
+
+    def get_map(self, params, query, body):
+        return self.maps[self._map_key(params["site"], params["floor"])]["map"]
+
+    def delete_map(self, params, query, body):
+        key = self._map_key(params["site"], params["floor"])
+        if key == self.current_map:
+            raise MockError(400, "The current map cannot be deleted")
+        del self.maps[key]
+        return _ok("Map deleted")
+
+    def start_mapping(self, params, query, body):
+        mapping = _validate(models.MappingModel, body)
+        if self.mapping is not None:
+            raise MockError(400, "Mapping is already running")
+        site_floor = mapping.site_floor or models.SiteFloorModel(site=self.site, floor=mapping.title)
+        self.mapping = {"site": site_floor.site, "floor": site_floor.floor}
+        self.status["current_state"] = "MAPPING"
+        return _ok("Mapping started")
+
+    def cancel_mapping(self, params, query, body):
+        if self.mapping is None:
+            raise MockError(400, "Mapping is not running")
+        self.mapping = None
+        self.status["current_state"] = "READY"
+        return _ok("Mapping cancelled")
+
+    def save_map(self, params, query, body):
+        if self.mapping is None:
+            raise MockError(400, "Mapping is not running")
+        key = (self.mapping["site"], self.mapping["floor"])
+        self.maps[key] = self._map(*key)
+        self.current_map = key
+        self.mapping = None
+        self.status["current_state"] = "READY"
+        return _ok("Map saved")
+
+    def change_map(self, params, query, body):
+        site_floor = _validate(models.SiteFloorModel, body)
+        self.current_map = self._map_key(site_floor.site, site_floor.floor)
+        return _ok("Map changed")
+
+    def remap(self, params, query, body):
+        site_floor = _validate(models.SiteFloorModel, body)
+        self._map_key(site_floor.site, site_floor.floor)
+        if self.mapping is not None:
+            raise MockError(400, "Mapping is already running")
+        self.mapping = {"site": site_floor.site, "floor": site_floor.floor}
+        self.status["current_state"] = "MAPPING"
+        return _ok("Remapping started")
+
+    # Profiles and modes
+
+    def get_profiles(self, params, query, body):
+        return self.profiles
+
+    def _set_profile(self, kind: str, body) -> Dict[str, Any]:
+        profile = _validate(models.RobotProfileModel, body).profile
+        if profile not in self.profiles[f"avaible_{kind}_profiles"]:
+            raise MockError(400, f"Unknown {kind} profile: {profile}")
+        self.profiles[f"current_{kind}_profile"] = profile
+        return _ok(f"{kind.capitalize()} profile changed")
+
+    def set_environment_profile(self, params, query, body):
+        return self._set_profile("environment", body)
+
+    def set_behavior_profile(self, params, query, body):
+        return self._set_profile("behavior", body)
+
+    def set_speed_profile(self, params, query, body):
+        return self._set_profile("speed", body)
+
+    def get_modes(self, params, query, body):
+        return self.modes
+
+    def set_mode(self, params, query, body):
+        mode = _validate(models.RobotModeModel, body).mode
+        if mode not in self.modes["avaible_modes"]:
+            raise MockError(400, f"Unknown mode: {mode}")
+        if mode not in self.modes["current_modes"]:
+            self.modes["current_modes"].append(mode)
+        return _ok("Mode set")
+
+    def remove_mode(self, params, query, body):
+        if params["mode"] not in self.modes["current_modes"]:
+            raise MockError(404, f"Mode not active: {params['mode']}")
+        self.modes["current_modes"].remove(params["mode"])
+        return _ok("Mode removed")
+
+    # Tasks
+
+    def _find_task(self, params) -> Dict[str, Any]:
+        try:
+            task = self.tasks.get(int(params["task_uid"]))
+        except ValueError:
+            task = None
+        if task is None:
+            raise MockError(404, f"Task not found: {params['task_uid']}")
+        return task
+
+    def _task_from(self, task_id: int, body) -> Dict[str, Any]:
+        request = _validate(models.TaskRequestModel, body)
+        target = self._find_target(request.target_uid)
+        return {
+            "id": task_id, "uid": task_id, "site": target["site_floor"]["site"], "floor": target["site_floor"]["floor"],
+            "task_type": request.type, "task_index": request.task_index, "success": True, "completed": False,
+            "message": "Task created", "target": target, "create_time": self.now(),
+            "celebrating_name": request.celebrating_name, "payload": list(request.payload),
+        }
+
+    def get_tasks(self, params, query, body):
+        return list(self.tasks.values())
+
+    def create_task(self, params, query, body):
+        task = self._task_from(self.next_task_id, body)
+        self.tasks[task["id"]] = task
+        self.next_task_id += 1
+        return _ok("Task created", {"uid": task["uid"]})
+
+    def get_task(self, params, query, body):
+        return self._find_task(params)
+
+    def update_task(self, params, query, body):
+        task = self._find_task(params)
+        updated = self._task_from(task["id"], body)
+        updated["create_time"] = task["create_time"]
+        self.tasks[task["id"]] = updated
+        return _ok("Task updated")
+
+    def delete_task(self, params, query, body):
+        del self.tasks[self._find_task(params)["id"]]
+        return _ok("Task deleted")
+
+    def pause_tasks(self, params, query, body):
+        self.paused = True
+        return _ok("Mission paused")
+
+    def resume_tasks(self, params, query, body):
+        self.paused = False
+        return _ok("Mission resumed")
+
+    def clear_tasks(self, params, query, body):
+        self.tasks.clear()
+        return _ok("Tasks cleared")
+
+    # UI
+
+    def speak(self, params, query, body):
+        speech = _validate(models.SpeechModel, body)
+        self.speech.append({"lang": speech.lang, "text": speech.text})
+        return _ok("Speech sent")
+
+    def set_screen(self, params, query, body):
+        url = query.get("url")
+        if not url:
+            raise MockError(422, "Missing query parameter: url")
+        self.screen_url = url
+        return _ok("Screen updated")
+
+
+# Name of the MockRobot method handling every (method, path template) the SDK uses.
+ROUTES: Dict[Tuple[str, str], str] = {
+    ("GET", "/api/v1/config/default-route"): "get_default_route",
+    ("POST", "/api/v1/config/default-route"): "set_default_route",
+    ("GET", "/api/v1/cruises"): "get_cruises",
+    ("POST", "/api/v1/cruises"): "add_cruise",
+    ("POST", "/api/v1/cruises/control"): "control_cruise",
+    ("GET", "/api/v1/cruises/{site}"): "get_cruises",
+    ("GET", "/api/v1/cruises/{site}/{floor}"): "get_cruises",
+    ("GET", "/api/v1/cruises/{site}/{floor}/{name}"): "get_cruise",
+    ("PATCH", "/api/v1/cruises/{site}/{floor}/{name}"): "update_cruise",
+    ("DELETE", "/api/v1/cruises/{site}/{floor}/{name}"): "delete_cruise",
+    ("GET", "/api/v1/layers"): "get_layers",
+    ("GET", "/api/v1/layers/{site}"): "get_layers",
+    ("GET", "/api/v1/layers/{site}/{floor}"): "get_layers",
+    ("GET", "/api/v1/layers/{site}/{floor}/{uid}"): "get_layer",
+    ("GET", "/api/v1/mapping"): "get_maps",
+    ("POST", "/api/v1/mapping/cancel"): "cancel_mapping",
+    ("POST", "/api/v1/mapping/change"): "change_map",
+    ("GET", "/api/v1/mapping/default-map"): "get_default_map",
+    ("POST", "/api/v1/mapping/default-map"): "set_default_map",
+    ("GET", "/api/v1/mapping/map"): "get_current_map",
+    ("POST", "/api/v1/mapping/remap"): "remap",
+    ("POST", "/api/v1/mapping/save"): "save_map",
+    ("POST", "/api/v1/mapping/start"): "start_mapping",
+    ("GET", "/api/v1/mapping/{site}/{floor}"): "get_map",
+    ("DELETE", "/api/v1/mapping/{site}/{floor}"): "delete_map",
+    ("GET", "/api/v1/mode"): "get_modes",
+    ("POST", "/api/v1/mode"): "set_mode",
+    ("DELETE", "/api/v1/mode/{mode}"): "remove_mode",
+    ("POST", "/api/v1/navigation/goal/pose"): "set_goal_pose",
+    ("POST", "/api/v1/navigation/goal/target"): "set_goal_target",
+    ("POST", "/api/v1/navigation/localization"): "start_localization",
+    ("GET", "/api/v1/navigation/path"): "get_path",
+    ("GET", "/api/v1/navigation/path/stream"): "get_path",
+    ("GET", "/api/v1/navigation/position"): "get_position",
+    ("GET", "/api/v1/navigation/position/stream"): "get_position",
+    ("GET", "/api/v1/navigation/stop"): "get_stop",
+    ("POST", "/api/v1/navigation/stop"): "set_stop",
+    ("POST", "/api/v1/navigation/vel"): "set_velocity",
+    ("POST", "/api/v1/navigation/vel/safe"): "set_velocity",
+    ("GET", "/api/v1/profile"): "get_profiles",
+    ("POST", "/api/v1/profile/behavior"): "set_behavior_profile",
+    ("POST", "/api/v1/profile/environment"): "set_environment_profile",
+    ("POST", "/api/v1/profile/speed"): "set_speed_profile",
+    ("GET", "/api/v1/status"): "get_status",
+    ("GET", "/api/v1/status/hardware"): "get_hardware",
+    ("GET", "/api/v1/status/info"): "get_info",
+    ("GET", "/api/v1/targets"): "get_targets",
+    ("POST", "/api/v1/targets"): "add_target",
+    ("GET", "/api/v1/targets/{site}"): "get_targets",
+    ("GET", "/api/v1/targets/{site}/{floor}"): "get_targets",
+    ("GET", "/api/v1/targets/{site}/{floor}/{name}"): "get_target",
+    ("PATCH", "/api/v1/targets/{site}/{floor}/{name}"): "update_target",
+    ("DELETE", "/api/v1/targets/{site}/{floor}/{name}"): "delete_target",
+    ("GET", "/api/v1/tasks"): "get_tasks",
+    ("POST", "/api/v1/tasks"): "create_task",
+    ("POST", "/api/v1/tasks/clear"): "clear_tasks",
+    ("POST", "/api/v1/tasks/pause"): "pause_tasks",
+    ("POST", "/api/v1/tasks/resume"): "resume_tasks",
+    ("GET", "/api/v1/tasks/{task_uid}"): "get_task",
+    ("PATCH", "/api/v1/tasks/{task_uid}"): "update_task",
+    ("DELETE", "/api/v1/tasks/{task_uid}"): "delete_task",
+    ("POST", "/api/v1/ui/screen/pixel"): "set_screen",
+    ("POST", "/api/v1/ui/speech"): "speak",
+}
@@ -0,0 +1,194 @@
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set
+
+from .app import MockApp
+
+_MAX_HEADER_BYTES = 64 * 1024
+
+
+class MockServer:
+    """Serves a MockApp over HTTP/1.1 with keep-alive, on an asyncio event loop.
+
+    Either every robot shares one port and is addressed by path prefix, or each robot gets
+    its own port so that clients use plain "http://host:port" base URLs.
+
+    Usage:
+        with MockServer(MockApp(robots=10), port_per_robot=True) as server:
+            robots = {name: Robot(url) for name, url in server.urls.items()}
+    """
+
+    def __init__(self, app: Optional[MockApp] = None, host: str = "127.0.0.1", port: int = 0, port_per_robot: bool = False):
+        """Initialize a new server.
+
+        Args:
+            app: App to serve. Defaults to a single robot.
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free one. With port_per_robot, robots get
+                consecutive ports starting here.
+            port_per_robot: Listen on a separate port for each robot.
+        """
+        self.app = app if app is not None else MockApp()
+        self.host = host
+        self.port = port
+        self.port_per_robot = port_per_robot
+        self.urls: Dict[str, str] = {}
+        self._servers: List[asyncio.AbstractServer] = []
+        self._ports: List[int] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the first listener."""
+        port = self._servers[0].sockets[0].getsockname()[1]
+        return f"http://{self.host}:{port}"
+
+    async def start_async(self):
+        """Start listening on the running event loop."""
+        if not self.port_per_robot:
+            self._servers.append(await asyncio.start_server(self._connection, self.host, self.port))
+            self.urls = {name: f"{self.url}/robots/{name}" for name in self.app.robots}
+            return
+        for i, name in enumerate(self.app.robots):
+            server = await asyncio.start_server(self._connection, self.host, self.port + i if self.port else 0)
+            self._servers.append(server)
+            port = server.sockets[0].getsockname()[1]
+            self.app.ports[port] = name
+            self._ports.append(port)
+            self.urls[name] = f"http://{self.host}:{port}"
+
+    async def aclose(self):
+        """Stop listening and close open connections."""
+        servers, self._servers = self._servers, []
+        for server in servers:
+            server.close()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for server in servers:
+            await server.wait_closed()
+        for port in self._ports:
+            self.app.ports.pop(port, None)
+        self._ports = []
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        port = writer.get_extra_info("sockname")[1]
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                if len(head) > _MAX_HEADER_BYTES:
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0) or 0)
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                response = await self.app.handle(method, target, body, port)
+                if response.drop:
+                    writer.transport.abort()
+                    return
+                await self._respond(writer, response, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            return
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, response, keep_alive: bool):
+        head = [f"HTTP/1.1 {response.status} {response.reason}"]
+        head.extend(f"{k}: {v}" for k, v in response.headers.items())
+        head.append(f"Content-Length: {len(response.body)}")
+        if not keep_alive:
+            head.append("Connection: close")
+        head = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1")
+        if not response.stall and not response.body_rate:
+            writer.write(head + response.body)
+            if writer.transport.get_write_buffer_size() > 64 * 1024:
+                await writer.drain()
+            return
+        writer.write(head)
+        await writer.drain()
+        if response.stall:
+            await asyncio.sleep(response.stall)
+        if not response.body_rate:
+            writer.write(response.body)
+            return
+        # Trickle the body in chunks of about 10 ms worth of bytes.
+        chunk = max(1, int(response.body_rate / 100))
+        for start in range(0, len(response.body), chunk):
+            writer.write(response.body[start:start + chunk])
+            await writer.drain()
+            await asyncio.sleep(len(response.body[start:start + chunk]) / response.body_rate)
+
+    def start(self) -> "MockServer":
+        """Start serving on a background thread.
+
+        Raises:
+            OSError: If a port cannot be bound, e.g. because it is already in use.
+        """
+        loop = self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start_async())
+            except BaseException as e:
+                errors.append(e)
+                loop.run_until_complete(self.aclose())
+                loop.close()
+                ready.set()
+                return
+            ready.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="saha-mock-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            self._thread.join()
+            self._loop = self._thread = None
+            raise errors[0]
+        return self
+
+    def stop(self):
+        """Stop a server started with start()."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    async def __aenter__(self) -> "MockServer":
+        await self.start_async()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
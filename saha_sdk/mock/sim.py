@@ -0,0 +1,373 @@
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .. import models
+from .robot import MockError, MockRobot, _target, _validate
+
+# Scale of the maximum linear velocity for each speed profile.
+SPEED_SCALES = {"slow": 0.5, "normal": 1.0, "fast": 1.25, "faster": 1.5, "fastest": 1.75}
+
+
+class SimClock:
+    """Simulated time shared by simulated robots.
+
+    Without a speed the clock only moves when advanced, which makes runs fully
+    deterministic. With one it follows the wall clock that many times faster, e.g. 60 for
+    a simulated minute every second, and can still be advanced on top of that.
+    """
+
+    def __init__(self, start: float = 0.0, speed: Optional[float] = None):
+        """Initialize a new clock.
+
+        Args:
+            start: Simulated time at creation, in seconds.
+            speed: Simulated seconds per wall clock second, or None for a manual clock.
+        """
+        self.start = start
+        self.speed = speed
+        self._offset = 0.0
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        if self.speed is None:
+            return self.start + self._offset
+        return self.start + self._offset + (time.monotonic() - self._origin) * self.speed
+
+    def advance(self, seconds: float) -> float:
+        """Move the clock forward and return the new time."""
+        if seconds < 0:
+            raise ValueError("The clock cannot go backwards")
+        self._offset += seconds
+        return self.now()
+
+
+@dataclass
+class Kinematics:
+    """Motion limits and controller tolerances of a simulated robot.
+
+    Attributes:
+        max_linear: Maximum linear velocity in m/s at the "normal" speed profile.
+        max_angular: Maximum angular velocity in rad/s.
+        turn_in_place: Heading error in radians above which the robot turns before driving.
+        goal_tolerance: Distance in meters at which a goal position is reached.
+        heading_tolerance: Heading error in radians at which a goal orientation is reached.
+        velocity_timeout: Seconds a velocity command is followed without a new one.
+        path_resolution: Distance in meters between points of reported paths.
+    """
+    max_linear: float = 0.8
+    max_angular: float = 1.2
+    turn_in_place: float = 0.35
+    goal_tolerance: float = 0.05
+    heading_tolerance: float = 0.02
+    velocity_timeout: float = 0.5
+    path_resolution: float = 0.5
+
+
+@dataclass
+class Battery:
+    """Battery model of a simulated robot, in percent of a full charge.
+
+    Attributes:
+        idle_drain: Drain per hour, moving or not.
+        distance_drain: Additional drain per meter driven.
+        charge_rate: Charge per hour while parked on a dock.
+        dock_type: Type of the targets that are docks.
+    """
+    idle_drain: float = 2.0
+    distance_drain: float = 0.05
+    charge_rate: float = 40.0
+    dock_type: str = "charge"
+
+
+@dataclass
+class _Goal:
+    x: float
+    y: float
+    theta: float
+    task: Optional[int] = None
+
+
+def _wrap(angle: float) -> float:
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+def _clamp(value: float, limit: float) -> float:
+    return max(-limit, min(limit, value))
+
+
+class SimulatedRobot(MockRobot):
+    """A mock robot that drives to its goals on a simulated clock.
+
+    The robot is a unicycle simulated in fixed time steps: it turns towards its goal,
+    drives there in a straight line within the velocity limits of its speed profile, and
+    turns to the goal heading. Its battery drains with time and distance, charges while
+    parked on a dock target, and the robot goes out of service when it runs empty.
+    Velocity commands cancel the goal and are followed for ``kinematics.velocity_timeout``.
+
+    Cruises visit their waypoints for the requested number of rounds. Activated tasks are
+    driven to one after another unless the mission is paused, and complete on arrival.
+
+    State is advanced up to ``clock.now()`` before every request, in whole steps, so a run
+    gives the same results however often the robot is polled.
+
+    Usage:
+        clock = SimClock()
+        app = MockApp(robots=10, robot_class=SimulatedRobot, clock=clock)
+        ...
+        clock.advance(3600)
+    """
+
+    def __init__(
+        self,
+        name: str = "robot-1",
+        clock: Optional[SimClock] = None,
+        kinematics: Optional[Kinematics] = None,
+        battery: Optional[Battery] = None,
+        step: float = 0.05,
+        dock: bool = True,
+        **kwargs
+    ):
+        """Initialize a new robot.
+
+        Args:
+            name: Robot UID.
+            clock: Simulated clock, usually shared by all robots. Defaults to a new manual clock.
+            kinematics: Motion limits. Defaults to Kinematics().
+            battery: Battery model. Defaults to Battery().
+            step: Simulation time step in seconds.
+            dock: Add a dock target named "dock" at the origin, where the robot starts charging.
+            **kwargs: Options of MockRobot, e.g. targets=100.
+        """
+        super().__init__(name, **kwargs)
+        self.clock = clock if clock is not None else SimClock()
+        self.kinematics = kinematics if kinematics is not None else Kinematics()
+        self.battery = battery if battery is not None else Battery()
+        self.step = step
+        self.odometer = 0.0
+        self._start = self.clock.now()
+        self._steps = 0
+        self._goals: Deque[_Goal] = deque()
+        self._tasks: Deque[int] = deque()
+        self._command: Tuple[float, float] = (0.0, 0.0)
+        self._command_until = -math.inf
+        if dock:
+            target = _target("dock", self.site, self.floor, type=self.battery.dock_type)
+            self.targets[target["uid"]] = target
+            self.status["is_charging"] = True
+
+    @property
+    def time(self) -> float:
+        """Simulated time the robot's state is at."""
+        return self._start + self._steps * self.step
+
+    def now(self) -> float:
+        return self.time
+
+    def update(self):
+        steps = int((self.clock.now() - self._start) / self.step + 1e-9) - self._steps
+        if steps > 0:
+            self.run(steps)
+
+    def run(self, steps: int):
+        """Advance the simulation by a number of steps, regardless of the clock."""
+        while steps > 0:
+            if not self._goals and self.time >= self._command_until:
+                self._next_task()
+                if not self._goals:
+                    self._rest(steps)
+                    return
+            self._tick()
+            steps -= 1
+
+    def _tick(self):
+        dt = self.step
+        v = w = 0.0
+        if self._goals:
+            v, w = self._follow(self._goals[0], dt)
+        elif self.time < self._command_until:
+            v, w = self._command
+        position = self.position
+        position["theta"] = _wrap(position["theta"] + w * dt)
+        position["x"] += v * math.cos(position["theta"]) * dt
+        position["y"] += v * math.sin(position["theta"]) * dt
+        self.twist = {"vel_x": v, "vel_z": w}
+        self.odometer += abs(v) * dt
+        self._steps += 1
+        self._drain(abs(v) * dt, dt)
+        if self._goals and self._reached(self._goals[0]):
+            self._arrive(self._goals.popleft())
+
+    def _rest(self, steps: int):
+        self.twist = {"vel_x": 0.0, "vel_z": 0.0}
+        self._steps += steps
+        self._drain(0.0, steps * self.step)
+
+    def _max_linear(self) -> float:
+        return self.kinematics.max_linear * SPEED_SCALES.get(self.profiles["current_speed_profile"], 1.0)
+
+    def _follow(self, goal: _Goal, dt: float) -> Tuple[float, float]:
+        kinematics = self.kinematics
+        dx, dy = goal.x - self.position["x"], goal.y - self.position["y"]
+        distance = math.hypot(dx, dy)
+        if distance <= kinematics.goal_tolerance:
+            return 0.0, _clamp(_wrap(goal.theta - self.position["theta"]) / dt, kinematics.max_angular)
+        error = _wrap(math.atan2(dy, dx) - self.position["theta"])
+        w = _clamp(error / dt, kinematics.max_angular)
+        if abs(error) > kinematics.turn_in_place:
+            return 0.0, w
+        return min(self._max_linear(), distance / dt), w
+
+    def _reached(self, goal: _Goal) -> bool:
+        return (
+            math.hypot(goal.x - self.position["x"], goal.y - self.position["y"]) <= self.kinematics.goal_tolerance
+            and abs(_wrap(goal.theta - self.position["theta"])) <= self.kinematics.heading_tolerance
+        )
+
+    def _arrive(self, goal: _Goal):
+        task = self.tasks.get(goal.task) if goal.task is not None else None
+        if task is not None:
+            task["completed"] = True
+            task["message"] = "Task completed"
+        if self._goals:
+            self.goal = self._goal_dict(self._goals[0])
+            return
+        self.goal = None
+        self.path = []
+        self.status["current_state"] = "READY"
+        self.status["is_charging"] = self._docked()
+        self._next_task()
+
+    def _docked(self) -> bool:
+        site, floor = self.current_map
+        return any(
+            t["type"] == self.battery.dock_type and t["site_floor"] == {"site": site, "floor": floor}
+            and math.hypot(t["px"] - self.position["x"], t["py"] - self.position["y"]) <= t["tol"]
+            for t in self.targets.values()
+        )
+
+    def _drain(self, distance: float, dt: float):
+        status = self.status
+        if status["is_charging"]:
+            status["battery_percent"] = min(100.0, status["battery_percent"] + self.battery.charge_rate * dt / 3600)
+            return
+        status["battery_percent"] -= self.battery.idle_drain * dt / 3600 + self.battery.distance_drain * distance
+        if status["battery_percent"] <= 0.0:
+            status["battery_percent"] = 0.0
+            status["out_of_service"] = True
+            status["current_state"] = "STOPPED"
+            self._halt()
+
+    def _halt(self):
+        self._goals.clear()
+        self.goal = None
+        self.path = []
+        self._command_until = -math.inf
+        self.twist = {"vel_x": 0.0, "vel_z": 0.0}
+
+    @staticmethod
+    def _goal_dict(goal: _Goal) -> Dict[str, float]:
+        return {"x": goal.x, "y": goal.y, "theta": goal.theta}
+
+    @staticmethod
+    def _target_goal(target: Dict[str, Any], task: Optional[int] = None) -> _Goal:
+        return _Goal(target["px"], target["py"], math.radians(target["yaw_deg"]), task)
+
+    def _check_motion(self):
+        if self.status["is_estopped"]:
+            raise MockError(400, "Robot is emergency stopped")
+        if self.status["out_of_service"]:
+            raise MockError(400, "Robot is out of service")
+
+    def _go(self, goals: List[_Goal], state: str):
+        self._halt()
+        self._goals.extend(goals)
+        if not self._goals:
+            self.status["current_state"] = "READY"
+            return
+        self.goal = self._goal_dict(self._goals[0])
+        self.status["current_state"] = state
+        self.status["is_charging"] = False
+
+    def _next_task(self):
+        if self._goals or self.paused or self.time < self._command_until:
+            return
+        while self._tasks and not (self.status["is_estopped"] or self.status["out_of_service"]):
+            task = self.tasks.get(self._tasks.popleft())
+            if task is not None and not task["completed"]:
+                self._go([self._target_goal(task["target"], task["id"])], "MOVING_TO_TARGET")
+                return
+
+    def _plan(self) -> List[Dict[str, float]]:
+        if not self._goals:
+            return []
+        goal = self._goals[0]
+        x, y = self.position["x"], self.position["y"]
+        dx, dy = goal.x - x, goal.y - y
+        distance = math.hypot(dx, dy)
+        heading = math.atan2(dy, dx) if distance > 0 else goal.theta
+        n = max(1, math.ceil(distance / self.kinematics.path_resolution))
+        points = [{"x": x + dx * i / n, "y": y + dy * i / n, "theta": heading} for i in range(n)]
+        points.append(self._goal_dict(goal))
+        return points
+
+    # Handlers with simulated motion
+
+    def _move_to(self, x: float, y: float, theta: float):
+        self._check_motion()
+        self._go([_Goal(x, y, theta)], "MOVING_TO_TARGET")
+
+    def get_path(self, params, query, body):
+        self.path = self._plan()
+        return super().get_path(params, query, body)
+
+    def set_stop(self, params, query, body):
+        result = super().set_stop(params, query, body)
+        if self.status["is_estopped"]:
+            self._halt()
+        return result
+
+    def set_velocity(self, params, query, body):
+        velocity = _validate(models.TwistModel, body)
+        self._check_motion()
+        self._go([], "READY")
+        self.status["is_charging"] = False
+        self._command = (_clamp(velocity.vel_x, self._max_linear()), _clamp(velocity.vel_z, self.kinematics.max_angular))
+        self._command_until = self.time + self.kinematics.velocity_timeout
+        result = super().set_velocity(params, query, body)
+        self.twist = {"vel_x": self._command[0], "vel_z": self._command[1]}
+        return result
+
+    def control_cruise(self, params, query, body):
+        control = _validate(models.CruiseControlRequestModel, body)
+        if control.cruise_cmd == "CMD_START":
+            self._check_motion()
+        result = super().control_cruise(params, query, body)
+        if control.cruise_cmd == "CMD_STOP":
+            self._go([], "READY")
+            return result
+        route = control.cruise_route or self.default_route
+        cruise = next(c for c in self.cruises.values() if c["name"] == route)
+        waypoints = [self.targets[uid] for uid in cruise["waypoints"] if uid in self.targets]
+        self._go([self._target_goal(t) for _ in range(max(1, control.number_of_rounds)) for t in waypoints], "CRUISING")
+        return result
+
+    def create_task(self, params, query, body):
+        result = super().create_task(params, query, body)
+        if body.get("activate"):
+            self._tasks.append(result["data"]["uid"])
+            self._next_task()
+        return result
+
+    def pause_tasks(self, params, query, body):
+        if self._goals and self._goals[0].task is not None:
+            self._tasks.appendleft(self._goals[0].task)
+            self._go([], "READY")
+        return super().pause_tasks(params, query, body)
+
+    def resume_tasks(self, params, query, body):
+        result = super().resume_tasks(params, query, body)
+        self._next_task()
+        return result
@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import PathModel, Position, RobotState, RobotStopModel, SiteFloorModel, ResponseModel, GoalTargetModel, TwistModel
 from typing import Dict, Any
 
+@traced
 def get_navigation_path(client: Robot) -> PathModel:
     """
     Retrieves the robot's current planned navigation path.
@@ -15,6 +17,7 @@ def get_navigation_path(client: Robot) -> PathModel:
     response = client.get("/api/v1/navigation/path")
     return PathModel(**response)
 
+@traced
 def get_navigation_path_stream(client: Robot) -> PathModel:
     """
     Enables continuous streaming of the navigation path.
@@ -28,6 +31,7 @@ def get_navigation_path_stream(client: Robot) -> PathModel:
     response = client.get("/api/v1/navigation/path/stream")
     return PathModel(**response)
 
+@traced
 def get_current_position(client: Robot) -> RobotState:
     """
     Retrieves the robot's current position.
@@ -41,6 +45,7 @@ def get_current_position(client: Robot) -> RobotState:
     response = client.get("/api/v1/navigation/position")
     return RobotState(**response)
 
+@traced
 def get_position_stream(client: Robot) -> RobotState:
     """
     Provides the robot's position data as a live stream.
@@ -54,6 +59,7 @@ def get_position_stream(client: Robot) -> RobotState:
     response = client.get("/api/v1/navigation/position/stream")
     return RobotState(**response)
 
+@traced
 def set_goal_pose(client: Robot, pose: Position) -> ResponseModel:
     """
     Commands the robot to move to a specific X-Y position.
@@ -68,6 +74,7 @@ def set_goal_pose(client: Robot, pose: Position) -> ResponseModel:
     response = client.post("/api/v1/navigation/goal/pose", data=pose.dict())
     return ResponseModel(**response)
 
+@traced
 def set_goal_target(client: Robot, target_uid: str) -> ResponseModel:
     """
     Directs the robot to a predefined target using its UID.
@@ -82,6 +89,7 @@ def set_goal_target(client: Robot, target_uid: str) -> ResponseModel:
     response = client.post("/api/v1/navigation/goal/target", data=GoalTargetModel(target_uid=target_uid).dict())
     return ResponseModel(**response)
 
+@traced
 def get_emergency_stop_status(client: Robot) -> RobotStopModel:
     """
     Checks whether the robot is in emergency stop state.
@@ -95,6 +103,7 @@ def get_emergency_stop_status(client: Robot) -> RobotStopModel:
     response = client.get("/api/v1/navigation/stop")
     return RobotStopModel(**response)
 
+@traced
 def set_emergency_stop(client: Robot, stop_model: RobotStopModel) -> ResponseModel:
     """
     Set the emergency stop status of the robot.
@@ -109,6 +118,7 @@ def set_emergency_stop(client: Robot, stop_model: RobotStopModel) -> ResponseMod
     response = client.post("/api/v1/navigation/stop", data=stop_model.dict())
     return ResponseModel(**response)
 
+@traced
 def send_safe_velocity(client: Robot, vel: TwistModel) -> ResponseModel:
     """
     Sends a safety-controlled velocity command to the robot.
@@ -123,6 +133,7 @@ def send_safe_velocity(client: Robot, vel: TwistModel) -> ResponseModel:
     response = client.post("/api/v1/navigation/vel/safe", data=vel.dict())
     return ResponseModel(**response)
 
+@traced
 def send_velocity(client: Robot, vel: TwistModel) -> ResponseModel:
     """
     Sends a direct velocity command to the robot (without safety control).
@@ -137,6 +148,7 @@ def send_velocity(client: Robot, vel: TwistModel) -> ResponseModel:
     response = client.post("/api/v1/navigation/vel", data=vel.dict())
     return ResponseModel(**response)
 
+@traced
 def start_localization(client: Robot, site_floor: SiteFloorModel) -> ResponseModel:
     """
     Starts the process to re-localize the robot's position.
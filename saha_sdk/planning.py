@@ -0,0 +1,217 @@
+import itertools
+import math
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .models import TargetModel
+
+Point = Tuple[float, float]
+CostFunction = Callable[[Point, Point], float]
+
+INF = float("inf")
+
+
+def euclidean(a: Point, b: Point) -> float:
+    """
+    Straight-line travel cost between two points in meters.
+
+    Args:
+        a (Point): Start (x, y)
+        b (Point): End (x, y)
+
+    Returns:
+        float: Distance between the points
+    """
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def target_positions(targets: Iterable[TargetModel]) -> Dict[str, Point]:
+    """
+    Build a lookup of target UID to (x, y) coordinates.
+
+    Args:
+        targets (Iterable[TargetModel]): Targets, e.g. from ``targets.get_all_targets``.
+
+    Returns:
+        Dict[str, Point]: Coordinates keyed by target UID
+    """
+    return {t.uid: (t.px or 0.0, t.py or 0.0) for t in targets}
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    Solve a rectangular assignment problem with the Hungarian method.
+
+    Every row is matched to at most one column and vice versa, minimizing the total
+    cost. Pairs with an infinite cost are never returned.
+
+    Args:
+        cost (Sequence[Sequence[float]]): Cost matrix of shape rows x columns.
+
+    Returns:
+        List[Tuple[int, int]]: Assigned (row, column) pairs
+    """
+    n_rows = len(cost)
+    n_cols = len(cost[0]) if n_rows else 0
+    if not n_rows or not n_cols:
+        return []
+
+    transposed = n_rows > n_cols
+    if transposed:
+        matrix = [[cost[r][c] for r in range(n_rows)] for c in range(n_cols)]
+        n, m = n_cols, n_rows
+    else:
+        matrix = [list(row) for row in cost]
+        n, m = n_rows, n_cols
+
+    finite = [v for row in matrix for v in row if v != INF]
+    big = (max(finite) if finite else 0.0) * (n + 1) + 1.0
+    a = [[0.0] * (m + 1)] + [[0.0] + [v if v != INF else big for v in row] for row in matrix]
+
+    # Shortest augmenting path formulation with row/column potentials, O(n^2 m).
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = INF
+            j1 = 0
+            row = a[i0]
+            ui0 = u[i0]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    pairs = []
+    for j in range(1, m + 1):
+        i = p[j]
+        if i and matrix[i - 1][j - 1] != INF:
+            pairs.append((j - 1, i - 1) if transposed else (i - 1, j - 1))
+    pairs.sort()
+    return pairs
+
+
+def greedy_assignment(cost: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    Approximate a rectangular assignment by repeatedly taking the cheapest free pair.
+
+    Faster than ``solve_assignment`` for large batches at the price of optimality.
+
+    Args:
+        cost (Sequence[Sequence[float]]): Cost matrix of shape rows x columns.
+
+    Returns:
+        List[Tuple[int, int]]: Assigned (row, column) pairs
+    """
+    candidates = sorted(
+        (value, r, c)
+        for r, row in enumerate(cost)
+        for c, value in enumerate(row)
+        if value != INF
+    )
+    used_rows = set()
+    used_cols = set()
+    pairs = []
+    for _, r, c in candidates:
+        if r in used_rows or c in used_cols:
+            continue
+        used_rows.add(r)
+        used_cols.add(c)
+        pairs.append((r, c))
+    pairs.sort()
+    return pairs
+
+
+def route_cost(start: Point, points: Sequence[Point], cost_fn: CostFunction = euclidean, return_to_start: bool = True) -> float:
+    """
+    Total travel cost of visiting points in the given order.
+
+    Args:
+        start (Point): Position the route starts from.
+        points (Sequence[Point]): Stops in visiting order.
+        cost_fn (CostFunction): Travel cost between two points.
+        return_to_start (bool): Whether the route ends back at start.
+
+    Returns:
+        float: Total travel cost
+    """
+    total = 0.0
+    current = start
+    for point in points:
+        total += cost_fn(current, point)
+        current = point
+    if return_to_start and points:
+        total += cost_fn(current, start)
+    return total
+
+
+def order_stops(
+    start: Point,
+    points: Sequence[Point],
+    cost_fn: CostFunction = euclidean,
+    return_to_start: bool = True,
+    exact_limit: int = 7
+) -> List[int]:
+    """
+    Order a small set of stops to minimize the travel cost from start.
+
+    Routes of up to ``exact_limit`` stops are solved exactly by enumeration, longer ones
+    with the nearest neighbour heuristic.
+
+    Args:
+        start (Point): Position the route starts from.
+        points (Sequence[Point]): Stops to visit.
+        cost_fn (CostFunction): Travel cost between two points.
+        return_to_start (bool): Whether the route ends back at start.
+        exact_limit (int): Maximum number of stops solved exactly.
+
+    Returns:
+        List[int]: Indices into points in visiting order
+    """
+    n = len(points)
+    if n <= 1:
+        return list(range(n))
+    if n <= exact_limit:
+        best_order = None
+        best_cost = INF
+        for order in itertools.permutations(range(n)):
+            cost = route_cost(start, [points[i] for i in order], cost_fn, return_to_start)
+            if cost < best_cost:
+                best_cost = cost
+                best_order = order
+        return list(best_order)
+
+    remaining = set(range(n))
+    order = []
+    current = start
+    while remaining:
+        nearest = min(remaining, key=lambda i: cost_fn(current, points[i]))
+        remaining.remove(nearest)
+        order.append(nearest)
+        current = points[nearest]
+    return order
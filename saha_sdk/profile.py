@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import RobotProfiles, RobotProfileModel, ResponseModel, RobotModes, RobotModeModel
 from typing import List
 
+@traced
 def get_robot_profiles(client: Robot) -> RobotProfiles:
     """
     Get the current robot profiles including available speed, behavior, and environment profiles.
@@ -15,6 +17,7 @@ def get_robot_profiles(client: Robot) -> RobotProfiles:
     response = client.get("/api/v1/profile")
     return RobotProfiles(**response)
 
+@traced
 def change_environment_profile(client: Robot, profile_model: RobotProfileModel) -> ResponseModel:
     """
     Change the environment profile of the robot.
@@ -29,6 +32,7 @@ def change_environment_profile(client: Robot, profile_model: RobotProfileModel)
     response = client.post("/api/v1/profile/environment", data=profile_model.dict())
     return ResponseModel(**response)
 
+@traced
 def change_behavior_profile(client: Robot, profile_model: RobotProfileModel) -> ResponseModel:
     """
     Change the behavior profile of the robot.
@@ -43,6 +47,7 @@ def change_behavior_profile(client: Robot, profile_model: RobotProfileModel) ->
     response = client.post("/api/v1/profile/behavior", data=profile_model.dict())
     return ResponseModel(**response)
 
+@traced
 def change_speed_profile(client: Robot, profile_model: RobotProfileModel) -> ResponseModel:
     """
     Change the speed profile of the robot.
@@ -57,6 +62,7 @@ def change_speed_profile(client: Robot, profile_model: RobotProfileModel) -> Res
     response = client.post("/api/v1/profile/speed", data=profile_model.dict())
     return ResponseModel(**response)
 
+@traced
 def get_robot_modes(client: Robot) -> RobotModes:
     """
     Get the available robot modes.
@@ -70,6 +76,7 @@ def get_robot_modes(client: Robot) -> RobotModes:
     response = client.get("/api/v1/mode")
     return RobotModes(**response)
 
+@traced
 def set_robot_mode(client: Robot, mode_model: RobotModeModel) -> ResponseModel:
     """
     Set the robot mode.
@@ -84,6 +91,7 @@ def set_robot_mode(client: Robot, mode_model: RobotModeModel) -> ResponseModel:
     response = client.post("/api/v1/mode", data=mode_model.dict())
     return ResponseModel(**response)
 
+@traced
 def remove_robot_mode(client: Robot, mode_model: RobotModeModel) -> ResponseModel:
     """
     Remove a robot mode.
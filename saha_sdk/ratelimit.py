@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Mapping, Optional, Tuple
+
+from . import endpoints
+from .exceptions import RateLimitedError
+from .metrics import Histogram, LatencySummary
+
+# Endpoint classes
+TELEMETRY = "telemetry"
+CONFIG = "config"
+COMMAND = "command"
+# Key of the limit shared by every class of a robot
+ROBOT = "robot"
+
+# Policies for requests arriving at an empty bucket
+QUEUE = "queue"
+REJECT = "reject"
+
+# Requests that are never delayed or rejected: stopping the robot must always get through.
+EXEMPT: Collection[Tuple[str, str]] = frozenset({("POST", "/api/v1/navigation/stop")})
+
+# Writes that make the robot act rather than change stored configuration.
+COMMAND_TEMPLATES = frozenset({
+    "/api/v1/cruises/control",
+    "/api/v1/mapping/cancel",
+    "/api/v1/mapping/change",
+    "/api/v1/mapping/remap",
+    "/api/v1/mapping/save",
+    "/api/v1/mapping/start",
+    "/api/v1/mode",
+    "/api/v1/mode/{mode}",
+    "/api/v1/navigation/goal/pose",
+    "/api/v1/navigation/goal/target",
+    "/api/v1/navigation/localization",
+    "/api/v1/navigation/vel",
+    "/api/v1/navigation/vel/safe",
+    "/api/v1/tasks",
+    "/api/v1/tasks/clear",
+    "/api/v1/tasks/pause",
+    "/api/v1/tasks/resume",
+    "/api/v1/tasks/{task_uid}",
+    "/api/v1/ui/screen/pixel",
+    "/api/v1/ui/speech",
+})
+
+
+def classify(method: str, path: str, exempt: Collection[Tuple[str, str]] = EXEMPT) -> Optional[str]:
+    """
+    Endpoint class of a request: reads are telemetry, writes are commands or config writes.
+
+    Args:
+        method (str): HTTP method.
+        path (str): Request path.
+        exempt (Collection[Tuple[str, str]]): (method, template) pairs that are not limited.
+
+    Returns:
+        Optional[str]: TELEMETRY, COMMAND or CONFIG, or None for exempt requests
+    """
+    method = method.upper()
+    template = endpoints.template_for(path)
+    if (method, template) in exempt:
+        return None
+    if method == "GET":
+        return TELEMETRY
+    return COMMAND if template in COMMAND_TEMPLATES else CONFIG
+
+
+@dataclass(frozen=True)
+class Limit:
+    """A token bucket: rate requests per second on average, in bursts of up to burst requests."""
+    rate: float
+    burst: float = 1.0
+
+
+@dataclass
+class LimitStats:
+    """Admissions of one endpoint class and the time requests spent queued."""
+    endpoint_class: str
+    admitted: int
+    queued: int
+    rejected: int
+    wait: LatencySummary
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, limit: Limit, now: float):
+        self.rate = limit.rate
+        self.burst = limit.burst
+        self.tokens = limit.burst
+        self.updated = now
+
+    def wait(self, now: float) -> float:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+
+class _Stats:
+    __slots__ = ("admitted", "queued", "rejected", "wait")
+
+    def __init__(self):
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.wait = Histogram()
+
+
+class RateLimiter:
+    """Client-side token-bucket limits of a robot, per endpoint class and for the robot as a whole.
+
+    A request takes one token from the bucket of its class and one from the ROBOT bucket,
+    if those are configured. With the QUEUE policy a request that finds a bucket empty
+    reserves the next token and sleeps until it is due, so queued requests are admitted in
+    arrival order at the configured rate; with REJECT, or when the wait would exceed
+    max_wait, it raises RateLimitedError instead. EXEMPT requests, such as the e-stop, are
+    never limited.
+
+    Usage:
+        limiter = RateLimiter({TELEMETRY: Limit(20, burst=5), CONFIG: Limit(2), ROBOT: Limit(30, burst=10)})
+        robot = Robot("http://robot-ip:port", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Limit],
+        policy: str = QUEUE,
+        max_wait: Optional[float] = None,
+        exempt: Collection[Tuple[str, str]] = EXEMPT,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize a new limiter.
+
+        Args:
+            limits: Limit per endpoint class (TELEMETRY, COMMAND, CONFIG) and/or ROBOT.
+            policy: QUEUE to wait for a token, REJECT to raise when none is available.
+            max_wait: With QUEUE, longest wait in seconds before a request is rejected.
+                Defaults to no limit.
+            exempt: (method, path template) pairs that are never limited.
+            clock: Monotonic clock in seconds.
+            sleep: Called with the seconds a queued request must wait.
+        """
+        unknown = set(limits) - {TELEMETRY, COMMAND, CONFIG, ROBOT}
+        if unknown:
+            raise ValueError(f"Unknown endpoint classes: {', '.join(sorted(unknown))}")
+        if any(limit.rate <= 0 or limit.burst < 1 for limit in limits.values()):
+            raise ValueError("Limits need a positive rate and a burst of at least 1")
+        if policy not in (QUEUE, REJECT):
+            raise ValueError(f"Unknown policy: {policy}")
+        self.limits = dict(limits)
+        self.policy = policy
+        self.max_wait = max_wait
+        self.exempt = exempt
+        self.clock = clock
+        self.sleep = sleep
+        now = clock()
+        self._buckets: Dict[str, _Bucket] = {name: _Bucket(limit, now) for name, limit in self.limits.items()}
+        self._stats: Dict[str, _Stats] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, method: str, path: str) -> float:
+        """Take the tokens of a request without sleeping.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+
+        Returns:
+            Seconds until the request may be sent.
+
+        Raises:
+            RateLimitedError: If the request is rejected; no tokens are taken.
+        """
+        endpoint_class = classify(method, path, self.exempt)
+        if endpoint_class is None:
+            return 0.0
+        buckets = [b for b in (self._buckets.get(endpoint_class), self._buckets.get(ROBOT)) if b is not None]
+        with self._lock:
+            stats = self._stats.get(endpoint_class)
+            if stats is None:
+                stats = self._stats[endpoint_class] = _Stats()
+            now = self.clock()
+            wait = max((bucket.wait(now) for bucket in buckets), default=0.0)
+            if wait > 0 and (self.policy == REJECT or (self.max_wait is not None and wait > self.max_wait)):
+                stats.rejected += 1
+                raise RateLimitedError(f"Rate limit of {endpoint_class} requests exceeded", retry_after=wait, endpoint_class=endpoint_class)
+            for bucket in buckets:
+                bucket.tokens -= 1.0
+            stats.admitted += 1
+            if wait > 0:
+                stats.queued += 1
+            stats.wait.record(wait)
+        return wait
+
+    def acquire(self, method: str, path: str) -> float:
+        """Wait until a request may be sent.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+
+        Returns:
+            Seconds waited.
+
+        Raises:
+            RateLimitedError: If the request is rejected.
+        """
+        wait = self.reserve(method, path)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    async def acquire_async(self, method: str, path: str) -> float:
+        """Wait in a coroutine until a request may be sent; see acquire()."""
+        wait = self.reserve(method, path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def snapshot(self) -> List[LimitStats]:
+        """Admissions and queue waits of every endpoint class seen so far."""
+        with self._lock:
+            items = [(name, s.admitted, s.queued, s.rejected, s.wait.summary()) for name, s in sorted(self._stats.items())]
+        return [LimitStats(name, admitted, queued, rejected, wait) for name, admitted, queued, rejected, wait in items]
@@ -0,0 +1,226 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import endpoints
+from .metrics import Histogram, LatencySummary
+from .transport import PooledHTTPTransport, Response, Transport
+
+# Priority classes, most urgent first
+SAFETY = 0
+MOTION = 1
+TASKS = 2
+TELEMETRY = 3
+BULK = 4
+PRIORITY_NAMES = ("safety", "motion", "tasks", "telemetry", "bulk")
+
+# Connections per robot (host) in each lane
+DEFAULT_LANES: Mapping[int, int] = {SAFETY: 1, MOTION: 1, TASKS: 2, TELEMETRY: 4, BULK: 1}
+
+_SAFETY = frozenset({("POST", "/api/v1/navigation/stop")})
+_MOTION_TEMPLATES = frozenset({
+    "/api/v1/cruises/control",
+    "/api/v1/navigation/goal/pose",
+    "/api/v1/navigation/goal/target",
+    "/api/v1/navigation/localization",
+    "/api/v1/navigation/vel",
+    "/api/v1/navigation/vel/safe",
+})
+_TASK_TEMPLATES = frozenset({
+    "/api/v1/mode",
+    "/api/v1/mode/{mode}",
+    "/api/v1/tasks",
+    "/api/v1/tasks/clear",
+    "/api/v1/tasks/pause",
+    "/api/v1/tasks/resume",
+    "/api/v1/tasks/{task_uid}",
+    "/api/v1/ui/screen/pixel",
+    "/api/v1/ui/speech",
+})
+# Reads that can return maps or other large payloads.
+_BULK_PREFIXES = ("/api/v1/layers", "/api/v1/mapping")
+
+
+def classify(method: str, path: str) -> int:
+    """
+    Priority class of a request.
+
+    Stop commands are SAFETY, goals and velocity MOTION, tasks, modes and UI TASKS. Other
+    reads are TELEMETRY unless they fetch maps or layers; configuration writes and large
+    downloads are BULK.
+
+    Args:
+        method (str): HTTP method.
+        path (str): Request path, or a URL whose path contains "/api/".
+
+    Returns:
+        int: SAFETY, MOTION, TASKS, TELEMETRY or BULK
+    """
+    method = method.upper()
+    start = path.find("/api/")
+    template = endpoints.template_for(path[start:] if start > 0 else path)
+    if (method, template) in _SAFETY:
+        return SAFETY
+    if method == "GET":
+        return BULK if template.startswith(_BULK_PREFIXES) else TELEMETRY
+    if template in _MOTION_TEMPLATES:
+        return MOTION
+    if template in _TASK_TEMPLATES:
+        return TASKS
+    return BULK
+
+
+@dataclass
+class LaneStats:
+    """Requests of one priority lane and the time they waited for a connection."""
+    priority: str
+    connections: int
+    sent: int
+    queued: int
+    in_flight: int
+    waiting: int
+    wait: LatencySummary
+
+
+class _Queue:
+    """FIFO admission to the connections of one lane of one robot."""
+    __slots__ = ("free", "waiters")
+
+    def __init__(self, slots: int):
+        self.free = slots
+        self.waiters: Deque[threading.Event] = deque()
+
+
+class _Lane:
+    def __init__(self, priority: int, connections: int, transport: Transport):
+        self.priority = priority
+        self.connections = connections
+        self.transport = transport
+        self.queues: Dict[str, _Queue] = {}
+        self.sent = 0
+        self.queued = 0
+        self.wait = Histogram()
+
+
+def _wait_timeout(transport: Transport, message: str) -> Exception:
+    # A network error of the lane's transport, so Robot reports it like a connect timeout.
+    for error in transport.network_errors:
+        if issubclass(TimeoutError, error):
+            return TimeoutError(message)
+    return transport.network_errors[0](message)
+
+
+class PriorityTransport(Transport):
+    """Sends each request on a connection lane of its priority class.
+
+    Every lane has its own transport, so its own connection pool, and a fixed number of
+    connections per robot. A 5 MB map download on the BULK lane therefore never holds the
+    connection a velocity command needs on the MOTION lane. Within a lane, requests to the
+    same robot wait for a free connection in arrival order, at most for the request's
+    (connect) timeout.
+
+    Usage:
+        transport = PriorityTransport()
+        fleet = RobotFleet({name: Robot(url, transport=transport) for name, url in urls.items()})
+    """
+
+    def __init__(
+        self,
+        lanes: Mapping[int, int] = DEFAULT_LANES,
+        transport_factory: Optional[Callable[[int], Transport]] = None,
+        classify: Callable[[str, str], int] = classify
+    ):
+        """Initialize a new transport.
+
+        Args:
+            lanes: Connections per robot of every priority class.
+            transport_factory: Creates the transport of a lane, given its connections per robot.
+                Defaults to a PooledHTTPTransport keeping that many connections alive.
+            classify: Maps (method, url) to a priority class.
+        """
+        missing = [PRIORITY_NAMES[p] for p in range(len(PRIORITY_NAMES)) if p not in lanes]
+        if missing:
+            raise ValueError(f"Missing lanes: {', '.join(missing)}")
+        if any(n < 1 for n in lanes.values()):
+            raise ValueError("Every lane needs at least one connection")
+        if transport_factory is None:
+            transport_factory = lambda connections: PooledHTTPTransport(maxsize=connections)
+        self.classify = classify
+        self.lanes: Dict[int, _Lane] = {
+            priority: _Lane(priority, connections, transport_factory(connections))
+            for priority, connections in sorted(lanes.items())
+        }
+        self.network_errors: Tuple[type, ...] = tuple({
+            error for lane in self.lanes.values() for error in lane.transport.network_errors
+        })
+        self._lock = threading.Lock()
+
+    def _acquire(self, lane: _Lane, host: str, timeout=None):
+        with self._lock:
+            queue = lane.queues.get(host)
+            if queue is None:
+                queue = lane.queues[host] = _Queue(lane.connections)
+            if queue.free > 0 and not queue.waiters:
+                queue.free -= 1
+                lane.wait.record(0.0)
+                return
+            event = threading.Event()
+            queue.waiters.append(event)
+            lane.queued += 1
+        start = time.perf_counter()
+        if isinstance(timeout, tuple):
+            timeout = timeout[0]  # (connect, read): waiting for a connection counts as connecting
+        acquired = event.wait(timeout)
+        with self._lock:
+            lane.wait.record(time.perf_counter() - start)
+            # _release() may have handed over the connection just after the wait expired.
+            if not acquired and not event.is_set():
+                queue.waiters.remove(event)
+                raise _wait_timeout(lane.transport, f"No {PRIORITY_NAMES[lane.priority]} connection to {host} within {timeout}s")
+
+    def _release(self, lane: _Lane, host: str):
+        with self._lock:
+            lane.sent += 1
+            queue = lane.queues[host]
+            if queue.waiters:
+                queue.waiters.popleft().set()
+            else:
+                queue.free += 1
+
+    def request(self, method: str, url: str, headers=None, **kwargs) -> Response:
+        lane = self.lanes[self.classify(method, url)]
+        host = urlsplit(url).netloc
+        self._acquire(lane, host, kwargs.get("timeout"))
+        try:
+            return lane.transport.request(method, url, headers=headers, **kwargs)
+        finally:
+            self._release(lane, host)
+
+    def warmup(self, url: str, headers=None, connections: int = 1, timeout=None):
+        """Open up to connections keep-alive connections, at most the lane's size, in every lane."""
+        for lane in self.lanes.values():
+            lane.transport.warmup(url, headers=headers, connections=min(connections, lane.connections), timeout=timeout)
+
+    def snapshot(self) -> List[LaneStats]:
+        """Requests and connection waits of every lane, most urgent first."""
+        with self._lock:
+            items = [
+                (
+                    lane, lane.sent, lane.queued,
+                    sum(lane.connections - q.free for q in lane.queues.values()),
+                    sum(len(q.waiters) for q in lane.queues.values()),
+                    lane.wait.summary()
+                )
+                for lane in self.lanes.values()
+            ]
+        return [
+            LaneStats(PRIORITY_NAMES[lane.priority], lane.connections, sent, queued, in_flight, waiting, wait)
+            for lane, sent, queued, in_flight, waiting, wait in items
+        ]
+
+    def close(self):
+        for lane in self.lanes.values():
+            lane.transport.close()
@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+
+from . import navigation, profile, status
+from .client import Robot
+from .fleet import RobotFleet
+from .models import RobotHardwareStatus, RobotInfoModel, RobotModes, RobotProfiles, RobotState, RobotStatus
+
+# Snapshot part name -> (module, function). Functions are looked up at call time.
+PARTS = {
+    "status": (status, "get_robot_status"),
+    "hardware": (status, "get_hardware_status"),
+    "info": (status, "get_robot_info"),
+    "position": (navigation, "get_current_position"),
+    "profiles": (profile, "get_robot_profiles"),
+    "modes": (profile, "get_robot_modes"),
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="saha-snapshot")
+    return _executor
+
+
+@dataclass
+class SnapshotPart:
+    """Result of fetching one part of a snapshot."""
+    value: Any = None
+    error: Optional[Exception] = None
+    fetched_at: float = 0.0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class Snapshot:
+    """Status, hardware, info, position, profiles and modes of a robot fetched together."""
+    parts: Dict[str, SnapshotPart] = field(default_factory=dict)
+
+    def _value(self, name: str) -> Any:
+        part = self.parts.get(name)
+        return part.value if part is not None else None
+
+    @property
+    def status(self) -> Optional[RobotStatus]:
+        return self._value("status")
+
+    @property
+    def hardware(self) -> Optional[RobotHardwareStatus]:
+        return self._value("hardware")
+
+    @property
+    def info(self) -> Optional[RobotInfoModel]:
+        return self._value("info")
+
+    @property
+    def position(self) -> Optional[RobotState]:
+        return self._value("position")
+
+    @property
+    def profiles(self) -> Optional[RobotProfiles]:
+        return self._value("profiles")
+
+    @property
+    def modes(self) -> Optional[RobotModes]:
+        return self._value("modes")
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Errors of the parts that could not be fetched."""
+        return {name: part.error for name, part in self.parts.items() if part.error is not None}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _fetch(robot: Robot, name: str) -> SnapshotPart:
+    module, function = PARTS[name]
+    start = time.perf_counter()
+    try:
+        value, error = getattr(module, function)(robot), None
+    except Exception as e:
+        value, error = None, e
+    return SnapshotPart(value=value, error=error, fetched_at=time.time(), latency=time.perf_counter() - start)
+
+
+def _check_parts(parts: Iterable[str]):
+    parts = list(parts)
+    unknown = [name for name in parts if name not in PARTS]
+    if unknown:
+        raise ValueError(f"Unknown snapshot parts: {', '.join(unknown)}")
+    return parts
+
+
+def get_snapshot(client: Robot, parts: Iterable[str] = tuple(PARTS), executor: Optional[Executor] = None) -> Snapshot:
+    """
+    Fetch several status endpoints of a robot in parallel.
+
+    Failed parts do not fail the snapshot; their error is stored instead of a value.
+
+    Args:
+        client (Robot): API client
+        parts (Iterable[str]): Parts to fetch: "status", "hardware", "info", "position", "profiles", "modes".
+        executor (Optional[Executor]): Executor to run the requests on. Defaults to a shared thread pool.
+
+    Returns:
+        Snapshot: Fetched parts with their timestamps and errors
+    """
+    parts = _check_parts(parts)
+    executor = executor or _default_executor()
+    futures = {name: executor.submit(_fetch, client, name) for name in parts}
+    return Snapshot(parts={name: future.result() for name, future in futures.items()})
+
+
+def get_fleet_snapshot(fleet: RobotFleet, parts: Iterable[str] = tuple(PARTS), names: Optional[Iterable[str]] = None) -> Dict[str, Snapshot]:
+    """
+    Fetch snapshots of many robots, running every robot and part pair concurrently.
+
+    Args:
+        fleet (RobotFleet): Robots to query.
+        parts (Iterable[str]): Parts to fetch for every robot.
+        names (Optional[Iterable[str]]): Restrict to these robots. Defaults to the whole fleet.
+
+    Returns:
+        Dict[str, Snapshot]: Snapshots keyed by robot name
+    """
+    parts = _check_parts(parts)
+    selected = list(fleet) if names is None else list(names)
+    futures = {
+        name: {part: fleet.submit(_fetch, fleet[name], part) for part in parts}
+        for name in selected
+    }
+    return {
+        name: Snapshot(parts={part: future.result() for part, future in robot_futures.items()})
+        for name, robot_futures in futures.items()
+    }
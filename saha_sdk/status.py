@@ -1,6 +1,8 @@
 from .client import Robot
+from .tracing import traced
 from .models import RobotStatus, RobotHardwareStatus, RobotInfoModel
 
+@traced
 def get_robot_status(client: Robot) -> RobotStatus:
     """
     Retrieves the robot's general status information.
@@ -16,6 +18,7 @@ def get_robot_status(client: Robot) -> RobotStatus:
     response = client.get("/api/v1/status")
     return RobotStatus(**response)
 
+@traced
 def get_hardware_status(client: Robot) -> RobotHardwareStatus:
     """
     Retrieves the health and connection status of the robot's hardware components.
@@ -31,6 +34,7 @@ def get_hardware_status(client: Robot) -> RobotHardwareStatus:
     response = client.get("/api/v1/status/hardware")
     return RobotHardwareStatus(**response)
 
+@traced
 def get_robot_info(client: Robot) -> RobotInfoModel:
     """
     Retrieves the information of the robot including robot ID, name, model, software version, hardware version, site, floor, and current mission details.
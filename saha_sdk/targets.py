@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import TargetModel, TargetRequestModel, ResponseModel
 from typing import List
 
+@traced
 def get_all_targets(client: Robot) -> List[TargetModel]:
     """
     Retrieve the list of all targets of the robot.
@@ -15,6 +17,7 @@ def get_all_targets(client: Robot) -> List[TargetModel]:
     response = client.get("/api/v1/targets")
     return [TargetModel(**item) for item in response]
 
+@traced
 def add_target(client: Robot, target_request: TargetRequestModel) -> ResponseModel:
     """
     Add a new target to the robot.
@@ -29,6 +32,7 @@ def add_target(client: Robot, target_request: TargetRequestModel) -> ResponseMod
     response = client.post("/api/v1/targets", data=target_request.dict())
     return ResponseModel(**response)
 
+@traced
 def get_targets_by_site(client: Robot, site: str) -> List[TargetModel]:
     """
     Retrieve the list of targets filtered by site.
@@ -43,6 +47,7 @@ def get_targets_by_site(client: Robot, site: str) -> List[TargetModel]:
     response = client.get(f"/api/v1/targets/{site}")
     return [TargetModel(**item) for item in response]
 
+@traced
 def get_targets_by_site_and_floor(client: Robot, site: str, floor: str) -> List[TargetModel]:
     """
     Retrieve the list of targets filtered by site and floor.
@@ -58,6 +63,7 @@ def get_targets_by_site_and_floor(client: Robot, site: str, floor: str) -> List[
     response = client.get(f"/api/v1/targets/{site}/{floor}")
     return [TargetModel(**item) for item in response]
 
+@traced
 def get_target(client: Robot, site: str, floor: str, name: str) -> TargetModel:
     """
     Retrieve a specific target by its site, floor, and name.
@@ -74,6 +80,7 @@ def get_target(client: Robot, site: str, floor: str, name: str) -> TargetModel:
     response = client.get(f"/api/v1/targets/{site}/{floor}/{name}")
     return TargetModel(**response)
 
+@traced
 def update_target(client: Robot, site: str, floor: str, name: str, target_request: TargetRequestModel) -> ResponseModel:
     """
     Update a specific target by its site, floor, and name.
@@ -91,6 +98,7 @@ def update_target(client: Robot, site: str, floor: str, name: str, target_reques
     response = client.patch(f"/api/v1/targets/{site}/{floor}/{name}", data=target_request.dict())
     return ResponseModel(**response)
 
+@traced
 def delete_target(client: Robot, site: str, floor: str, name: str) -> ResponseModel:
     """
     Delete a specific target by its site, floor, and name.
@@ -1,7 +1,9 @@
 from .client import Robot
+from .tracing import traced
 from .models import TaskModel, TaskRequestModel, ResponseModel
 from typing import List
 
+@traced
 def get_all_tasks(client: Robot) -> List[TaskModel]:
     """
     Retrieve the list of all tasks of the robot.
@@ -15,6 +17,7 @@ def get_all_tasks(client: Robot) -> List[TaskModel]:
     response = client.get("/api/v1/tasks")
     return [TaskModel(**item) for item in response]
 
+@traced
 def create_task(client: Robot, task_request: TaskRequestModel) -> ResponseModel:
     """
     Create a new task or update an existing one.
@@ -29,6 +32,7 @@ def create_task(client: Robot, task_request: TaskRequestModel) -> ResponseModel:
     response = client.post("/api/v1/tasks", data=task_request.dict())
     return ResponseModel(**response)
 
+@traced
 def get_task(client: Robot, task_uid: str) -> TaskModel:
     """
     Retrieve a specific task by its ID.
@@ -43,6 +47,7 @@ def get_task(client: Robot, task_uid: str) -> TaskModel:
     response = client.get(f"/api/v1/tasks/{task_uid}")
     return TaskModel(**response)
 
+@traced
 def update_task(client: Robot, task_uid: str, task_request: TaskRequestModel) -> ResponseModel:
     """
     Update a specific task by its ID.
@@ -58,6 +63,7 @@ def update_task(client: Robot, task_uid: str, task_request: TaskRequestModel) ->
     response = client.patch(f"/api/v1/tasks/{task_uid}", data=task_request.dict())
     return ResponseModel(**response)
 
+@traced
 def delete_task(client: Robot, task_uid: str) -> ResponseModel:
     """
     Delete a specific task by its ID.
@@ -72,6 +78,7 @@ def delete_task(client: Robot, task_uid: str) -> ResponseModel:
     response = client.delete(f"/api/v1/tasks/{task_uid}")
     return ResponseModel(**response)
 
+@traced
 def pause_mission(client: Robot) -> ResponseModel:
     """
     Pause the robot's current mission.
@@ -85,6 +92,7 @@ def pause_mission(client: Robot) -> ResponseModel:
     response = client.post("/api/v1/tasks/pause")
     return ResponseModel(**response)
 
+@traced
 def resume_mission(client: Robot) -> ResponseModel:
     """
     Resume the robot's paused mission.
@@ -98,6 +106,7 @@ def resume_mission(client: Robot) -> ResponseModel:
     response = client.post("/api/v1/tasks/resume")
     return ResponseModel(**response)
 
+@traced
 def clear_all_tasks(client: Robot) -> ResponseModel:
     """
     Clear all tasks from the robot's mission.
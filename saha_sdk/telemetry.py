@@ -0,0 +1,418 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import snapshot
+from ._compat import numpy as np, require_numpy
+from .client import Robot
+from .models import RobotState, RobotStatus
+
+# Column name -> scale applied before rounding to an integer. Timestamps are stored in
+# milliseconds, coordinates in millimeters, angles in milliradians, battery in 0.1 %.
+COLUMNS: Dict[str, float] = {
+    "t": 1000.0,
+    "x": 1000.0,
+    "y": 1000.0,
+    "theta": 1000.0,
+    "vel_x": 1000.0,
+    "vel_z": 1000.0,
+    "battery": 10.0,
+    "state": 1.0,
+    "flags": 1.0,
+}
+FLAG_CHARGING = 1
+FLAG_ESTOPPED = 2
+FLAG_OUT_OF_SERVICE = 4
+
+_FILE_MAGIC = b"SAHATS1\n"
+_BLOCK_MAGIC = b"BLK1"
+_BLOCK_HEADER = struct.Struct("<4sIqqI")
+_LENGTH = struct.Struct("<I")
+_RAW = ".raw"
+_DOWNSAMPLED = ".ds"
+
+
+def encode_varints(values: "np.ndarray") -> bytes:
+    """
+    Encode signed integers as zigzag LEB128 varints.
+
+    Args:
+        values (np.ndarray): Integer values.
+
+    Returns:
+        bytes: Concatenated varints
+    """
+    require_numpy("Varint encoding")
+    v = np.asarray(values, dtype=np.int64)
+    u = ((v << 1) ^ (v >> 63)).astype(np.uint64)
+    if not len(u):
+        return b""
+    bits = np.zeros(len(u), dtype=np.int64)
+    rest = u.copy()
+    while rest.any():
+        nonzero = rest > 0
+        bits += nonzero
+        rest >>= np.uint64(7)
+    nbytes = np.maximum(bits, 1)
+    width = int(nbytes.max())
+    shifts = (np.arange(width, dtype=np.uint64) * np.uint64(7))
+    groups = ((u[:, None] >> shifts[None, :]) & np.uint64(0x7F)).astype(np.uint8)
+    k = np.arange(width)[None, :]
+    groups[k < (nbytes[:, None] - 1)] |= 0x80
+    return groups[k < nbytes[:, None]].tobytes()
+
+
+def decode_varints(buffer) -> "np.ndarray":
+    """
+    Decode zigzag LEB128 varints.
+
+    Args:
+        buffer: Bytes-like object holding concatenated varints.
+
+    Returns:
+        np.ndarray: Decoded int64 values
+    """
+    require_numpy("Varint decoding")
+    b = np.frombuffer(buffer, dtype=np.uint8)
+    if not len(b):
+        return np.zeros(0, dtype=np.int64)
+    ends = (b & 0x80) == 0
+    starts = np.concatenate(([0], np.flatnonzero(ends)[:-1] + 1))
+    owner = np.cumsum(ends) - ends
+    shift = ((np.arange(len(b)) - starts[owner]) * 7).astype(np.uint64)
+    terms = (b & 0x7F).astype(np.uint64) << shift
+    u = np.bitwise_or.reduceat(terms, starts)
+    return (u >> np.uint64(1)).astype(np.int64) ^ -(u & np.uint64(1)).astype(np.int64)
+
+
+class _Segment:
+    """Block index of one segment file."""
+
+    def __init__(self, path: str, start: int):
+        self.path = path
+        self.start = start
+        self.blocks: List[Tuple[int, int, int, int, int]] = []  # offset, count, t_first, t_last, length
+        self.size = 0
+
+    @property
+    def t_last(self) -> Optional[int]:
+        return self.blocks[-1][3] if self.blocks else None
+
+    def refresh(self):
+        """Index blocks appended since the last refresh."""
+        size = os.path.getsize(self.path)
+        if size <= max(self.size, len(_FILE_MAGIC)):
+            self.size = max(self.size, size)
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            offset = self.size or len(_FILE_MAGIC)
+            while offset + _BLOCK_HEADER.size <= size:
+                magic, count, t_first, t_last, length = _BLOCK_HEADER.unpack_from(m, offset)
+                if magic != _BLOCK_MAGIC or offset + _BLOCK_HEADER.size + length > size:
+                    break
+                self.blocks.append((offset, count, t_first, t_last, length))
+                offset += _BLOCK_HEADER.size + length
+        self.size = offset
+
+    def read(self, t0: int, t1: int) -> Dict[str, "np.ndarray"]:
+        """Decode the blocks overlapping [t0, t1] in milliseconds."""
+        chunks: Dict[str, List] = {name: [] for name in COLUMNS}
+        selected = [b for b in self.blocks if b[3] >= t0 and b[2] <= t1]
+        if not selected:
+            return {}
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for offset, count, _, _, length in selected:
+                position = offset + _BLOCK_HEADER.size
+                for name in COLUMNS:
+                    (column_length,) = _LENGTH.unpack_from(m, position)
+                    position += _LENGTH.size
+                    deltas = decode_varints(m[position:position + column_length])
+                    position += column_length
+                    chunks[name].append(np.cumsum(deltas))
+        return {name: np.concatenate(parts) for name, parts in chunks.items()}
+
+
+def _encode_block(columns: Dict[str, "np.ndarray"]) -> bytes:
+    parts = []
+    for name in COLUMNS:
+        values = columns[name]
+        deltas = np.diff(values, prepend=np.int64(0))
+        encoded = encode_varints(deltas)
+        parts.append(_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    payload = b"".join(parts)
+    t = columns["t"]
+    return _BLOCK_HEADER.pack(_BLOCK_MAGIC, len(t), int(t[0]), int(t[-1]), len(payload)) + payload
+
+
+class TelemetryRecorder:
+    """Append-only, columnar telemetry history of one robot.
+
+    Samples are buffered and written in blocks. Each block stores every column as
+    delta-encoded zigzag varints of fixed-point integers, so slowly changing values such as
+    battery and state take about one byte per sample. Segment files are read through mmap
+    and only the blocks overlapping a query are decoded. Old segments are downsampled and
+    eventually deleted by maintain(), which runs whenever a segment is rotated.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        block_size: int = 256,
+        segment_seconds: float = 3600.0,
+        segment_bytes: int = 8 << 20,
+        raw_retention: float = 6 * 3600.0,
+        downsample_interval: float = 10.0,
+        retention: float = 7 * 86400.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """Open or create a robot's telemetry directory.
+
+        Args:
+            directory: Directory holding the robot's segment files.
+            block_size: Samples buffered in memory before a block is written.
+            segment_seconds: Maximum time span of a segment file before it is rotated.
+            segment_bytes: Maximum size of a segment file before it is rotated.
+            raw_retention: Age in seconds after which segments are downsampled.
+            downsample_interval: Bucket width in seconds of downsampled data.
+            retention: Age in seconds after which data is deleted.
+            clock: Wall clock in seconds.
+        """
+        require_numpy("TelemetryRecorder")
+        self.directory = directory
+        self.block_size = block_size
+        self.segment_seconds = segment_seconds
+        self.segment_bytes = segment_bytes
+        self.raw_retention = raw_retention
+        self.downsample_interval = downsample_interval
+        self.retention = retention
+        self.clock = clock
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._buffer: Dict[str, List[int]] = {name: [] for name in COLUMNS}
+        self._last: Dict[str, int] = {name: 0 for name in COLUMNS}
+        self._states_path = os.path.join(directory, "states.json")
+        self.states: List[str] = []
+        if os.path.exists(self._states_path):
+            with open(self._states_path) as f:
+                self.states = json.load(f)
+        self._state_codes = {state: code for code, state in enumerate(self.states)}
+        self._segments: List[_Segment] = []
+        for name in sorted(os.listdir(directory)):
+            stem, ext = os.path.splitext(name)
+            if ext in (_RAW, _DOWNSAMPLED):
+                segment = _Segment(os.path.join(directory, name), int(stem))
+                segment.refresh()
+                self._segments.append(segment)
+        self._segments.sort(key=lambda s: s.start)
+        self._active: Optional[_Segment] = None
+
+    # Writing
+
+    def _state_code(self, state: str) -> int:
+        code = self._state_codes.get(state)
+        if code is None:
+            code = len(self.states)
+            self.states.append(state)
+            self._state_codes[state] = code
+            with open(self._states_path, "w") as f:
+                json.dump(self.states, f)
+        return code
+
+    def record(self, timestamp: Optional[float] = None, state: Optional[RobotState] = None, robot_status: Optional[RobotStatus] = None):
+        """Append a sample. Columns not given repeat their previous value.
+
+        Args:
+            timestamp: Sample time in seconds. Defaults to the recorder's clock.
+            state: Position and velocity, e.g. from ``navigation.get_position_stream``.
+            robot_status: Battery, state and flags, e.g. from ``status.get_robot_status``.
+        """
+        timestamp = self.clock() if timestamp is None else timestamp
+        with self._lock:
+            values = dict(self._last)
+            values["t"] = int(round(timestamp * COLUMNS["t"]))
+            if state is not None:
+                values["x"] = int(round(state.position.x * COLUMNS["x"]))
+                values["y"] = int(round(state.position.y * COLUMNS["y"]))
+                values["theta"] = int(round(state.position.theta * COLUMNS["theta"]))
+                values["vel_x"] = int(round(state.twist.vel_x * COLUMNS["vel_x"]))
+                values["vel_z"] = int(round(state.twist.vel_z * COLUMNS["vel_z"]))
+            if robot_status is not None:
+                values["battery"] = int(round(robot_status.battery_percent * COLUMNS["battery"]))
+                values["state"] = self._state_code(robot_status.current_state)
+                values["flags"] = (
+                    FLAG_CHARGING * robot_status.is_charging
+                    | FLAG_ESTOPPED * robot_status.is_estopped
+                    | FLAG_OUT_OF_SERVICE * robot_status.out_of_service
+                )
+            for name, value in values.items():
+                self._buffer[name].append(value)
+            self._last = values
+            if len(self._buffer["t"]) >= self.block_size:
+                self._flush()
+
+    def sample(self, client: Robot) -> Dict[str, Exception]:
+        """Fetch the status and position of a robot concurrently and record them.
+
+        Only the parts that were fetched are recorded; the columns of a failed part repeat
+        their previous value. No sample is recorded if both parts failed.
+
+        Args:
+            client: API client of the robot.
+
+        Returns:
+            Errors of the parts that could not be fetched, keyed by "status" or "position".
+        """
+        snap = snapshot.get_snapshot(client, parts=("status", "position"))
+        if snap.status is not None or snap.position is not None:
+            self.record(state=snap.position, robot_status=snap.status)
+        return snap.errors
+
+    def flush(self):
+        """Write buffered samples to disk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer["t"]:
+            return
+        columns = {name: np.asarray(values, dtype=np.int64) for name, values in self._buffer.items()}
+        self._buffer = {name: [] for name in COLUMNS}
+        block = _encode_block(columns)
+        t_first = int(columns["t"][0])
+
+        active = self._active
+        if active is not None and (
+            active.size + len(block) > self.segment_bytes
+            or t_first - active.start >= self.segment_seconds * 1000
+        ):
+            active = self._active = None
+            self._maintain(self.clock())
+        if active is None:
+            path = os.path.join(self.directory, f"{t_first:016d}{_RAW}")
+            with open(path, "wb") as f:
+                f.write(_FILE_MAGIC)
+            active = self._active = _Segment(path, t_first)
+            self._segments.append(active)
+        with open(active.path, "ab") as f:
+            f.write(block)
+        active.refresh()
+
+    def close(self):
+        """Flush buffered samples."""
+        self.flush()
+
+    def __enter__(self) -> "TelemetryRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Reading
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, "np.ndarray"]:
+        """Samples between two timestamps, including buffered ones.
+
+        Args:
+            start: First timestamp in seconds. Defaults to the oldest sample.
+            end: Last timestamp in seconds. Defaults to the newest sample.
+
+        Returns:
+            Arrays keyed by column: t, x, y, theta, vel_x, vel_z, battery (floats in seconds,
+            meters, radians and percent), state (strings), is_charging, is_estopped and
+            out_of_service (booleans).
+        """
+        t0 = -(1 << 62) if start is None else int(round(start * COLUMNS["t"]))
+        t1 = (1 << 62) if end is None else int(round(end * COLUMNS["t"]))
+        with self._lock:
+            parts = []
+            for segment in self._segments:
+                segment.refresh()
+                data = segment.read(t0, t1)
+                if data:
+                    parts.append(data)
+            if self._buffer["t"]:
+                parts.append({name: np.asarray(values, dtype=np.int64) for name, values in self._buffer.items()})
+            states = np.asarray(self.states or [""], dtype=object)
+
+        if parts:
+            merged = {name: np.concatenate([p[name] for p in parts]) for name in COLUMNS}
+        else:
+            merged = {name: np.zeros(0, dtype=np.int64) for name in COLUMNS}
+        mask = (merged["t"] >= t0) & (merged["t"] <= t1)
+        result = {
+            name: merged[name][mask] / scale
+            for name, scale in COLUMNS.items()
+            if name not in ("state", "flags")
+        }
+        flags = merged["flags"][mask]
+        result["state"] = states[merged["state"][mask]] if len(flags) else np.zeros(0, dtype=object)
+        result["is_charging"] = (flags & FLAG_CHARGING) > 0
+        result["is_estopped"] = (flags & FLAG_ESTOPPED) > 0
+        result["out_of_service"] = (flags & FLAG_OUT_OF_SERVICE) > 0
+        return result
+
+    # Maintenance
+
+    def maintain(self, now: Optional[float] = None):
+        """Downsample segments older than raw_retention and delete those older than retention.
+
+        Runs automatically whenever a segment is rotated.
+
+        Args:
+            now: Current time in seconds. Defaults to the recorder's clock.
+        """
+        with self._lock:
+            self._maintain(self.clock() if now is None else now)
+
+    def _maintain(self, now: float):
+        now_ms = now * COLUMNS["t"]
+        kept = []
+        for segment in self._segments:
+            if segment is self._active or segment.t_last is None:
+                kept.append(segment)
+                continue
+            age = now_ms - segment.t_last
+            if age > self.retention * 1000:
+                os.remove(segment.path)
+            elif age > self.raw_retention * 1000 and segment.path.endswith(_RAW):
+                kept.append(self._downsample(segment))
+            else:
+                kept.append(segment)
+        self._segments = kept
+
+    def _downsample(self, segment: _Segment) -> _Segment:
+        """Replace a raw segment by one sample per downsample_interval bucket.
+
+        Numeric columns are averaged, theta by its circular mean so that headings on either
+        side of +-pi do not average to 0. State and flags keep the last value of the bucket.
+        """
+        data = segment.read(-(1 << 62), 1 << 62)
+        bucket = (data["t"] // int(self.downsample_interval * 1000)).astype(np.int64)
+        starts = np.flatnonzero(np.diff(bucket, prepend=bucket[0] - 1))
+        counts = np.diff(np.append(starts, len(bucket)))
+        ends = starts + counts - 1
+        columns = {}
+        for name in COLUMNS:
+            if name in ("state", "flags"):
+                columns[name] = data[name][ends]
+            elif name == "theta":
+                theta = data[name] / COLUMNS[name]
+                mean = np.arctan2(np.add.reduceat(np.sin(theta), starts), np.add.reduceat(np.cos(theta), starts))
+                columns[name] = np.round(mean * COLUMNS[name]).astype(np.int64)
+            else:
+                columns[name] = np.round(np.add.reduceat(data[name], starts) / counts).astype(np.int64)
+
+        path = os.path.join(self.directory, f"{segment.start:016d}{_DOWNSAMPLED}")
+        with open(path, "wb") as f:
+            f.write(_FILE_MAGIC)
+            f.write(_encode_block(columns))
+        os.remove(segment.path)
+        downsampled = _Segment(path, segment.start)
+        downsampled.refresh()
+        return downsampled
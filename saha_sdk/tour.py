@@ -0,0 +1,245 @@
+import time
+from typing import Callable, List, Mapping, Optional, Sequence
+
+from ._compat import numpy as np, require_numpy
+from .models import CruiseRequestModel
+from .planning import CostFunction, Point
+
+_EPS = 1e-9
+
+
+def _require_numpy():
+    require_numpy("Tour optimization")
+
+
+def distance_matrix(points: Sequence[Point], cost_fn: Optional[CostFunction] = None) -> "np.ndarray":
+    """
+    Pairwise travel costs between points.
+
+    Args:
+        points (Sequence[Point]): (x, y) coordinates.
+        cost_fn (Optional[CostFunction]): Travel cost between two points, e.g. grid path costs.
+            It need not be symmetric. If None, straight-line distances are computed in one
+            vectorized step.
+
+    Returns:
+        np.ndarray: n x n cost matrix
+    """
+    _require_numpy()
+    xy = np.asarray(points, dtype=float).reshape(-1, 2)
+    if cost_fn is None:
+        diff = xy[:, None, :] - xy[None, :, :]
+        return np.sqrt((diff ** 2).sum(axis=2))
+    n = len(xy)
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                matrix[i, j] = cost_fn(tuple(xy[i]), tuple(xy[j]))
+    return matrix
+
+
+def tour_length(tour: Sequence[int], matrix: "np.ndarray") -> float:
+    """
+    Length of a closed tour.
+
+    Args:
+        tour (Sequence[int]): Point indices in visiting order.
+        matrix (np.ndarray): Cost matrix from ``distance_matrix``.
+
+    Returns:
+        float: Total cost including the leg back to the first point
+    """
+    _require_numpy()
+    t = np.asarray(tour)
+    return float(matrix[t, np.roll(t, -1)].sum())
+
+
+def nearest_neighbour_tour(matrix: "np.ndarray", start: int = 0) -> List[int]:
+    """
+    Build a closed tour by always moving to the closest unvisited point.
+
+    Args:
+        matrix (np.ndarray): Cost matrix from ``distance_matrix``.
+        start (int): Index of the first point.
+
+    Returns:
+        List[int]: Point indices in visiting order
+    """
+    _require_numpy()
+    n = len(matrix)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    current = start
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, matrix[current])
+        current = int(np.argmin(row))
+        visited[current] = True
+        tour.append(current)
+    return tour
+
+
+def _two_opt_pass(tour: "np.ndarray", matrix: "np.ndarray") -> bool:
+    """Apply the best 2-opt move for every edge of the tour; return whether any was applied."""
+    n = len(tour)
+    improved = False
+    for i in range(n - 2):
+        a, b = tour[i], tour[i + 1]
+        js = np.arange(i + 2, n if i > 0 else n - 1)
+        if not len(js):
+            continue
+        c = tour[js]
+        d = tour[(js + 1) % n]
+        # Reversing tour[i+1:j+1] also turns its inner edges around, which only costs
+        # nothing if the matrix is symmetric.
+        nxt = np.roll(tour, -1)
+        turned = np.concatenate(([0.0], np.cumsum(matrix[nxt, tour] - matrix[tour, nxt])))
+        delta = matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d] + turned[js] - turned[i + 1]
+        k = int(np.argmin(delta))
+        if delta[k] < -_EPS:
+            j = js[k]
+            tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1].copy()
+            improved = True
+    return improved
+
+
+def _or_opt_pass(tour: "np.ndarray", matrix: "np.ndarray", max_segment: int = 3) -> bool:
+    """Move segments of up to max_segment points to their cheapest position; return whether any moved."""
+    n = len(tour)
+    improved = False
+    for length in range(1, max_segment + 1):
+        if n < length + 3:
+            break
+        i = 1
+        while i + length <= n:
+            segment = tour[i:i + length]
+            prev, nxt = tour[i - 1], tour[(i + length) % n]
+            first, last = segment[0], segment[-1]
+            gain = matrix[prev, first] + matrix[last, nxt] - matrix[prev, nxt]
+
+            rest = np.concatenate((tour[:i], tour[i + length:]))
+            u = rest
+            v = np.roll(rest, -1)
+            forward = matrix[u, first] + matrix[last, v] - matrix[u, v]
+            backward = (matrix[u, last] + matrix[first, v] - matrix[u, v]
+                        + (matrix[segment[1:], segment[:-1]] - matrix[segment[:-1], segment[1:]]).sum())
+            # Re-inserting between prev and nxt is the current tour.
+            same = (u == prev) & (v == nxt)
+            forward[same] = np.inf
+            backward[same] = np.inf
+
+            kf = int(np.argmin(forward))
+            kb = int(np.argmin(backward))
+            best, reverse, k = (forward[kf], False, kf) if forward[kf] <= backward[kb] else (backward[kb], True, kb)
+            if best < gain - _EPS:
+                moved = segment[::-1] if reverse else segment
+                tour[:] = np.concatenate((rest[:k + 1], moved, rest[k + 1:]))
+                improved = True
+            else:
+                i += 1
+    return improved
+
+
+def optimize_tour(
+    matrix: "np.ndarray",
+    start: int = 0,
+    time_limit: Optional[float] = None,
+    clock: Callable[[], float] = time.perf_counter
+) -> List[int]:
+    """
+    Find a short closed tour through all points.
+
+    Starts from a nearest neighbour tour and alternates 2-opt and Or-opt passes until
+    neither improves the tour or the time limit is reached.
+
+    Args:
+        matrix (np.ndarray): Cost matrix from ``distance_matrix``; matrix[i, j] is the cost
+            from i to j and may differ from matrix[j, i].
+        start (int): Index of the point the tour starts at.
+        time_limit (Optional[float]): Maximum optimization time in seconds.
+        clock (Callable[[], float]): Time source for the time limit.
+
+    Returns:
+        List[int]: Point indices in visiting order, beginning with start
+    """
+    _require_numpy()
+    matrix = np.asarray(matrix, dtype=float)
+    n = len(matrix)
+    if n <= 3:
+        return [start] + [i for i in range(n) if i != start]
+
+    deadline = None if time_limit is None else clock() + time_limit
+    tour = np.asarray(nearest_neighbour_tour(matrix, start))
+    while True:
+        improved = _two_opt_pass(tour, matrix)
+        if deadline is not None and clock() >= deadline:
+            break
+        improved = _or_opt_pass(tour, matrix) or improved
+        if not improved or (deadline is not None and clock() >= deadline):
+            break
+
+    k = int(np.flatnonzero(tour == start)[0])
+    return [int(i) for i in np.roll(tour, -k)]
+
+
+def optimize_waypoints(
+    waypoints: Sequence[str],
+    positions: Mapping[str, Point],
+    cost_fn: Optional[CostFunction] = None,
+    keep_start: bool = True,
+    time_limit: Optional[float] = None
+) -> List[str]:
+    """
+    Reorder cruise waypoints into a short closed patrol round.
+
+    Args:
+        waypoints (Sequence[str]): Waypoint target UIDs. Duplicates are visited once.
+        positions (Mapping[str, Point]): Target coordinates keyed by UID, see ``planning.target_positions``.
+        cost_fn (Optional[CostFunction]): Travel cost between two points. Defaults to straight-line distance.
+        keep_start (bool): Keep the first waypoint as the start of the round.
+        time_limit (Optional[float]): Maximum optimization time in seconds.
+
+    Returns:
+        List[str]: Waypoint UIDs in the optimized order
+    """
+    uids = list(dict.fromkeys(waypoints))
+    missing = [uid for uid in uids if uid not in positions]
+    if missing:
+        raise KeyError(f"Unknown waypoint targets: {', '.join(missing)}")
+    if len(uids) <= 3:
+        return uids
+    matrix = distance_matrix([positions[uid] for uid in uids], cost_fn)
+    start = 0 if keep_start else int(np.argmin(matrix.sum(axis=1)))
+    return [uids[i] for i in optimize_tour(matrix, start, time_limit)]
+
+
+def optimize_cruise(
+    cruise_request: CruiseRequestModel,
+    positions: Mapping[str, Point],
+    cost_fn: Optional[CostFunction] = None,
+    keep_start: bool = True,
+    time_limit: Optional[float] = None
+) -> CruiseRequestModel:
+    """
+    Return a copy of a cruise request with its waypoints in an optimized order.
+
+    Use before ``cruise.add_cruise`` or ``cruise.update_cruise``.
+
+    Args:
+        cruise_request (CruiseRequestModel): Cruise to optimize.
+        positions (Mapping[str, Point]): Target coordinates keyed by UID.
+        cost_fn (Optional[CostFunction]): Travel cost between two points.
+        keep_start (bool): Keep the first waypoint as the start of the round.
+        time_limit (Optional[float]): Maximum optimization time in seconds.
+
+    Returns:
+        CruiseRequestModel: Cruise request with reordered waypoints
+    """
+    waypoints = optimize_waypoints(cruise_request.waypoints, positions, cost_fn, keep_start, time_limit)
+    return CruiseRequestModel(
+        name=cruise_request.name,
+        waypoints=waypoints,
+        site=cruise_request.site,
+        floor=cruise_request.floor
+    )
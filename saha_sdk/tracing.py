@@ -0,0 +1,284 @@
+import contextvars
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from . import endpoints
+from . import _compat
+
+# Lifecycle events, in the order they occur for a request.
+BEFORE_SEND = "before_send"
+AFTER_CONNECT = "after_connect"
+AFTER_RECEIVE = "after_receive"
+AFTER_DECODE = "after_decode"
+AFTER_VALIDATE = "after_validate"
+ON_ERROR = "on_error"
+EVENTS = (BEFORE_SEND, AFTER_CONNECT, AFTER_RECEIVE, AFTER_DECODE, AFTER_VALIDATE, ON_ERROR)
+
+_current_call: contextvars.ContextVar = contextvars.ContextVar("saha_sdk_call", default=None)
+_current_request: contextvars.ContextVar = contextvars.ContextVar("saha_sdk_request", default=None)
+
+
+def _wall_ns(span, t: Optional[float]) -> Optional[int]:
+    return None if t is None else span.start_time_ns + int((t - span.start) * 1e9)
+
+
+@dataclass
+class RequestSpan:
+    """Timing of one HTTP request. Times are ``time.perf_counter()`` values."""
+    tracer: "Tracer"
+    robot: str
+    method: str
+    path: str
+    endpoint: str
+    start: float
+    start_time_ns: int
+    call: Optional["CallSpan"] = None
+    connected: Optional[float] = None
+    connection_reused: Optional[bool] = None
+    received: Optional[float] = None
+    decoded: Optional[float] = None
+    end: Optional[float] = None
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """Seconds spent connecting (including DNS), waiting for the robot, and decoding."""
+        result = {}
+        if self.connected is not None:
+            result["connect"] = self.connected - self.start
+        if self.received is not None:
+            result["wait"] = self.received - (self.connected or self.start)
+        if self.decoded is not None and self.received is not None:
+            result["decode"] = self.decoded - self.received
+        if self.end is not None:
+            result["total"] = self.end - self.start
+        return result
+
+    def time_ns(self, t: Optional[float]) -> Optional[int]:
+        """Convert a perf_counter value of this span to nanoseconds since the epoch."""
+        return _wall_ns(self, t)
+
+
+@dataclass
+class CallSpan:
+    """Timing of one SDK function call, e.g. ``targets.get_all_targets``."""
+    tracer: "Tracer"
+    name: str
+    robot: str
+    start: float
+    start_time_ns: int
+    end: Optional[float] = None
+    error: Optional[BaseException] = None
+    requests: List[RequestSpan] = field(default_factory=list)
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """Seconds spent in requests and in validating the last response into models."""
+        result = {"requests": sum(r.durations.get("total", 0.0) for r in self.requests)}
+        last = self.requests[-1] if self.requests else None
+        if self.end is not None:
+            result["total"] = self.end - self.start
+            if last is not None and last.end is not None and self.error is None:
+                result["validate"] = self.end - last.end
+        return result
+
+    def time_ns(self, t: Optional[float]) -> Optional[int]:
+        """Convert a perf_counter value of this span to nanoseconds since the epoch."""
+        return _wall_ns(self, t)
+
+
+Hook = Callable[[Any], None]
+
+
+class Tracer:
+    """Dispatches request lifecycle events to hooks.
+
+    Assign a tracer to ``Robot.tracer`` to receive:
+
+    - before_send(RequestSpan): the request is about to be handed to the transport
+    - after_connect(RequestSpan): a connection is ready; only reported by transports that
+      manage their own connection pool
+    - after_receive(RequestSpan): the response has arrived
+    - after_decode(RequestSpan): the response body has been decoded
+    - after_validate(CallSpan): an SDK function has built its models and returned
+    - on_error(RequestSpan or CallSpan): a request or SDK function raised
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Hook]] = {event: [] for event in EVENTS}
+
+    def on(self, event: str, hook: Hook) -> Callable[[], None]:
+        """Register a hook for an event.
+
+        Args:
+            event: One of EVENTS.
+            hook: Called with the span.
+
+        Returns:
+            Function that removes the hook.
+        """
+        if event not in self._hooks:
+            raise ValueError(f"Unknown event: {event}")
+        self._hooks[event].append(hook)
+        return lambda: self._hooks[event].remove(hook)
+
+    def add(self, hooks: Any) -> Callable[[], None]:
+        """Register every method of an object named after an event, e.g. OpenTelemetryHooks.
+
+        Returns:
+            Function that removes the hooks.
+        """
+        removers = [self.on(event, getattr(hooks, event)) for event in EVENTS if callable(getattr(hooks, event, None))]
+
+        def remove():
+            for remover in removers:
+                remover()
+        return remove
+
+    def emit(self, event: str, span: Any):
+        """Call the hooks of an event. Exceptions in hooks are not caught."""
+        for hook in self._hooks[event]:
+            hook(span)
+
+    def start_request(self, robot: str, method: str, path: str) -> RequestSpan:
+        call = _current_call.get()
+        span = RequestSpan(
+            tracer=self, robot=robot, method=method, path=path, endpoint=endpoints.template_for(path),
+            start=time.perf_counter(), start_time_ns=time.time_ns(), call=call if call is not None and call.tracer is self else None
+        )
+        if span.call is not None:
+            span.call.requests.append(span)
+        self.emit(BEFORE_SEND, span)
+        return span
+
+
+def current_request() -> Optional[RequestSpan]:
+    """The request span being sent in this thread or task, if any."""
+    return _current_request.get()
+
+
+def connection_established(reused: bool):
+    """Report that the transport has a connection for the current request.
+
+    Called by transports; does nothing outside a traced request.
+
+    Args:
+        reused: Whether an idle keep-alive connection was reused.
+    """
+    span = _current_request.get()
+    if span is not None:
+        span.connected = time.perf_counter()
+        span.connection_reused = reused
+        span.tracer.emit(AFTER_CONNECT, span)
+
+
+def traced(fn: Callable) -> Callable:
+    """Record calls of an SDK function taking the client as its first argument as CallSpans."""
+    module = fn.__module__.rsplit(".", 1)[-1]
+    name = f"{module}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(client, *args, **kwargs):
+        tracer = getattr(client, "tracer", None)
+        if tracer is None:
+            return fn(client, *args, **kwargs)
+        span = CallSpan(tracer=tracer, name=name, robot=client.name, start=time.perf_counter(), start_time_ns=time.time_ns())
+        token = _current_call.set(span)
+        try:
+            result = fn(client, *args, **kwargs)
+        except BaseException as e:
+            span.end, span.error = time.perf_counter(), e
+            tracer.emit(ON_ERROR, span)
+            raise
+        finally:
+            _current_call.reset(token)
+        span.end = time.perf_counter()
+        tracer.emit(AFTER_VALIDATE, span)
+        return result
+    return wrapper
+
+
+class OpenTelemetryHooks:
+    """Exports SDK calls and requests as OpenTelemetry spans.
+
+    SDK functions become spans named after the function with their requests as child
+    spans. Request spans carry the HTTP method, URL path, endpoint template and status,
+    the connect/wait/decode durations as attributes, and lifecycle events at the times
+    they occurred. Spans are emitted when they end, with their original start times.
+
+    Usage:
+        robot.tracer = Tracer()
+        robot.tracer.add(OpenTelemetryHooks())
+    """
+
+    def __init__(self, tracer=None):
+        """Initialize the exporter.
+
+        Args:
+            tracer: OpenTelemetry tracer. Defaults to ``trace.get_tracer("saha_sdk")``,
+                which requires the opentelemetry-api package.
+        """
+        if tracer is None:
+            if _compat.opentelemetry_trace is None:
+                raise ImportError("OpenTelemetryHooks requires opentelemetry-api. Install it with: pip install opentelemetry-api")
+            tracer = _compat.opentelemetry_trace.get_tracer("saha_sdk")
+        self.tracer = tracer
+
+    def _context(self, parent):
+        if parent is None or _compat.opentelemetry_trace is None:
+            return None
+        return _compat.opentelemetry_trace.set_span_in_context(parent)
+
+    def _export_request(self, span: RequestSpan, parent=None):
+        otel_span = self.tracer.start_span(
+            f"{span.method} {span.endpoint}",
+            context=self._context(parent),
+            start_time=span.start_time_ns,
+            attributes={
+                "http.method": span.method,
+                "http.target": span.path,
+                "saha.robot": span.robot,
+                "saha.endpoint": span.endpoint,
+            }
+        )
+        if span.status is not None:
+            otel_span.set_attribute("http.status_code", span.status)
+        if span.connection_reused is not None:
+            otel_span.set_attribute("saha.connection_reused", span.connection_reused)
+        for name, seconds in span.durations.items():
+            otel_span.set_attribute(f"saha.duration.{name}", seconds)
+        for event, t in (("connected", span.connected), ("received", span.received), ("decoded", span.decoded)):
+            if t is not None:
+                otel_span.add_event(event, timestamp=span.time_ns(t))
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+        otel_span.end(end_time=span.time_ns(span.end))
+
+    def _export_call(self, span: CallSpan):
+        otel_span = self.tracer.start_span(
+            span.name, start_time=span.start_time_ns, attributes={"saha.robot": span.robot}
+        )
+        for name, seconds in span.durations.items():
+            otel_span.set_attribute(f"saha.duration.{name}", seconds)
+        for request in span.requests:
+            self._export_request(request, otel_span)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+        otel_span.end(end_time=span.time_ns(span.end))
+
+    def after_decode(self, span: RequestSpan):
+        if span.call is None:
+            self._export_request(span)
+
+    def after_validate(self, span: CallSpan):
+        self._export_call(span)
+
+    def on_error(self, span):
+        if isinstance(span, CallSpan):
+            self._export_call(span)
+        elif span.call is None:
+            self._export_request(span)
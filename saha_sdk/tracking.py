@@ -0,0 +1,268 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from . import navigation
+from .fleet import RobotFleet
+from .models import CruiseModel, PathModel, RobotState
+
+
+@dataclass
+class CruiseProgress:
+    """Progress of a robot through a cruise."""
+    cruise: str
+    current_waypoint: str
+    waypoint_index: int
+    rounds_completed: int
+    number_of_rounds: int
+    distance_to_waypoint: float
+    distance_remaining_round: float
+    distance_remaining: float
+    speed: float
+    eta_round: float
+    eta: float
+    finished: bool
+
+
+class CruiseTracker:
+    """Tracks progress through a started cruise from position samples.
+
+    Leg lengths and the distance left in a round after each waypoint are computed once,
+    so each position sample only costs a distance to the next waypoint (or a short walk
+    along the planned path) and a few additions. A waypoint counts as reached once the
+    robot is within its tolerance or has moved past it along the leg leading to it.
+    """
+
+    def __init__(
+        self,
+        cruise: CruiseModel,
+        number_of_rounds: int = 1,
+        default_speed: float = 0.5,
+        min_speed: float = 0.05,
+        speed_smoothing: float = 0.2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize a new tracker.
+
+        Args:
+            cruise: The cruise that was started, e.g. from ``cruise.get_cruise``.
+            number_of_rounds: Rounds passed to ``cruise.start_cruise``.
+            default_speed: Speed in m/s assumed until the robot has been observed moving.
+            min_speed: Lower bound on the speed used for ETAs, in m/s.
+            speed_smoothing: Weight of the newest sample in the exponentially smoothed speed.
+            clock: Monotonic time source in seconds, used when samples carry no timestamp.
+        """
+        if not cruise.waypoints:
+            raise ValueError("Cruise has no waypoints")
+        self.cruise = cruise
+        self.number_of_rounds = max(1, number_of_rounds)
+        self.min_speed = min_speed
+        self.speed_smoothing = speed_smoothing
+        self.clock = clock
+
+        self._points = [(w.px or 0.0, w.py or 0.0) for w in cruise.waypoints]
+        self._tolerances = [w.tol for w in cruise.waypoints]
+        n = len(self._points)
+        # _rest[k]: distance from waypoint k to the last waypoint along the round.
+        self._rest = [0.0] * n
+        for k in range(n - 2, -1, -1):
+            self._rest[k] = self._rest[k + 1] + self._distance(self._points[k], self._points[k + 1])
+        closing = self._distance(self._points[-1], self._points[0])
+        self.round_length = self._rest[0] + closing
+
+        self.index = 0
+        self.rounds_completed = 0
+        self.speed = default_speed
+        self._last_position = None
+        self._last_time = None
+        self._path_cumulative: List[float] = []
+        self._path_points: List[tuple] = []
+        self._path_index = 0
+
+    @staticmethod
+    def _distance(a, b) -> float:
+        return math.hypot(a[0] - b[0], a[1] - b[1])
+
+    @property
+    def finished(self) -> bool:
+        return self.rounds_completed >= self.number_of_rounds
+
+    def update_path(self, path: PathModel):
+        """Use the robot's planned path to measure the distance to the next waypoint.
+
+        Args:
+            path: Path from ``navigation.get_navigation_path``. Ignored unless it ends at
+                the next waypoint.
+        """
+        points = [(p.x, p.y) for p in path.points]
+        if not points or self.finished or self._distance(points[-1], self._points[self.index]) > self._tolerances[self.index]:
+            self._path_points = []
+            self._path_cumulative = []
+            return
+        cumulative = [0.0]
+        for a, b in zip(points, points[1:]):
+            cumulative.append(cumulative[-1] + self._distance(a, b))
+        self._path_points = points
+        self._path_cumulative = cumulative
+        self._path_index = 0
+
+    def _distance_to_waypoint(self, position) -> float:
+        target = self._points[self.index]
+        if not self._path_points:
+            return self._distance(position, target)
+        # The robot moves forward along the path, so only look a few points ahead.
+        points = self._path_points
+        best = self._path_index
+        best_distance = self._distance(position, points[best])
+        for k in range(best + 1, min(best + 16, len(points))):
+            d = self._distance(position, points[k])
+            if d < best_distance:
+                best, best_distance = k, d
+        self._path_index = best
+        return best_distance + self._path_cumulative[-1] - self._path_cumulative[best]
+
+    def _passed(self, position) -> bool:
+        """Whether the position projects beyond the next waypoint on the leg leading to it."""
+        if len(self._points) == 1 or (self.index == 0 and self.rounds_completed == 0):
+            return False
+        a = self._points[self.index - 1]
+        b = self._points[self.index]
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        length2 = dx * dx + dy * dy
+        if length2 == 0.0:
+            return False
+        return ((position[0] - a[0]) * dx + (position[1] - a[1]) * dy) / length2 >= 1.0
+
+    def _reached(self, position) -> bool:
+        return self._distance(position, self._points[self.index]) <= self._tolerances[self.index] or self._passed(position)
+
+    def update(self, state: RobotState, timestamp: Optional[float] = None) -> CruiseProgress:
+        """Record a position sample and return the updated progress.
+
+        Args:
+            state: Position sample, e.g. from ``navigation.get_position_stream``.
+            timestamp: Time of the sample in seconds. Defaults to the tracker's clock.
+
+        Returns:
+            Current progress of the cruise.
+        """
+        now = self.clock() if timestamp is None else timestamp
+        position = (state.position.x, state.position.y)
+
+        if self._last_position is not None and now > self._last_time:
+            observed = abs(state.twist.vel_x) or self._distance(position, self._last_position) / (now - self._last_time)
+            self.speed += self.speed_smoothing * (observed - self.speed)
+        self._last_position = position
+        self._last_time = now
+
+        while not self.finished and self._reached(position):
+            self._path_points = []
+            self._path_cumulative = []
+            if self.index == len(self._points) - 1:
+                self.rounds_completed += 1
+                self.index = 0
+                if len(self._points) == 1:
+                    break
+            else:
+                self.index += 1
+
+        return self.progress(position)
+
+    def progress(self, position=None) -> CruiseProgress:
+        """Current progress, using the last sampled position if none is given."""
+        position = position if position is not None else (self._last_position or self._points[0])
+        speed = max(self.speed, self.min_speed)
+        if self.finished:
+            to_waypoint = remaining_round = remaining = 0.0
+        else:
+            to_waypoint = self._distance_to_waypoint(position)
+            remaining_round = to_waypoint + self._rest[self.index]
+            rounds_after = self.number_of_rounds - self.rounds_completed - 1
+            remaining = remaining_round + rounds_after * self.round_length
+        return CruiseProgress(
+            cruise=self.cruise.name,
+            current_waypoint=self.cruise.waypoints[self.index].uid,
+            waypoint_index=self.index,
+            rounds_completed=self.rounds_completed,
+            number_of_rounds=self.number_of_rounds,
+            distance_to_waypoint=to_waypoint,
+            distance_remaining_round=remaining_round,
+            distance_remaining=remaining,
+            speed=speed,
+            eta_round=remaining_round / speed,
+            eta=remaining / speed,
+            finished=self.finished
+        )
+
+
+class FleetCruiseTracker:
+    """Tracks the cruises of many robots in one process."""
+
+    def __init__(self, fleet: Optional[RobotFleet] = None):
+        """Initialize a new fleet tracker.
+
+        Args:
+            fleet: Fleet used by poll() to fetch positions.
+        """
+        self.fleet = fleet
+        self.trackers: Dict[str, CruiseTracker] = {}
+
+    def start(self, name: str, cruise: CruiseModel, number_of_rounds: int = 1, **kwargs) -> CruiseTracker:
+        """Start tracking the cruise of a robot.
+
+        Args:
+            name: Name of the robot within the fleet.
+            cruise: The cruise that was started.
+            number_of_rounds: Rounds passed to ``cruise.start_cruise``.
+            **kwargs: Additional CruiseTracker options.
+
+        Returns:
+            The robot's tracker.
+        """
+        tracker = CruiseTracker(cruise, number_of_rounds, **kwargs)
+        self.trackers[name] = tracker
+        return tracker
+
+    def stop(self, name: str):
+        """Stop tracking a robot."""
+        self.trackers.pop(name, None)
+
+    def update(self, name: str, state: RobotState, timestamp: Optional[float] = None) -> CruiseProgress:
+        """Record a position sample of one robot."""
+        return self.trackers[name].update(state, timestamp)
+
+    def poll(self) -> Dict[str, CruiseProgress]:
+        """Fetch the position and planned path of every tracked robot concurrently and update its progress.
+
+        Returns:
+            Progress keyed by robot name. Robots whose position could not be fetched are omitted;
+            robots whose path could not be fetched are measured in a straight line.
+        """
+        names = [name for name, tracker in self.trackers.items() if not tracker.finished]
+        futures = {
+            name: (
+                self.fleet.submit(navigation.get_position_stream, self.fleet[name]),
+                self.fleet.submit(navigation.get_navigation_path, self.fleet[name])
+            )
+            for name in names
+        }
+        progress = {}
+        for name, (state_future, path_future) in futures.items():
+            try:
+                path = path_future.result()
+            except Exception:
+                path = None
+            try:
+                state = state_future.result()
+            except Exception:
+                continue
+            tracker = self.trackers[name]
+            if path is not None:
+                tracker.update_path(path)
+            progress[name] = tracker.update(state)
+        return progress
+
+    def progress(self) -> Dict[str, CruiseProgress]:
+        """Last known progress of every tracked robot."""
+        return {name: tracker.progress() for name, tracker in self.trackers.items()}
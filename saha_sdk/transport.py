@@ -0,0 +1,549 @@
+import asyncio
+import functools
+import io
+import ipaddress
+import json as _json
+import socket
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from urllib.parse import unquote, urlencode, urlsplit, urlunsplit
+
+import requests
+import requests.adapters
+import urllib3
+import urllib3.connection
+
+from . import _compat, tracing
+
+
+class TransportResponse:
+    """An HTTP response with the parts of the requests.Response interface the client uses."""
+
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[Dict[str, str]] = None, url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Decode the body as JSON. Raises ValueError if it is not valid JSON."""
+        return _json.loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse [{self.status_code}]>"
+
+
+Response = Union[requests.Response, TransportResponse]
+
+
+def _prepare(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    params: Optional[Dict[str, Any]] = None,
+    json: Any = None,
+    data: Any = None
+) -> Tuple[str, Dict[str, str], Optional[bytes]]:
+    """Encode query parameters and body the way requests does."""
+    headers = dict(headers or {})
+    if params:
+        query = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+        if query:
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+    body = None
+    if json is not None:
+        body = _json.dumps(json).encode("utf-8")
+        headers.setdefault("Content-Type", "application/json")
+    elif isinstance(data, dict):
+        body = urlencode(data, doseq=True).encode("utf-8")
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    elif isinstance(data, str):
+        body = data.encode("utf-8")
+    elif data is not None:
+        body = bytes(data)
+    return url, headers, body
+
+
+class _TracedConnection:
+    """Reports to the tracer whether a request opened its connection or reused an idle one.
+
+    connect() reports a new connection once it is established, so its DNS lookup and
+    connect time are measured apart from the request. request() reports a reused one.
+    """
+    _connected = False
+
+    def connect(self):
+        super().connect()
+        self._connected = True
+        tracing.connection_established(False)
+
+    def request(self, *args, **kwargs):
+        if self.sock is not None and not self._connected:
+            tracing.connection_established(True)
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            self._connected = False
+
+
+class _TracedHTTPConnection(_TracedConnection, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _TracedHTTPSConnection(_TracedConnection, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _TracedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _TracedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+_TRACED_POOL_CLASSES = {"http": _TracedHTTPConnectionPool, "https": _TracedHTTPSConnectionPool}
+
+
+class TracingPoolManager(urllib3.PoolManager):
+    """urllib3 PoolManager whose connections report after_connect events to the tracer.
+
+    Outside a traced request the events cost a context variable lookup.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = _TRACED_POOL_CLASSES
+
+
+class TracingHTTPAdapter(requests.adapters.HTTPAdapter):
+    """requests adapter whose connections report after_connect events to the tracer.
+
+    Usage:
+        session.mount("http://", TracingHTTPAdapter())
+        session.mount("https://", TracingHTTPAdapter())
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _TRACED_POOL_CLASSES
+
+
+class Transport:
+    """Sends HTTP requests on behalf of a Robot client.
+
+    Implementations accept the keyword arguments the client passes to ``requests.request``
+    (headers, params, json, data, timeout) and return an object with ``status_code``,
+    ``content``, ``text``, ``headers`` and ``json()``.
+    """
+
+    # Exceptions raised by the transport for connection problems. The client reports them
+    # as "Network Error".
+    network_errors: Tuple[Type[BaseException], ...] = ()
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Response:
+        """Send a request and return its response."""
+        raise NotImplementedError
+
+    async def request_async(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Response:
+        """Send a request from a coroutine. Runs request() in the loop's default executor unless overridden."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(self.request, method, url, headers=headers, **kwargs))
+
+    def warmup(self, url: str, headers: Optional[Dict[str, str]] = None, connections: int = 1, timeout: Optional[float] = None):
+        """Connect ahead of the first real request by sending GET requests to url.
+
+        With connections > 1 the requests are sent concurrently, so a pooling transport
+        opens up to that many keep-alive connections. Raises the transport's network errors.
+        """
+        if connections <= 1:
+            self.request("GET", url, headers=headers, timeout=timeout)
+            return
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="saha-warmup") as executor:
+            futures = [executor.submit(self.request, "GET", url, headers=headers, timeout=timeout) for _ in range(connections)]
+            for future in futures:
+                future.result()
+
+    def close(self):
+        """Release connections held by the transport."""
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """Transport backed by the requests library.
+
+    Without a session every call goes through ``requests.request``. With a session, or with
+    per-thread sessions, connections are kept alive and reused. Per-thread sessions report
+    after_connect events; mount TracingHTTPAdapter on a session of your own for the same.
+    """
+
+    network_errors = (requests.RequestException,)
+
+    def __init__(self, session: Optional[requests.Session] = None, per_thread_sessions: bool = False):
+        """Initialize a new transport.
+
+        Args:
+            session: Session to send every request with.
+            per_thread_sessions: Give every thread its own keep-alive session. Ignored if a
+                session is given.
+        """
+        self.session = session
+        self.per_thread_sessions = per_thread_sessions
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def _session(self) -> Optional[requests.Session]:
+        if self.session is not None or not self.per_thread_sessions:
+            return self.session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("http://", TracingHTTPAdapter())
+            session.mount("https://", TracingHTTPAdapter())
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        session = self._session()
+        if session is None:
+            return requests.request(method, url, headers=headers, **kwargs)
+        return session.request(method, url, headers=headers, **kwargs)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+
+class DNSCache:
+    """Addresses of host names, resolved at most once per ttl seconds.
+
+    Resolving mDNS names such as "robot-1.local" can take hundreds of milliseconds, and
+    without a cache it is repeated for every new connection. A cache can be shared by
+    several transports.
+    """
+
+    def __init__(self, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic, resolver: Callable = socket.getaddrinfo):
+        """Initialize a new cache.
+
+        Args:
+            ttl: Seconds an address is reused before the name is resolved again.
+            clock: Monotonic clock in seconds.
+            resolver: Called like socket.getaddrinfo.
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self.resolver = resolver
+        self._entries: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> str:
+        """Address of host, from the cache unless it expired. IP addresses are returned as they are.
+
+        Raises:
+            socket.gaierror: If the name cannot be resolved.
+        """
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+        key = (host, port)
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        address = self.resolver(host, port, 0, socket.SOCK_STREAM)[0][4][0]
+        with self._lock:
+            self._entries[key] = (address, now + self.ttl)
+        return address
+
+    def invalidate(self, host: str):
+        """Forget the addresses of host, e.g. after connecting to it failed."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == host]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class PooledHTTPTransport(Transport):
+    """HTTP/1.1 transport on a urllib3 connection pool, without the per-request overhead of requests."""
+
+    network_errors = (urllib3.exceptions.HTTPError, socket.gaierror)
+
+    def __init__(self, maxsize: int = 10, block: bool = False, timeout: Optional[float] = None, dns_cache: Optional[DNSCache] = None, **pool_kwargs):
+        """Initialize a new transport.
+
+        Args:
+            maxsize: Connections kept alive per host.
+            block: Wait for a free connection instead of opening extra ones when all are in use.
+            timeout: Default connect and read timeout in seconds.
+            dns_cache: Resolve host names through this cache and connect to the cached
+                address (optional). The Host header and TLS server name stay the host name.
+            **pool_kwargs: Additional urllib3.PoolManager options.
+        """
+        self.timeout = timeout
+        self.dns_cache = dns_cache
+        self.pool = TracingPoolManager(maxsize=maxsize, block=block, retries=False, **pool_kwargs)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        url, headers, body = _prepare(url, headers, params, json, data)
+        timeout = timeout if timeout is not None else self.timeout
+        parts = urlsplit(url)
+        host = parts.hostname
+        address = host
+        if self.dns_cache is not None:
+            address = self.dns_cache.resolve(host, parts.port or _DEFAULT_PORTS.get(parts.scheme, 80))
+        if address == host:
+            pool = self.pool.connection_from_host(host, parts.port, parts.scheme)
+        else:
+            headers.setdefault("Host", parts.netloc)
+            tls = {"server_hostname": host, "assert_hostname": host} if parts.scheme == "https" else None
+            pool = self.pool.connection_from_host(address, parts.port, parts.scheme, pool_kwargs=tls)
+        try:
+            response = pool.urlopen(
+                method, urlunsplit(("", "", parts.path or "/", parts.query, "")), body=body, headers=headers,
+                redirect=False, assert_same_host=False,
+                timeout=urllib3.Timeout(total=timeout) if timeout is not None else urllib3.Timeout.DEFAULT_TIMEOUT
+            )
+        except urllib3.exceptions.HTTPError:
+            if address != host:
+                self.dns_cache.invalidate(host)
+            raise
+        return TransportResponse(response.status, response.data, dict(response.headers), url)
+
+    def close(self):
+        self.pool.clear()
+
+
+class AsyncTransport(Transport):
+    """Transport backed by an httpx.AsyncClient, for use from asyncio code.
+
+    Coroutines call request_async() directly. Synchronous calls are run on a private event
+    loop thread, so the same Robot can be used from both worlds.
+    """
+
+    def __init__(self, **client_kwargs):
+        """Initialize a new transport.
+
+        Args:
+            **client_kwargs: Options for httpx.AsyncClient, e.g. limits or http2.
+        """
+        _compat.require_httpx("AsyncTransport")
+        self.network_errors = (_compat.httpx.HTTPError,)
+        self.client_kwargs = client_kwargs
+        # Keyed weakly so the clients of discarded loops are dropped along with them.
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _client(self) -> "httpx.AsyncClient":
+        # An AsyncClient's connections belong to the loop that opened them.
+        loop = asyncio.get_event_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Clients of closed loops can no longer be used or closed; drop their connections.
+            for closed in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed]
+            client = self._clients[loop] = _compat.httpx.AsyncClient(**self.client_kwargs)
+        return client
+
+    async def request_async(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        url, headers, body = _prepare(url, headers, params, json, data)
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        response = await self._client().request(method, url, headers=headers, content=body, **kwargs)
+        return TransportResponse(response.status_code, response.content, dict(response.headers), str(response.url))
+
+    def _bridge_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="saha-async-transport", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        coroutine = self.request_async(method, url, headers=headers, **kwargs)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._bridge_loop()).result()
+
+    async def aclose(self):
+        """Close the client of the running event loop."""
+        client = self._clients.pop(asyncio.get_event_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self):
+        """Close the client used by synchronous calls and stop its event loop."""
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class WSGITransport(Transport):
+    """Calls a WSGI application, e.g. the Flask app of ``examples/mock_robot_server.py``, in-process.
+
+    No sockets are opened; the base URL of the client only provides the host name. Connection
+    errors raised by the application, e.g. a dropped connection of the mock robot, are
+    reported as network errors.
+    """
+
+    network_errors = (OSError,)
+
+    def __init__(self, app: Callable):
+        """Initialize a new transport.
+
+        Args:
+            app: WSGI application.
+        """
+        self.app = app
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        url, headers, body = _prepare(url, headers, params, json, data)
+        parts = urlsplit(url)
+        body = body or b""
+        environ = {
+            "REQUEST_METHOD": method.upper(),
+            "SCRIPT_NAME": "",
+            "PATH_INFO": unquote(parts.path) or "/",
+            "QUERY_STRING": parts.query,
+            "SERVER_NAME": parts.hostname or "localhost",
+            "SERVER_PORT": str(parts.port or (443 if parts.scheme == "https" else 80)),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": parts.scheme or "http",
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in headers.items():
+            key = name.upper().replace("-", "_")
+            if key == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+            elif key != "CONTENT_LENGTH":
+                environ[f"HTTP_{key}"] = value
+
+        started = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = dict(response_headers)
+
+        result = self.app(environ, start_response)
+        try:
+            content = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return TransportResponse(started["status"], content, started["headers"], url)
+
+
+class ASGITransport(Transport):
+    """Calls an ASGI application in-process.
+
+    Coroutines await the application directly via request_async(). Synchronous calls run it
+    on an event loop owned by the calling thread. Connection errors raised by the
+    application are reported as network errors.
+    """
+
+    network_errors = (OSError,)
+
+    def __init__(self, app: Callable):
+        """Initialize a new transport.
+
+        Args:
+            app: ASGI 3 application.
+        """
+        self.app = app
+        self._local = threading.local()
+
+    async def request_async(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, params=None, json=None, data=None, timeout=None) -> TransportResponse:
+        url, headers, body = _prepare(url, headers, params, json, data)
+        parts = urlsplit(url)
+        body = body or b""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": parts.scheme or "http",
+            "path": unquote(parts.path) or "/",
+            "raw_path": (parts.path or "/").encode("latin-1"),
+            "query_string": parts.query.encode("latin-1"),
+            "root_path": "",
+            "headers": [(k.lower().encode("latin-1"), str(v).encode("latin-1")) for k, v in headers.items()]
+            + [(b"content-length", str(len(body)).encode("latin-1"))],
+            "server": (parts.hostname or "localhost", parts.port or (443 if parts.scheme == "https" else 80)),
+            "client": ("127.0.0.1", 0),
+        }
+        request_sent = False
+        disconnected = asyncio.Event()
+        status = 500
+        response_headers: Dict[str, str] = {}
+        chunks: List[bytes] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update((k.decode("latin-1"), v.decode("latin-1")) for k, v in message.get("headers", ()))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    disconnected.set()
+
+        await self.app(scope, receive, send)
+        disconnected.set()
+        return TransportResponse(status, b"".join(chunks), response_headers, url)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            loop = self._local.loop = asyncio.new_event_loop()
+        return loop.run_until_complete(self.request_async(method, url, headers=headers, **kwargs))
+
+    def close(self):
+        """Close the event loop of the calling thread."""
+        loop = getattr(self._local, "loop", None)
+        if loop is not None:
+            loop.close()
+            self._local.loop = None
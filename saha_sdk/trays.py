@@ -0,0 +1,189 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from . import task
+from .client import Robot
+from .models import ResponseModel, TaskRequestModel
+from .planning import CostFunction, Point, euclidean, order_stops, route_cost
+
+TABLE_SERVICE = "TABLE_SERVICE"
+
+
+@dataclass
+class TripStop:
+    """A table visited during a trip and the trays unloaded there."""
+    target_uid: str
+    payload: List[bool]
+    orders: List[TaskRequestModel] = field(default_factory=list)
+
+    @property
+    def trays(self) -> int:
+        return sum(self.payload)
+
+
+@dataclass
+class Trip:
+    """An ordered multi-tray delivery round starting and ending at the pickup point."""
+    stops: List[TripStop]
+    cost: float = 0.0
+
+    def task_requests(self) -> List[TaskRequestModel]:
+        """Build one TABLE_SERVICE task per stop with its task_index and tray mask.
+
+        The orders of a stop are merged: the task waits for the longest of their timeouts,
+        is active if any of them is, and greets every distinct celebrating_name.
+
+        Returns:
+            Task requests in visiting order.
+
+        Raises:
+            ValueError: If a stop holds an order that is not TABLE_SERVICE.
+        """
+        requests = []
+        for index, stop in enumerate(self.stops):
+            other = [o.type for o in stop.orders if o.type != TABLE_SERVICE]
+            if other:
+                raise ValueError(f"Stop {stop.target_uid} holds {other[0]} orders; trips only serve {TABLE_SERVICE}")
+            names = list(dict.fromkeys(o.celebrating_name for o in stop.orders if o.celebrating_name))
+            requests.append(TaskRequestModel(
+                timeout=max((o.timeout for o in stop.orders), default=0),
+                type=TABLE_SERVICE,
+                activate=any(o.activate for o in stop.orders) if stop.orders else True,
+                task_index=index,
+                target_uid=stop.target_uid,
+                payload=list(stop.payload),
+                celebrating_name=", ".join(names)
+            ))
+        return requests
+
+
+def trays_needed(order: TaskRequestModel) -> int:
+    """Number of trays an order occupies; an order without a tray selected takes one."""
+    return max(1, sum(1 for used in order.payload if used))
+
+
+class TrayPlanner:
+    """Groups table-service orders into multi-tray trips with short stop orders."""
+
+    def __init__(self, positions: Mapping[str, Point], trays: int = 4, cost_fn: CostFunction = euclidean, return_to_start: bool = True):
+        """Initialize a new planner.
+
+        Args:
+            positions: Target coordinates keyed by target UID, see ``planning.target_positions``.
+            trays: Number of trays on the robot.
+            cost_fn: Travel cost between two (x, y) points, e.g. a grid path cost function.
+            return_to_start: Whether trips end back at the pickup point.
+        """
+        self.positions = positions
+        self.trays = trays
+        self.cost_fn = cost_fn
+        self.return_to_start = return_to_start
+
+    def plan(self, orders: Sequence[TaskRequestModel], start: Point) -> Tuple[List[Trip], List[TaskRequestModel]]:
+        """Group orders into trips that fill the trays and minimize total travel.
+
+        Orders for the same table share a stop. Stops are merged into trips with the
+        Clarke-Wright savings heuristic under the tray capacity, and the stops of each
+        trip are then visited in the cheapest order.
+
+        Args:
+            orders: Pending orders. The number of trays of each order is taken from its
+                payload.
+            start: Pickup point, e.g. the kitchen, where every trip starts.
+
+        Returns:
+            Trips, cheapest stop order first, and the orders that were not planned: those
+            that are not TABLE_SERVICE and those for unknown targets.
+        """
+        unknown = [o for o in orders if o.type != TABLE_SERVICE or o.target_uid not in self.positions]
+        stops = self._stops([o for o in orders if o.type == TABLE_SERVICE and o.target_uid in self.positions])
+        if not stops:
+            return [], unknown
+
+        cost = self.cost_fn
+        points = [self.positions[s.target_uid] for s in stops]
+        routes: Dict[int, List[int]] = {i: [i] for i in range(len(stops))}
+        route_of = list(range(len(stops)))
+        load = {i: stops[i].trays for i in range(len(stops))}
+
+        savings = sorted(
+            ((cost(start, points[i]) + cost(start, points[j]) - cost(points[i], points[j]), i, j)
+             for i in range(len(stops)) for j in range(i + 1, len(stops))),
+            reverse=True
+        )
+        for saving, i, j in savings:
+            if saving <= 0:
+                break
+            ri, rj = route_of[i], route_of[j]
+            if ri == rj or load[ri] + load[rj] > self.trays:
+                continue
+            a, b = routes[ri], routes[rj]
+            if a[-1] == i and b[0] == j:
+                merged = a + b
+            elif a[0] == i and b[-1] == j:
+                merged = b + a
+            elif a[0] == i and b[0] == j:
+                merged = a[::-1] + b
+            elif a[-1] == i and b[-1] == j:
+                merged = a + b[::-1]
+            else:
+                continue
+            routes[ri] = merged
+            load[ri] += load.pop(rj)
+            del routes[rj]
+            for k in merged:
+                route_of[k] = ri
+
+        trips = []
+        for members in routes.values():
+            order = order_stops(start, [points[k] for k in members], cost, self.return_to_start)
+            trip_stops = [stops[members[k]] for k in order]
+            self._assign_trays(trip_stops)
+            trips.append(Trip(
+                stops=trip_stops,
+                cost=route_cost(start, [self.positions[s.target_uid] for s in trip_stops], cost, self.return_to_start)
+            ))
+        trips.sort(key=lambda t: t.cost)
+        return trips, unknown
+
+    def issue(self, robot: Robot, trip: Trip) -> List[ResponseModel]:
+        """Create the tasks of a trip on a robot, in visiting order.
+
+        Args:
+            robot: API client of the robot running the trip.
+            trip: Trip to issue.
+
+        Returns:
+            Result of each create_task call.
+        """
+        return [task.create_task(robot, request) for request in trip.task_requests()]
+
+    def _stops(self, orders: Sequence[TaskRequestModel]) -> List[TripStop]:
+        """Merge orders per table and split tables that need more trays than the robot has."""
+        by_table: Dict[str, List[TaskRequestModel]] = {}
+        for order in orders:
+            by_table.setdefault(order.target_uid, []).append(order)
+
+        stops = []
+        for target_uid, table_orders in by_table.items():
+            current = TripStop(target_uid, [False] * self.trays)
+            used = 0
+            for order in table_orders:
+                needed = min(trays_needed(order), self.trays)
+                if used + needed > self.trays:
+                    stops.append(current)
+                    current = TripStop(target_uid, [False] * self.trays)
+                    used = 0
+                current.orders.append(order)
+                used += needed
+                current.payload = [k < used for k in range(self.trays)]
+            stops.append(current)
+        return stops
+
+    def _assign_trays(self, stops: List[TripStop]):
+        """Give each stop of a trip its own consecutive trays, first stop on the first trays."""
+        offset = 0
+        for stop in stops:
+            count = stop.trays
+            stop.payload = [offset <= k < offset + count for k in range(self.trays)]
+            offset += count
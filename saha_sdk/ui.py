@@ -1,6 +1,8 @@
 from .client import Robot
+from .tracing import traced
 from .models import SpeechModel, ResponseModel
 
+@traced
 def speak_text(client: Robot, speech_model: SpeechModel) -> ResponseModel:
     """
     Send a text to speech command to the robot.
@@ -15,6 +17,7 @@ def speak_text(client: Robot, speech_model: SpeechModel) -> ResponseModel:
     response = client.post("/api/v1/ui/speech", data=speech_model.dict())
     return ResponseModel(**response)
 
+@traced
 def change_pixel_screen_video(client: Robot, url: str) -> ResponseModel:
     """
     Change the pixel screen video of the robot.
@@ -0,0 +1,249 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .codecs import Codec, get_codec
+from .fleet import RobotFleet
+from .models import RobotHardwareStatus, RobotStatus
+
+# Endpoint name -> (path, model)
+ENDPOINTS: Dict[str, Tuple[str, Type[BaseModel]]] = {
+    "status": ("/api/v1/status", RobotStatus),
+    "hardware": ("/api/v1/status/hardware", RobotHardwareStatus),
+}
+
+_MISSING = object()
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A field of a watched endpoint that changed between two polls."""
+    robot: str
+    endpoint: str
+    field: str
+    old: Any
+    new: Any
+    timestamp: float
+
+
+Subscriber = Callable[[ChangeEvent], None]
+
+
+def flatten(value: Any, prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten a decoded JSON payload into dotted field paths.
+
+    List items that have a "name" are keyed by it (e.g. ``lidars[main_lidar].is_working``)
+    so reordered sensor lists do not show up as changes.
+
+    Args:
+        value (Any): Decoded JSON value.
+        prefix (str): Path of value within the payload.
+
+    Returns:
+        Dict[str, Any]: Leaf values keyed by field path
+    """
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            result.update(flatten(item, f"{prefix}.{key}" if prefix else key))
+        return result
+    if isinstance(value, list):
+        result = {}
+        for index, item in enumerate(value):
+            key = item.get("name") if isinstance(item, dict) and item.get("name") else index
+            result.update(flatten(item, f"{prefix}[{key}]"))
+        return result
+    return {prefix: value}
+
+
+class StatusWatcher:
+    """Polls status endpoints and notifies subscribers of the fields that changed.
+
+    The last raw body of every robot and endpoint is kept; identical bodies are skipped
+    before any JSON decoding or validation. Changed bodies are decoded, compared field by
+    field with the previous payload, and events are delivered only to subscribers of the
+    affected endpoint and field.
+    """
+
+    def __init__(
+        self,
+        fleet: RobotFleet,
+        endpoints: Iterable[str] = tuple(ENDPOINTS),
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+        codec: Optional[Union[str, Codec]] = None
+    ):
+        """Initialize a new watcher.
+
+        Args:
+            fleet: Robots to watch.
+            endpoints: Endpoints to poll: "status" and/or "hardware".
+            interval: Seconds between polls when running in the background.
+            clock: Wall clock used to timestamp events.
+            codec: JSON codec for changed bodies. Defaults to the fastest one installed.
+        """
+        self.fleet = fleet
+        self.endpoints = list(endpoints)
+        unknown = [e for e in self.endpoints if e not in ENDPOINTS]
+        if unknown:
+            raise ValueError(f"Unknown endpoints: {', '.join(unknown)}")
+        self.interval = interval
+        self.clock = clock
+        self.codec = get_codec(codec)
+        self.polls = 0
+        self.skipped = 0
+        self._raw: Dict[Tuple[str, str], bytes] = {}
+        self._fields: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._models: Dict[Tuple[str, str], BaseModel] = {}
+        self._by_field: Dict[Tuple[str, str], List[Subscriber]] = {}
+        self._by_endpoint: Dict[str, List[Subscriber]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def subscribe(self, callback: Subscriber, endpoint: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """Register a callback for change events.
+
+        Args:
+            callback: Called with each matching ChangeEvent.
+            endpoint: Only events of this endpoint. Defaults to all endpoints.
+            fields: Only events of these field paths, e.g. ["battery_percent", "is_estopped"].
+                Requires endpoint.
+
+        Returns:
+            Function that removes the subscription.
+        """
+        if fields is not None and endpoint is None:
+            raise ValueError("fields requires an endpoint")
+        keys = [(endpoint, f) for f in fields] if fields is not None else None
+        with self._lock:
+            if keys is None:
+                self._by_endpoint.setdefault(endpoint, []).append(callback)
+            else:
+                for key in keys:
+                    self._by_field.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if keys is None:
+                    self._by_endpoint[endpoint].remove(callback)
+                else:
+                    for key in keys:
+                        self._by_field[key].remove(callback)
+        return unsubscribe
+
+    def latest(self, robot: str, endpoint: str) -> Optional[BaseModel]:
+        """Last payload of an endpoint as a model, e.g. RobotStatus. Validated on first access."""
+        key = (robot, endpoint)
+        model = self._models.get(key)
+        if model is None and key in self._raw:
+            model = ENDPOINTS[endpoint][1](**self.codec.loads(self._raw[key]))
+            self._models[key] = model
+        return model
+
+    def check(self, robot: str, endpoint: str, raw: bytes) -> List[ChangeEvent]:
+        """Compare a freshly fetched body with the previous one and publish the changes.
+
+        The first body of a robot and endpoint is stored without producing events.
+
+        Args:
+            robot: Name of the robot.
+            endpoint: Endpoint name.
+            raw: Undecoded response body.
+
+        Returns:
+            Change events that were published.
+        """
+        key = (robot, endpoint)
+        self.polls += 1
+        if self._raw.get(key) == raw:
+            self.skipped += 1
+            return []
+        fields = flatten(self.codec.loads(raw))
+        previous = self._fields.get(key)
+        self._raw[key] = raw
+        self._fields[key] = fields
+        self._models.pop(key, None)
+        if previous is None:
+            return []
+
+        now = self.clock()
+        events = [
+            ChangeEvent(robot, endpoint, name, previous.get(name), value, now)
+            for name, value in fields.items()
+            if previous.get(name, _MISSING) != value
+        ]
+        events.extend(
+            ChangeEvent(robot, endpoint, name, value, None, now)
+            for name, value in previous.items()
+            if name not in fields
+        )
+        self._publish(events)
+        return events
+
+    def _publish(self, events: List[ChangeEvent]):
+        if not events:
+            return
+        with self._lock:
+            wildcard = list(self._by_endpoint.get(None, ()))
+            per_endpoint = list(self._by_endpoint.get(events[0].endpoint, ()))
+            per_field = {e.field: list(self._by_field.get((e.endpoint, e.field), ())) for e in events}
+        for event in events:
+            for callback in wildcard + per_endpoint + per_field[event.field]:
+                try:
+                    callback(event)
+                except Exception:
+                    _logger.exception("Subscriber %r failed on %s %s", callback, event.endpoint, event.field)
+
+    def poll(self) -> List[ChangeEvent]:
+        """Fetch every watched endpoint of every robot concurrently and publish the changes.
+
+        Robots that cannot be reached are skipped until the next poll.
+
+        Returns:
+            Change events of this poll.
+        """
+        futures = [
+            (name, endpoint, self.fleet.submit(robot.get_raw, ENDPOINTS[endpoint][0]))
+            for name, robot in self.fleet.items()
+            for endpoint in self.endpoints
+        ]
+        events = []
+        for name, endpoint, future in futures:
+            try:
+                raw = future.result()
+            except Exception:
+                continue
+            events.extend(self.check(name, endpoint, raw))
+        return events
+
+    def start(self):
+        """Poll in a background thread every interval seconds."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="saha-status-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll()
+            except Exception:
+                _logger.exception("Status poll failed")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -13,6 +13,12 @@ setup(
     install_requires=[
         "requests>=2.0.0",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.17"],
+        "async": ["httpx>=0.23"],
+        "fast": ["orjson>=3.0"],
+        "msgspec": ["msgspec>=0.9"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
@@ -0,0 +1,38 @@
+import inspect
+import unittest
+from saha_sdk import cruise, layer, mapping, navigation, profile, status, targets, task, ui
+from benchmarks.bench_sdk import CASES, compare, run
+
+
+class TestSDKBenchmarks(unittest.TestCase):
+    """Test cases for the SDK benchmark suite."""
+
+    def test_cases_cover_sdk(self):
+        """Test every public module function has a benchmark case."""
+        functions = {
+            f"{module.__name__.rsplit('.', 1)[-1]}.{name}"
+            for module in (cruise, layer, mapping, navigation, profile, status, targets, task, ui)
+            for name, fn in vars(module).items()
+            if inspect.isfunction(fn) and fn.__module__ == module.__name__ and not name.startswith("_")
+        }
+        self.assertEqual(functions - {case.name for case in CASES}, set())
+
+    def test_run(self):
+        """Test a short run measures every applicable mode."""
+        results = run(servers=("inprocess",), sizes=(5,), pattern="*/targets.*", min_time=0.0, fleet_size=2, concurrency=2)
+
+        self.assertIn("inprocess/sync/warm/5/targets.delete_target", results)
+        self.assertIn("inprocess/async/warm/5/targets.get_all_targets", results)
+        self.assertNotIn("inprocess/async/warm/5/targets.add_target", results)
+        self.assertEqual(results["inprocess/fleet/warm/5/targets.get_target"]["calls_per_round"], 2)
+        self.assertTrue(all(r["median_us"] > 0 and r["alloc_peak_bytes"] > 0 for r in results.values()))
+
+    def test_compare(self):
+        """Test regressions above the threshold are reported, worst first."""
+        baseline = {"results": {"a": {"median_us": 100.0}, "b": {"median_us": 100.0}, "c": {"median_us": 100.0}}}
+        current = {"results": {"a": {"median_us": 105.0}, "b": {"median_us": 150.0}, "c": {"median_us": 300.0}, "d": {"median_us": 1.0}}}
+        self.assertEqual([r[0] for r in compare(baseline, current, threshold=0.1)], ["c", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
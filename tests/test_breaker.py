@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import unittest
+from saha_sdk.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import CircuitOpenError, NotFoundError, SahaRobotikAPIError, ServerError
+from saha_sdk.transport import Transport, TransportResponse
+
+
+class _FlakyTransport(Transport):
+    """Fails with a connection error while ``down`` is set."""
+    network_errors = (ConnectionError,)
+
+    def __init__(self, status: int = 200):
+        self.down = False
+        self.error = None
+        self.status = status
+        self.calls = 0
+        self.answered = threading.Event()
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        if self.down:
+            raise ConnectionError("unreachable")
+        self.answered.set()
+        return TransportResponse(self.status, b"{}")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the per-robot circuit breaker."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = _Clock()
+        self.transport = _FlakyTransport()
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=5.0, probe_interval=None, clock=self.clock)
+        self.robot = Robot("http://robot", transport=self.transport, breaker=self.breaker)
+
+    def _fail(self, times: int):
+        self.transport.down = True
+        for _ in range(times):
+            with self.assertRaises(SahaRobotikAPIError):
+                self.robot.get("/api/v1/status")
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit and further calls fail fast."""
+        self._fail(2)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self._fail(1)
+        self.assertEqual(self.breaker.state, OPEN)
+
+        calls = self.transport.calls
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.robot.get("/api/v1/status")
+        self.assertEqual(self.transport.calls, calls)
+        self.assertEqual(cm.exception.retry_after, 5.0)
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_success_resets_count(self):
+        """Test a success between failures restarts the count."""
+        self._fail(2)
+        self.transport.down = False
+        self.robot.get("/api/v1/status")
+        self._fail(2)
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_half_open_trial(self):
+        """Test a single trial request is let through after the reset timeout."""
+        self._fail(3)
+        self.clock.now = 5.0
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+
+        self._fail(1)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.opens, 2)
+
+        self.clock.now = 10.0
+        self.transport.down = False
+        self.robot.get("/api/v1/status")
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_one_trial_at_a_time(self):
+        """Test other requests fail fast while the trial is in flight."""
+        self._fail(3)
+        self.clock.now = 5.0
+        self.breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record_success()
+        self.breaker.before_request()
+
+    def test_trial_released_on_other_errors(self):
+        """Test a trial that ends without an outcome, e.g. cancelled, frees the trial slot."""
+        self._fail(3)
+        self.clock.now = 5.0
+        self.transport.down = False
+        self.transport.error = RuntimeError("transport bug")
+        with self.assertRaises(RuntimeError):
+            self.robot.get("/api/v1/status")
+
+        async def cancelled(*args, **kwargs):
+            raise asyncio.CancelledError()
+
+        self.transport.request_async = cancelled
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(self.robot.request_async("GET", "/api/v1/status"))
+
+        self.transport.error = None
+        self.robot.get("/api/v1/status")
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_failure_statuses(self):
+        """Test gateway errors count as failures but client errors do not."""
+        self.transport.status = 503
+        for _ in range(3):
+            with self.assertRaises(ServerError):
+                self.robot.get("/api/v1/status")
+        self.assertEqual(self.breaker.state, OPEN)
+
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=None)
+        robot = Robot("http://robot", transport=_FlakyTransport(status=404), breaker=breaker)
+        with self.assertRaises(NotFoundError):
+            robot.get("/api/v1/tasks/missing")
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_background_probe(self):
+        """Test a probe closes the circuit as soon as the robot answers again."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0, probe_interval=0.01)
+        transport = _FlakyTransport()
+        robot = Robot("http://robot", transport=transport, breaker=breaker)
+        transport.down = True
+        with self.assertRaises(SahaRobotikAPIError):
+            robot.get("/api/v1/status")
+        self.assertEqual(breaker.state, OPEN)
+
+        transport.down = False
+        self.assertTrue(transport.answered.wait(5.0))
+        breaker.close()
+        self.assertEqual(breaker.state, CLOSED)
+        robot.get("/api/v1/status")
+
+    def test_bound_once(self):
+        """Test a breaker cannot guard two robots."""
+        with self.assertRaises(ValueError):
+            Robot("http://other", breaker=self.breaker)
+
+
+if __name__ == '__main__':
+    unittest.main()
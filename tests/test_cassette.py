@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from saha_sdk import status
+from saha_sdk.cassette import Cassette, Interaction, ReplayTransport, UnrecordedRequestError
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import NotFoundError, SahaRobotikAPIError
+from saha_sdk.transport import Transport, WSGITransport
+
+
+def wsgi_app(environ, start_response):
+    battery = wsgi_app.battery
+    wsgi_app.battery -= 1
+    if environ["PATH_INFO"] == "/api/v1/status":
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps({"battery_percent": battery}).encode()]
+    if environ["PATH_INFO"] == "/api/v1/targets" and environ["REQUEST_METHOD"] == "POST":
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [b'{"success": true, "message": "ok"}']
+    start_response("404 Not Found", [("Content-Type", "application/json")])
+    return [b'{"error": {"message": "Not found"}}']
+
+
+class FailingTransport(Transport):
+    network_errors = (ConnectionError,)
+
+    def request(self, method, url, headers=None, **kwargs):
+        raise ConnectionError("connection refused")
+
+
+class TestCassette(unittest.TestCase):
+    """Test cases for recording and replaying traffic."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        wsgi_app.battery = 90
+        self.robot = Robot("http://robot", api_key="secret", transport=WSGITransport(wsgi_app), codec="json")
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "traffic.jsonl.gz")
+
+    def record(self):
+        with self.robot.record(self.path) as cassette:
+            status.get_robot_status(self.robot)
+            status.get_robot_status(self.robot)
+            self.robot.post("/api/v1/targets", data={"name": "t1", "site": "site"})
+            with self.assertRaises(NotFoundError):
+                self.robot.get("/api/v1/missing", params={"page": 2})
+        return cassette
+
+    def test_record(self):
+        """Test requests are recorded with timing and the transport is restored."""
+        cassette = self.record()
+
+        self.assertIsInstance(self.robot.transport, WSGITransport)
+        self.assertEqual([(i.method, i.path, i.status) for i in cassette], [
+            ("GET", "/api/v1/status", 200), ("GET", "/api/v1/status", 200),
+            ("POST", "/api/v1/targets", 200), ("GET", "/api/v1/missing?page=2", 404),
+        ])
+        self.assertEqual(cassette.interactions[2].body, b'{"name":"t1","site":"site"}')
+        offsets = [i.offset for i in cassette]
+        self.assertEqual(offsets, sorted(offsets))
+        self.assertTrue(all(i.duration >= 0 for i in cassette))
+
+    def test_save_and_load(self):
+        """Test cassettes round-trip through files without request headers."""
+        cassette = self.record()
+        cassette.interactions.append(Interaction(1.0, 0.5, "GET", "/bin", content=b"\xff\x00"))
+        cassette.save(self.path)
+
+        with open(self.path, "rb") as f:
+            self.assertNotIn(b"secret", f.read())
+        loaded = Cassette.load(self.path)
+
+        self.assertEqual(loaded.base_url, "http://robot")
+        self.assertEqual([i.content for i in loaded], [i.content for i in cassette])
+        self.assertEqual(loaded.interactions[3].path, "/api/v1/missing?page=2")
+
+    def test_replay(self):
+        """Test identical requests are answered with their responses in recorded order."""
+        self.record()
+        robot = Robot("http://other", transport=ReplayTransport(self.path, speed="asap"))
+
+        self.assertEqual(status.get_robot_status(robot).battery_percent, 90.0)
+        self.assertEqual(status.get_robot_status(robot).battery_percent, 89.0)
+        self.assertTrue(robot.post("/api/v1/targets", data={"site": "site", "name": "t1"})["success"])
+        with self.assertRaises(NotFoundError):
+            robot.get("/api/v1/missing", params={"page": 2})
+        with self.assertRaises(UnrecordedRequestError):
+            status.get_robot_status(robot)
+        self.assertEqual(robot.transport.remaining, 0)
+
+    def test_replay_repeat(self):
+        """Test repeat keeps serving the last response."""
+        transport = ReplayTransport(self.record(), speed="asap", repeat=True)
+        robot = Robot("http://robot", transport=transport)
+        values = [status.get_robot_status(robot).battery_percent for _ in range(3)]
+        self.assertEqual(values, [90.0, 89.0, 89.0])
+
+    def test_replay_speed(self):
+        """Test responses are delayed by their recorded duration divided by the speed."""
+        cassette = Cassette([Interaction(0.0, 0.2, "GET", "/api/v1/status", status=200, content=b"{}")] * 2)
+        fast = Robot("http://robot", transport=ReplayTransport(cassette, speed=10.0))
+
+        start = time.perf_counter()
+        fast.get("/api/v1/status")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02)
+        self.assertLess(time.perf_counter() - start, 0.2)
+        with self.assertRaises(ValueError):
+            ReplayTransport(cassette, speed="warp")
+
+    def test_replay_offsets(self):
+        """Test requests are paced by their recorded offsets from the start of replay."""
+        cassette = Cassette([
+            Interaction(5.0, 0.0, "GET", "/api/v1/status", status=200, content=b"{}"),
+            Interaction(6.0, 0.0, "GET", "/api/v1/status", status=200, content=b"{}"),
+            Interaction(6.5, 0.0, "GET", "/api/v1/status", status=200, content=b"{}"),
+        ])
+        robot = Robot("http://robot", transport=ReplayTransport(cassette, speed=10.0))
+
+        start = time.perf_counter()
+        robot.get("/api/v1/status")
+        self.assertLess(time.perf_counter() - start, 0.05)
+        robot.get("/api/v1/status")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+        time.sleep(0.1)
+        late = time.perf_counter()
+        robot.get("/api/v1/status")
+        self.assertLess(time.perf_counter() - late, 0.05)
+
+    def test_network_errors(self):
+        """Test network errors are recorded and raised again on replay."""
+        robot = Robot("http://robot", transport=FailingTransport())
+        with robot.record() as cassette:
+            with self.assertRaises(SahaRobotikAPIError):
+                robot.get("/api/v1/status")
+
+        replay = Robot("http://robot", transport=ReplayTransport(cassette, speed="asap"))
+        with self.assertRaisesRegex(SahaRobotikAPIError, "connection refused"):
+            replay.get("/api/v1/status")
+
+    def test_replay_async(self):
+        """Test coroutines can replay a cassette."""
+        robot = Robot("http://robot", transport=ReplayTransport(self.record(), speed="asap"))
+        result = asyncio.run(robot.request_async("GET", "/api/v1/status"))
+        self.assertEqual(result, {"battery_percent": 90})
+
+
+if __name__ == '__main__':
+    unittest.main()
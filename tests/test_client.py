@@ -18,7 +18,7 @@ class TestRobotClient(unittest.TestCase):
         """Set up test fixtures."""
         self.base_url = "https://api.example.com"
         self.api_key = "test-api-key"
-        self.client = Robot(self.base_url, self.api_key)
+        self.client = Robot(self.base_url, self.api_key, codec="json")
 
     def test_init(self):
         """Test Robot client initialization."""
@@ -122,6 +122,36 @@ class TestRobotClient(unittest.TestCase):
 
         self.assertEqual(result, {"raw": "raw text response"})
 
+    @patch('saha_sdk.client.requests.request')
+    def test_get_raw(self, mock_request):
+        """Test get_raw returns the undecoded body."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"data": "test"}'
+        mock_request.return_value = mock_response
+
+        result = self.client.get_raw("/api/v1/test")
+
+        self.assertEqual(result, b'{"data": "test"}')
+        mock_response.json.assert_not_called()
+        mock_request.assert_called_once_with(
+            "GET",
+            f"{self.base_url}/api/v1/test",
+            headers=self.client.headers,
+            params=None
+        )
+
+    @patch('saha_sdk.client.requests.request')
+    def test_get_raw_error(self, mock_request):
+        """Test get_raw raises on error responses."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.json.return_value = {"error": {"message": "Not found"}}
+        mock_request.return_value = mock_response
+
+        with self.assertRaises(NotFoundError):
+            self.client.get_raw("/api/v1/test")
+
     @patch('saha_sdk.client.requests.request')
     def test_network_error(self, mock_request):
         """Test network error handling."""
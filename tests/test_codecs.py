@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import Mock, patch
+from saha_sdk import codecs
+from saha_sdk.client import Robot
+
+
+class TestCodecs(unittest.TestCase):
+    """Test cases for JSON codecs."""
+
+    def test_roundtrip(self):
+        """Test every installed codec decodes what it encodes."""
+        value = {"name": "target", "px": 1.5, "payload": [True, False], "label": "{}", "id": 7, "none": None}
+        for name, codec in codecs.available_codecs().items():
+            with self.subTest(codec=name):
+                self.assertEqual(codec.loads(codec.dumps(value)), value)
+                with self.assertRaises(ValueError):
+                    codec.loads(b"{not json")
+
+    def test_get_codec(self):
+        """Test codecs are resolved by name, instance or automatically."""
+        self.assertIsInstance(codecs.get_codec("json"), codecs.JSONCodec)
+        codec = codecs.JSONCodec()
+        self.assertIs(codecs.get_codec(codec), codec)
+        expected = "orjson" if codecs.orjson is not None else "msgspec" if codecs.msgspec is not None else "json"
+        self.assertEqual(codecs.get_codec().name, expected)
+        with self.assertRaises(ValueError):
+            codecs.get_codec("yaml")
+
+    @unittest.skipIf(codecs.orjson is None, "orjson is not installed")
+    def test_orjson_codec_in_client(self):
+        """Test a fast codec encodes request bodies and decodes response content itself."""
+        client = Robot("https://api.example.com", "key", codec="orjson")
+        mock_response = Mock(status_code=200, content=b'{"success": true}')
+        with patch('saha_sdk.client.requests.request', return_value=mock_response) as mock_request:
+            result = client.post("/api/v1/test", data={"key": "value"})
+
+        self.assertEqual(result, {"success": True})
+        mock_response.json.assert_not_called()
+        mock_request.assert_called_once_with(
+            "POST",
+            "https://api.example.com/api/v1/test",
+            headers=client.headers,
+            data=b'{"key":"value"}'
+        )
+
+    @unittest.skipIf(codecs.orjson is None, "orjson is not installed")
+    def test_invalid_body_is_raw(self):
+        """Test bodies that are not JSON are returned as raw text with a fast codec."""
+        client = Robot("https://api.example.com", "key", codec="orjson")
+        mock_response = Mock(status_code=200, content=b"OK", text="OK")
+        with patch('saha_sdk.client.requests.request', return_value=mock_response):
+            self.assertEqual(client.get("/api/v1/test"), {"raw": "OK"})
+
+
+if __name__ == '__main__':
+    unittest.main()
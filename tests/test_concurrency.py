@@ -0,0 +1,107 @@
+import sys
+import threading
+import unittest
+from saha_sdk.client import Robot
+from saha_sdk.mock import MockApp, MockServer
+from saha_sdk.transport import PooledHTTPTransport, RequestsTransport, Transport, TransportResponse
+
+THREADS = 16
+
+
+def _hammer(target, count: int = THREADS):
+    """Run target in count threads at once with a tiny switch interval, so threads interleave as often as possible."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+
+class _RecordingTransport(Transport):
+    def __init__(self):
+        self.seen = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.seen.append(dict(headers))
+        return TransportResponse(200, b"{}")
+
+
+class TestConcurrency(unittest.TestCase):
+    """Test cases for sharing one client between many threads."""
+
+    def test_headers_are_snapshots(self):
+        """Test headers are read-only and unaffected by later key changes."""
+        client = Robot("http://robot", "key-1")
+        headers = client.headers
+
+        client.set_api_key("key-2")
+
+        self.assertEqual(headers, {"Content-Type": "application/json", "x-api-key": "key-1"})
+        self.assertEqual(client.headers["x-api-key"], "key-2")
+        self.assertEqual(client.api_key, "key-2")
+        with self.assertRaises(TypeError):
+            client.headers["x-api-key"] = "key-3"
+
+        client.api_key = None
+        self.assertEqual(client.headers, {"Content-Type": "application/json"})
+
+    def test_key_rotation(self):
+        """Test every request carries one complete key while another thread rotates keys."""
+        keys = [f"key-{i}" for i in range(50)]
+        transport = _RecordingTransport()
+        client = Robot("http://robot", keys[0], transport=transport)
+        stop = threading.Event()
+
+        def rotate():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                client.set_api_key(keys[i % len(keys)])
+
+        def send(_):
+            for _ in range(1000):
+                client.get("/api/v1/status/info")
+
+        rotator = threading.Thread(target=rotate)
+        rotator.start()
+        try:
+            _hammer(send)
+        finally:
+            stop.set()
+            rotator.join()
+
+        self.assertEqual(len(transport.seen), THREADS * 1000)
+        self.assertGreater(len({headers["x-api-key"] for headers in transport.seen}), 1)
+        for headers in transport.seen:
+            self.assertEqual(set(headers), {"Content-Type", "x-api-key"})
+            self.assertIn(headers["x-api-key"], keys)
+
+    def test_shared_transports(self):
+        """Test responses never cross between threads sharing a transport against a real server."""
+        for transport in (PooledHTTPTransport(maxsize=4), RequestsTransport(per_thread_sessions=True)):
+            with self.subTest(transport=type(transport).__name__), MockServer(MockApp(robots=4)) as server:
+                clients = [Robot(url, "key", transport=transport) for url in server.urls.values()]
+                errors = []
+
+                def send(i):
+                    client = clients[i % len(clients)]
+                    name = client.base_url.rsplit("/", 1)[-1]
+                    try:
+                        for _ in range(50):
+                            info = client.get("/api/v1/status/info")
+                            if info["robot_uid"] != name:
+                                errors.append((name, info["robot_uid"]))
+                    except Exception as e:
+                        errors.append((name, e))
+
+                _hammer(send)
+                self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.dispatch import TaskDispatcher
+from saha_sdk.models import Position, ResponseModel, RobotState, RobotStatus, TaskRequestModel, TwistModel
+
+
+def make_task(target_uid):
+    return TaskRequestModel(type="TABLE_SERVICE", activate=True, target_uid=target_uid, payload=[True, False, False, False])
+
+
+def make_state(x, y):
+    return RobotState(position=Position(x=x, y=y), twist=TwistModel())
+
+
+class TestTaskDispatcher(unittest.TestCase):
+    """Test cases for the TaskDispatcher class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.fleet = RobotFleet({
+            "r1": Robot("https://r1.example.com"),
+            "r2": Robot("https://r2.example.com"),
+        })
+        self.dispatcher = TaskDispatcher(self.fleet, clock=lambda: 100.0)
+        ready = RobotStatus(current_state="READY", battery_percent=80.0)
+        self.dispatcher.update_snapshot("r1", ready, make_state(0.0, 0.0))
+        self.dispatcher.update_snapshot("r2", ready, make_state(10.0, 0.0))
+        table_positions = {"t1": (1.0, 0.0), "t2": (9.0, 0.0), "t3": (2.0, 0.0)}
+        self.dispatcher.positions = {"r1": table_positions, "r2": table_positions}
+
+    def tearDown(self):
+        self.fleet.close()
+
+    def test_plan_assigns_nearest_robot(self):
+        """Test tasks go to the closest robot."""
+        assignments, unassigned = self.dispatcher.plan([make_task("t2"), make_task("t1")])
+
+        self.assertEqual(unassigned, [])
+        self.assertEqual({(a.robot, a.task.target_uid) for a in assignments}, {("r1", "t1"), ("r2", "t2")})
+
+    def test_plan_chains_tasks_per_robot(self):
+        """Test further tasks start from the previously assigned target."""
+        assignments, _ = self.dispatcher.plan([make_task("t1"), make_task("t3"), make_task("t2")])
+
+        r1 = [a.task.target_uid for a in assignments if a.robot == "r1"]
+        self.assertEqual(r1, ["t1", "t3"])
+        self.assertAlmostEqual(sum(a.cost for a in assignments), 1.0 + 1.0 + 1.0)
+
+    def test_plan_skips_unavailable_robots(self):
+        """Test e-stopped and low-battery robots receive no tasks."""
+        self.dispatcher.update_snapshot("r1", RobotStatus(current_state="READY", battery_percent=5.0))
+        self.dispatcher.update_snapshot("r2", RobotStatus(current_state="READY", is_estopped=True, battery_percent=90.0))
+
+        assignments, unassigned = self.dispatcher.plan([make_task("t1")])
+
+        self.assertEqual(assignments, [])
+        self.assertEqual(len(unassigned), 1)
+
+    def test_plan_unknown_target(self):
+        """Test tasks for unknown targets are left unassigned."""
+        assignments, unassigned = self.dispatcher.plan([make_task("missing")])
+
+        self.assertEqual(assignments, [])
+        self.assertEqual(unassigned[0].target_uid, "missing")
+
+    def test_greedy_method(self):
+        """Test greedy assignment method."""
+        self.dispatcher.method = "greedy"
+        assignments, _ = self.dispatcher.plan([make_task("t2"), make_task("t1")])
+        self.assertEqual({(a.robot, a.task.target_uid) for a in assignments}, {("r1", "t1"), ("r2", "t2")})
+
+    def test_invalid_method(self):
+        """Test unknown assignment methods are rejected."""
+        with self.assertRaises(ValueError):
+            TaskDispatcher(self.fleet, method="random")
+
+    @patch('saha_sdk.task.create_task')
+    def test_dispatch_issues_tasks(self, mock_create):
+        """Test dispatch creates each assigned task on its robot."""
+        mock_create.return_value = ResponseModel(success=True)
+        self.dispatcher.submit_many([make_task("t1"), make_task("t2"), make_task("missing")])
+
+        assignments = self.dispatcher.dispatch()
+
+        self.assertEqual(mock_create.call_count, 2)
+        called = {(robot.base_url, req.target_uid) for (robot, req), _ in mock_create.call_args_list}
+        self.assertEqual(called, {("https://r1.example.com", "t1"), ("https://r2.example.com", "t2")})
+        self.assertTrue(all(a.response.success for a in assignments))
+        self.assertEqual(self.dispatcher.pending, 1)
+
+    @patch('saha_sdk.task.create_task')
+    def test_unroutable_tasks_fail(self, mock_create):
+        """Test tasks no robot knows the target of are moved to failed after max_attempts."""
+        mock_create.return_value = ResponseModel(success=True)
+        self.dispatcher.submit_many([make_task("missing"), make_task("t1")])
+
+        with patch.object(self.dispatcher, "refresh_targets") as mock_refresh:
+            self.dispatcher.dispatch()
+            self.dispatcher.dispatch()
+            self.assertEqual(self.dispatcher.pending, 1)
+            self.dispatcher.dispatch()
+
+        self.assertEqual(self.dispatcher.pending, 0)
+        self.assertEqual([(f.task.target_uid, f.attempts) for f in self.dispatcher.failed], [("missing", 3)])
+        self.assertEqual(mock_refresh.call_count, 2)
+        self.assertEqual(mock_create.call_count, 1)
+
+    @patch('saha_sdk.task.create_task')
+    def test_failed_creation_requeued(self, mock_create):
+        """Test tasks whose creation fails are queued again, then moved to failed."""
+        error = ConnectionError("unreachable")
+        mock_create.side_effect = [error, ResponseModel(success=True)]
+        self.dispatcher.submit(make_task("t1"))
+
+        self.assertIs(self.dispatcher.dispatch()[0].error, error)
+        self.assertEqual(self.dispatcher.pending, 1)
+        self.assertIs(self.dispatcher.snapshots["r1"].error, error)
+
+        self.dispatcher.snapshots["r1"].error = None
+        self.assertTrue(self.dispatcher.dispatch()[0].response.success)
+        self.assertEqual(self.dispatcher.pending, 0)
+
+        mock_create.side_effect = error
+        self.dispatcher.max_attempts = 1
+        self.dispatcher.snapshots["r1"].error = None
+        self.dispatcher.submit(make_task("t1"))
+        self.dispatcher.dispatch()
+        self.assertEqual((self.dispatcher.pending, self.dispatcher.failed[0].error), (0, error))
+
+    @patch('saha_sdk.task.create_task')
+    def test_same_request_twice(self, mock_create):
+        """Test a request submitted twice is retried and failed as two tasks."""
+        error = ConnectionError("unreachable")
+        mock_create.side_effect = error
+        self.dispatcher.max_attempts = 2
+        request = make_task("t1")
+        self.dispatcher.submit_many([request, request])
+
+        self.assertEqual(len(self.dispatcher.dispatch()), 2)
+        self.assertEqual(self.dispatcher.pending, 2)
+        for snapshot in self.dispatcher.snapshots.values():
+            snapshot.error = None
+        self.dispatcher.dispatch()
+        self.assertEqual(self.dispatcher.pending, 0)
+        self.assertEqual([f.attempts for f in self.dispatcher.failed], [2, 2])
+
+    @patch('saha_sdk.task.create_task')
+    def test_queued_load(self, mock_create):
+        """Test later batches start from the end of the tasks already issued to a robot."""
+        mock_create.return_value = ResponseModel(success=True)
+        for positions in self.dispatcher.positions.values():
+            positions.update({"a": (4.9, 0.0), "b": (0.0, 3.0)})
+
+        self.dispatcher.submit(make_task("a"))
+        self.assertEqual(self.dispatcher.dispatch()[0].robot, "r1")
+        r1 = self.dispatcher.snapshots["r1"]
+        self.assertEqual((r1.queued, r1.end_position, r1.queued_cost), (1, (4.9, 0.0), 4.9))
+
+        # Idle at (0, 0), r1 would be nearest to b; busy until reaching a, r2 is.
+        self.dispatcher.submit(make_task("b"))
+        self.assertEqual(self.dispatcher.dispatch()[0].robot, "r2")
+
+    def test_refresh_stale_targets(self):
+        """Test target coordinates are refreshed once they are older than targets_max_age."""
+        now = [100.0]
+        dispatcher = TaskDispatcher(self.fleet, clock=lambda: now[0], targets_max_age=60.0)
+        dispatcher.positions = self.dispatcher.positions
+        dispatcher.targets_updated = {"r1": 100.0, "r2": 30.0}
+        dispatcher.snapshots = self.dispatcher.snapshots
+        dispatcher.submit(make_task("missing"))
+
+        with patch.object(dispatcher, "refresh_targets") as mock_refresh, patch.object(dispatcher, "refresh"):
+            dispatcher.dispatch()
+        mock_refresh.assert_called_once_with(["r2"])
+
+    @patch('saha_sdk.task.get_all_tasks')
+    @patch('saha_sdk.navigation.get_current_position')
+    @patch('saha_sdk.status.get_robot_status')
+    def test_refresh(self, mock_status, mock_position, mock_tasks):
+        """Test refresh updates snapshots of every robot."""
+        mock_status.return_value = RobotStatus(current_state="BUSY", battery_percent=50.0)
+        mock_position.return_value = make_state(3.0, 4.0)
+        mock_tasks.return_value = []
+
+        snapshots = self.dispatcher.refresh()
+
+        self.assertEqual(snapshots["r1"].current_state, "BUSY")
+        self.assertEqual(snapshots["r2"].position, (3.0, 4.0))
+        self.assertFalse(self.dispatcher.is_available(snapshots["r1"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
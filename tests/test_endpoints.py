@@ -0,0 +1,36 @@
+import unittest
+from saha_sdk import endpoints
+
+
+class TestEndpoints(unittest.TestCase):
+    """Test cases for endpoint path templates."""
+
+    def test_match(self):
+        """Test paths resolve to their templates and parameters."""
+        self.assertEqual(
+            endpoints.match("/api/v1/targets/site1/floor1/t1"),
+            ("/api/v1/targets/{site}/{floor}/{name}", {"site": "site1", "floor": "floor1", "name": "t1"})
+        )
+        self.assertEqual(endpoints.template_for("/api/v1/status"), "/api/v1/status")
+
+    def test_literal_segments_win(self):
+        """Test literal segments take precedence over parameters."""
+        self.assertEqual(endpoints.template_for("/api/v1/tasks/clear"), "/api/v1/tasks/clear")
+        self.assertEqual(endpoints.template_for("/api/v1/tasks/42"), "/api/v1/tasks/{task_uid}")
+        self.assertEqual(endpoints.template_for("/api/v1/cruises/control"), "/api/v1/cruises/control")
+        self.assertEqual(endpoints.template_for("/api/v1/mapping/default-map"), "/api/v1/mapping/default-map")
+        self.assertEqual(endpoints.template_for("/api/v1/mapping/site1/floor1"), "/api/v1/mapping/{site}/{floor}")
+
+    def test_query_string_and_unknown_paths(self):
+        """Test query strings are ignored and unknown paths are grouped together."""
+        self.assertEqual(endpoints.template_for("/api/v1/ui/screen/pixel?url=x"), "/api/v1/ui/screen/pixel")
+        self.assertEqual(endpoints.template_for("/api/v2/unknown"), endpoints.UNMATCHED)
+
+    def test_match_returns_copy(self):
+        """Test modifying returned parameters does not affect the cache."""
+        endpoints.match("/api/v1/tasks/7")[1]["task_uid"] = "changed"
+        self.assertEqual(endpoints.match("/api/v1/tasks/7")[1], {"task_uid": "7"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.exceptions import SahaRobotikAPIError
+
+
+class TestRobotFleet(unittest.TestCase):
+    """Test cases for the RobotFleet class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.fleet = RobotFleet({
+            "r1": Robot("https://r1.example.com"),
+            "r2": Robot("https://r2.example.com"),
+        }, max_workers=4)
+
+    def tearDown(self):
+        self.fleet.close()
+
+    def test_container(self):
+        """Test fleet membership helpers."""
+        self.assertEqual(len(self.fleet), 2)
+        self.assertIn("r1", self.fleet)
+        self.assertEqual(list(self.fleet), ["r1", "r2"])
+        self.fleet.add("r3", Robot("https://r3.example.com"))
+        self.assertEqual(self.fleet["r3"].base_url, "https://r3.example.com")
+        self.fleet.remove("r3")
+        self.assertNotIn("r3", self.fleet)
+
+    def test_map(self):
+        """Test map calls the function once per robot."""
+        results = self.fleet.map(lambda robot, suffix: robot.base_url + suffix, "/x")
+        self.assertEqual(results, {"r1": "https://r1.example.com/x", "r2": "https://r2.example.com/x"})
+
+    def test_map_selected_names(self):
+        """Test map restricted to a subset of robots."""
+        results = self.fleet.map(lambda robot: robot.base_url, names=["r2"])
+        self.assertEqual(results, {"r2": "https://r2.example.com"})
+
+    @patch.object(Robot, 'get')
+    def test_map_returns_exceptions(self, mock_get):
+        """Test failures are returned in place of results by default."""
+        error = SahaRobotikAPIError("Network Error")
+        mock_get.side_effect = [{"ok": True}, error]
+
+        results = self.fleet.map(lambda robot: robot.get("/api/v1/status"))
+
+        self.assertEqual(sorted(map(type, results.values()), key=str),
+                         sorted([dict, SahaRobotikAPIError], key=str))
+
+    def test_map_raises(self):
+        """Test failures are raised when return_exceptions is False."""
+        def fail(robot):
+            raise SahaRobotikAPIError("boom")
+
+        with self.assertRaises(SahaRobotikAPIError):
+            self.fleet.map(fail, return_exceptions=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
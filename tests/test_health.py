@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import Mock, patch
+from saha_sdk import health
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.models import CameraStatus, InternetStatus, LidarStatus, RobotHardwareStatus
+
+
+def make_hardware(lidar_ok=True, camera_ok=True, wifi=True, mobile=False, lidar_error="", internet_error=""):
+    return RobotHardwareStatus(
+        lidars=[
+            LidarStatus(name="main_lidar", is_working=lidar_ok, error=lidar_error),
+            LidarStatus(name="rear_lidar", is_working=True),
+        ],
+        cameras=[CameraStatus(name="front_camera", is_working=camera_ok, error="" if camera_ok else "Timeout")],
+        internet_status=InternetStatus(wifi_connected=wifi, mobile_connected=mobile, error=internet_error)
+    )
+
+
+@unittest.skipIf(health.np is None, "numpy is not installed")
+class TestHardwareHealthAggregator(unittest.TestCase):
+    """Test cases for fleet hardware health aggregation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.aggregator = health.HardwareHealthAggregator()
+        self.statuses = {
+            "r1": make_hardware(lidar_ok=False, lidar_error="No data"),
+            "r2": make_hardware(camera_ok=False, wifi=False, mobile=True),
+            "r3": make_hardware(mobile=True, lidar_error="No error"),
+            "r4": make_hardware(lidar_ok=False, wifi=False, lidar_error="No data", internet_error="DNS failure"),
+        }
+        self.sites = {"r1": "hotel", "r2": "hotel", "r3": "hotel", "r4": "office"}
+
+    def test_group_by_site(self):
+        """Test failing sensors and connectivity are counted per site."""
+        self.assertEqual(self.aggregator.update(self.statuses, self.sites), 4)
+
+        self.assertEqual(self.aggregator.failing_sensors(), {
+            "hotel": {"lidar": 1, "camera": 1},
+            "office": {"lidar": 1, "camera": 0},
+        })
+        self.assertEqual(self.aggregator.connectivity(), {
+            "hotel": {"offline": 0, "wifi": 1, "mobile": 1, "both": 1},
+            "office": {"offline": 1, "wifi": 0, "mobile": 0, "both": 0},
+        })
+        self.assertEqual(self.aggregator.top_errors(), [("No data", 2), ("Timeout", 1), ("DNS failure", 1)])
+
+    def test_incremental_update_matches_rebuild(self):
+        """Test updating a few robots gives the same counts as aggregating from scratch."""
+        self.aggregator.update(self.statuses, self.sites)
+
+        self.assertEqual(self.aggregator.update({"r1": make_hardware(), "r2": self.statuses["r2"]}), 1)
+
+        statuses = dict(self.statuses, r1=make_hardware())
+        fresh = health.HardwareHealthAggregator()
+        fresh.update(statuses, self.sites)
+        summary, expected = self.aggregator.summary(), fresh.summary()
+        self.assertEqual(summary.failing, expected.failing)
+        self.assertEqual(summary.sensors, expected.sensors)
+        self.assertEqual(summary.connectivity, expected.connectivity)
+        self.assertEqual(dict(summary.top_errors), dict(expected.top_errors))
+        self.assertEqual(self.aggregator.failing_sensors()["hotel"], {"lidar": 0, "camera": 1})
+
+    def test_remove(self):
+        """Test a removed robot no longer counts."""
+        self.aggregator.update(self.statuses, self.sites)
+
+        self.aggregator.remove("r4")
+
+        summary = self.aggregator.summary()
+        self.assertEqual(summary.robots, 3)
+        self.assertNotIn("office", summary.connectivity)
+        self.assertEqual(summary.top_errors, [("No data", 1), ("Timeout", 1)])
+
+    @patch('saha_sdk.client.requests.request')
+    def test_collect(self, mock_request):
+        """Test hardware status and site are fetched for every robot."""
+        def respond(method, url, **kwargs):
+            response = Mock(status_code=200)
+            if url.endswith("/status/hardware"):
+                response.json.return_value = make_hardware(lidar_ok=False).model_dump()
+            else:
+                response.json.return_value = {"robot_uid": "r", "project_id": "p", "site_floor": {"site": "lab", "floor": "1"}}
+            return response
+        mock_request.side_effect = respond
+        fleet = RobotFleet({"a": Robot("http://a", "key", codec="json"), "b": Robot("http://b", "key", codec="json")})
+        aggregator = health.HardwareHealthAggregator(fleet)
+
+        self.assertEqual(aggregator.collect(), 2)
+        self.assertEqual(aggregator.failing_sensors(), {"lab": {"lidar": 2, "camera": 0}})
+        self.assertEqual(aggregator.collect(), 0)
+        self.assertEqual(mock_request.call_count, 6)
+        fleet.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.history import VANISHED_MESSAGE, TaskHistory
+
+
+def make_item(task_id, target="t1", completed=False, create_time=1000.0, message="Task started"):
+    return {
+        "id": task_id,
+        "uid": task_id,
+        "site": "site1",
+        "floor": "floor1",
+        "task_type": "TABLE_SERVICE",
+        "task_index": 0,
+        "success": True,
+        "completed": completed,
+        "message": message,
+        "target": {
+            "name": target,
+            "uid": target,
+            "site_floor": {"site": "site1", "floor": "floor1"},
+            "eg": "",
+            "eg_dir": ""
+        },
+        "create_time": create_time,
+        "celebrating_name": "",
+        "payload": [True, False, False, False]
+    }
+
+
+class TestTaskHistory(unittest.TestCase):
+    """Test cases for the TaskHistory class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.now = 1000.0
+        self.history = TaskHistory(clock=lambda: self.now)
+        self.client = Robot("https://api.example.com", "test-api-key")
+
+    def tearDown(self):
+        self.history.close()
+
+    @patch.object(Robot, 'get')
+    def test_sync_new_tasks(self, mock_get):
+        """Test sync stores new tasks and advances the watermark."""
+        mock_get.return_value = [make_item(1), make_item(2)]
+
+        result = self.history.sync(self.client)
+
+        mock_get.assert_called_once_with("/api/v1/tasks")
+        self.assertEqual((result.new, result.changed, result.watermark), (2, 0, (1000.0, 2)))
+        self.assertEqual([t["id"] for t in self.history.tasks()], [1, 2])
+
+    def test_unchanged_tasks_are_skipped(self):
+        """Test finished tasks below the watermark are not validated again."""
+        self.history.ingest([make_item(1, completed=True)])
+
+        with patch('saha_sdk.history.TaskModel') as mock_model:
+            result = self.history.ingest([make_item(1, completed=True)])
+
+        mock_model.assert_not_called()
+        self.assertEqual((result.new, result.changed), (0, 0))
+
+    def test_state_changes_are_appended(self):
+        """Test completion of an open task is recorded as a new event."""
+        self.history.ingest([make_item(1)])
+        self.assertEqual(self.history.ingest([make_item(1)]).changed, 0)
+
+        self.now = 1030.0
+        result = self.history.ingest([make_item(1, completed=True, message="Done")])
+
+        self.assertEqual(result.changed, 1)
+        task = self.history.tasks()[0]
+        self.assertTrue(task["completed"])
+        self.assertEqual(task["message"], "Done")
+        self.assertEqual(task["updated_at"], 1030.0)
+
+    def test_completion_latency(self):
+        """Test latency per target from creation to completion."""
+        self.history.ingest([make_item(1, "t1"), make_item(2, "t2", create_time=1010.0)])
+        self.now = 1060.0
+        self.history.ingest([make_item(1, "t1", completed=True), make_item(2, "t2", completed=True, create_time=1010.0)])
+
+        stats = self.history.completion_latency()
+
+        self.assertEqual(stats["t1"].count, 1)
+        self.assertAlmostEqual(stats["t1"].mean, 60.0)
+        self.assertAlmostEqual(stats["t2"].max, 50.0)
+
+    def test_throughput(self):
+        """Test completions are counted per bucket."""
+        self.now = 3599.0
+        self.history.ingest([make_item(1, completed=True), make_item(2, completed=True)])
+        self.now = 3600.0
+        self.history.ingest([make_item(3, completed=True)])
+
+        self.assertEqual(self.history.throughput(bucket=3600.0), [(0.0, 2), (3600.0, 1)])
+
+    def test_robots_are_independent(self):
+        """Test watermarks are tracked per robot."""
+        self.history.ingest([make_item(5)], robot="r1")
+        result = self.history.ingest([make_item(1)], robot="r2")
+
+        self.assertEqual(result.new, 1)
+        self.assertEqual(self.history.watermark("r1"), (1000.0, 5))
+        self.assertEqual(len(self.history.tasks(robot="r2")), 1)
+
+    def test_reused_ids(self):
+        """Test a task reusing the id of an older task is stored as a new task."""
+        self.history.ingest([make_item(1, completed=True), make_item(2, completed=True)])
+        result = self.history.ingest([make_item(1, "t2", create_time=2000.0)])
+
+        self.assertEqual(result.new, 1)
+        self.assertEqual(result.watermark, (2000.0, 1))
+        self.assertEqual([(t["id"], t["target_uid"]) for t in self.history.tasks()], [(1, "t1"), (2, "t1"), (1, "t2")])
+
+    def test_vanished_tasks_are_closed(self):
+        """Test open tasks the robot no longer lists are closed without counting as completed."""
+        self.history.ingest([make_item(1), make_item(2)])
+        self.now = 1030.0
+        result = self.history.ingest([make_item(2)])
+
+        self.assertEqual((result.new, result.changed, result.closed), (0, 0, 1))
+        first = self.history.tasks()[0]
+        self.assertEqual((first["completed"], first["success"], first["message"]), (True, False, VANISHED_MESSAGE))
+        self.assertEqual(self.history.completion_latency(), {})
+        self.assertEqual(self.history.ingest([make_item(2)]).closed, 0)
+
+    def test_state_survives_reopen(self):
+        """Test the watermark and open tasks are restored from disk."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tasks.db")
+            with TaskHistory(path, clock=lambda: 1000.0) as history:
+                history.ingest([make_item(1), make_item(2, completed=True)])
+            with TaskHistory(path, clock=lambda: 1020.0) as history:
+                self.assertEqual(history.watermark(), (1000.0, 2))
+                result = history.ingest([make_item(1, completed=True), make_item(2, completed=True)])
+                self.assertEqual((result.new, result.changed), (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import saha_sdk
+from benchmarks.bench_import import FORBIDDEN, probe
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for lazy loading of the package."""
+
+    def test_forbidden_modules(self):
+        """Test importing the package does not load heavy dependencies it does not need yet."""
+        for statement, forbidden in FORBIDDEN.items():
+            with self.subTest(statement=statement):
+                modules = set(probe(statement)["modules"])
+                self.assertEqual([name for name in forbidden if name in modules], [])
+
+    def test_public_api(self):
+        """Test submodules and classes are available as attributes."""
+        from saha_sdk.client import Robot
+        from saha_sdk import status
+        self.assertIs(saha_sdk.Robot, Robot)
+        self.assertIs(saha_sdk.status, status)
+        self.assertIs(saha_sdk.models.RobotStatus, status.RobotStatus)
+        self.assertIn("navigation", dir(saha_sdk))
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            saha_sdk.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()
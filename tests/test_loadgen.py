@@ -0,0 +1,60 @@
+import unittest
+from saha_sdk.mock import FaultInjector, FaultRule, Latency
+from saha_sdk.mock.loadgen import LoadGenerator, StepResult, TrafficMix, capacity
+
+
+class TestLoadGenerator(unittest.TestCase):
+    """Test cases for the fleet load generator."""
+
+    def test_in_process(self):
+        """Test every stream of a mix is driven and measured."""
+        mix = TrafficMix(status_hz=10.0, position_hz=20.0, tasks_per_minute=600.0, teleop_hz=20.0, teleop_fraction=0.5)
+        result = LoadGenerator(mix, workers=8, in_process=True).run_step(robots=4, duration=0.5)
+
+        self.assertEqual(result.errors, 0)
+        self.assertLess(result.drop_rate, 0.1)
+        self.assertGreater(result.requests, 40)
+        self.assertEqual(set(result.latency), {"status", "position", "task", "teleop"})
+        self.assertLessEqual(result.latency["status"]["p50"], result.latency["status"]["p99"])
+        self.assertGreater(result.cpu_percent, 0)
+
+    def test_dropped_frames(self):
+        """Test frames are dropped when responses are slower than the stream."""
+        faults = FaultInjector([FaultRule(endpoint="/api/v1/navigation/position/stream", latency=Latency(value=0.25))])
+        mix = TrafficMix(status_hz=0.0, position_hz=20.0, tasks_per_minute=0.0)
+        generator = LoadGenerator(mix, workers=8, faults=faults, in_process=True)
+
+        results = generator.ramp([2, 4], duration=0.5, max_drop=0.1)
+
+        self.assertEqual(len(results), 1)
+        self.assertGreater(results[0].drop_rate, 0.5)
+        self.assertEqual(capacity(results, 0.1), 0)
+
+    def test_subprocess(self):
+        """Test the mock server runs in its own process."""
+        result = LoadGenerator(TrafficMix(status_hz=10.0, position_hz=10.0), workers=4).run_step(robots=2, duration=0.3)
+        self.assertEqual(result.errors, 0)
+        self.assertGreater(result.requests, 5)
+
+    def test_capacity(self):
+        """Test capacity is the largest fleet within the drop budget."""
+        results = [StepResult(10, 1.0, scheduled=100), StepResult(50, 1.0, scheduled=100, dropped=1), StepResult(100, 1.0, scheduled=100, dropped=20)]
+        self.assertEqual(capacity(results, 0.01), 50)
+        self.assertEqual(capacity(results, 0.0), 10)
+
+    def test_error_budget(self):
+        """Test injected errors only limit capacity beyond the error budget."""
+        results = [StepResult(10, 1.0, scheduled=100, requests=100, errors=2), StepResult(50, 1.0, scheduled=100, requests=100, errors=10)]
+        self.assertEqual(capacity(results, 0.01), 0)
+        self.assertEqual(capacity(results, 0.01, max_errors=0.05), 10)
+
+        faults = FaultInjector([FaultRule(endpoint="/api/v1/status", error_rate=0.2)], seed=1)
+        generator = LoadGenerator(TrafficMix(status_hz=20.0, position_hz=0.0, tasks_per_minute=0.0), workers=4, faults=faults, in_process=True)
+        results = generator.ramp([2, 3], duration=0.3, max_drop=0.5, max_errors=0.9)
+        self.assertEqual(len(results), 2)
+        self.assertGreater(results[0].errors, 0)
+        self.assertEqual(capacity(results, 0.5, max_errors=0.9), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import random
+import unittest
+from unittest.mock import patch
+from saha_sdk import metrics
+from saha_sdk.client import Robot
+from saha_sdk.codecs import JSONCodec
+from saha_sdk.exceptions import NotFoundError
+from saha_sdk.transport import Transport, TransportResponse
+
+
+class RoutingTransport(Transport):
+    """Answers from a path -> (status, body) table."""
+
+    def __init__(self, routes):
+        self.routes = routes
+
+    def request(self, method, url, headers=None, **kwargs):
+        status, body = self.routes[url.split("://", 1)[1].split("/", 1)[1]]
+        return TransportResponse(status, body)
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for the latency histogram."""
+
+    def test_percentiles(self):
+        """Test percentiles stay within the bucket precision."""
+        rng = random.Random(1)
+        values = sorted(rng.uniform(0.0001, 2.0) for _ in range(10000))
+        histogram = metrics.Histogram()
+        for value in values:
+            histogram.record(value)
+
+        for q in (50, 90, 99):
+            exact = values[int(q / 100 * len(values)) - 1]
+            self.assertAlmostEqual(histogram.percentile(q), exact, delta=exact * 0.02)
+        self.assertEqual(histogram.count, 10000)
+        self.assertAlmostEqual(histogram.mean, sum(values) / len(values))
+
+    def test_cumulative(self):
+        """Test cumulative counts for exporter buckets."""
+        histogram = metrics.Histogram()
+        for value in (0.0005, 0.003, 0.003, 0.2):
+            histogram.record(value)
+        self.assertEqual(histogram.cumulative([0.001, 0.005, 0.1, 1.0]), [1, 3, 3, 4])
+
+    def test_merge(self):
+        """Test merged histograms combine counts and extremes."""
+        a, b = metrics.Histogram(), metrics.Histogram()
+        a.record(0.01)
+        b.record(0.5)
+        a.merge(b)
+        self.assertEqual((a.count, a.min, a.max), (2, 0.01, 0.5))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for request metrics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = metrics.MetricsRegistry()
+        routes = {
+            "api/v1/targets/s/f/a": (200, b'{"name": "a"}'),
+            "api/v1/targets/s/f/b": (200, b'{"name": "b"}'),
+            "api/v1/targets/s/f/missing": (404, b'{"error": {"message": "Not found"}}'),
+            "api/v1/tasks": (201, b"{}"),
+        }
+        self.robot = Robot("http://robot", transport=RoutingTransport(routes), name="r1", metrics=self.registry)
+
+    def test_grouped_by_template(self):
+        """Test requests are counted per template with statuses, bytes and exceptions."""
+        self.robot.get("/api/v1/targets/s/f/a")
+        self.robot.get("/api/v1/targets/s/f/b")
+        with self.assertRaises(NotFoundError):
+            self.robot.get("/api/v1/targets/s/f/missing")
+        self.robot.post("/api/v1/tasks", data={"x": 1})
+
+        snapshot = {(m.method, m.endpoint): m for m in self.registry.snapshot()}
+
+        targets = snapshot[("GET", "/api/v1/targets/{site}/{floor}/{name}")]
+        self.assertEqual((targets.robot, targets.requests, targets.errors), ("r1", 3, 1))
+        self.assertEqual(targets.statuses, {200: 2, 404: 1})
+        self.assertEqual(targets.exceptions, {"NotFoundError": 1})
+        self.assertEqual(targets.bytes_in, 26 + 35)
+        self.assertEqual(targets.latency.count, 3)
+        tasks = snapshot[("POST", "/api/v1/tasks")]
+        self.assertEqual(tasks.bytes_out, len(self.robot.codec.dumps({"x": 1})))
+
+    def test_body_encoded_once(self):
+        """Test json= bodies are encoded once and measured on the bytes sent."""
+        robot = Robot("http://robot", transport=self.robot.transport, name="r1", metrics=self.registry, codec="json")
+        with patch.object(JSONCodec, "dumps", autospec=True, side_effect=lambda codec, obj: json.dumps(obj).encode()) as dumps:
+            robot.post("/api/v1/tasks", data={"x": 1})
+            asyncio.run(robot.request_async("POST", "/api/v1/tasks", data={"x": 1}))
+
+        self.assertEqual(dumps.call_count, 2)
+        self.assertEqual(self.registry.snapshot()[0].bytes_out, 2 * len(b'{"x": 1}'))
+
+    def test_disabled(self):
+        """Test nothing is recorded while the registry is disabled."""
+        self.registry.disable()
+        self.robot.get("/api/v1/targets/s/f/a")
+        self.assertEqual(self.registry.snapshot(), [])
+
+    def test_get_raw(self):
+        """Test raw requests are recorded as well."""
+        self.assertEqual(self.robot.get_raw("/api/v1/targets/s/f/a"), b'{"name": "a"}')
+        self.assertEqual(self.registry.snapshot()[0].requests, 1)
+
+    def test_prometheus(self):
+        """Test the Prometheus exposition."""
+        self.robot.get("/api/v1/targets/s/f/a")
+        with self.assertRaises(NotFoundError):
+            self.robot.get("/api/v1/targets/s/f/missing")
+
+        text = self.registry.to_prometheus()
+
+        labels = 'robot="r1",method="GET",endpoint="/api/v1/targets/{site}/{floor}/{name}"'
+        self.assertIn(f'saha_sdk_requests_total{{{labels},status="200"}} 1', text)
+        self.assertIn(f'saha_sdk_exceptions_total{{{labels},exception="NotFoundError"}} 1', text)
+        self.assertIn(f'saha_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"saha_sdk_request_duration_seconds_count{{{labels}}} 2", text)
+        self.assertIn("# TYPE saha_sdk_request_duration_seconds histogram", text)
+
+    def test_default_registry_disabled(self):
+        """Test clients use the shared registry, which starts disabled."""
+        self.assertIs(Robot("http://x").metrics, metrics.REGISTRY)
+        self.assertFalse(metrics.REGISTRY.enabled)
+
+
+if __name__ == '__main__':
+    unittest.main()
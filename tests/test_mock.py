@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from saha_sdk import cruise, endpoints, layer, mapping, navigation, profile, status, targets, task, ui
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import BadRequestError, NotFoundError, SahaRobotikAPIError
+from saha_sdk.mock import MockApp, MockRobot, MockServer
+from saha_sdk.mock.robot import ROUTES
+from saha_sdk.models import (
+    CruiseControlRequestModel, CruiseRequestModel, MappingModel, Position, RobotModeModel, RobotProfileModel,
+    RobotStopModel, SiteFloorModel, SpeechModel, TargetRequestModel, TaskRequestModel, TwistModel
+)
+from saha_sdk.transport import ASGITransport, PooledHTTPTransport
+
+
+def target_request(name, px=0.0, py=0.0):
+    return TargetRequestModel(name=name, site="site", floor="0", eg="", eg_dir="", px=px, py=py)
+
+
+class TestMockApp(unittest.TestCase):
+    """Test cases for the mock robot API, in-process."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = MockApp(robots=2, targets=3)
+        self.transport = ASGITransport(self.app)
+        self.robot = Robot("http://mock", transport=self.transport)
+        self.addCleanup(self.transport.close)
+
+    def test_routes_cover_sdk(self):
+        """Test every endpoint used by the SDK has a handler."""
+        routed = {template for _, template in ROUTES}
+        self.assertEqual(set(endpoints.TEMPLATES) - routed, set())
+
+    def test_status(self):
+        """Test status endpoints."""
+        self.assertEqual(status.get_robot_status(self.robot).current_state, "READY")
+        self.assertTrue(status.get_hardware_status(self.robot).lidars[0].is_working)
+        self.assertEqual(status.get_robot_info(self.robot).robot_uid, "robot-1")
+
+    def test_targets_and_navigation(self):
+        """Test targets can be managed and navigated to."""
+        self.assertEqual(len(targets.get_all_targets(self.robot)), 3)
+        targets.add_target(self.robot, target_request("dock", 4.0, 2.0))
+        targets.update_target(self.robot, "site", "0", "dock", target_request("dock", 6.0, 2.0))
+        self.assertEqual(targets.get_target(self.robot, "site", "0", "dock").px, 6.0)
+        self.assertEqual(len(targets.get_targets_by_site_and_floor(self.robot, "site", "0")), 4)
+
+        navigation.set_goal_target(self.robot, "site_0_dock")
+
+        self.assertEqual(navigation.get_current_position(self.robot).position.x, 6.0)
+        self.assertEqual(len(navigation.get_navigation_path(self.robot).points), 2)
+        targets.delete_target(self.robot, "site", "0", "dock")
+        with self.assertRaises(NotFoundError):
+            navigation.set_goal_target(self.robot, "site_0_dock")
+
+    def test_emergency_stop(self):
+        """Test the emergency stop blocks motion until released."""
+        navigation.set_emergency_stop(self.robot, RobotStopModel(stop=True))
+        self.assertTrue(navigation.get_emergency_stop_status(self.robot).stop)
+        with self.assertRaises(BadRequestError):
+            navigation.send_velocity(self.robot, TwistModel(vel_x=0.5))
+        navigation.set_emergency_stop(self.robot, RobotStopModel(stop=False))
+        navigation.set_goal_pose(self.robot, Position(x=1.0, y=2.0))
+        self.assertEqual(navigation.get_position_stream(self.robot).position.y, 2.0)
+
+    def test_tasks(self):
+        """Test the task lifecycle."""
+        uid = targets.get_all_targets(self.robot)[0].uid
+        request = TaskRequestModel(type="TABLE_SERVICE", activate=True, target_uid=uid, payload=[False] * 4)
+        task.create_task(self.robot, request)
+        task_uid = str(task.get_all_tasks(self.robot)[0].uid)
+
+        task.update_task(self.robot, task_uid, request.model_copy(update={"type": "DISH"}))
+
+        self.assertEqual(task.get_task(self.robot, task_uid).task_type, "DISH")
+        task.pause_mission(self.robot)
+        self.assertTrue(self.app["robot-1"].paused)
+        task.delete_task(self.robot, task_uid)
+        with self.assertRaises(NotFoundError):
+            task.get_task(self.robot, task_uid)
+
+    def test_cruises(self):
+        """Test cruises resolve their waypoints."""
+        uids = [t.uid for t in targets.get_all_targets(self.robot)]
+        cruise.add_cruise(self.robot, CruiseRequestModel(name="round", waypoints=uids, site="site", floor="0"))
+
+        self.assertEqual(len(cruise.get_cruise(self.robot, "site", "0", "round").waypoints), 3)
+        cruise.start_cruise(self.robot, CruiseControlRequestModel(cruise_cmd="CMD_START", cruise_route="round"))
+        self.assertEqual(status.get_robot_status(self.robot).current_state, "CRUISING")
+        cruise.delete_cruise(self.robot, "site", "0", "round")
+        self.assertEqual(cruise.get_all_cruises(self.robot), [])
+
+    def test_mapping_profiles_and_ui(self):
+        """Test mapping, profile, mode and UI endpoints."""
+        mapping.start_mapping(self.robot, MappingModel(site_floor=SiteFloorModel(site="site", floor="1"), title="first"))
+        mapping.save_map(self.robot)
+        self.assertEqual(len(mapping.get_available_maps(self.robot)), 2)
+        self.assertEqual(mapping.get_current_map(self.robot).site_floor.floor, "1")
+        self.assertEqual(len(layer.get_all_layers(self.robot)), 1)
+
+        profile.change_speed_profile(self.robot, RobotProfileModel(profile="fast"))
+        profile.set_robot_mode(self.robot, RobotModeModel(mode="quiet"))
+        self.assertEqual(profile.get_robot_profiles(self.robot).current_speed_profile, "fast")
+        profile.remove_robot_mode(self.robot, RobotModeModel(mode="quiet"))
+        self.assertEqual(profile.get_robot_modes(self.robot).current_modes, [])
+
+        ui.speak_text(self.robot, SpeechModel(lang="en", text="Hello"))
+        ui.change_pixel_screen_video(self.robot, "video.mp4")
+        self.assertEqual(self.app["robot-1"].speech, [{"lang": "en", "text": "Hello"}])
+        self.assertEqual(self.app["robot-1"].screen_url, "video.mp4")
+
+    def test_errors(self):
+        """Test invalid requests get API errors."""
+        with self.assertRaises(BadRequestError):
+            self.robot.post("/api/v1/targets", data={"name": ""})
+        with self.assertRaises(NotFoundError):
+            self.robot.get("/api/v1/unknown")
+        with self.assertRaises(SahaRobotikAPIError) as context:
+            self.robot.delete("/api/v1/status")
+        self.assertEqual(context.exception.status_code, 405)
+
+    def test_robot_prefix(self):
+        """Test robots are addressed by path prefix with their own state."""
+        second = Robot("http://mock/robots/robot-2", transport=self.transport)
+        navigation.set_goal_pose(second, Position(x=9.0))
+
+        self.assertEqual(status.get_robot_info(second).robot_uid, "robot-2")
+        self.assertEqual(navigation.get_current_position(self.robot).position.x, 0.0)
+        with self.assertRaises(NotFoundError):
+            Robot("http://mock/robots/robot-9", transport=self.transport).get("/api/v1/status")
+
+
+class TestMockServer(unittest.TestCase):
+    """Test cases for serving the mock over sockets."""
+
+    def test_port_per_robot(self):
+        """Test every robot gets its own port."""
+        app = MockApp([MockRobot("a"), MockRobot("b")])
+        with MockServer(app, port_per_robot=True) as server, PooledHTTPTransport() as transport:
+            robots = {name: Robot(url, transport=transport) for name, url in server.urls.items()}
+            infos = {name: status.get_robot_info(robot).robot_uid for name, robot in robots.items()}
+            self.assertEqual(infos, {"a": "a", "b": "b"})
+        self.assertEqual(app.ports, {})
+
+    def test_shared_port(self):
+        """Test keep-alive connections serve many requests."""
+        with MockServer(MockApp(robots=2)) as server, PooledHTTPTransport(maxsize=1) as transport:
+            robot = Robot(server.urls["robot-2"], transport=transport)
+            for _ in range(50):
+                status.get_robot_status(robot)
+            self.assertEqual(status.get_robot_info(robot).robot_uid, "robot-2")
+            self.assertEqual(Robot(server.url, transport=transport).get("/health")["robots"], 2)
+
+    def test_port_in_use(self):
+        """Test start() raises instead of hanging when the port is taken."""
+        with MockServer() as server:
+            port = int(server.url.rsplit(":", 1)[1])
+            second = MockServer(port=port)
+            with self.assertRaises(OSError):
+                second.start()
+            second.stop()
+            self.assertEqual(status.get_robot_status(Robot(server.url)).battery_percent, 100.0)
+
+    def test_async_server(self):
+        """Test the server runs on an existing event loop."""
+        async def run():
+            async with MockServer() as server:
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: status.get_robot_status(Robot(server.url)).battery_percent
+                )
+
+        self.assertEqual(asyncio.run(run()), 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
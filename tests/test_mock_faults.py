@@ -0,0 +1,119 @@
+import json
+import time
+import unittest
+from saha_sdk import status
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import SahaRobotikAPIError, ServerError
+from saha_sdk.mock import FaultInjector, FaultRule, Latency, MockApp, MockServer
+from saha_sdk.transport import ASGITransport, PooledHTTPTransport
+
+
+class TestFaultInjector(unittest.TestCase):
+    """Test cases for fault decisions."""
+
+    def test_latency_distributions(self):
+        """Test latency samples follow their distribution."""
+        import random
+        rng = random.Random(1)
+        self.assertEqual(Latency("constant", value=0.1).sample(rng), 0.1)
+        self.assertTrue(all(0.1 <= Latency("uniform", low=0.1, high=0.2).sample(rng) <= 0.2 for _ in range(100)))
+        samples = sorted(Latency("lognormal", median=0.05, sigma=0.5).sample(rng) for _ in range(1001))
+        self.assertAlmostEqual(samples[500], 0.05, delta=0.01)
+        with self.assertRaises(ValueError):
+            Latency("pareto")
+
+    def test_deterministic(self):
+        """Test the same seed gives every robot the same faults."""
+        def faults(seed):
+            injector = FaultInjector([FaultRule(latency=Latency("exponential", mean=0.1), drop_rate=0.2)], seed=seed)
+            return [injector.decide("GET", "/api/v1/status", "robot-1") for _ in range(50)]
+
+        self.assertEqual(faults(3), faults(3))
+        self.assertNotEqual(faults(3), faults(4))
+
+    def test_error_bursts(self):
+        """Test errors come in bursts of consecutive requests."""
+        injector = FaultInjector([FaultRule(error_rate=0.05, error_burst=4)], seed=2)
+        statuses = [injector.decide("GET", "/api/v1/status", "r").status for _ in range(400)]
+        runs = "".join("E" if s else "." for s in statuses).split(".")
+        self.assertTrue(any(runs))
+        self.assertTrue(all(len(run) % 4 == 0 for run in runs))
+
+    def test_matching(self):
+        """Test rules apply to their endpoints, methods and robots only."""
+        injector = FaultInjector([FaultRule(endpoint="/api/v1/navigation/*", method="GET", robot="a", drop_rate=1.0)])
+        self.assertTrue(injector.decide("GET", "/api/v1/navigation/position", "a").drop)
+        self.assertIsNone(injector.decide("POST", "/api/v1/navigation/stop", "a"))
+        self.assertIsNone(injector.decide("GET", "/api/v1/navigation/position", "b"))
+        self.assertIsNone(injector.decide("GET", "/api/v1/status", "a"))
+
+
+class TestMockFaults(unittest.TestCase):
+    """Test cases for faults served by the mock."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = MockApp()
+        self.transport = ASGITransport(self.app)
+        self.addCleanup(self.transport.close)
+        self.robot = Robot("http://mock", transport=self.transport)
+
+    def test_admin_endpoint(self):
+        """Test faults are configured at runtime."""
+        config = self.robot.post("/_admin/faults", data={"endpoint": "/api/v1/status", "error_rate": 1.0, "error_status": 500})
+        self.assertEqual(config["rules"][0]["error_status"], 500)
+        with self.assertRaises(ServerError):
+            status.get_robot_status(self.robot)
+
+        self.robot.delete("/_admin/faults")
+        self.assertEqual(status.get_robot_status(self.robot).battery_percent, 100.0)
+
+        self.transport.request("PUT", "http://mock/_admin/faults", data=json.dumps({"profile": "lan", "seed": 7}))
+        self.assertEqual(self.robot.get("/_admin/faults")["seed"], 7)
+        with self.assertRaises(SahaRobotikAPIError):
+            self.robot.post("/_admin/faults", data={"latency": {"distribution": "pareto"}})
+
+    def test_drop_in_process(self):
+        """Test a dropped connection is reported as a network error without sockets."""
+        self.app.faults.add(FaultRule(endpoint="/api/v1/status", drop_rate=1.0))
+        with self.assertRaisesRegex(SahaRobotikAPIError, "Network Error"):
+            status.get_robot_status(self.robot)
+
+    def test_latency(self):
+        """Test responses are delayed."""
+        self.app.faults.add(FaultRule(latency=Latency(value=0.05)))
+        start = time.perf_counter()
+        status.get_robot_status(self.robot)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+
+class TestServerFaults(unittest.TestCase):
+    """Test cases for connection level faults over sockets."""
+
+    def test_drop_and_slow_body(self):
+        """Test dropped connections and slow bodies reach the client."""
+        app = MockApp(faults=FaultInjector([
+            FaultRule(endpoint="/api/v1/status", drop_rate=1.0),
+            FaultRule(endpoint="/api/v1/targets", body_rate=20000.0),
+        ]))
+        with MockServer(app) as server, PooledHTTPTransport(timeout=5) as transport:
+            robot = Robot(server.url, transport=transport)
+            with self.assertRaisesRegex(SahaRobotikAPIError, "Network Error"):
+                status.get_robot_status(robot)
+
+            start = time.perf_counter()
+            body = robot.get_raw("/api/v1/targets")
+            self.assertGreaterEqual(time.perf_counter() - start, len(body) / 20000.0 * 0.8)
+
+    def test_stall_timeout(self):
+        """Test stalled responses trip client timeouts."""
+        app = MockApp(faults=FaultInjector([FaultRule(endpoint="/api/v1/navigation/position/stream", stall_rate=1.0, stall=1.0)]))
+        with MockServer(app) as server, PooledHTTPTransport(timeout=0.2) as transport:
+            robot = Robot(server.url, transport=transport)
+            with self.assertRaisesRegex(SahaRobotikAPIError, "Network Error"):
+                robot.get("/api/v1/navigation/position/stream")
+            self.assertIn("position", robot.get("/api/v1/navigation/position"))
+
+
+if __name__ == '__main__':
+    unittest.main()
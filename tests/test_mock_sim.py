@@ -0,0 +1,170 @@
+import math
+import unittest
+from saha_sdk import cruise, navigation, status, targets, task
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import BadRequestError
+from saha_sdk.mock import Battery, MockApp, SimClock, SimulatedRobot
+from saha_sdk.models import CruiseControlRequestModel, CruiseRequestModel, Position, RobotStopModel, TaskRequestModel, TwistModel
+from saha_sdk.transport import ASGITransport
+
+
+class TestSimClock(unittest.TestCase):
+    """Test cases for the simulated clock."""
+
+    def test_manual(self):
+        """Test a clock without speed only moves when advanced."""
+        clock = SimClock(start=100.0)
+        self.assertEqual(clock.now(), 100.0)
+        self.assertEqual(clock.advance(3600), 3700.0)
+        with self.assertRaises(ValueError):
+            clock.advance(-1)
+
+    def test_speed(self):
+        """Test a clock with speed runs faster than the wall clock."""
+        clock = SimClock(speed=1000.0)
+        start = clock.now()
+        while clock.now() == start:
+            pass
+        self.assertGreater(clock.advance(10) - start, 10)
+
+
+class TestSimulatedRobot(unittest.TestCase):
+    """Test cases for robots driving on a simulated clock."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = SimClock()
+        self.app = MockApp(robots=2, targets=5, robot_class=SimulatedRobot, clock=self.clock)
+        self.transport = ASGITransport(self.app)
+        self.robot = Robot("http://mock", transport=self.transport)
+        self.addCleanup(self.transport.close)
+
+    def position(self, robot=None):
+        return navigation.get_current_position(robot or self.robot)
+
+    def test_drives_to_target(self):
+        """Test the robot drives to the target within its velocity limits."""
+        target = targets.get_target(self.robot, "site", "0", "target_1")
+        navigation.set_goal_target(self.robot, target.uid)
+        self.assertEqual(status.get_robot_status(self.robot).current_state, "MOVING_TO_TARGET")
+        path = navigation.get_navigation_path(self.robot)
+        self.assertGreater(len(path.points), 2)
+        self.assertEqual((path.points[-1].x, path.points[-1].y), (target.px, target.py))
+
+        speeds = []
+        for _ in range(100):
+            self.clock.advance(1.0)
+            speeds.append(self.position().twist.vel_x)
+        current = self.position()
+
+        self.assertAlmostEqual(max(speeds), 0.8)
+        self.assertAlmostEqual(current.position.x, target.px, delta=0.05)
+        self.assertAlmostEqual(current.position.y, target.py, delta=0.05)
+        self.assertAlmostEqual(current.position.theta, math.radians(target.yaw_deg), delta=0.02)
+        robot_status = status.get_robot_status(self.robot)
+        self.assertEqual(robot_status.current_state, "READY")
+        self.assertFalse(robot_status.is_charging)
+        self.assertLess(robot_status.battery_percent, 100.0)
+        self.assertEqual(navigation.get_navigation_path(self.robot).points, [])
+
+    def test_deterministic(self):
+        """Test results do not depend on how often the robot is polled."""
+        def run(poll_interval):
+            clock = SimClock()
+            robot = Robot("http://mock", transport=ASGITransport(MockApp(robot_class=SimulatedRobot, clock=clock)))
+            navigation.set_goal_pose(robot, Position(x=7.0, y=-3.0, theta=1.0))
+            for _ in range(int(30 / poll_interval)):
+                clock.advance(poll_interval)
+                navigation.get_current_position(robot)
+            return navigation.get_current_position(robot).model_dump()
+
+        self.assertEqual(run(0.05), run(5.0))
+
+    def test_velocity_commands(self):
+        """Test velocity commands are clamped and time out."""
+        navigation.send_velocity(self.robot, TwistModel(vel_x=2.0))
+        self.assertEqual(self.position().twist.vel_x, 0.8)
+        self.clock.advance(0.25)
+        self.assertAlmostEqual(self.position().position.x, 0.2)
+        self.clock.advance(10)
+        current = self.position()
+        self.assertAlmostEqual(current.position.x, 0.4)
+        self.assertEqual(current.twist.vel_x, 0.0)
+
+    def test_emergency_stop(self):
+        """Test the emergency stop cancels the goal."""
+        navigation.set_goal_pose(self.robot, Position(x=10.0))
+        self.clock.advance(2)
+        navigation.set_emergency_stop(self.robot, RobotStopModel(stop=True))
+        x = self.position().position.x
+        self.clock.advance(60)
+        self.assertEqual(self.position().position.x, x)
+
+    def test_cruise_rounds(self):
+        """Test cruises visit their waypoints for every round."""
+        uids = [t.uid for t in targets.get_all_targets(self.robot) if t.name in ("target_1", "target_2")]
+        cruise.add_cruise(self.robot, CruiseRequestModel(name="loop", waypoints=uids, site="site", floor="0"))
+        cruise.start_cruise(self.robot, CruiseControlRequestModel(cruise_cmd="CMD_START", cruise_route="loop", number_of_rounds=3))
+        self.clock.advance(60)
+        self.assertEqual(status.get_robot_status(self.robot).current_state, "CRUISING")
+        self.clock.advance(600)
+        self.assertEqual(status.get_robot_status(self.robot).current_state, "READY")
+        simulated = self.app["robot-1"]
+        first, second = (targets.get_target(self.robot, "site", "0", name) for name in ("target_1", "target_2"))
+        loop = math.hypot(first.px - second.px, first.py - second.py)
+        self.assertGreater(simulated.odometer, 5 * loop)
+        self.assertAlmostEqual(self.position().position.x, second.px, delta=0.05)
+
+    def test_tasks(self):
+        """Test activated tasks are driven to in order and completed."""
+        for name in ("target_3", "target_4"):
+            uid = targets.get_target(self.robot, "site", "0", name).uid
+            task.create_task(self.robot, TaskRequestModel(type="DELIVERY", activate=True, target_uid=uid, payload=[]))
+        task.pause_mission(self.robot)
+        self.clock.advance(600)
+        self.assertEqual([t.completed for t in task.get_all_tasks(self.robot)], [False, False])
+        task.resume_mission(self.robot)
+        self.clock.advance(600)
+        self.assertEqual([t.completed for t in task.get_all_tasks(self.robot)], [True, True])
+
+    def test_battery(self):
+        """Test the battery drains away from the dock, charges on it and runs empty."""
+        simulated = SimulatedRobot("robot-3", clock=self.clock, battery=Battery(idle_drain=360.0, charge_rate=3600.0))
+        self.app.add(simulated)
+        robot = Robot("http://mock/robots/robot-3", transport=self.transport)
+        navigation.set_goal_pose(robot, Position(x=2.0))
+        self.clock.advance(10)
+        drained = status.get_robot_status(robot).battery_percent
+        self.assertLess(drained, 99.0)
+
+        navigation.set_goal_target(robot, "site_0_dock")
+        self.clock.advance(20)
+        robot_status = status.get_robot_status(robot)
+        self.assertTrue(robot_status.is_charging)
+        self.assertGreater(robot_status.battery_percent, drained)
+
+        navigation.set_goal_pose(robot, Position(x=1.0))
+        self.clock.advance(1800)
+        robot_status = status.get_robot_status(robot)
+        self.assertEqual(robot_status.battery_percent, 0.0)
+        self.assertTrue(robot_status.out_of_service)
+        with self.assertRaises(BadRequestError):
+            navigation.set_goal_pose(robot, Position(x=0.0))
+
+    def test_simulated_hours(self):
+        """Test a fleet cruises for simulated hours."""
+        for name in ("robot-1", "robot-2"):
+            robot = Robot(f"http://mock/robots/{name}", transport=self.transport)
+            uids = [t.uid for t in targets.get_all_targets(robot) if t.name != "dock"]
+            cruise.add_cruise(robot, CruiseRequestModel(name="all", waypoints=uids, site="site", floor="0"))
+            cruise.start_cruise(robot, CruiseControlRequestModel(cruise_cmd="CMD_START", cruise_route="all", number_of_rounds=100))
+        for _ in range(12):
+            self.clock.advance(600)
+            for name in ("robot-1", "robot-2"):
+                status.get_robot_status(Robot(f"http://mock/robots/{name}", transport=self.transport))
+        self.assertGreater(self.app["robot-1"].odometer, 1000)
+        self.assertNotEqual(self.app["robot-1"].position, self.app["robot-2"].position)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import itertools
+import unittest
+from saha_sdk import planning
+from saha_sdk.models import SiteFloorModel, TargetModel
+
+
+def brute_force(cost):
+    rows, cols = len(cost), len(cost[0])
+    best = float("inf")
+    if rows > cols:
+        cost = [list(col) for col in zip(*cost)]
+        rows, cols = cols, rows
+    for perm in itertools.permutations(range(cols), rows):
+        best = min(best, sum(cost[r][c] for r, c in enumerate(perm)))
+    return best
+
+
+class TestPlanning(unittest.TestCase):
+    """Test cases for planning helpers."""
+
+    def test_euclidean(self):
+        """Test straight-line distance."""
+        self.assertAlmostEqual(planning.euclidean((0.0, 0.0), (3.0, 4.0)), 5.0)
+
+    def test_target_positions(self):
+        """Test target coordinate lookup."""
+        target = TargetModel(name="t", uid="s_f_t", site_floor=SiteFloorModel(site="s", floor="f"), px=1.5, py=-2.0)
+        self.assertEqual(planning.target_positions([target]), {"s_f_t": (1.5, -2.0)})
+
+    def test_solve_assignment_square(self):
+        """Test Hungarian assignment on a square matrix."""
+        cost = [[4, 1, 3], [2, 0, 5], [3, 2, 2]]
+        pairs = planning.solve_assignment(cost)
+        self.assertEqual(sum(cost[r][c] for r, c in pairs), 5)
+        self.assertEqual(len(pairs), 3)
+
+    def test_solve_assignment_rectangular(self):
+        """Test Hungarian assignment is optimal on wide and tall matrices."""
+        wide = [[7, 3, 9, 1], [2, 8, 4, 6]]
+        tall = [list(col) for col in zip(*wide)]
+        for cost in (wide, tall):
+            pairs = planning.solve_assignment(cost)
+            self.assertEqual(len(pairs), 2)
+            self.assertEqual(sum(cost[r][c] for r, c in pairs), brute_force(cost))
+
+    def test_solve_assignment_skips_infinite(self):
+        """Test infeasible pairs are never assigned."""
+        inf = planning.INF
+        pairs = planning.solve_assignment([[inf, inf], [1.0, inf]])
+        self.assertEqual(pairs, [(1, 0)])
+
+    def test_greedy_assignment(self):
+        """Test greedy assignment picks the cheapest free pairs."""
+        pairs = planning.greedy_assignment([[1, 2], [1, 10]])
+        self.assertEqual(pairs, [(0, 0), (1, 1)])
+
+    def test_route_cost(self):
+        """Test route cost with and without the return leg."""
+        points = [(3.0, 4.0), (3.0, 0.0)]
+        self.assertAlmostEqual(planning.route_cost((0.0, 0.0), points, return_to_start=False), 9.0)
+        self.assertAlmostEqual(planning.route_cost((0.0, 0.0), points), 12.0)
+
+    def test_order_stops_exact(self):
+        """Test small routes are ordered optimally."""
+        points = [(4.0, 0.0), (1.0, 0.0), (3.0, 0.0), (2.0, 0.0)]
+        order = planning.order_stops((0.0, 0.0), points, return_to_start=False)
+        self.assertEqual(order, [1, 3, 2, 0])
+
+    def test_order_stops_nearest_neighbour(self):
+        """Test long routes fall back to nearest neighbour."""
+        points = [(float(x), 0.0) for x in (5, 1, 4, 2, 3)]
+        order = planning.order_stops((0.0, 0.0), points, exact_limit=3)
+        self.assertEqual(order, [1, 3, 4, 2, 0])
+
+    def test_empty(self):
+        """Test empty matrices."""
+        self.assertEqual(planning.solve_assignment([]), [])
+        self.assertEqual(planning.greedy_assignment([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
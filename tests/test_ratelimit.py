@@ -0,0 +1,135 @@
+import unittest
+from saha_sdk import navigation, targets, ui
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import RateLimitedError
+from saha_sdk.models import RobotStopModel, SpeechModel
+from saha_sdk.ratelimit import COMMAND, CONFIG, REJECT, ROBOT, TELEMETRY, Limit, RateLimiter, classify
+from saha_sdk.transport import Transport, TransportResponse
+
+
+class _Clock:
+    """Fake monotonic clock; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class _OkTransport(Transport):
+    def __init__(self):
+        self.paths = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.paths.append(url)
+        return TransportResponse(200, b"{}")
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for client-side rate limiting."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = _Clock()
+
+    def _limiter(self, limits, **kwargs):
+        return RateLimiter(limits, clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_classify(self):
+        """Test requests are sorted into endpoint classes."""
+        self.assertEqual(classify("GET", "/api/v1/status"), TELEMETRY)
+        self.assertEqual(classify("GET", "/api/v1/navigation/stop"), TELEMETRY)
+        self.assertEqual(classify("POST", "/api/v1/ui/speech"), COMMAND)
+        self.assertEqual(classify("POST", "/api/v1/ui/screen/pixel?url=x"), COMMAND)
+        self.assertEqual(classify("PATCH", "/api/v1/targets/site/floor/t1"), CONFIG)
+        self.assertIsNone(classify("POST", "/api/v1/navigation/stop"))
+
+    def test_queue(self):
+        """Test a burst is admitted at once and later requests are spaced at the rate."""
+        limiter = self._limiter({TELEMETRY: Limit(rate=10.0, burst=2)})
+        waits = [limiter.acquire("GET", "/api/v1/status") for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1)
+        self.assertAlmostEqual(waits[3], 0.1)
+        self.assertAlmostEqual(self.clock.now, 0.2)
+
+        stats, = limiter.snapshot()
+        self.assertEqual((stats.endpoint_class, stats.admitted, stats.queued, stats.rejected), (TELEMETRY, 4, 2, 0))
+        self.assertAlmostEqual(stats.wait.max, 0.1)
+
+    def test_reserve_in_order(self):
+        """Test concurrent reservations are due one after another."""
+        limiter = self._limiter({CONFIG: Limit(rate=2.0)})
+        waits = [limiter.reserve("PATCH", "/api/v1/targets/s/f/t") for _ in range(3)]
+        self.assertEqual(waits, [0.0, 0.5, 1.0])
+
+    def test_reject(self):
+        """Test the reject policy raises without taking a token."""
+        limiter = self._limiter({COMMAND: Limit(rate=1.0)}, policy=REJECT)
+        limiter.acquire("POST", "/api/v1/ui/speech")
+        with self.assertRaises(RateLimitedError) as cm:
+            limiter.acquire("POST", "/api/v1/ui/speech")
+        self.assertEqual(cm.exception.endpoint_class, COMMAND)
+        self.assertAlmostEqual(cm.exception.retry_after, 1.0)
+
+        self.clock.now = 1.0
+        limiter.acquire("POST", "/api/v1/ui/speech")
+        self.assertEqual(limiter.snapshot()[0].rejected, 1)
+
+    def test_max_wait(self):
+        """Test queued requests are rejected when the wait would be too long."""
+        limiter = self._limiter({CONFIG: Limit(rate=1.0)}, max_wait=1.5)
+        for _ in range(2):
+            limiter.reserve("POST", "/api/v1/targets")
+        with self.assertRaises(RateLimitedError):
+            limiter.reserve("POST", "/api/v1/targets")
+
+    def test_robot_limit(self):
+        """Test the robot-wide limit is shared by every endpoint class."""
+        limiter = self._limiter({ROBOT: Limit(rate=1.0, burst=2)}, policy=REJECT)
+        limiter.acquire("GET", "/api/v1/status")
+        limiter.acquire("POST", "/api/v1/ui/speech")
+        with self.assertRaises(RateLimitedError):
+            limiter.acquire("PATCH", "/api/v1/targets/s/f/t")
+
+    def test_estop_exempt(self):
+        """Test the e-stop goes through when every bucket is empty."""
+        transport = _OkTransport()
+        limiter = self._limiter({COMMAND: Limit(rate=1.0), ROBOT: Limit(rate=1.0)}, policy=REJECT)
+        robot = Robot("http://robot", transport=transport, rate_limiter=limiter)
+
+        ui.speak_text(robot, SpeechModel(lang="en", text="hello"))
+        with self.assertRaises(RateLimitedError):
+            ui.speak_text(robot, SpeechModel(lang="en", text="again"))
+        for _ in range(3):
+            navigation.set_emergency_stop(robot, RobotStopModel(stop=True))
+
+        self.assertEqual(len(transport.paths), 4)
+
+    def test_client(self):
+        """Test a client waits for its limiter before sending."""
+        transport = _OkTransport()
+        limiter = self._limiter({CONFIG: Limit(rate=4.0)})
+        robot = Robot("http://robot", transport=transport, rate_limiter=limiter)
+        for _ in range(3):
+            targets.delete_target(robot, "site", "floor", "t1")
+        self.assertEqual(self.clock.slept, [0.25, 0.25])
+        self.assertEqual(len(transport.paths), 3)
+
+    def test_invalid(self):
+        """Test unknown classes and empty limits are refused."""
+        with self.assertRaises(ValueError):
+            RateLimiter({"bulk": Limit(1.0)})
+        with self.assertRaises(ValueError):
+            RateLimiter({TELEMETRY: Limit(0.0)})
+
+
+if __name__ == '__main__':
+    unittest.main()
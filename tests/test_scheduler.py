@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+from saha_sdk import mapping, navigation, status
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import SahaRobotikAPIError
+from saha_sdk.mock import MockServer
+from saha_sdk.scheduler import BULK, MOTION, SAFETY, TASKS, TELEMETRY, PriorityTransport, classify
+from saha_sdk.transport import Transport, TransportResponse
+
+
+class _GatedTransport(Transport):
+    """Blocks requests to gated paths until released; records the order requests were sent."""
+    network_errors = (ConnectionError,)
+
+    def __init__(self, sent):
+        self.sent = sent
+        self.gate = threading.Event()
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(url)
+        if "/mapping/" in url:
+            self.gate.wait(5.0)
+        return TransportResponse(200, b"{}")
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+
+class TestPriorityTransport(unittest.TestCase):
+    """Test cases for the priority request scheduler."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sent = []
+        self.lane_transports = []
+
+        def factory(connections):
+            transport = _GatedTransport(self.sent)
+            self.lane_transports.append(transport)
+            return transport
+
+        self.transport = PriorityTransport(transport_factory=factory)
+        self.robot = Robot("http://robot", transport=self.transport)
+
+    def tearDown(self):
+        for transport in self.lane_transports:
+            transport.gate.set()
+
+    def _stats(self, name):
+        return next(s for s in self.transport.snapshot() if s.priority == name)
+
+    def test_classify(self):
+        """Test requests are sorted into priority classes."""
+        self.assertEqual(classify("POST", "/api/v1/navigation/stop"), SAFETY)
+        self.assertEqual(classify("POST", "/api/v1/navigation/vel"), MOTION)
+        self.assertEqual(classify("POST", "http://host/robots/r1/api/v1/navigation/goal/target"), MOTION)
+        self.assertEqual(classify("DELETE", "/api/v1/tasks/t1"), TASKS)
+        self.assertEqual(classify("GET", "/api/v1/navigation/position"), TELEMETRY)
+        self.assertEqual(classify("GET", "/api/v1/mapping/site/floor"), BULK)
+        self.assertEqual(classify("PATCH", "/api/v1/targets/site/floor/t1"), BULK)
+
+    def test_lanes_are_independent(self):
+        """Test a slow download does not delay a motion command."""
+        download = threading.Thread(target=self.robot.get, args=("/api/v1/mapping/site/floor",))
+        download.start()
+        _wait_for(lambda: self._stats("bulk").in_flight == 1)
+
+        self.robot.post("/api/v1/navigation/goal/target", {"target_uid": "t1"})
+        self.assertEqual(self._stats("motion").sent, 1)
+        self.assertEqual(self._stats("bulk").sent, 0)
+
+        for transport in self.lane_transports:
+            transport.gate.set()
+        download.join()
+        self.assertEqual(self._stats("bulk").sent, 1)
+
+    def test_fifo_within_lane(self):
+        """Test requests waiting for a lane's connection are sent in arrival order."""
+        threads = []
+        for i in range(4):
+            thread = threading.Thread(target=self.robot.get, args=(f"/api/v1/mapping/site/{i}",))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda: self._stats("bulk").in_flight + self._stats("bulk").waiting == i + 1)
+
+        stats = self._stats("bulk")
+        self.assertEqual((stats.in_flight, stats.waiting, stats.queued), (1, 3, 3))
+        for transport in self.lane_transports:
+            transport.gate.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.sent, [f"http://robot/api/v1/mapping/site/{i}" for i in range(4)])
+        self.assertEqual(self._stats("bulk").waiting, 0)
+
+    def test_wait_timeout(self):
+        """Test a request waiting for a busy lane gives up after its timeout."""
+        download = threading.Thread(target=self.robot.get, args=("/api/v1/mapping/site/floor",))
+        download.start()
+        _wait_for(lambda: self._stats("bulk").in_flight == 1)
+
+        with self.assertRaises(SahaRobotikAPIError):
+            self.robot._request("GET", "/api/v1/mapping/site/other", timeout=0.05)
+        self.assertEqual(self._stats("bulk").waiting, 0)
+
+        for transport in self.lane_transports:
+            transport.gate.set()
+        download.join()
+        self.robot.get("/api/v1/mapping/site/floor")
+        self.assertEqual(self.sent, ["http://robot/api/v1/mapping/site/floor"] * 2)
+
+    def test_invalid_lanes(self):
+        """Test every priority class needs a lane with at least one connection."""
+        with self.assertRaises(ValueError):
+            PriorityTransport({SAFETY: 1, MOTION: 1})
+        with self.assertRaises(ValueError):
+            PriorityTransport({SAFETY: 1, MOTION: 0, TASKS: 1, TELEMETRY: 1, BULK: 1})
+
+    def test_mock_server(self):
+        """Test SDK calls reach the mock robot through the default lanes."""
+        with MockServer() as server, PriorityTransport() as transport:
+            robot = Robot(server.urls["robot-1"], transport=transport)
+            status.get_robot_status(robot)
+            navigation.get_current_position(robot)
+            mapping.get_current_map(robot)
+            sent = {s.priority: s.sent for s in transport.snapshot()}
+        self.assertEqual(sent, {"safety": 0, "motion": 0, "tasks": 0, "telemetry": 2, "bulk": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
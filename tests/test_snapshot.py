@@ -0,0 +1,88 @@
+import threading
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk import snapshot
+from saha_sdk.exceptions import SahaRobotikAPIError
+from saha_sdk.models import RobotModes, RobotStatus, RobotState
+
+RESPONSES = {
+    "/api/v1/status": {"battery_percent": 75.0, "current_state": "READY"},
+    "/api/v1/navigation/position": {"position": {"x": 1.0, "y": 2.0, "theta": 0.0}, "twist": {"vel_x": 0.0, "vel_z": 0.0}},
+    "/api/v1/mode": {"avaible_modes": ["elev"], "current_modes": []},
+}
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for the snapshot module."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = Robot("https://api.example.com", "test-api-key")
+
+    @patch.object(Robot, 'get')
+    def test_get_snapshot(self, mock_get):
+        """Test requested parts are fetched and typed."""
+        mock_get.side_effect = lambda path: RESPONSES[path]
+
+        result = snapshot.get_snapshot(self.client, parts=["status", "position", "modes"])
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertIsInstance(result.status, RobotStatus)
+        self.assertIsInstance(result.position, RobotState)
+        self.assertIsInstance(result.modes, RobotModes)
+        self.assertIsNone(result.hardware)
+        self.assertTrue(result.ok)
+        self.assertGreater(result.parts["status"].fetched_at, 0.0)
+
+    @patch.object(Robot, 'get')
+    def test_parts_run_in_parallel(self, mock_get):
+        """Test parts are requested concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(path):
+            barrier.wait()
+            return RESPONSES[path]
+        mock_get.side_effect = get
+
+        result = snapshot.get_snapshot(self.client, parts=["status", "position"])
+
+        self.assertTrue(result.ok)
+
+    @patch.object(Robot, 'get')
+    def test_part_errors(self, mock_get):
+        """Test a failing part is reported without failing the snapshot."""
+        def get(path):
+            if path == "/api/v1/mode":
+                raise SahaRobotikAPIError("Network Error")
+            return RESPONSES[path]
+        mock_get.side_effect = get
+
+        result = snapshot.get_snapshot(self.client, parts=["status", "modes"])
+
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.errors["modes"], SahaRobotikAPIError)
+        self.assertIsInstance(result.status, RobotStatus)
+
+    def test_unknown_part(self):
+        """Test unknown parts are rejected."""
+        with self.assertRaises(ValueError):
+            snapshot.get_snapshot(self.client, parts=["battery"])
+
+    @patch.object(Robot, 'get')
+    def test_get_fleet_snapshot(self, mock_get):
+        """Test every robot and part pair is fetched."""
+        mock_get.side_effect = lambda path: RESPONSES[path]
+        fleet = RobotFleet({"r1": Robot("https://r1.example.com"), "r2": Robot("https://r2.example.com")})
+
+        result = snapshot.get_fleet_snapshot(fleet, parts=["status", "position"])
+        fleet.close()
+
+        self.assertEqual(set(result), {"r1", "r2"})
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(result["r2"].position.position.y, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
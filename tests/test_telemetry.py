@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from saha_sdk import telemetry
+from saha_sdk.client import Robot
+from saha_sdk.models import Position, RobotState, RobotStatus, TwistModel
+from saha_sdk.snapshot import Snapshot, SnapshotPart
+
+
+def make_state(x, y, vel_x=0.0):
+    return RobotState(position=Position(x=x, y=y, theta=0.5), twist=TwistModel(vel_x=vel_x, vel_z=0.0))
+
+
+@unittest.skipIf(telemetry.np is None, "numpy is not installed")
+class TestTelemetry(unittest.TestCase):
+    """Test cases for the telemetry recorder."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_varint_roundtrip(self):
+        """Test zigzag varints survive encoding for small and large values."""
+        values = telemetry.np.array([0, 1, -1, 63, -64, 64, 300, -300, 2 ** 40, -(2 ** 62)], dtype=telemetry.np.int64)
+        encoded = telemetry.encode_varints(values)
+        self.assertEqual(len(telemetry.encode_varints(telemetry.np.array([5, -5]))), 2)
+        self.assertTrue((telemetry.decode_varints(encoded) == values).all())
+
+    def test_record_and_query(self):
+        """Test samples come back as arrays, both buffered and flushed."""
+        status = RobotStatus(battery_percent=87.5, current_state="READY", is_charging=True)
+        recorder = telemetry.TelemetryRecorder(self.directory, block_size=4)
+        for k in range(10):
+            recorder.record(1000.0 + k, state=make_state(k * 0.1, 2.0, vel_x=0.3), robot_status=status)
+
+        data = recorder.query(1002.0, 1008.0)
+
+        self.assertEqual(len(data["t"]), 7)
+        self.assertAlmostEqual(data["t"][0], 1002.0)
+        self.assertAlmostEqual(data["x"][3], 0.5)
+        self.assertAlmostEqual(data["theta"][0], 0.5)
+        self.assertAlmostEqual(data["battery"][0], 87.5)
+        self.assertEqual(data["state"][0], "READY")
+        self.assertTrue(data["is_charging"].all())
+        self.assertFalse(data["is_estopped"].any())
+
+    def test_missing_columns_repeat(self):
+        """Test a sample without status keeps the previous status values."""
+        recorder = telemetry.TelemetryRecorder(self.directory)
+        recorder.record(1.0, robot_status=RobotStatus(battery_percent=50.0, current_state="CHARGING"))
+        recorder.record(2.0, state=make_state(1.0, 1.0))
+
+        data = recorder.query()
+
+        self.assertEqual(list(data["battery"]), [50.0, 50.0])
+        self.assertEqual(list(data["state"]), ["CHARGING", "CHARGING"])
+        self.assertEqual(list(data["x"]), [0.0, 1.0])
+
+    def test_reopen(self):
+        """Test flushed data and state names are read back by a new recorder."""
+        with telemetry.TelemetryRecorder(self.directory) as recorder:
+            recorder.record(1.0, robot_status=RobotStatus(current_state="BUSY"))
+            recorder.record(2.0, robot_status=RobotStatus(current_state="READY"))
+
+        data = telemetry.TelemetryRecorder(self.directory).query()
+
+        self.assertEqual(list(data["state"]), ["BUSY", "READY"])
+
+    def test_compact_encoding(self):
+        """Test a slowly changing sample takes a few bytes per sample."""
+        with telemetry.TelemetryRecorder(self.directory, block_size=1000) as recorder:
+            for k in range(1000):
+                recorder.record(k * 0.5, state=make_state(k * 0.001, 0.0), robot_status=RobotStatus())
+        size = sum(os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory))
+        self.assertLess(size, 1000 * 16)
+
+    def test_rotation_downsampling_and_retention(self):
+        """Test old segments are downsampled and then deleted."""
+        recorder = telemetry.TelemetryRecorder(
+            self.directory, block_size=10, segment_seconds=100, raw_retention=200,
+            downsample_interval=10, retention=1000, clock=lambda: 0.0
+        )
+        for k in range(300):
+            recorder.record(float(k), state=make_state(float(k), 0.0))
+        recorder.flush()
+        self.assertEqual(len([n for n in os.listdir(self.directory) if n.endswith(".raw")]), 3)
+
+        recorder.maintain(now=350.0)
+        data = recorder.query(0.0, 99.9)
+        self.assertEqual(len(data["t"]), 10)
+        self.assertAlmostEqual(data["x"][0], 4.5)
+        self.assertEqual(len(recorder.query(100.0, 299.0)["t"]), 200)
+
+        recorder.maintain(now=1150.0)
+        self.assertEqual(len(recorder.query(0.0, 99.9)["t"]), 0)
+        self.assertEqual(len(recorder.query()["t"]), 110)
+
+    @patch("saha_sdk.telemetry.snapshot.get_snapshot")
+    def test_sample(self, mock_snapshot):
+        """Test sampling a robot records its status and position."""
+        mock_snapshot.return_value = Snapshot(parts={
+            "status": SnapshotPart(value=RobotStatus(battery_percent=42.0)),
+            "position": SnapshotPart(value=make_state(3.0, 4.0)),
+        })
+        recorder = telemetry.TelemetryRecorder(self.directory, clock=lambda: 10.0)
+
+        recorder.sample(Robot("http://localhost", "key"))
+
+        data = recorder.query()
+        self.assertEqual(list(data["battery"]), [42.0])
+        self.assertEqual(list(data["y"]), [4.0])
+
+    @patch("saha_sdk.telemetry.snapshot.get_snapshot")
+    def test_sample_errors(self, mock_snapshot):
+        """Test failed parts are not recorded, and nothing is recorded if both failed."""
+        error = ConnectionError("timeout")
+        recorder = telemetry.TelemetryRecorder(self.directory, clock=lambda: 10.0)
+        robot = Robot("http://localhost", "key")
+
+        mock_snapshot.return_value = Snapshot(parts={
+            "status": SnapshotPart(error=error),
+            "position": SnapshotPart(value=make_state(3.0, 4.0)),
+        })
+        self.assertEqual(recorder.sample(robot), {"status": error})
+        mock_snapshot.return_value = Snapshot(parts={
+            "status": SnapshotPart(error=error),
+            "position": SnapshotPart(error=error),
+        })
+        self.assertEqual(set(recorder.sample(robot)), {"status", "position"})
+
+        data = recorder.query()
+        self.assertEqual(list(data["y"]), [4.0])
+        self.assertEqual(list(data["battery"]), [0.0])
+
+    def test_downsampled_heading(self):
+        """Test headings are averaged on the circle."""
+        recorder = telemetry.TelemetryRecorder(
+            self.directory, block_size=10, segment_seconds=10, raw_retention=10,
+            downsample_interval=10, clock=lambda: 0.0
+        )
+        for k in range(20):
+            theta = 3.1 if k % 2 else -3.1
+            recorder.record(float(k), state=RobotState(position=Position(x=0.0, y=0.0, theta=theta), twist=TwistModel()))
+        recorder.flush()
+
+        recorder.maintain(now=100.0)
+        data = recorder.query(0.0, 9.9)
+        self.assertEqual(len(data["t"]), 1)
+        self.assertAlmostEqual(abs(data["theta"][0]), 3.1416, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import math
+import random
+import unittest
+from saha_sdk import tour
+from saha_sdk.models import CruiseRequestModel
+
+
+@unittest.skipIf(tour.np is None, "numpy is not installed")
+class TestTour(unittest.TestCase):
+    """Test cases for cruise tour optimization."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.circle = [(math.cos(2 * math.pi * k / 12), math.sin(2 * math.pi * k / 12)) for k in range(12)]
+
+    def test_distance_matrix(self):
+        """Test vectorized and custom cost matrices agree."""
+        points = [(0.0, 0.0), (3.0, 4.0), (6.0, 8.0)]
+        matrix = tour.distance_matrix(points)
+        custom = tour.distance_matrix(points, cost_fn=lambda a, b: math.hypot(a[0] - b[0], a[1] - b[1]))
+        self.assertAlmostEqual(matrix[0, 2], 10.0)
+        self.assertTrue(tour.np.allclose(matrix, custom))
+
+    def test_optimize_finds_circle_order(self):
+        """Test a shuffled circle is untangled into its perimeter."""
+        order = list(range(12))
+        random.Random(3).shuffle(order)
+        points = [self.circle[k] for k in order]
+        matrix = tour.distance_matrix(points)
+
+        result = tour.optimize_tour(matrix, start=0)
+
+        perimeter = 12 * 2 * math.sin(math.pi / 12)
+        self.assertAlmostEqual(tour.tour_length(result, matrix), perimeter, places=6)
+        self.assertEqual(result[0], 0)
+        self.assertEqual(sorted(result), list(range(12)))
+
+    def test_optimize_improves_nearest_neighbour(self):
+        """Test local search never makes the starting tour longer."""
+        rng = random.Random(7)
+        matrix = tour.distance_matrix([(rng.random(), rng.random()) for _ in range(80)])
+
+        result = tour.optimize_tour(matrix)
+
+        self.assertLessEqual(tour.tour_length(result, matrix),
+                             tour.tour_length(tour.nearest_neighbour_tour(matrix), matrix) + 1e-9)
+
+    def test_optimize_asymmetric_costs(self):
+        """Test local search accounts for direction when costs are asymmetric."""
+        rng = random.Random(11)
+        for n in (6, 40):
+            matrix = tour.np.array([[0.0 if i == j else rng.uniform(1.0, 10.0) for j in range(n)] for i in range(n)])
+
+            result = tour.optimize_tour(matrix)
+
+            self.assertEqual(sorted(result), list(range(n)))
+            self.assertLessEqual(tour.tour_length(result, matrix),
+                                 tour.tour_length(tour.nearest_neighbour_tour(matrix), matrix) + 1e-9)
+
+    def test_optimize_waypoints(self):
+        """Test waypoint UIDs are reordered, deduplicated and keep their start."""
+        positions = {f"wp{k}": p for k, p in enumerate(self.circle)}
+        waypoints = ["wp0", "wp6", "wp1", "wp7", "wp2", "wp8", "wp3", "wp9", "wp4", "wp10", "wp5", "wp11", "wp6"]
+
+        result = tour.optimize_waypoints(waypoints, positions)
+
+        self.assertEqual(result[0], "wp0")
+        self.assertEqual(len(result), 12)
+        self.assertIn(result[1], ("wp1", "wp11"))
+
+    def test_optimize_waypoints_unknown(self):
+        """Test unknown waypoint targets are reported."""
+        with self.assertRaises(KeyError):
+            tour.optimize_waypoints(["a", "b"], {"a": (0.0, 0.0)})
+
+    def test_optimize_cruise(self):
+        """Test cruise requests are copied with optimized waypoints."""
+        positions = {"a": (0.0, 0.0), "b": (1.0, 1.0), "c": (1.0, 0.0), "d": (0.0, 1.0)}
+        request = CruiseRequestModel(name="patrol", waypoints=["a", "b", "c", "d"], site="s", floor="f")
+
+        result = tour.optimize_cruise(request, positions)
+
+        self.assertEqual(result.name, "patrol")
+        self.assertEqual(result.waypoints[0], "a")
+        self.assertNotIn(result.waypoints[2], ("c", "d"))
+        self.assertEqual(request.waypoints, ["a", "b", "c", "d"])
+
+
+if __name__ == '__main__':
+    unittest.main()
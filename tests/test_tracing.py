@@ -0,0 +1,178 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from saha_sdk import status, targets, tracing
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import NotFoundError
+from saha_sdk.transport import PooledHTTPTransport, RequestsTransport, WSGITransport
+
+
+TARGET = {"name": "t1", "uid": "site_floor_t1", "site_floor": {"site": "site", "floor": "floor"}}
+
+
+def wsgi_app(environ, start_response):
+    if environ["PATH_INFO"] == "/api/v1/targets":
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps([TARGET, TARGET]).encode()]
+    start_response("404 Not Found", [("Content-Type", "application/json")])
+    return [b'{"error": {"message": "Not found"}}']
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        content = b'{"battery_percent": 50.0}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeSpan:
+    def __init__(self, name, context, start_time, attributes):
+        self.name, self.context, self.start_time = name, context, start_time
+        self.attributes = dict(attributes or {})
+        self.events, self.exceptions, self.end_time = [], [], None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_event(self, name, timestamp=None):
+        self.events.append(name)
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, context=None, start_time=None, attributes=None):
+        span = FakeSpan(name, context, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+class TestTracing(unittest.TestCase):
+    """Test cases for request lifecycle hooks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tracer = tracing.Tracer()
+        self.events = []
+        for event in tracing.EVENTS:
+            self.tracer.on(event, lambda span, event=event: self.events.append((event, span)))
+        self.robot = Robot("http://robot", transport=WSGITransport(wsgi_app), name="r1", tracer=self.tracer)
+
+    def test_event_order(self):
+        """Test a module function produces request events followed by after_validate."""
+        result = targets.get_all_targets(self.robot)
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual([e for e, _ in self.events], ["before_send", "after_receive", "after_decode", "after_validate"])
+        request, call = self.events[0][1], self.events[-1][1]
+        self.assertEqual((request.endpoint, request.status, request.robot), ("/api/v1/targets", 200, "r1"))
+        self.assertEqual(call.name, "targets.get_all_targets")
+        self.assertEqual(call.requests, [request])
+        self.assertEqual(set(request.durations), {"wait", "decode", "total"})
+        self.assertIn("validate", call.durations)
+        self.assertGreaterEqual(call.end, request.end)
+
+    def test_errors(self):
+        """Test failing requests and calls emit on_error."""
+        with self.assertRaises(NotFoundError):
+            targets.get_target(self.robot, "site", "floor", "missing")
+
+        self.assertEqual([e for e, _ in self.events], ["before_send", "after_receive", "on_error", "on_error"])
+        request, call = self.events[2][1], self.events[3][1]
+        self.assertIsInstance(request.error, NotFoundError)
+        self.assertEqual(request.endpoint, "/api/v1/targets/{site}/{floor}/{name}")
+        self.assertIsInstance(call, tracing.CallSpan)
+
+    def test_untraced_client(self):
+        """Test module functions work unchanged without a tracer."""
+        self.robot.tracer = None
+        self.assertEqual(len(targets.get_all_targets(self.robot)), 2)
+        self.assertEqual(self.events, [])
+
+    def test_remove_hook(self):
+        """Test removed hooks are no longer called."""
+        calls = []
+        remove = self.tracer.on("before_send", calls.append)
+        remove()
+        self.robot.get("/api/v1/targets")
+        self.assertEqual(calls, [])
+        with self.assertRaises(ValueError):
+            self.tracer.on("after_everything", calls.append)
+
+    def test_opentelemetry_hooks(self):
+        """Test calls are exported as spans with their requests as children."""
+        fake = FakeTracer()
+        self.tracer.add(tracing.OpenTelemetryHooks(tracer=fake))
+
+        targets.get_all_targets(self.robot)
+        self.robot.get("/api/v1/targets")
+
+        self.assertEqual([s.name for s in fake.spans], ["targets.get_all_targets", "GET /api/v1/targets", "GET /api/v1/targets"])
+        call, child, standalone = fake.spans
+        self.assertEqual(child.attributes["http.status_code"], 200)
+        self.assertEqual(child.attributes["saha.robot"], "r1")
+        self.assertIn("saha.duration.validate", call.attributes)
+        self.assertEqual(child.events, ["received", "decoded"])
+        self.assertGreaterEqual(call.end_time, child.end_time)
+        self.assertLessEqual(call.start_time, child.start_time)
+
+
+class TestConnectTracing(unittest.TestCase):
+    """Test cases for connection events of pooled transports."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a local server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_after_connect(self):
+        """Test new and reused connections are reported."""
+        tracer = tracing.Tracer()
+        connects = []
+        tracer.on("after_connect", connects.append)
+        with PooledHTTPTransport(maxsize=1) as transport:
+            robot = Robot(self.url, transport=transport, tracer=tracer)
+            status.get_robot_status(robot)
+            status.get_robot_status(robot)
+
+        self.assertEqual([span.connection_reused for span in connects], [False, True])
+        self.assertIn("connect", connects[0].durations)
+
+    def test_after_connect_requests(self):
+        """Test per-thread requests sessions report new and reused connections."""
+        tracer = tracing.Tracer()
+        connects = []
+        tracer.on("after_connect", connects.append)
+        with RequestsTransport(per_thread_sessions=True) as transport:
+            robot = Robot(self.url, transport=transport, tracer=tracer)
+            status.get_robot_status(robot)
+            status.get_robot_status(robot)
+
+        self.assertEqual([span.connection_reused for span in connects], [False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
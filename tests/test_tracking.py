@@ -0,0 +1,143 @@
+import math
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.tracking import CruiseTracker, FleetCruiseTracker
+from saha_sdk.models import CruiseModel, PathModel, Position, RobotState, SiteFloorModel, TargetModel, TwistModel
+
+
+def make_cruise():
+    site_floor = SiteFloorModel(site="s", floor="f")
+    corners = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+    waypoints = [
+        TargetModel(name=f"wp{k}", uid=f"s_f_wp{k}", site_floor=site_floor, px=x, py=y, tol=0.5)
+        for k, (x, y) in enumerate(corners)
+    ]
+    return CruiseModel(name="square", waypoints=waypoints, site_floor=site_floor)
+
+
+def at(x, y, vel=0.0):
+    return RobotState(position=Position(x=x, y=y), twist=TwistModel(vel_x=vel))
+
+
+class TestCruiseTracker(unittest.TestCase):
+    """Test cases for the CruiseTracker class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tracker = CruiseTracker(make_cruise(), number_of_rounds=2, default_speed=1.0)
+
+    def test_round_length(self):
+        """Test the closed round length."""
+        self.assertAlmostEqual(self.tracker.round_length, 40.0)
+
+    def test_initial_progress(self):
+        """Test distance and ETA before the first waypoint is reached."""
+        progress = self.tracker.update(at(-5.0, 0.0), timestamp=0.0)
+
+        self.assertEqual(progress.current_waypoint, "s_f_wp0")
+        self.assertAlmostEqual(progress.distance_to_waypoint, 5.0)
+        self.assertAlmostEqual(progress.distance_remaining_round, 35.0)
+        self.assertAlmostEqual(progress.distance_remaining, 75.0)
+        self.assertAlmostEqual(progress.eta, 75.0)
+
+    def test_waypoints_and_rounds_advance(self):
+        """Test waypoints are passed in order and rounds are counted."""
+        for k, (x, y) in enumerate([(0, 0), (10, 0), (10, 10), (0, 10)]):
+            progress = self.tracker.update(at(x, y), timestamp=float(k))
+        self.assertEqual(progress.rounds_completed, 1)
+        self.assertEqual(progress.waypoint_index, 0)
+        self.assertAlmostEqual(progress.distance_remaining, 40.0)
+
+        for k, (x, y) in enumerate([(0, 0), (10, 0), (10, 10), (0, 10)]):
+            progress = self.tracker.update(at(x, y), timestamp=10.0 + k)
+        self.assertTrue(progress.finished)
+        self.assertEqual(progress.distance_remaining, 0.0)
+
+    def test_speed_smoothing(self):
+        """Test the ETA follows the observed speed."""
+        self.tracker.update(at(0.0, 0.0), timestamp=0.0)
+        for t in range(1, 50):
+            progress = self.tracker.update(at(0.0, 0.0, vel=2.0), timestamp=float(t))
+        self.assertAlmostEqual(progress.speed, 2.0, places=3)
+        self.assertAlmostEqual(progress.eta, progress.distance_remaining / progress.speed)
+
+    def test_passed_waypoint(self):
+        """Test a waypoint the robot passed outside its tolerance counts as reached."""
+        self.tracker.update(at(0.0, 0.0), timestamp=0.0)
+        progress = self.tracker.update(at(11.0, 0.8), timestamp=1.0)
+        self.assertEqual(progress.current_waypoint, "s_f_wp2")
+
+        progress = self.tracker.update(at(9.0, 4.0), timestamp=2.0)
+        self.assertEqual(progress.current_waypoint, "s_f_wp2")
+        self.assertAlmostEqual(progress.distance_to_waypoint, math.hypot(1.0, 6.0))
+
+    def test_path_distance(self):
+        """Test the planned path is used for the distance to the next waypoint."""
+        self.tracker.update(at(0.0, 0.0), timestamp=0.0)
+        path = PathModel(site="s", floor="f", points=[
+            Position(x=0.0, y=0.0), Position(x=0.0, y=5.0), Position(x=10.0, y=5.0), Position(x=10.0, y=0.0)
+        ])
+        self.tracker.update_path(path)
+
+        progress = self.tracker.update(at(0.0, 4.0), timestamp=1.0)
+
+        self.assertAlmostEqual(progress.distance_to_waypoint, 1.0 + 10.0 + 5.0)
+
+    def test_path_to_other_target_ignored(self):
+        """Test a path that does not end at the next waypoint is ignored."""
+        self.tracker.update(at(0.0, 0.0), timestamp=0.0)
+        self.tracker.update_path(PathModel(site="s", floor="f", points=[Position(x=0.0, y=0.0), Position(x=3.0, y=3.0)]))
+
+        progress = self.tracker.update(at(2.0, 0.0), timestamp=1.0)
+
+        self.assertAlmostEqual(progress.distance_to_waypoint, 8.0)
+
+    def test_empty_cruise(self):
+        """Test cruises without waypoints are rejected."""
+        with self.assertRaises(ValueError):
+            CruiseTracker(CruiseModel(name="empty", waypoints=[], site_floor=SiteFloorModel()))
+
+
+class TestFleetCruiseTracker(unittest.TestCase):
+    """Test cases for the FleetCruiseTracker class."""
+
+    @patch('saha_sdk.navigation.get_navigation_path')
+    @patch('saha_sdk.navigation.get_position_stream')
+    def test_poll(self, mock_position, mock_path):
+        """Test poll updates every tracked robot from its position and planned path."""
+        mock_position.return_value = at(10.0, 0.0)
+        mock_path.return_value = PathModel(site="s", floor="f", points=[
+            Position(x=10.0, y=0.0), Position(x=10.0, y=5.0), Position(x=0.0, y=5.0), Position(x=0.0, y=0.0)
+        ])
+        fleet = RobotFleet({"r1": Robot("https://r1.example.com"), "r2": Robot("https://r2.example.com")})
+        tracker = FleetCruiseTracker(fleet)
+        tracker.start("r1", make_cruise())
+        tracker.start("r2", make_cruise())
+
+        progress = tracker.poll()
+        fleet.close()
+
+        self.assertEqual(set(progress), {"r1", "r2"})
+        self.assertEqual((mock_position.call_count, mock_path.call_count), (2, 2))
+        self.assertAlmostEqual(progress["r1"].distance_to_waypoint, 20.0)
+
+    @patch('saha_sdk.navigation.get_navigation_path')
+    @patch('saha_sdk.navigation.get_position_stream')
+    def test_poll_without_path(self, mock_position, mock_path):
+        """Test robots whose path cannot be fetched are measured in a straight line."""
+        mock_position.return_value = at(10.0, 0.0)
+        mock_path.side_effect = ConnectionError("offline")
+        fleet = RobotFleet({"r1": Robot("https://r1.example.com")})
+        tracker = FleetCruiseTracker(fleet)
+        tracker.start("r1", make_cruise())
+
+        progress = tracker.poll()
+        fleet.close()
+
+        self.assertAlmostEqual(progress["r1"].distance_to_waypoint, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
+from saha_sdk import transport
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import NotFoundError, SahaRobotikAPIError
+
+
+def wsgi_app(environ, start_response):
+    """Echo the request back as JSON."""
+    body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+    if environ["PATH_INFO"] == "/missing":
+        start_response("404 Not Found", [("Content-Type", "application/json")])
+        return [b'{"error": {"message": "Not found"}}']
+    start_response("200 OK", [("Content-Type", "application/json")])
+    return [json.dumps({
+        "method": environ["REQUEST_METHOD"],
+        "path": environ["PATH_INFO"],
+        "query": parse_qs(environ["QUERY_STRING"]),
+        "api_key": environ.get("HTTP_X_API_KEY"),
+        "body": json.loads(body) if body else None,
+    }).encode()]
+
+
+async def asgi_app(scope, receive, send):
+    """Echo the request back as JSON."""
+    message = await receive()
+    headers = dict(scope["headers"])
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": json.dumps({
+        "method": scope["method"],
+        "path": scope["path"],
+        "query": parse_qs(scope["query_string"].decode()),
+        "api_key": headers.get(b"x-api-key", b"").decode(),
+        "body": json.loads(message["body"]) if message["body"] else None,
+    }).encode()})
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _echo(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        content = json.dumps({"method": self.command, "path": self.path, "body": json.loads(body) if body else None}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _echo
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInProcessTransports(unittest.TestCase):
+    """Test cases for the WSGI and ASGI transports."""
+
+    def test_wsgi_transport(self):
+        """Test requests reach the WSGI app with headers, query and body."""
+        robot = Robot("http://robot.local", "key", transport=transport.WSGITransport(wsgi_app))
+
+        self.assertEqual(robot.get("/api/v1/tasks", params={"site": "s1", "floor": None}), {
+            "method": "GET", "path": "/api/v1/tasks", "query": {"site": ["s1"]}, "api_key": "key", "body": None,
+        })
+        self.assertEqual(robot.post("/api/v1/tasks", data={"a": 1})["body"], {"a": 1})
+        with self.assertRaises(NotFoundError):
+            robot.get("/missing")
+
+    def test_asgi_transport(self):
+        """Test sync and async requests reach the ASGI app."""
+        robot = Robot("http://robot.local", "key", transport=transport.ASGITransport(asgi_app))
+
+        result = robot.patch("/api/v1/cruises/x", data={"name": "x"})
+        self.assertEqual((result["method"], result["path"], result["api_key"], result["body"]), ("PATCH", "/api/v1/cruises/x", "key", {"name": "x"}))
+
+        result = asyncio.run(robot.request_async("GET", "/api/v1/status", params={"a": "b"}))
+        self.assertEqual(result["query"], {"a": ["b"]})
+
+    def test_response_interface(self):
+        """Test TransportResponse behaves like requests.Response for the client."""
+        response = transport.TransportResponse(200, b"not json")
+        self.assertEqual(response.text, "not json")
+        with self.assertRaises(ValueError):
+            response.json()
+
+
+class TestNetworkTransports(unittest.TestCase):
+    """Test cases for the socket based transports."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a local echo server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the echo server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_pooled_transport(self):
+        """Test the pooled transport sends query and body and reuses connections."""
+        with transport.PooledHTTPTransport(maxsize=2) as pooled:
+            robot = Robot(self.url, "key", transport=pooled)
+            self.assertEqual(robot.get("/api/v1/status", params={"x": 1})["path"], "/api/v1/status?x=1")
+            self.assertEqual(robot.post("/api/v1/tasks", data={"a": 1})["body"], {"a": 1})
+
+    def test_pooled_transport_network_error(self):
+        """Test connection failures become network errors."""
+        robot = Robot("http://127.0.0.1:9", transport=transport.PooledHTTPTransport(timeout=1))
+        with self.assertRaises(SahaRobotikAPIError) as context:
+            robot.get("/api/v1/status")
+        self.assertIn("Network Error", str(context.exception))
+
+    def test_per_thread_sessions(self):
+        """Test every thread gets its own session."""
+        requests_transport = transport.RequestsTransport(per_thread_sessions=True)
+        robot = Robot(self.url, transport=requests_transport)
+        threads = [threading.Thread(target=robot.get, args=("/api/v1/status",)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        robot.get("/api/v1/status")
+        self.assertEqual(len(requests_transport._sessions), 4)
+        requests_transport.close()
+
+    def test_session(self):
+        """Test an explicit session is used."""
+        session = Mock()
+        session.request.return_value = Mock(status_code=200, json=Mock(return_value={"ok": True}))
+        robot = Robot(self.url, transport=transport.RequestsTransport(session=session), codec="json")
+        with patch('saha_sdk.client.requests.request') as mock_request:
+            self.assertEqual(robot.get("/api/v1/status"), {"ok": True})
+            mock_request.assert_not_called()
+        session.request.assert_called_once_with("GET", f"{self.url}/api/v1/status", headers=robot.headers, params=None)
+
+    @unittest.skipIf(transport._compat.httpx is None, "httpx is not installed")
+    def test_async_transport(self):
+        """Test the async transport from coroutines and synchronous code."""
+        async_transport = transport.AsyncTransport()
+        robot = Robot(self.url, transport=async_transport)
+
+        async def main():
+            result = await robot.request_async("POST", "/api/v1/tasks", data={"a": 1})
+            await async_transport.aclose()
+            return result
+
+        self.assertEqual(asyncio.run(main())["body"], {"a": 1})
+        self.assertEqual(robot.get("/api/v1/status")["method"], "GET")
+        async_transport.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
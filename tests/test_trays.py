@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.trays import TrayPlanner, Trip, TripStop, trays_needed
+from saha_sdk.models import ResponseModel, TaskRequestModel
+
+
+def make_order(target_uid, trays=1, **kwargs):
+    return TaskRequestModel(
+        type=kwargs.pop("type", "TABLE_SERVICE"), activate=True, target_uid=target_uid,
+        payload=[k < trays for k in range(4)], **kwargs
+    )
+
+
+class TestTrayPlanner(unittest.TestCase):
+    """Test cases for the TrayPlanner class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.positions = {
+            "east_1": (10.0, 0.0), "east_2": (11.0, 0.0), "east_3": (12.0, 0.0),
+            "west_1": (-10.0, 0.0), "west_2": (-11.0, 0.0),
+        }
+        self.planner = TrayPlanner(self.positions)
+        self.kitchen = (0.0, 0.0)
+
+    def test_trays_needed(self):
+        """Test tray count of an order."""
+        self.assertEqual(trays_needed(make_order("east_1", 3)), 3)
+        self.assertEqual(trays_needed(make_order("east_1", 0)), 1)
+
+    def test_groups_nearby_tables(self):
+        """Test tables on the same side share a trip."""
+        orders = [make_order(uid) for uid in ("east_3", "west_1", "east_1", "west_2", "east_2")]
+
+        trips, unknown = self.planner.plan(orders, self.kitchen)
+
+        self.assertEqual(unknown, [])
+        self.assertEqual(len(trips), 2)
+        groups = sorted(sorted(s.target_uid for s in trip.stops) for trip in trips)
+        self.assertEqual(groups, [["east_1", "east_2", "east_3"], ["west_1", "west_2"]])
+
+    def test_stop_order_and_payload(self):
+        """Test stops are visited nearest first with consecutive tray masks."""
+        planner = TrayPlanner(self.positions, return_to_start=False)
+        trips, _ = planner.plan([make_order("east_2", 2), make_order("east_1")], self.kitchen)
+
+        requests = trips[0].task_requests()
+        self.assertEqual([r.target_uid for r in requests], ["east_1", "east_2"])
+        self.assertEqual([r.task_index for r in requests], [0, 1])
+        self.assertEqual(requests[0].payload, [True, False, False, False])
+        self.assertEqual(requests[1].payload, [False, True, True, False])
+        self.assertAlmostEqual(trips[0].cost, 11.0)
+
+    def test_tray_capacity(self):
+        """Test trips never exceed the tray capacity."""
+        orders = [make_order("east_1", 2), make_order("east_2", 2), make_order("east_3", 2)]
+
+        trips, _ = self.planner.plan(orders, self.kitchen)
+
+        self.assertEqual(len(trips), 2)
+        for trip in trips:
+            self.assertLessEqual(sum(s.trays for s in trip.stops), 4)
+
+    def test_same_table_orders_share_stop(self):
+        """Test orders for one table are merged and split beyond capacity."""
+        orders = [make_order("west_1", 3), make_order("west_1", 1), make_order("west_1", 2)]
+
+        trips, _ = self.planner.plan(orders, self.kitchen)
+
+        stops = [s for trip in trips for s in trip.stops]
+        self.assertEqual(sorted(s.trays for s in stops), [2, 4])
+
+    def test_unknown_targets(self):
+        """Test orders for unknown targets are returned separately."""
+        trips, unknown = self.planner.plan([make_order("nowhere")], self.kitchen)
+        self.assertEqual(trips, [])
+        self.assertEqual(unknown[0].target_uid, "nowhere")
+
+    def test_other_task_types(self):
+        """Test orders that are not table service are returned unplanned and rejected in trips."""
+        dish = make_order("east_1", type="DISH")
+        trips, unplanned = self.planner.plan([dish, make_order("east_2")], self.kitchen)
+
+        self.assertEqual(unplanned, [dish])
+        self.assertEqual([s.target_uid for trip in trips for s in trip.stops], ["east_2"])
+        with self.assertRaises(ValueError):
+            Trip(stops=[TripStop("east_1", [True, False, False, False], [dish])]).task_requests()
+
+    def test_merged_stop_fields(self):
+        """Test the orders of a stop are merged into its task."""
+        orders = [
+            make_order("west_1", timeout=10, celebrating_name="Ada"),
+            make_order("west_1", timeout=30),
+            make_order("west_1", timeout=20, celebrating_name="Linus"),
+            make_order("west_1", celebrating_name="Ada"),
+        ]
+        trips, _ = self.planner.plan(orders, self.kitchen)
+
+        request = trips[0].task_requests()[0]
+        self.assertEqual(request.timeout, 30)
+        self.assertEqual(request.celebrating_name, "Ada, Linus")
+
+    @patch('saha_sdk.task.create_task')
+    def test_issue(self, mock_create):
+        """Test issuing a trip creates its tasks in order."""
+        mock_create.return_value = ResponseModel(success=True)
+        robot = Robot("https://api.example.com")
+        trip = Trip(stops=[
+            TripStop("east_1", [True, False, False, False], [make_order("east_1")]),
+            TripStop("east_2", [False, True, False, False], [make_order("east_2")]),
+        ])
+
+        results = self.planner.issue(robot, trip)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual([call.args[1].task_index for call in mock_create.call_args_list], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import socket
+import unittest
+from saha_sdk import status, tracing
+from saha_sdk.client import Robot
+from saha_sdk.exceptions import SahaRobotikAPIError
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.keepalive import KeepAlive
+from saha_sdk.mock import MockServer
+from saha_sdk.transport import DNSCache, PooledHTTPTransport
+
+
+class _Resolver:
+    """Resolves every name to the loopback address and counts lookups."""
+
+    def __init__(self):
+        self.lookups = []
+
+    def __call__(self, host, port, family=0, type=0):
+        self.lookups.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDNSCache(unittest.TestCase):
+    """Test cases for the DNS cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.resolver = _Resolver()
+        self.clock = _Clock()
+        self.cache = DNSCache(ttl=10.0, clock=self.clock, resolver=self.resolver)
+
+    def test_ttl(self):
+        """Test names are resolved again only once their entry expired."""
+        self.assertEqual(self.cache.resolve("robot-1.local", 80), "127.0.0.1")
+        self.cache.resolve("robot-1.local", 80)
+        self.assertEqual(self.resolver.lookups, ["robot-1.local"])
+
+        self.clock.now = 10.0
+        self.cache.resolve("robot-1.local", 80)
+        self.assertEqual(len(self.resolver.lookups), 2)
+
+    def test_invalidate(self):
+        """Test invalidated names are resolved again."""
+        self.cache.resolve("robot-1.local", 80)
+        self.cache.invalidate("robot-1.local")
+        self.cache.resolve("robot-1.local", 80)
+        self.assertEqual(len(self.resolver.lookups), 2)
+
+    def test_addresses(self):
+        """Test IP addresses are not looked up."""
+        self.assertEqual(self.cache.resolve("10.0.0.7", 80), "10.0.0.7")
+        self.assertEqual(self.cache.resolve("::1", 80), "::1")
+        self.assertEqual(self.resolver.lookups, [])
+
+
+class TestWarmup(unittest.TestCase):
+    """Test cases for pre-warmed connections."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the mock server."""
+        cls.server = MockServer().start()
+        cls.url = cls.server.urls["robot-1"]
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the mock server."""
+        cls.server.stop()
+
+    def test_dns_cache(self):
+        """Test the pooled transport connects to cached addresses and keeps the host name."""
+        resolver = _Resolver()
+        cache = DNSCache(resolver=resolver)
+        url = self.url.replace("127.0.0.1", "robot-1.local")
+        with PooledHTTPTransport(dns_cache=cache) as transport:
+            robot = Robot(url, transport=transport)
+            for _ in range(3):
+                status.get_robot_status(robot)
+        self.assertEqual(resolver.lookups, ["robot-1.local"])
+
+    def test_first_call_reuses_connection(self):
+        """Test the first call after warmup() uses an open connection."""
+        tracer = tracing.Tracer()
+        connects = []
+        tracer.on("after_connect", connects.append)
+        with PooledHTTPTransport() as transport:
+            robot = Robot(self.url, transport=transport, tracer=tracer)
+            self.assertGreater(robot.warmup(), 0)
+            status.get_robot_status(robot)
+        self.assertEqual([span.connection_reused for span in connects], [True])
+
+    def test_warm_option(self):
+        """Test warm=True warms up, and ignores robots that cannot be reached."""
+        with PooledHTTPTransport() as transport:
+            tracer = tracing.Tracer()
+            connects = []
+            tracer.on("after_connect", connects.append)
+            robot = Robot(self.url, transport=transport, tracer=tracer, warm=True)
+            status.get_robot_status(robot)
+        self.assertEqual([span.connection_reused for span in connects], [True])
+
+        offline = Robot("http://127.0.0.1:9", transport=PooledHTTPTransport(timeout=1), warm=True)
+        with self.assertRaises(SahaRobotikAPIError):
+            offline.warmup()
+
+    def test_keepalive(self):
+        """Test every robot of the fleet is probed and failures are counted."""
+        fleet = RobotFleet({
+            "online": Robot(self.url, transport=PooledHTTPTransport()),
+            "offline": Robot("http://127.0.0.1:9", transport=PooledHTTPTransport(timeout=1)),
+        })
+        with fleet:
+            keepalive = KeepAlive(fleet, connections=2)
+            errors = keepalive.probe()
+        self.assertIsNone(errors["online"])
+        self.assertIsInstance(errors["offline"], SahaRobotikAPIError)
+        self.assertEqual((keepalive.rounds, keepalive.failures), (1, {"offline": 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
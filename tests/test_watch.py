@@ -0,0 +1,152 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+from saha_sdk.client import Robot
+from saha_sdk.fleet import RobotFleet
+from saha_sdk.watch import ChangeEvent, StatusWatcher, flatten
+from saha_sdk.models import RobotStatus
+
+
+def status_body(**overrides):
+    body = {"is_charging": False, "battery_percent": 80.0, "is_estopped": False,
+            "current_state": "READY", "out_of_service": False}
+    body.update(overrides)
+    return json.dumps(body).encode()
+
+
+def hardware_body(lidar_working=True):
+    return json.dumps({
+        "lidars": [{"name": "main_lidar", "is_working": lidar_working, "state": "WORKING", "error": ""}],
+        "cameras": [],
+        "internet_status": {"state": "CONNECTED"}
+    }).encode()
+
+
+class TestStatusWatcher(unittest.TestCase):
+    """Test cases for the StatusWatcher class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.fleet = RobotFleet({"r1": Robot("https://r1.example.com")})
+        self.watcher = StatusWatcher(self.fleet, clock=lambda: 42.0)
+        self.events = []
+
+    def tearDown(self):
+        self.fleet.close()
+
+    def test_flatten(self):
+        """Test named list items are keyed by name."""
+        fields = flatten(json.loads(hardware_body()))
+        self.assertIn("lidars[main_lidar].is_working", fields)
+        self.assertEqual(fields["internet_status.state"], "CONNECTED")
+        self.assertEqual(flatten({"values": [1, 2]}), {"values[0]": 1, "values[1]": 2})
+
+    def test_first_payload_has_no_events(self):
+        """Test the first payload only establishes the baseline."""
+        self.assertEqual(self.watcher.check("r1", "status", status_body()), [])
+
+    def test_unchanged_payload_is_not_decoded(self):
+        """Test identical bodies are skipped before decoding."""
+        self.watcher.check("r1", "status", status_body())
+
+        with patch.object(self.watcher.codec, 'loads') as mock_loads:
+            events = self.watcher.check("r1", "status", status_body())
+
+        self.assertEqual(events, [])
+        mock_loads.assert_not_called()
+        self.assertEqual(self.watcher.skipped, 1)
+
+    def test_changed_fields(self):
+        """Test only the changed fields produce events."""
+        self.watcher.subscribe(self.events.append)
+        self.watcher.check("r1", "status", status_body())
+
+        events = self.watcher.check("r1", "status", status_body(battery_percent=79.0, is_estopped=True))
+
+        self.assertEqual(sorted(e.field for e in events), ["battery_percent", "is_estopped"])
+        self.assertIn(ChangeEvent("r1", "status", "battery_percent", 80.0, 79.0, 42.0), self.events)
+        self.assertEqual(len(self.events), 2)
+
+    def test_field_subscription(self):
+        """Test field subscribers only receive their fields."""
+        self.watcher.subscribe(self.events.append, endpoint="hardware", fields=["lidars[main_lidar].is_working"])
+        self.watcher.check("r1", "status", status_body())
+        self.watcher.check("r1", "hardware", hardware_body())
+
+        self.watcher.check("r1", "status", status_body(battery_percent=10.0))
+        self.watcher.check("r1", "hardware", hardware_body(lidar_working=False))
+
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual((self.events[0].old, self.events[0].new), (True, False))
+
+    def test_unsubscribe(self):
+        """Test unsubscribed callbacks receive no more events."""
+        unsubscribe = self.watcher.subscribe(self.events.append, endpoint="status")
+        self.watcher.check("r1", "status", status_body())
+        unsubscribe()
+
+        self.watcher.check("r1", "status", status_body(current_state="MOVING"))
+
+        self.assertEqual(self.events, [])
+
+    def test_fields_require_endpoint(self):
+        """Test field subscriptions need an endpoint."""
+        with self.assertRaises(ValueError):
+            self.watcher.subscribe(self.events.append, fields=["battery_percent"])
+
+    def test_latest(self):
+        """Test the last payload is available as a model."""
+        self.watcher.check("r1", "status", status_body(battery_percent=55.0))
+
+        latest = self.watcher.latest("r1", "status")
+
+        self.assertIsInstance(latest, RobotStatus)
+        self.assertEqual(latest.battery_percent, 55.0)
+
+    @patch.object(Robot, 'get_raw')
+    def test_poll(self, mock_get_raw):
+        """Test poll fetches every endpoint and reports changes."""
+        bodies = {"/api/v1/status": status_body(), "/api/v1/status/hardware": hardware_body()}
+        mock_get_raw.side_effect = lambda path: bodies[path]
+        self.watcher.poll()
+        bodies["/api/v1/status"] = status_body(is_charging=True)
+
+        events = self.watcher.poll()
+
+        self.assertEqual(mock_get_raw.call_count, 4)
+        self.assertEqual([e.field for e in events], ["is_charging"])
+
+    @patch.object(Robot, 'get_raw')
+    def test_failing_subscriber(self, mock_get_raw):
+        """Test a raising subscriber or poll neither stops other subscribers nor the background loop."""
+        bodies = iter([status_body(), status_body(is_charging=True), b"{not json", status_body(is_charging=False)])
+        polled = threading.Event()
+
+        def get_raw(path):
+            body = next(bodies, None)
+            if body is None:
+                polled.set()
+                raise ConnectionError("offline")
+            return body
+
+        def failing(event):
+            raise RuntimeError("subscriber bug")
+
+        mock_get_raw.side_effect = get_raw
+        watcher = StatusWatcher(self.fleet, endpoints=["status"], interval=0.0)
+        watcher.subscribe(failing)
+        watcher.subscribe(self.events.append)
+        with self.assertLogs("saha_sdk.watch", "ERROR") as logs:
+            watcher.start()
+            self.assertTrue(polled.wait(5.0))
+            watcher.stop()
+
+        self.assertEqual([e.new for e in self.events], [True, False])
+        output = "\n".join(logs.output)
+        self.assertIn("subscriber bug", output)
+        self.assertIn("Status poll failed", output)
+
+
+if __name__ == '__main__':
+    unittest.main()